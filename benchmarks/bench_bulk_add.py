@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""
+Throughput benchmark: add_task in a loop vs one add_tasks batch.
+
+Run: python benchmarks/bench_bulk_add.py [--batch 50000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import (  # noqa: E402
+    ColumnarTaskStore,
+    DictTaskStore,
+    TaskManager,
+    TaskPriority,
+)
+
+STORES = {"dict": DictTaskStore, "columnar": ColumnarTaskStore}
+
+
+def make_items(count: int) -> list:
+    """Build add_tasks items with a realistic mix of priorities and deadlines."""
+    due_date = datetime.now() + timedelta(days=30)
+    priorities = list(TaskPriority)
+    return [
+        {
+            "title": f"Imported task {i}",
+            "description": "Imported from upstream",
+            "priority": priorities[i % len(priorities)],
+            "due_date": due_date + timedelta(minutes=i) if i % 3 == 0 else None,
+        }
+        for i in range(count)
+    ]
+
+
+def run_loop(store_factory, items: list) -> float:
+    """Return the seconds taken to add every item with add_task."""
+    manager = TaskManager(store=store_factory())
+    start = time.perf_counter()
+    for item in items:
+        manager.add_task(**item)
+    return time.perf_counter() - start
+
+
+def run_batch(store_factory, items: list) -> float:
+    """Return the seconds taken to add every item with one add_tasks call."""
+    manager = TaskManager(store=store_factory())
+    start = time.perf_counter()
+    manager.add_tasks(items)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print the best time of each variant."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    items = make_items(args.batch)
+    print(f"batch of {args.batch} tasks, best of {args.repeat}")
+    print(
+        f"{'store':>9} {'loop s':>8} {'batch s':>8} {'loop/s':>10} {'batch/s':>10} {'speedup':>8}"
+    )
+    for name, factory in STORES.items():
+        loop = min(run_loop(factory, items) for _ in range(args.repeat))
+        batch = min(run_batch(factory, items) for _ in range(args.repeat))
+        print(
+            f"{name:>9} {loop:>8.3f} {batch:>8.3f} {args.batch / loop:>10.0f} "
+            f"{args.batch / batch:>10.0f} {loop / batch:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
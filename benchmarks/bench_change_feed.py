@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""
+Change feed benchmark: finding what changed in a manager of N tasks.
+
+- writes: update_task throughput with and without an attached feed, the
+  cost every writer pays for publishing events.
+- detection: a consumer learning about K changed tasks, either by polling
+  get_all_tasks() and diffing versions against its last scan, or by
+  reading the feed after its last sequence number.
+- delivery: time from update_task returning in a writer thread to the
+  event reaching a consumer thread blocked in poll().
+
+The filled manager is moved out of the garbage collector's reach with
+gc.freeze(); otherwise full collections over millions of objects, set
+off by any allocating loop, dominate the timings of both consumers.
+
+Run: python benchmarks/bench_change_feed.py [--tasks 1000000] [--changes 10 1000 100000]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import TaskManager, ThreadSafeTaskManager  # noqa: E402
+
+BATCH = 50_000
+WRITES = 200_000
+DELIVERIES = 2_000
+
+
+def fill(manager, count: int) -> None:
+    """Bulk-add ``count`` tasks."""
+    for first in range(0, count, BATCH):
+        manager.add_tasks({"title": f"Task {i}"} for i in range(first, min(first + BATCH, count)))
+
+
+def timed(operation) -> float:
+    """Return the seconds one call of ``operation()`` takes."""
+    started = time.perf_counter()
+    operation()
+    return time.perf_counter() - started
+
+
+def update_random(manager, ids: list, label: str) -> None:
+    """Give each task in ``ids`` a new description starting with ``label``."""
+    for task_id in ids:
+        manager.update_task(task_id, description=f"{label} {task_id}")
+
+
+def scan_versions(manager) -> dict:
+    """Return the version of every task, the polling consumer's state."""
+    return {task.task_id: task.version for task in manager.get_all_tasks()}
+
+
+def poll_and_diff(manager, seen: dict) -> list:
+    """Return the IDs whose version differs from ``seen``, updating it."""
+    changed = []
+    for task in manager.get_all_tasks():
+        if seen.get(task.task_id) != task.version:
+            seen[task.task_id] = task.version
+            changed.append(task.task_id)
+    return changed
+
+
+def read_feed(subscription) -> set:
+    """Drain a subscription and return the IDs it reported."""
+    changed = set()
+    while True:
+        events = subscription.poll(limit=10_000)
+        if not events:
+            return changed
+        changed.update(event.task_id for event in events)
+
+
+def delivery_latencies(count: int) -> list:
+    """Update tasks from one thread and time their arrival in another."""
+    manager = ThreadSafeTaskManager()
+    fill(manager, 1000)
+    subscription = manager.change_feed().subscribe()
+    sent = {}
+    latencies = []
+
+    def consume():
+        while len(latencies) < count:
+            for event in subscription.poll(timeout=None):
+                if event.field == "description":
+                    latencies.append(time.perf_counter() - sent[event.sequence])
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for i in range(count):
+        manager.update_task(i % 1000 + 1, description=f"Edit {i}")
+        # The description event is the one before the updated_at event.
+        sent[manager.change_feed().last_sequence - 1] = time.perf_counter()
+        time.sleep(0.0002)
+    consumer.join()
+    return sorted(latencies)
+
+
+def main() -> None:
+    """Run the three sections and print their tables."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--changes", type=int, nargs="+", default=[10, 1000, 100_000])
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    manager = TaskManager()
+    fill(manager, args.tasks)
+    # Keep full collections over the filled heap out of every timing.
+    gc.freeze()
+    print(f"{args.tasks} tasks, {os.cpu_count()} CPUs")
+
+    ids = [rng.randint(1, args.tasks) for _ in range(WRITES)]
+    plain = timed(lambda: update_random(manager, ids, "First"))
+    # Two events per update; keep every batch, so no detection round overruns.
+    feed = manager.change_feed(capacity=2 * max(WRITES, *args.changes))
+    published = timed(lambda: update_random(manager, ids, "Second"))
+    print(f"\nwrites {'':<18} {'updates/s':>10}")
+    print(f"  {'no feed':<23} {WRITES / plain:>10.0f}")
+    print(f"  {'feed attached':<23} {WRITES / published:>10.0f}")
+    print(f"  {'events per update':<23} {feed.last_sequence / WRITES:>10.1f}")
+
+    print(f"\ndetection {'changed':>15} {'poll + diff s':>14} {'feed read s':>12}")
+    seen = scan_versions(manager)
+    for changes in args.changes:
+        subscription = feed.subscribe()
+        update_random(
+            manager, [rng.randint(1, args.tasks) for _ in range(changes)], f"Round {changes}"
+        )
+        diff = timed(lambda: poll_and_diff(manager, seen))
+        read = timed(lambda: read_feed(subscription))
+        print(f"  {'':<8}{changes:>15} {diff:>14.3f} {read:>12.5f}")
+
+    latencies = delivery_latencies(DELIVERIES)
+
+    def at(fraction: float) -> float:
+        return latencies[min(int(len(latencies) * fraction), len(latencies) - 1)] * 1000
+
+    print(f"\ndelivery {'':<16} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    print(f"  {'blocked poll()':<23} {at(0.5):>9.4f} {at(0.99):>9.4f} {latencies[-1] * 1000:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
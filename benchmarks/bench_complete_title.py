@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Title completion benchmark: prefix index vs a startswith scan.
+
+Simulates typing each query one character at a time, with a stream of
+updates between keystrokes, and reports the mean latency per keystroke.
+
+Run: python benchmarks/bench_complete_title.py [--tasks 1000000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import TaskManager, TaskPriority  # noqa: E402
+
+VERBS = ["fix", "write", "review", "deploy", "update", "test", "plan", "document"]
+NOUNS = ["login", "api", "release", "database", "invoice", "dashboard", "cache", "report"]
+QUERIES = ["deploy cache", "review invoice 12", "t", "plan release 99999"]
+
+
+def build_manager(count: int) -> TaskManager:
+    """Build a manager with titles sharing common prefixes."""
+    rng = random.Random(42)
+    priorities = list(TaskPriority)
+    manager = TaskManager()
+    manager.add_tasks(
+        {
+            "title": f"{rng.choice(VERBS)} {rng.choice(NOUNS)} {rng.randrange(count)}",
+            "priority": rng.choice(priorities),
+        }
+        for _ in range(count)
+    )
+    return manager
+
+
+def scan(manager: TaskManager, prefix: str, limit: int) -> list:
+    """Rank matching tasks the way callers did before the index."""
+    prefix = prefix.casefold()
+    matches = [task for task in manager.get_all_tasks() if task.title.casefold().startswith(prefix)]
+    matches.sort(key=lambda task: (-task.priority.value, -task.task_id))
+    return matches[:limit]
+
+
+def type_query(function, manager: TaskManager, query: str, rng: random.Random) -> float:
+    """Return the mean milliseconds per keystroke, renaming a task between keystrokes."""
+    total = 0.0
+    for end in range(1, len(query) + 1):
+        task = manager.get_task(rng.randrange(1, manager.get_task_count()))
+        task.update_title(f"{rng.choice(VERBS)} {rng.choice(NOUNS)} renamed")
+        start = time.perf_counter()
+        function(manager, query[:end], 10)
+        total += time.perf_counter() - start
+    return total / len(query) * 1000
+
+
+def main() -> None:
+    """Build the index once, then time typed queries with and without it."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--scan", action=argparse.BooleanOptionalAction, default=True)
+    args = parser.parse_args()
+
+    manager = build_manager(args.tasks)
+    start = time.perf_counter()
+    manager.complete_title("")
+    print(f"{args.tasks} tasks, index built and warmed in {time.perf_counter() - start:.1f} s")
+
+    rng = random.Random(7)
+    print(f"{'query':>20} {'index ms/key':>13} {'scan ms/key':>12}")
+    for query in QUERIES:
+        indexed = type_query(
+            lambda m, prefix, limit: m.complete_title(prefix, limit), manager, query, rng
+        )
+        scanned = type_query(scan, manager, query, rng) if args.scan else float("nan")
+        print(f"{query:>20} {indexed:>13.3f} {scanned:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
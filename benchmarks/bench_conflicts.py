@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""
+Contention benchmark: concurrent read-modify-write cycles on a few hot tasks.
+
+Client threads repeatedly pick one of H hot tasks, read it, wait a short
+think time standing in for a client round trip, and write back its
+description counter plus one. Three ways of making that write:
+
+- last-writer-wins: update_task without a version; concurrent cycles
+  overwrite each other and increments are lost.
+- versioned: update_task(expected_version=...) and retry the cycle on
+  VersionConflictError; nothing is lost, conflicts cost retries.
+- write lock: hold the manager's write lock for the whole cycle, the
+  global-mutex alternative; nothing is lost, but cycles never overlap.
+
+The report shows committed increments/s, the conflict rate (conflicts
+per attempted write) and lost increments for each hot-set size.
+
+Run: python benchmarks/bench_conflicts.py [--clients 8] [--hot 1 10 100 1000] [--think-ms 0.2]
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import ThreadSafeTaskManager, VersionConflictError  # noqa: E402
+
+
+def last_writer_wins(manager, task_id: int, think: float) -> int:
+    """Run one unchecked cycle; return the number of conflicts (always 0)."""
+    value = int(manager.get_task(task_id).description)
+    time.sleep(think)
+    manager.update_task(task_id, description=str(value + 1))
+    return 0
+
+
+def versioned(manager, task_id: int, think: float) -> int:
+    """Run one cycle with compare-and-set, retrying until it commits; return the conflicts."""
+    conflicts = 0
+    while True:
+        task = manager.get_task(task_id)
+        # Read the version before the value, so a write in between is caught.
+        version = task.version
+        value = int(task.description)
+        time.sleep(think)
+        try:
+            manager.update_task(task_id, description=str(value + 1), expected_version=version)
+            return conflicts
+        except VersionConflictError:
+            conflicts += 1
+
+
+def write_locked(manager, task_id: int, think: float) -> int:
+    """Run one cycle holding the write lock throughout; return the conflicts (always 0)."""
+    with manager._lock.write:
+        value = int(manager.get_task(task_id).description)
+        time.sleep(think)
+        manager.update_task(task_id, description=str(value + 1))
+    return 0
+
+
+STRATEGIES = {
+    "last-writer-wins": last_writer_wins,
+    "versioned": versioned,
+    "write lock": write_locked,
+}
+
+
+def run(strategy, hot: int, clients: int, think: float, seconds: float) -> tuple:
+    """Run ``clients`` threads for ``seconds``; return (commits, conflicts, lost)."""
+    manager = ThreadSafeTaskManager()
+    added = manager.add_tasks({"title": f"Hot {i}", "description": "0"} for i in range(hot)).added
+    ids = [task.task_id for task in added]
+    commits = [0] * clients
+    conflicts = [0] * clients
+    deadline = time.perf_counter() + seconds
+
+    def client(index):
+        rng = random.Random(index)
+        while time.perf_counter() < deadline:
+            conflicts[index] += strategy(manager, rng.choice(ids), think)
+            commits[index] += 1
+
+    threads = [threading.Thread(target=client, args=(index,)) for index in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    counted = sum(int(manager.get_task(task_id).description) for task_id in ids)
+    return sum(commits), sum(conflicts), sum(commits) - counted
+
+
+def main() -> None:
+    """Run every strategy for every hot-set size and print the table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--hot", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--think-ms", type=float, default=0.2, help="pause between read and write")
+    parser.add_argument("--seconds", type=float, default=2.0, help="time per run")
+    args = parser.parse_args()
+    think = args.think_ms / 1000
+
+    print(f"{args.clients} clients, {args.think_ms} ms think time, {os.cpu_count()} CPUs")
+    print(f"{'hot tasks':>9}  {'strategy':<17} {'commits/s':>10} {'conflict rate':>14} {'lost':>8}")
+    for hot in args.hot:
+        for name, strategy in STRATEGIES.items():
+            commits, conflicts, lost = run(strategy, hot, args.clients, think, args.seconds)
+            attempts = commits + conflicts
+            print(
+                f"{hot:>9}  {name:<17} {commits / args.seconds:>10.0f} "
+                f"{conflicts / attempts if attempts else 0:>14.1%} {lost:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
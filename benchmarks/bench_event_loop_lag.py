@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""
+Event-loop lag benchmark: a bulk import while an asyncio service keeps running.
+
+A JSON Lines export of N tasks is imported three ways while a ticker
+coroutine sleeps 1 ms in a loop and records how late each wake-up is:
+
+- TaskManager.import_jsonl called directly on the loop, which blocks it.
+- AsyncTaskManager.import_jsonl, one executor call per batch.
+- AsyncTaskManager.add_tasks(atomic=False), one executor call per chunk.
+
+A probe coroutine also times get_task_count calls, standing in for the
+requests of the service, during each import. The
+report shows import time and p50/p99/max loop lag and probe latency.
+The max lag of the offloaded imports is set by full garbage collections
+of the growing heap, which pause every thread; --no-gc shows the lag
+without them.
+
+Run: python benchmarks/bench_event_loop_lag.py [--tasks 1000000] [--batch 1000] [--no-gc]
+"""
+
+import argparse
+import asyncio
+import gc
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import AsyncTaskManager, TaskManager, ThreadSafeTaskManager  # noqa: E402
+
+TICK = 0.001
+
+
+def build_export(count: int) -> str:
+    """Return a JSON Lines export of ``count`` tasks."""
+    source = TaskManager()
+    source.add_tasks({"title": f"Task {i}", "description": "Imported"} for i in range(count))
+    buffer = io.StringIO()
+    source.export_jsonl(buffer)
+    return buffer.getvalue()
+
+
+async def ticker(stop: asyncio.Event, lags: list) -> None:
+    """Sleep one tick at a time and record how late each wake-up is."""
+    clock = time.perf_counter
+    while not stop.is_set():
+        started = clock()
+        await asyncio.sleep(TICK)
+        lags.append(clock() - started - TICK)
+
+
+async def prober(facade: AsyncTaskManager, stop: asyncio.Event, latencies: list) -> None:
+    """Time cheap manager calls, as a request handler would make them, until stopped."""
+    clock = time.perf_counter
+    while not stop.is_set():
+        started = clock()
+        await facade.get_task_count()
+        latencies.append(clock() - started)
+        await asyncio.sleep(TICK)
+
+
+async def measure(job, facade: AsyncTaskManager) -> tuple:
+    """Run ``job()`` alongside the ticker and prober; return (seconds, lags, latencies)."""
+    stop = asyncio.Event()
+    lags, latencies = [], []
+    background = [
+        asyncio.ensure_future(ticker(stop, lags)),
+        asyncio.ensure_future(prober(facade, stop, latencies)),
+    ]
+    await asyncio.sleep(0.05)
+    lags.clear()
+    latencies.clear()
+    started = time.perf_counter()
+    await job()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await asyncio.gather(*background)
+    return elapsed, lags, latencies
+
+
+def percentiles(samples: list) -> str:
+    """Format the p50, p99 and max of samples in milliseconds."""
+    if not samples:
+        return f"{'-':>8} {'-':>8} {'-':>9}"
+    samples = sorted(samples)
+
+    def at(fraction: float) -> float:
+        return samples[min(int(len(samples) * fraction), len(samples) - 1)] * 1000
+
+    return f"{at(0.5):>8.2f} {at(0.99):>8.2f} {samples[-1] * 1000:>9.1f}"
+
+
+async def run(export: str, count: int, batch: int) -> None:
+    """Run every import strategy and print one row each."""
+
+    async def blocking(facade, source):
+        facade.manager.import_jsonl(source, batch)
+
+    async def offloaded(facade, source):
+        await facade.import_jsonl(source, batch)
+
+    async def chunked(facade, source):
+        await facade.add_tasks(
+            ({"title": f"Task {i}", "description": "Added"} for i in range(count)), atomic=False
+        )
+
+    print(
+        f"{'strategy':<32} {'seconds':>8} {'ticks':>7} "
+        f"{'lag p50':>8} {'lag p99':>8} {'lag max':>9} "
+        f"{'get p50':>8} {'get p99':>8} {'get max':>9}   (ms)"
+    )
+    for name, job in (
+        ("import_jsonl on the loop", blocking),
+        ("AsyncTaskManager.import_jsonl", offloaded),
+        ("AsyncTaskManager.add_tasks", chunked),
+    ):
+        facade = AsyncTaskManager(ThreadSafeTaskManager())
+        # Copying the export into a stream is setup, not part of the import.
+        source = io.StringIO(export)
+        elapsed, lags, latencies = await measure(lambda: job(facade, source), facade)
+        assert facade.manager.get_task_count() == count
+        print(
+            f"{name:<32} {elapsed:>8.2f} {len(lags):>7} "
+            f"{percentiles(lags)} {percentiles(latencies)}"
+        )
+
+
+def main() -> None:
+    """Build the export and compare the import strategies."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=1000, help="lines per import batch")
+    parser.add_argument("--no-gc", action="store_true", help="disable the cyclic collector")
+    args = parser.parse_args()
+    if args.no_gc:
+        gc.disable()
+
+    export = build_export(args.tasks)
+    print(
+        f"{args.tasks} tasks, {len(export) / 1e6:.0f} MB of JSON Lines, {TICK * 1000:.0f} ms tick"
+    )
+    asyncio.run(run(export, args.tasks, args.batch))
+
+
+if __name__ == "__main__":
+    main()
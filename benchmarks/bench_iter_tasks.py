@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Listing benchmark: get_all_tasks() vs the iter_tasks() keyset cursor.
+
+Measures the peak Python allocations of walking every task and the time
+to the first screen of 20 tasks. The SQLite engine loads tasks on demand,
+so it shows how much of a listing each approach keeps in memory.
+
+Run: python benchmarks/bench_iter_tasks.py [--tasks 1000000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from itertools import islice
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import SqliteTaskStore, TaskManager  # noqa: E402
+
+FILL_BATCH = 10_000
+SCREEN = 20
+
+
+def fill(manager: TaskManager, count: int) -> None:
+    """Add ``count`` tasks in bounded batches."""
+    for start in range(0, count, FILL_BATCH):
+        manager.add_tasks(
+            {"title": f"Task {i}"} for i in range(start, min(start + FILL_BATCH, count))
+        )
+
+
+def measure(function):
+    """Call ``function`` and return (milliseconds, peak traced bytes)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    milliseconds = (time.perf_counter() - start) * 1000
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return milliseconds, peak
+
+
+def walk(tasks) -> None:
+    """Consume tasks one at a time, as a listing screen would."""
+    for _ in tasks:
+        pass
+
+
+def main() -> None:
+    """Walk and page through every engine's tasks, printing time and peak memory."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        managers = {
+            "dict": TaskManager(),
+            "sqlite": TaskManager(store=SqliteTaskStore(os.path.join(directory, "tasks.db"))),
+        }
+        print(f"{args.tasks} tasks")
+        print(f"{'engine':>7} {'method':>14} {'walk ms':>9} {'walk peak':>12} {'screen ms':>10}")
+        for name, manager in managers.items():
+            fill(manager, args.tasks)
+            methods = {
+                "get_all_tasks": manager.get_all_tasks,
+                "iter_tasks": manager.iter_tasks,
+            }
+            for method_name, method in methods.items():
+                walk_ms, peak = measure(lambda: walk(method()))
+                screen_ms, _ = measure(lambda: list(islice(method(), SCREEN)))
+                print(
+                    f"{name:>7} {method_name:>14} {walk_ms:>9.0f} "
+                    f"{peak / 1e6:>10.1f}MB {screen_ms:>10.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
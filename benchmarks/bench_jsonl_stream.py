@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""
+Memory benchmark: peak Python allocations of export_jsonl / import_jsonl by dataset size.
+
+Tasks live in SQLite databases on disk, so the measured peak is the
+streaming overhead of the export and import themselves.
+
+Run: python benchmarks/bench_jsonl_stream.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import SqliteTaskStore, TaskManager, TaskPriority  # noqa: E402
+
+FILL_BATCH = 10_000
+
+
+def fill(manager: TaskManager, count: int) -> None:
+    """Add ``count`` tasks in bounded batches."""
+    priorities = list(TaskPriority)
+    for start in range(0, count, FILL_BATCH):
+        manager.add_tasks(
+            {"title": f"Task {i}", "priority": priorities[i % len(priorities)]}
+            for i in range(start, min(start + FILL_BATCH, count))
+        )
+
+
+def measure(function):
+    """Call ``function`` and return (seconds, peak traced bytes)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    """Export and re-import each dataset size, printing time and peak memory."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'tasks':>9} {'export s':>9} {'export peak':>12} {'import s':>9} {'import peak':>12}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            source = TaskManager(store=SqliteTaskStore(os.path.join(directory, "source.db")))
+            fill(source, size)
+            source._store.commit()
+            export_path = os.path.join(directory, "tasks.jsonl")
+            target = TaskManager(store=SqliteTaskStore(os.path.join(directory, "target.db")))
+
+            with open(export_path, "w") as export_file:
+                export_seconds, export_peak = measure(lambda: source.export_jsonl(export_file))
+            with open(export_path) as import_file:
+                import_seconds, import_peak = measure(lambda: target.import_jsonl(import_file))
+
+            assert target.get_task_count() == size
+            print(
+                f"{size:>9} {export_seconds:>9.2f} {export_peak / 2**20:>9.1f} MiB "
+                f"{import_seconds:>9.2f} {import_peak / 2**20:>9.1f} MiB"
+            )
+            source.close()
+            target.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""
+Query benchmark: TaskManager.query() vs chained getters, filters and sorts.
+
+Run: python benchmarks/bench_query.py [--tasks 1000000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import TaskManager, TaskPriority, TaskStatus  # noqa: E402
+
+
+def build_manager(count: int) -> TaskManager:
+    """Build a manager with mixed statuses, priorities and deadlines."""
+    rng = random.Random(42)
+    now = datetime.now()
+    priorities = list(TaskPriority)
+    manager = TaskManager()
+    manager.add_tasks(
+        {
+            "title": f"Task {i}",
+            "priority": rng.choice(priorities),
+            "due_date": now + timedelta(minutes=rng.randrange(1, 525_600)) if i % 3 else None,
+        }
+        for i in range(count)
+    )
+    for task in manager.get_all_tasks():
+        task.created_at = now - timedelta(seconds=rng.randrange(10**8))
+    manager.mark_tasks_completed(rng.sample(range(1, count + 1), count // 2))
+    manager.mark_tasks_in_progress(rng.sample(range(1, count + 1), count // 10))
+    return manager
+
+
+def workloads(manager: TaskManager) -> list:
+    """Return (name, chained-getter version, query version) triples."""
+    now = datetime.now()
+    week = now + timedelta(days=7)
+
+    def next_due_chained():
+        tasks = manager.get_tasks_by_status(TaskStatus.PENDING)
+        tasks = [task for task in tasks if task.priority is TaskPriority.CRITICAL]
+        tasks = [task for task in tasks if task.due_date is not None]
+        return sorted(tasks, key=lambda task: task.due_date)[:10]
+
+    def due_this_week_chained():
+        tasks = manager.get_tasks_by_status(TaskStatus.PENDING)
+        tasks = [task for task in tasks if task.due_date is not None and task.due_date < week]
+        return sorted(tasks, key=lambda task: task.due_date)[:20]
+
+    def newest_in_progress_chained():
+        tasks = manager.get_tasks_by_status(TaskStatus.IN_PROGRESS)
+        tasks = [task for task in tasks if task.priority is TaskPriority.HIGH]
+        return sorted(tasks, key=lambda task: task.created_at, reverse=True)[:10]
+
+    query = manager.query()
+    return [
+        (
+            "critical pending by due, top 10",
+            next_due_chained,
+            query.status(TaskStatus.PENDING)
+            .priority(TaskPriority.CRITICAL)
+            .due_between()
+            .order_by("due_date")
+            .limit(10)
+            .all,
+        ),
+        (
+            "pending due this week, top 20",
+            due_this_week_chained,
+            query.status(TaskStatus.PENDING)
+            .due_between(end=week)
+            .order_by("due_date")
+            .limit(20)
+            .all,
+        ),
+        (
+            "newest high in progress, top 10",
+            newest_in_progress_chained,
+            query.status(TaskStatus.IN_PROGRESS)
+            .priority(TaskPriority.HIGH)
+            .order_by("created_at", descending=True)
+            .limit(10)
+            .all,
+        ),
+    ]
+
+
+def best(function, repeat: int) -> float:
+    """Return the best time of ``repeat`` calls, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    """Time each workload both ways and print the plans."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    manager = build_manager(args.tasks)
+    print(f"{args.tasks} tasks")
+    for name, chained, query in workloads(manager):
+        assert len(chained()) == len(query())
+        print(f"\n{name}")
+        print(f"  chained {best(chained, args.repeat):9.2f} ms")
+        print(f"  query   {best(query, args.repeat):9.2f} ms")
+        print("  " + str(query.__self__.explain()).replace("\n", "\n  "))
+
+
+if __name__ == "__main__":
+    main()
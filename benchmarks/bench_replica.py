@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+"""
+Read-replica benchmark: publishing N tasks to shared memory for other processes.
+
+- publish: how long publish() pauses the calling thread (the fork), how
+  long until the epoch is readable, and the size of the block.
+- writes: update_task latency in the main process while idle and while
+  an epoch is being encoded by the forked child.
+- readers: a spawned reader process attaches a TaskReplica and runs
+  get_statistics, a priority filter and point reads on it. The alternative
+  of handing the reader a private copy is timed as dump_binary plus
+  load_binary, and the same reads on the in-process manager are the
+  reference.
+
+Run: python benchmarks/bench_replica.py [--tasks 1000000] [--seconds 2]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import (  # noqa: E402
+    ReplicaPublisher,
+    TaskManager,
+    TaskPriority,
+    TaskReplica,
+    ThreadSafeTaskManager,
+)
+from src.task_manager.snapshot import encode_snapshot  # noqa: E402
+
+BATCH = 50_000
+POINT_READS = 10_000
+
+
+def fill(manager, count: int) -> None:
+    """Bulk-add ``count`` tasks with mixed priorities."""
+    for first in range(0, count, BATCH):
+        manager.add_tasks(
+            {"title": f"Task {i}", "priority": TaskPriority(i % 4 + 1)}
+            for i in range(first, min(first + BATCH, count))
+        )
+
+
+def timed(operation) -> float:
+    """Return the seconds one call of ``operation()`` takes."""
+    started = time.perf_counter()
+    operation()
+    return time.perf_counter() - started
+
+
+def run_reads(manager, count: int) -> dict:
+    """Time statistics, a filter and point reads; return seconds per workload."""
+    rng = random.Random(0)
+    ids = [rng.randint(1, count) for _ in range(POINT_READS)]
+
+    def points():
+        for task_id in ids:
+            manager.get_task(task_id)
+
+    return {
+        "stats": timed(manager.get_statistics),
+        "filter": timed(lambda: manager.get_tasks_by_priority(TaskPriority.CRITICAL)),
+        "points": timed(points),
+    }
+
+
+def reader(name: str, count: int, results) -> None:
+    """Attach to the publisher from a fresh process and report the timings."""
+    started = time.perf_counter()
+    replica = TaskReplica(name)
+    attach = time.perf_counter() - started
+    timings = run_reads(replica, count)
+    timings["attach"] = attach
+    replica.close()
+    results.put(timings)
+
+
+def write_latencies(manager, count: int, seconds: float) -> list:
+    """Update random tasks for ``seconds`` and return each call's latency."""
+    rng = random.Random(1)
+    latencies = []
+    clock = time.perf_counter
+    deadline = clock() + seconds
+    while clock() < deadline:
+        task_id = rng.randint(1, count)
+        started = clock()
+        manager.update_task(task_id, description="Edited")
+        latencies.append(clock() - started)
+    return latencies
+
+
+def summary(latencies: list) -> str:
+    """Format the call count and p50/p99/max latency in milliseconds."""
+    latencies = sorted(latencies)
+
+    def at(fraction: float) -> float:
+        return latencies[min(int(len(latencies) * fraction), len(latencies) - 1)] * 1000
+
+    return f"{len(latencies):>9} {at(0.5):>9.4f} {at(0.99):>9.4f} {latencies[-1] * 1000:>9.2f}"
+
+
+def main() -> None:
+    """Publish a filled manager and print the three sections."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--seconds", type=float, default=2.0, help="time per write workload")
+    args = parser.parse_args()
+
+    manager = ThreadSafeTaskManager()
+    fill(manager, args.tasks)
+    name = f"tmbench{os.getpid()}"
+    print(f"{args.tasks} tasks, {os.cpu_count()} CPUs")
+
+    with ReplicaPublisher(manager, name) as publisher:
+        pause = timed(publisher.publish)
+        publisher.stop()
+        readable = timed(lambda: publisher.publish(wait=True))
+        size = sum(len(chunk) for chunk in encode_snapshot(manager.get_all_tasks(), 0, 0))
+        print("\npublish")
+        print(f"  fork pause of the caller    {pause * 1000:>9.1f} ms")
+        print(f"  until the epoch is readable {readable * 1000:>9.1f} ms")
+        print(f"  epoch block size            {size / 1e6:>9.1f} MB")
+
+        print(f"\nwrites {'':<20} {'updates':>9} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+        idle = write_latencies(manager, args.tasks, args.seconds)
+        print(f"  {'idle':<25} {summary(idle)}")
+        publisher.publish()
+        busy = write_latencies(manager, args.tasks, args.seconds)
+        publisher.stop()
+        print(f"  {'while publishing':<25} {summary(busy)}")
+
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+        process = context.Process(target=reader, args=(name, args.tasks, results))
+        process.start()
+        replica = results.get()
+        process.join()
+
+    data = manager.dump_binary()
+    copy = TaskManager()
+    load = timed(lambda: copy.load_binary(data))
+    local = run_reads(manager, args.tasks)
+
+    print(
+        f"\nreaders {'':<19} {'attach s':>9} {'stats s':>9} {'filter s':>9} "
+        f"{'{} gets s'.format(POINT_READS):>12}"
+    )
+    print(
+        f"  {'replica, other process':<25} {replica['attach']:>9.4f} {replica['stats']:>9.4f} "
+        f"{replica['filter']:>9.3f} {replica['points']:>12.3f}"
+    )
+    print(f"  {'private copy, load_binary':<25} {load:>9.4f}")
+    print(
+        f"  {'in-process manager':<25} {'':>9} {local['stats']:>9.4f} "
+        f"{local['filter']:>9.3f} {local['points']:>12.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Search benchmark: inverted index vs substring scan over get_all_tasks().
+
+Run: python benchmarks/bench_search.py [--tasks 1000000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import TaskManager  # noqa: E402
+
+VERBS = ["fix", "write", "review", "deploy", "update", "test", "plan", "document"]
+NOUNS = ["login", "api", "release", "database", "invoice", "dashboard", "cache", "report"]
+# A long tail of rarer words, as in real task text.
+TAIL = [f"ticket{i}" for i in range(50_000)]
+
+QUERIES = ["invoice", "deploy cache", "ticket123", "fix login OR review report", "ticket7 api"]
+
+
+def build_manager(count: int) -> TaskManager:
+    """Build a manager whose tasks use a mix of common and rare words."""
+    rng = random.Random(42)
+    manager = TaskManager()
+    manager.add_tasks(
+        {
+            "title": f"{rng.choice(VERBS)} {rng.choice(NOUNS)} {rng.choice(TAIL)}",
+            "description": f"{rng.choice(NOUNS)} {rng.choice(TAIL)} follow-up",
+        }
+        for _ in range(count)
+    )
+    return manager
+
+
+def scan(manager: TaskManager, query: str) -> list:
+    """Match every AND term by substring, the way callers searched before."""
+    terms = query.lower().split()
+    return [
+        task
+        for task in manager.get_all_tasks()
+        if all(term in f"{task.title} {task.description}".lower() for term in terms)
+    ]
+
+
+def best(function, repeat: int) -> float:
+    """Return the best time of ``repeat`` calls, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    """Build the index once, then time each query with and without it."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    manager = build_manager(args.tasks)
+    start = time.perf_counter()
+    manager.search("warm up")
+    print(f"{args.tasks} tasks, index built in {time.perf_counter() - start:.1f} s")
+
+    print(f"{'query':>28} {'hits':>7} {'top10 ms':>9} {'all ms':>8} {'scan ms':>9}")
+    for query in QUERIES:
+        hits = len(manager.search(query))
+        top = best(lambda: manager.search(query, limit=10), args.repeat)
+        full = best(lambda: manager.search(query), args.repeat)
+        scanned = best(lambda: scan(manager, query), 1) if " OR " not in query else float("nan")
+        print(f"{query:>28} {hits:>7} {top:>9.2f} {full:>8.2f} {scanned:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
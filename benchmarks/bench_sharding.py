@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+"""
+Sharding benchmark: ShardedTaskManager throughput from 1 to 8 shards.
+
+For each shard count, N tasks are bulk-added, then three workloads run:
+
+- scan: get_statistics(verify=True), a full scan that every shard runs
+  on its share in parallel
+- filter: get_tasks_by_priority, scanned on the shards and merged here
+- point: get_task / mark_task_in_progress / update_task from several
+  client threads, each call routed to one shard
+
+An in-process ThreadSafeTaskManager is the baseline. Speedups need as
+many free cores as shards; the CPU count is printed with the results.
+
+Run: python benchmarks/bench_sharding.py [--tasks 1000000] [--shards 1 2 4 8] [--clients 8]
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import (  # noqa: E402
+    ShardedTaskManager,
+    TaskNotFoundError,
+    TaskPriority,
+    ThreadSafeTaskManager,
+    ValidationError,
+)
+
+BATCH = 50_000
+
+
+def fill(manager, count: int) -> float:
+    """Bulk-add ``count`` tasks and return the seconds taken."""
+    started = time.perf_counter()
+    for first in range(0, count, BATCH):
+        manager.add_tasks(
+            {"title": f"Task {i}", "priority": TaskPriority(i % 4 + 1)}
+            for i in range(first, min(first + BATCH, count))
+        )
+    return time.perf_counter() - started
+
+
+def rate(operation, seconds: float) -> float:
+    """Call ``operation()`` repeatedly for about ``seconds`` and return calls/s."""
+    calls = 0
+    started = time.perf_counter()
+    while True:
+        operation()
+        calls += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= seconds:
+            return calls / elapsed
+
+
+def point_rate(manager, count: int, clients: int, seconds: float) -> float:
+    """Run point operations from ``clients`` threads and return the total ops/s."""
+    totals = [0] * clients
+    deadline = time.perf_counter() + seconds
+
+    def client(index):
+        rng = random.Random(index)
+        done = 0
+        while time.perf_counter() < deadline:
+            task_id = rng.randint(1, count)
+            roll = rng.random()
+            try:
+                if roll < 0.8:
+                    manager.get_task(task_id)
+                elif roll < 0.9:
+                    manager.mark_task_in_progress(task_id)
+                else:
+                    manager.update_task(task_id, description=f"Touched by {index}")
+            except (TaskNotFoundError, ValidationError):
+                pass
+            done += 1
+        totals[index] = done
+
+    threads = [threading.Thread(target=client, args=(index,)) for index in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(totals) / seconds
+
+
+def measure(manager, args) -> tuple:
+    """Return (fill s, scans/s, filters/s, point ops/s) for one manager."""
+    fill_seconds = fill(manager, args.tasks)
+    scans = rate(lambda: manager.get_statistics(verify=True), args.seconds)
+    filters = rate(lambda: manager.get_tasks_by_priority(TaskPriority.CRITICAL), args.seconds)
+    points = point_rate(manager, args.tasks, args.clients, args.seconds)
+    assert manager.get_task_count() == args.tasks
+    return fill_seconds, scans, filters, points
+
+
+def main() -> None:
+    """Measure the baseline and every shard count and print the table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--clients", type=int, default=8, help="threads issuing point operations")
+    parser.add_argument("--seconds", type=float, default=3.0, help="time per workload")
+    args = parser.parse_args()
+
+    print(f"{args.tasks} tasks, {os.cpu_count()} CPUs, {args.clients} point-operation clients")
+    print(
+        f"{'manager':<14} {'fill s':>8} {'scans/s':>9} {'x':>5} "
+        f"{'filters/s':>10} {'x':>5} {'point ops/s':>12} {'x':>5}"
+    )
+
+    def row(name, results, base):
+        fill_seconds, scans, filters, points = results
+        print(
+            f"{name:<14} {fill_seconds:>8.2f} {scans:>9.2f} {scans / base[1]:>5.1f} "
+            f"{filters:>10.2f} {filters / base[2]:>5.1f} "
+            f"{points:>12.0f} {points / base[3]:>5.1f}"
+        )
+
+    baseline = measure(ThreadSafeTaskManager(), args)
+    row("in-process", baseline, baseline)
+    for shards in args.shards:
+        with ShardedTaskManager(shards=shards) as manager:
+            row(f"{shards} shard(s)", measure(manager, args), baseline)
+
+
+if __name__ == "__main__":
+    main()
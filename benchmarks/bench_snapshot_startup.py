@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""
+Cold-start benchmark: JSON reload and log replay vs an mmap'ed binary snapshot.
+
+Run: python benchmarks/bench_snapshot_startup.py [--tasks 1000000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import TaskManager, TaskPriority, WriteAheadLog  # noqa: E402
+from src.task_manager.codec import decode_task, encode_task  # noqa: E402
+
+
+def build_manager(count: int, wal=None) -> TaskManager:
+    """Build a manager holding ``count`` tasks with mixed priorities and deadlines."""
+    due_date = datetime.now() + timedelta(days=30)
+    priorities = list(TaskPriority)
+    manager = TaskManager(wal=wal)
+    manager.add_tasks(
+        {
+            "title": f"Imported task {i}",
+            "description": "Imported from upstream",
+            "priority": priorities[i % len(priorities)],
+            "due_date": due_date + timedelta(minutes=i) if i % 3 == 0 else None,
+        }
+        for i in range(count)
+    )
+    return manager
+
+
+def timed(function):
+    """Call ``function`` and return (seconds, result)."""
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def load_json(path: str) -> TaskManager:
+    """Rebuild a manager from a JSON dump of encoded tasks."""
+    with open(path) as json_file:
+        rows = json.load(json_file)
+    manager = TaskManager()
+    manager._store.add_many([decode_task(row) for row in rows])
+    manager._next_id = len(rows) + 1
+    return manager
+
+
+def main() -> None:
+    """Write every format once, then time a cold start from each."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "tasks.json")
+        log_path = os.path.join(directory, "tasks.wal")
+        snapshot_path = os.path.join(directory, "tasks.snap")
+
+        wal = WriteAheadLog(log_path, group_commit_size=10_000, group_commit_interval=None)
+        manager = build_manager(args.tasks, wal=wal)
+        manager.close()
+        with open(json_path, "w") as json_file:
+            json.dump([encode_task(task) for task in manager.get_all_tasks()], json_file)
+        manager.save_snapshot(snapshot_path)
+
+        print(f"{args.tasks} tasks")
+        for name, path in (("json", json_path), ("log", log_path), ("snapshot", snapshot_path)):
+            print(f"  {name:>8} file {os.path.getsize(path) / 2**20:>8.1f} MiB")
+
+        replay_wal = WriteAheadLog(log_path + ".replay", group_commit_interval=None)
+        os.replace(log_path, replay_wal.path)
+        results = [
+            ("json reload", timed(lambda: load_json(json_path))),
+            ("log replay", timed(lambda: TaskManager(wal=replay_wal))),
+            ("mmap snapshot", timed(lambda: TaskManager.from_snapshot(snapshot_path))),
+        ]
+
+        print(f"{'start from':>14} {'open s':>8} {'+stats s':>9} {'+get s':>8}")
+        for name, (open_seconds, loaded) in results:
+            stats_seconds, _ = timed(loaded.get_statistics)
+            get_seconds, _ = timed(lambda: loaded.get_task(args.tasks // 2))
+            print(f"{name:>14} {open_seconds:>8.3f} {stats_seconds:>9.3f} {get_seconds:>8.5f}")
+            loaded.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Memory benchmark: bytes per task for the former dataclass layout vs the slotted Task.
+
+Run: python benchmarks/bench_task_memory.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import Task, TaskPriority, TaskStatus  # noqa: E402
+
+
+@dataclass
+class LegacyTask:
+    """Replica of the original dataclass layout (per-instance __dict__)."""
+
+    task_id: int
+    title: str
+    description: str = ""
+    status: TaskStatus = TaskStatus.PENDING
+    priority: TaskPriority = TaskPriority.MEDIUM
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    due_date: Optional[datetime] = None
+
+
+def measure(factory, count: int) -> float:
+    """Return the traced bytes per task needed to hold ``count`` tasks."""
+    # Titles and descriptions are shared so only the task layout is measured.
+    title = "Benchmark task"
+    description = "Shared description"
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    tasks = [factory(task_id=i, title=title, description=description) for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del tasks
+    return used / count
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**4, 10**5, 10**6])
+    args = parser.parse_args()
+
+    print(f"{'tasks':>10} {'legacy B/task':>14} {'slotted B/task':>15} {'saving':>8}")
+    for count in args.sizes:
+        legacy = measure(LegacyTask, count)
+        slotted = measure(Task, count)
+        saving = (1 - slotted / legacy) * 100
+        print(f"{count:>10} {legacy:>14.1f} {slotted:>15.1f} {saving:>7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+"""
+Contention benchmark: ThreadSafeTaskManager under mixed read/write loads.
+
+Each thread runs a random mix of reads (get_task, get_statistics, a
+limited priority query) and writes (status changes, renames, adds).
+Throughput and p50/p99 latencies are reported for the reader/writer lock
+and for one exclusive lock, then the store's invariants are checked.
+
+Run: python benchmarks/bench_thread_safety.py [--tasks 100000] [--threads 8] [--ops 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import (  # noqa: E402
+    TaskPriority,
+    TaskStatus,
+    ThreadSafeTaskManager,
+    ValidationError,
+)
+
+READ_RATIOS = (0.5, 0.9, 0.99)
+
+
+def build_manager(count: int, exclusive: bool) -> ThreadSafeTaskManager:
+    """Build a manager; ``exclusive`` makes reads take the write lock too."""
+    manager = ThreadSafeTaskManager()
+    manager.add_tasks({"title": f"Task {i}"} for i in range(count))
+    if exclusive:
+        manager._read_guard = manager._lock.write
+    return manager
+
+
+def read(manager: ThreadSafeTaskManager, rng: random.Random, task_count: int) -> None:
+    """Run one read operation."""
+    choice = rng.random()
+    if choice < 0.8:
+        manager.get_task(rng.randint(1, task_count))
+    elif choice < 0.95:
+        manager.get_statistics()
+    else:
+        manager.query().priority(TaskPriority.HIGH).limit(10).all()
+
+
+def write(manager: ThreadSafeTaskManager, rng: random.Random, task_count: int) -> None:
+    """Run one write operation."""
+    choice = rng.random()
+    task_id = rng.randint(1, task_count)
+    try:
+        if choice < 0.4:
+            manager.mark_task_in_progress(task_id)
+        elif choice < 0.6:
+            manager.mark_task_completed(task_id)
+        elif choice < 0.9:
+            manager.update_task(task_id, priority=rng.choice(list(TaskPriority)))
+        else:
+            manager.add_task("Added under load")
+    except ValidationError:
+        pass
+
+
+def percentile(samples: list, fraction: float) -> float:
+    """Return a percentile of sorted samples, in microseconds."""
+    if not samples:
+        return float("nan")
+    return samples[min(int(len(samples) * fraction), len(samples) - 1)] * 1e6
+
+
+def run(manager: ThreadSafeTaskManager, threads: int, ops: int, read_ratio: float, tasks: int):
+    """Run the mix on every thread; return ops/s and sorted read and write latencies."""
+    reads, writes = [], []
+    start_barrier = threading.Barrier(threads)
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        read_times, write_times = [], []
+        clock = time.perf_counter
+        start_barrier.wait()
+        for _ in range(ops):
+            is_read = rng.random() < read_ratio
+            started = clock()
+            if is_read:
+                read(manager, rng, tasks)
+                read_times.append(clock() - started)
+            else:
+                write(manager, rng, tasks)
+                write_times.append(clock() - started)
+        reads.extend(read_times)
+        writes.extend(write_times)
+
+    workers = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return threads * ops / elapsed, sorted(reads), sorted(writes)
+
+
+def check_invariants(manager: ThreadSafeTaskManager) -> None:
+    """Fail loudly if counters, status buckets or IDs disagree with the tasks."""
+    manager.get_statistics(verify=True)
+    tasks = manager.get_all_tasks()
+    ids = [task.task_id for task in tasks]
+    assert len(ids) == len(set(ids)) == manager.get_task_count(), "duplicate or lost IDs"
+    for status in TaskStatus:
+        bucket = manager.get_tasks_by_status(status)
+        assert all(task.status is status for task in bucket), f"{status} bucket is stale"
+
+
+def main() -> None:
+    """Run every read ratio with both locking modes and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=20_000, help="operations per thread")
+    args = parser.parse_args()
+
+    print(f"{args.tasks} tasks, {args.threads} threads x {args.ops} ops")
+    print(
+        f"{'reads':>6} {'lock':>10} {'ops/s':>9} {'read p50':>9} {'read p99':>9} "
+        f"{'write p50':>10} {'write p99':>10}"
+    )
+    for read_ratio in READ_RATIOS:
+        for mode, exclusive in (("rw", False), ("exclusive", True)):
+            manager = build_manager(args.tasks, exclusive)
+            rate, reads, writes = run(manager, args.threads, args.ops, read_ratio, args.tasks)
+            check_invariants(manager)
+            print(
+                f"{read_ratio:>6.0%} {mode:>10} {rate:>9.0f} "
+                f"{percentile(reads, 0.5):>7.0f}us {percentile(reads, 0.99):>7.0f}us "
+                f"{percentile(writes, 0.5):>8.0f}us {percentile(writes, 0.99):>8.0f}us"
+            )
+    print("invariants: ok")
+
+
+if __name__ == "__main__":
+    main()
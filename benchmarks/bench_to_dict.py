@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Serialization benchmark: repeated full-store to_dict, uncached vs version-cached.
+
+Run: python benchmarks/bench_to_dict.py [--tasks 100000] [--rounds 5] [--churn 0.01]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import TaskManager, TaskPriority  # noqa: E402
+
+
+def uncached_to_dict(task) -> dict:
+    """Serialize a task the way to_dict did before caching."""
+    return {
+        "task_id": task.task_id,
+        "title": task.title,
+        "description": task.description,
+        "status": task.status.value,
+        "priority": task.priority.value,
+        "created_at": task.created_at.isoformat(),
+        "updated_at": task.updated_at.isoformat(),
+        "due_date": task.due_date.isoformat() if task.due_date else None,
+        "is_overdue": task.is_overdue(),
+    }
+
+
+def build_manager(count: int) -> TaskManager:
+    """Build a manager holding ``count`` tasks, a third of them with deadlines."""
+    due_date = datetime.now() + timedelta(days=30)
+    priorities = list(TaskPriority)
+    manager = TaskManager()
+    manager.add_tasks(
+        {
+            "title": f"Task {i}",
+            "description": "Generated for the serialization benchmark",
+            "priority": priorities[i % len(priorities)],
+            "due_date": due_date + timedelta(minutes=i) if i % 3 == 0 else None,
+        }
+        for i in range(count)
+    )
+    return manager
+
+
+def run(manager: TaskManager, serialize, rounds: int, churn: float) -> float:
+    """Serialize every task ``rounds`` times, touching a ``churn`` share in between."""
+    tasks = manager.get_all_tasks()
+    step = max(1, int(1 / churn)) if churn else 0
+    start = time.perf_counter()
+    for round_number in range(rounds):
+        for task in tasks:
+            serialize(task)
+        if step:
+            for task in tasks[round_number % step :: step]:
+                task.update_description(f"Touched in round {round_number}")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print per-round timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--churn", type=float, default=0.01)
+    args = parser.parse_args()
+
+    uncached = run(build_manager(args.tasks), uncached_to_dict, args.rounds, args.churn)
+    cached = run(build_manager(args.tasks), lambda task: task.to_dict(), args.rounds, args.churn)
+
+    print(f"{args.tasks} tasks, {args.rounds} rounds, {args.churn:.0%} changed per round")
+    print(f"{'variant':>9} {'total s':>8} {'per round s':>12} {'tasks/s':>11}")
+    for name, seconds in (("uncached", uncached), ("cached", cached)):
+        print(
+            f"{name:>9} {seconds:>8.3f} {seconds / args.rounds:>12.3f} "
+            f"{args.tasks * args.rounds / seconds:>11.0f}"
+        )
+    print(f"speedup: {uncached / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
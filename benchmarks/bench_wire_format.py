@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+Wire format benchmark: size and encode/decode throughput, binary vs JSON.
+
+Run: python benchmarks/bench_wire_format.py [--tasks 100000] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import Task, TaskPriority, TaskStatus, wire  # noqa: E402
+
+
+def make_tasks(count: int) -> list:
+    """Build tasks with distinct timestamps and mixed priorities, statuses and deadlines."""
+    now = datetime.now()
+    priorities = list(TaskPriority)
+    statuses = list(TaskStatus)
+    tasks = []
+    for i in range(count):
+        created = now - timedelta(seconds=i, microseconds=i)
+        tasks.append(
+            Task(
+                task_id=i + 1,
+                title=f"Task {i}",
+                description="Moved between services",
+                status=statuses[i % len(statuses)],
+                priority=priorities[i % len(priorities)],
+                created_at=created,
+                updated_at=created + timedelta(minutes=i % 7) if i % 2 else created,
+                due_date=now + timedelta(days=i % 30, seconds=i) if i % 3 == 0 else None,
+            )
+        )
+    return tasks
+
+
+def json_encode(tasks: list) -> bytes:
+    """Encode tasks as a JSON array of to_dict() objects."""
+    return json.dumps([task.to_dict() for task in tasks]).encode()
+
+
+def json_decode(data: bytes) -> list:
+    """Decode a JSON array back into Task objects."""
+    return [
+        Task._restore(
+            item["task_id"],
+            item["title"],
+            item["description"],
+            TaskStatus(item["status"]),
+            TaskPriority(item["priority"]),
+            datetime.fromisoformat(item["created_at"]),
+            datetime.fromisoformat(item["updated_at"]),
+            datetime.fromisoformat(item["due_date"]) if item["due_date"] else None,
+        )
+        for item in json.loads(data)
+    ]
+
+
+def json_priorities(data: bytes) -> list:
+    """Read one field of every task from JSON (the whole document must be parsed)."""
+    return [item["priority"] for item in json.loads(data)]
+
+
+def binary_priorities(data: bytes) -> list:
+    """Read one field of every task lazily from the binary batch."""
+    return [view.priority for view in wire.TaskBatchView(data)]
+
+
+def best(function, argument, repeat: int) -> float:
+    """Return the best time of ``repeat`` calls."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(argument)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print size and throughput for each format."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.tasks)
+    json_data = json_encode(tasks)
+    binary_data = wire.pack_tasks(tasks)
+    assert wire.TaskBatchView(binary_data).to_tasks() == json_decode(json_data) == tasks
+
+    rows = [
+        (
+            "json",
+            len(json_data),
+            best(json_encode, tasks, args.repeat),
+            best(json_decode, json_data, args.repeat),
+            best(json_priorities, json_data, args.repeat),
+        ),
+        (
+            "binary",
+            len(binary_data),
+            best(wire.pack_tasks, tasks, args.repeat),
+            best(lambda data: wire.TaskBatchView(data).to_tasks(), binary_data, args.repeat),
+            best(binary_priorities, binary_data, args.repeat),
+        ),
+    ]
+
+    print(f"{args.tasks} tasks, best of {args.repeat}")
+    print(f"{'format':>7} {'bytes/task':>11} {'encode/s':>11} {'decode/s':>11} {'1 field/s':>11}")
+    for name, size, encode, decode, one_field in rows:
+        print(
+            f"{name:>7} {size / args.tasks:>11.1f} {args.tasks / encode:>11.0f} "
+            f"{args.tasks / decode:>11.0f} {args.tasks / one_field:>11.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Work queue benchmark: claim_next vs listing and sorting the pending tasks per claim.
+
+Run: python benchmarks/bench_work_queue.py [--sizes 10000 100000 1000000] [--claims 1000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task_manager import TaskManager, TaskPriority, TaskStatus  # noqa: E402
+
+# Claims timed with the sorting approach, which costs O(n log n) each.
+SORT_CLAIMS = 5
+
+
+def build_manager(count: int) -> TaskManager:
+    """Build a manager with mixed priorities and deadlines."""
+    rng = random.Random(42)
+    priorities = list(TaskPriority)
+    now = datetime.now()
+    manager = TaskManager()
+    manager.add_tasks(
+        {
+            "title": f"Task {i}",
+            "priority": rng.choice(priorities),
+            "due_date": now + timedelta(hours=1, minutes=rng.randrange(100_000)) if i % 3 else None,
+        }
+        for i in range(count)
+    )
+    return manager
+
+
+def sort_key(task):
+    """Order tasks the way workers sorted them before the queue existed."""
+    return -task.priority.value, task.due_date or datetime.max, task.created_at
+
+
+def claim_by_sorting(manager: TaskManager) -> None:
+    """Take the best pending task by sorting every pending task."""
+    pending = manager.get_tasks_by_status(TaskStatus.PENDING)
+    pending.sort(key=sort_key)
+    manager.mark_task_in_progress(pending[0].task_id)
+
+
+def per_claim_ms(function, claims: int) -> float:
+    """Return the mean time of ``claims`` calls, in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(claims):
+        function()
+    return (time.perf_counter() - start) / claims * 1000
+
+
+def threaded_claims_per_second(manager: TaskManager, threads: int, claims: int) -> float:
+    """Claim and complete tasks from several threads, returning the total rate."""
+    work_queue = manager.work_queue()
+
+    def worker(worker_id: str) -> None:
+        for _ in range(claims):
+            task = work_queue.claim_next(worker_id, 30)
+            work_queue.complete(task.task_id, worker_id)
+
+    workers = [threading.Thread(target=worker, args=(f"w{i}",)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return threads * claims / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Time single claims at each size, then claim-and-complete from 4 threads."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--claims", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'tasks':>9} {'sort ms':>9} {'queue build ms':>15} {'claim ms':>9} {'4 threads/s':>12}")
+    for size in args.sizes:
+        manager = build_manager(size)
+        sort_ms = per_claim_ms(lambda: claim_by_sorting(manager), SORT_CLAIMS)
+
+        start = time.perf_counter()
+        work_queue = manager.work_queue()
+        build_ms = (time.perf_counter() - start) * 1000
+        claim_ms = per_claim_ms(lambda: work_queue.claim_next("bench", 30), args.claims)
+        rate = threaded_claims_per_second(manager, 4, args.claims // 4)
+        print(f"{size:>9} {sort_ms:>9.1f} {build_ms:>15.0f} {claim_ms:>9.4f} {rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
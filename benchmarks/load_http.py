@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+"""
+HTTP load generator for the server mode of main.py.
+
+Starts ``python main.py --serve`` on a free port (or targets --url), seeds
+tasks, then drives a request mix from several keep-alive connections for
+a fixed time and reports requests/s and latency percentiles per endpoint.
+
+Run: python benchmarks/load_http.py [--connections 16] [--duration 10] [--url http://host:port]
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (weight, name) of each request kind in the mix.
+MIX = [
+    (70, "get task"),
+    (10, "stats"),
+    (10, "create"),
+    (5, "start"),
+    (5, "list 50"),
+]
+
+
+def free_port() -> int:
+    """Return a TCP port that is free right now."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, workers: int) -> subprocess.Popen:
+    """Start main.py in server mode and wait until /readyz answers."""
+    env = dict(os.environ, TASK_HTTP_PORT=str(port), TASK_HTTP_WORKERS=str(workers))
+    env.pop("TASK_WAL_PATH", None)
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "main.py"), "--serve"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/readyz")
+            if connection.getresponse().status == 200:
+                return process
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("server did not become ready")
+
+
+def request(connection, method: str, path: str, body=None) -> int:
+    """Send one request on a kept-alive connection and return its status."""
+    payload = None if body is None else json.dumps(body)
+    connection.request(method, path, body=payload, headers={"Content-Type": "application/json"})
+    response = connection.getresponse()
+    response.read()
+    return response.status
+
+
+def seed(host: str, port: int, count: int) -> None:
+    """Create ``count`` tasks to read and update."""
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    for i in range(count):
+        request(connection, "POST", "/tasks", {"title": f"Seed task {i}", "priority": i % 4 + 1})
+    connection.close()
+
+
+def run_client(host, port, seeded, deadline, seed_value, latencies, statuses) -> None:
+    """Send the request mix on one connection until the deadline."""
+    rng = random.Random(seed_value)
+    kinds = [name for weight, name in MIX for _ in range(weight)]
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    clock = time.perf_counter
+    local = defaultdict(list)
+    local_statuses = defaultdict(int)
+    while clock() < deadline:
+        kind = rng.choice(kinds)
+        task_id = rng.randint(1, seeded)
+        started = clock()
+        if kind == "get task":
+            status = request(connection, "GET", f"/tasks/{task_id}")
+        elif kind == "stats":
+            status = request(connection, "GET", "/stats")
+        elif kind == "create":
+            status = request(connection, "POST", "/tasks", {"title": "Load test task"})
+        elif kind == "start":
+            status = request(connection, "POST", f"/tasks/{task_id}/start")
+        else:
+            status = request(connection, "GET", f"/tasks?after_id={task_id}&limit=50")
+        local[kind].append(clock() - started)
+        local_statuses[status] += 1
+    connection.close()
+    for kind, samples in local.items():
+        latencies[kind].extend(samples)
+    for status, count in local_statuses.items():
+        statuses[status] += count
+
+
+def percentile(samples: list, fraction: float) -> float:
+    """Return a percentile of sorted samples, in milliseconds."""
+    return samples[min(int(len(samples) * fraction), len(samples) - 1)] * 1000
+
+
+def main() -> None:
+    """Run the load and print throughput and latency percentiles."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", help="target server; default starts main.py --serve")
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=16, help="server pool size when spawned")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--seed-tasks", type=int, default=2000)
+    args = parser.parse_args()
+
+    process = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        process = start_server(port, args.workers)
+
+    try:
+        seed(host, port, args.seed_tasks)
+        latencies = defaultdict(list)
+        statuses = defaultdict(int)
+        deadline = time.perf_counter() + args.duration
+        clients = [
+            threading.Thread(
+                target=run_client,
+                args=(host, port, args.seed_tasks, deadline, i, latencies, statuses),
+            )
+            for i in range(args.connections)
+        ]
+        started = time.perf_counter()
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(10)
+
+    everything = sorted(sample for samples in latencies.values() for sample in samples)
+    print(f"{args.connections} connections, {elapsed:.1f} s, statuses {dict(statuses)}")
+    print(
+        f"{'endpoint':>10} {'requests':>9} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    )
+    for kind, samples in sorted(latencies.items()) + [("all", everything)]:
+        samples.sort()
+        print(
+            f"{kind:>10} {len(samples):>9} {percentile(samples, 0.5):>8.2f} "
+            f"{percentile(samples, 0.9):>8.2f} {percentile(samples, 0.99):>8.2f} "
+            f"{samples[-1] * 1000:>8.2f}"
+        )
+    print(f"throughput: {len(everything) / elapsed:.0f} requests/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,14 @@
 """
 Aplicación de línea de comandos para gestión de tareas.
 Ejecutar: python main.py
+Modo servidor HTTP: python main.py --serve
 """
 
+import atexit
 import os
+import signal
 import sys
-import time
+import threading
 from datetime import datetime, timedelta
 
 try:
@@ -23,12 +26,20 @@ except ImportError:  # por si alguien ejecuta sin instalar la librería
     Context = None
 
 from src.task_manager import (
-    TaskManager,
     TaskNotFoundError,
     TaskPriority,
     TaskStatus,
+    ThreadSafeTaskManager,
     ValidationError,
+    WriteAheadLog,
 )
+from src.task_manager.http_api import TaskServer
+
+# Tareas mostradas por pagina en "Ver todas las tareas".
+TASKS_PER_PAGE = 20
+
+# Puerto por defecto del modo servidor (el Service de Kubernetes apunta al 8000).
+DEFAULT_HTTP_PORT = 8000
 
 
 def print_separator():
@@ -125,15 +136,24 @@ def view_all_tasks(manager):
     print("TODAS LAS TAREAS")
     print_separator()
 
-    tasks = manager.get_all_tasks()
-
-    if not tasks:
+    total = manager.get_task_count()
+    if total == 0:
         print("No hay tareas registradas.")
         return
 
-    print(f"\nTotal de tareas: {len(tasks)}")
-    for task in tasks:
-        print_task(task)
+    print(f"\nTotal de tareas: {total}")
+    # Se recorre por paginas con un cursor por ID, sin copiar la lista completa.
+    after_id = 0
+    while True:
+        page = list(manager.iter_tasks(after_id=after_id, limit=TASKS_PER_PAGE))
+        for task in page:
+            print_task(task)
+        if len(page) < TASKS_PER_PAGE:
+            return
+        after_id = page[-1].task_id
+        answer = input("\nEnter para ver mas tareas, 'q' para volver al menu: ")
+        if answer.strip().lower() == "q":
+            return
 
 
 def view_tasks_by_status(manager):
@@ -438,9 +458,61 @@ def demo_mode(manager):
     print("\nUsa la opcion 2 para ver todas las tareas.")
 
 
+def build_manager():
+    """
+    Crea el gestor de tareas.
+
+    Si la variable TASK_WAL_PATH apunta a un archivo, el gestor funciona en
+    modo durable: reconstruye las tareas desde ese log y registra en el cada
+    cambio, de modo que sobreviven a reinicios del contenedor.
+
+    El gestor es seguro entre hilos para que el modo servidor lo comparta.
+    """
+    wal_path = os.getenv("TASK_WAL_PATH")
+    if not wal_path:
+        return ThreadSafeTaskManager()
+
+    manager = ThreadSafeTaskManager(wal=WriteAheadLog(wal_path))
+    atexit.register(manager.close)
+    return manager
+
+
+def serve(manager):
+    """
+    Atiende la API HTTP JSON hasta recibir SIGTERM o SIGINT.
+
+    Variables de entorno: TASK_HTTP_HOST (0.0.0.0), TASK_HTTP_PORT (8000) y
+    TASK_HTTP_WORKERS (16, conexiones atendidas a la vez).
+    """
+    host = os.getenv("TASK_HTTP_HOST", "0.0.0.0")
+    port = int(os.getenv("TASK_HTTP_PORT", DEFAULT_HTTP_PORT))
+    workers = int(os.getenv("TASK_HTTP_WORKERS", "16"))
+    server = TaskServer(manager, (host, port), max_workers=workers)
+
+    def stop(signum, frame):
+        # /readyz falla desde ya; shutdown() espera al bucle, asi que va en otro hilo.
+        server.drain()
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    print(f"[INFO] API HTTP escuchando en {server.url}")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+    print("[INFO] Servidor detenido.")
+
+
 def main():
     """Función principal de la aplicación."""
-    manager = TaskManager()
+    manager = build_manager()
+
+    if "--serve" in sys.argv[1:]:
+        if os.getenv("LOAD_DEMO", "n").strip().lower() == "s":
+            demo_mode(manager)
+        serve(manager)
+        return
 
     ld_client = None
     ld_flag_key = os.getenv("LD_FLAG_KEY", "enable-advanced-statistics")
@@ -467,11 +539,6 @@ def main():
 
         try:
             choice = input("Seleccione una opcion (0-10): ").strip()
-        except EOFError:
-            # Sin TTY (por ejemplo en Kubernetes): quedar en modo idle para evitar reinicios.
-            print("\n[INFO] Entrada no interactiva detectada. Manteniendo contenedor en ejecución.")
-            while True:
-                time.sleep(3600)
 
             if choice == "0":
                 print("\nGracias por usar el Gestor de Tareas. Hasta luego!")
@@ -513,6 +580,11 @@ def main():
             if sys.stdin.isatty():
                 input("\nPresione Enter para continuar...")
 
+        except EOFError:
+            # Sin TTY (por ejemplo en Kubernetes): atender la API HTTP en vez de quedar inactivo.
+            print("\n[INFO] Entrada no interactiva detectada. Iniciando modo servidor.")
+            serve(manager)
+            return
         except KeyboardInterrupt:
             print("\n\nInterrumpido por el usuario. Hasta luego!")
             sys.exit(0)
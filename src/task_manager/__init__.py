@@ -3,16 +3,71 @@
 __version__ = "1.0.0"
 __author__ = "Senior Dev Team"
 
-from .exceptions import DuplicateTaskError, TaskNotFoundError, ValidationError
+from .async_manager import (
+    AsyncChangeFeed,
+    AsyncFeedSubscription,
+    AsyncTaskManager,
+    AsyncTaskQuery,
+    AsyncWorkQueue,
+)
+from .change_feed import ChangeEvent, ChangeFeed, FeedSubscription
+from .columnar import ColumnarTaskStore
+from .exceptions import (
+    DuplicateTaskError,
+    FeedOverrunError,
+    LeaseError,
+    SnapshotFormatError,
+    TaskNotFoundError,
+    ValidationError,
+    VersionConflictError,
+    WireFormatError,
+)
+from .replica import ReplicaPublisher, TaskReplica
+from .results import BulkAddResult, ImportResult, TransitionResult
+from .sharded import ShardedTaskManager
+from .snapshot import SnapshotTaskStore
+from .sqlite_store import SqliteTaskStore
+from .storage import DictTaskStore, TaskStore
 from .task import Task, TaskPriority, TaskStatus
 from .task_manager import TaskManager
+from .thread_safe import ThreadSafeTaskManager
+from .wal import WriteAheadLog
+from .work_queue import Lease, WorkQueue
 
 __all__ = [
     "Task",
     "TaskStatus",
     "TaskPriority",
     "TaskManager",
+    "ThreadSafeTaskManager",
+    "AsyncChangeFeed",
+    "AsyncFeedSubscription",
+    "AsyncTaskManager",
+    "AsyncTaskQuery",
+    "AsyncWorkQueue",
+    "ShardedTaskManager",
+    "ReplicaPublisher",
+    "TaskReplica",
+    "TaskStore",
+    "DictTaskStore",
+    "ColumnarTaskStore",
+    "SnapshotTaskStore",
+    "SqliteTaskStore",
+    "BulkAddResult",
+    "TransitionResult",
+    "ImportResult",
+    "WriteAheadLog",
+    "WorkQueue",
+    "Lease",
+    "ChangeFeed",
+    "ChangeEvent",
+    "FeedSubscription",
     "TaskNotFoundError",
     "DuplicateTaskError",
+    "LeaseError",
     "ValidationError",
+    "SnapshotFormatError",
+    "WireFormatError",
+    "VersionConflictError",
+    "FeedOverrunError",
 ]
@@ -0,0 +1,442 @@
+"""Awaitable facade over a ThreadSafeTaskManager for asyncio applications."""
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from itertools import islice
+from typing import IO, AsyncIterator, Callable, Iterable, Iterator, List, Mapping, Optional, TypeVar
+
+from .change_feed import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CAPACITY,
+    ChangeEvent,
+    ChangeFeed,
+    FeedSubscription,
+)
+from .query import QueryPlan, TaskQuery
+from .results import BulkAddResult, ImportResult
+from .task import Task
+from .task_manager import TaskManager
+from .thread_safe import ThreadSafeTaskManager
+from .wal import WriteAheadLog
+from .work_queue import WorkQueue
+
+T = TypeVar("T")
+
+# Tasks fetched per executor call by the async generators.
+_PAGE_SIZE = 500
+
+# Items added per executor call by non-atomic add_tasks.
+_ADD_CHUNK_SIZE = 1000
+
+
+def _offloaded(method: Callable[..., T]) -> Callable[..., T]:
+    """Make an awaitable counterpart of a TaskManager method that runs it in the executor."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    async def offloaded(self, *args, **kwargs):
+        return await self._call(getattr(self._manager, name), *args, **kwargs)
+
+    return offloaded
+
+
+def _paginate(iterator: Iterator[T], size: int) -> List[T]:
+    """Return the next ``size`` items of an iterator."""
+    return list(islice(iterator, size))
+
+
+class AsyncTaskManager:
+    """
+    Awaitable counterpart of every public TaskManager method.
+
+    Every call runs on a worker thread of an executor (the event loop's
+    default one unless another is given). A slow scan, export or
+    persistence call does not stall the event loop. The wrapped
+    ThreadSafeTaskManager serializes the workers.
+
+    Large jobs are split so they do not hold the manager's write lock for
+    their whole run. import_jsonl and non-atomic add_tasks add one batch
+    per executor call. The iter_* methods are async generators that fetch
+    one page per call. Requests from other coroutines are served between
+    batches.
+
+    Tasks returned are the manager's live objects. Change them through
+    manager methods such as update_task, not by assigning attributes.
+    """
+
+    def __init__(
+        self,
+        manager: Optional[ThreadSafeTaskManager] = None,
+        executor: Optional[Executor] = None,
+        page_size: int = _PAGE_SIZE,
+    ):
+        """
+        Initialize an async facade.
+
+        Args:
+            manager: Manager to wrap; defaults to a new ThreadSafeTaskManager
+            executor: Executor to run calls in; defaults to the running
+                loop's default executor
+            page_size: Tasks fetched per executor call by the async generators
+
+        Raises:
+            TypeError: If the manager is not a ThreadSafeTaskManager
+            ValueError: If page_size is not positive
+        """
+        if manager is None:
+            manager = ThreadSafeTaskManager()
+        elif not isinstance(manager, ThreadSafeTaskManager):
+            raise TypeError("AsyncTaskManager needs a ThreadSafeTaskManager")
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        self._manager = manager
+        self._executor = executor
+        self._page_size = page_size
+
+    @property
+    def manager(self) -> ThreadSafeTaskManager:
+        """The wrapped manager, for synchronous use outside the event loop."""
+        return self._manager
+
+    @classmethod
+    async def from_snapshot(
+        cls, path: str, wal: Optional[WriteAheadLog] = None, **kwargs
+    ) -> "AsyncTaskManager":
+        """
+        Start a manager from a snapshot; see TaskManager.from_snapshot.
+
+        Args:
+            path: Snapshot file
+            wal: Optional write-ahead log to replay and attach
+            **kwargs: Passed to AsyncTaskManager
+
+        Returns:
+            An async facade over the loaded ThreadSafeTaskManager
+        """
+        loop = asyncio.get_running_loop()
+        manager = await loop.run_in_executor(
+            kwargs.get("executor"), ThreadSafeTaskManager.from_snapshot, path, wal
+        )
+        return cls(manager, **kwargs)
+
+    async def _call(self, function: Callable[..., T], *args, **kwargs) -> T:
+        """Run a blocking call in the executor and wait for its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(function, *args, **kwargs)
+        )
+
+    async def _paged(self, iterator: Iterator[Task]) -> AsyncIterator[Task]:
+        """Yield from a blocking iterator, fetching a page per executor call."""
+        while True:
+            page = await self._call(_paginate, iterator, self._page_size)
+            for task in page:
+                yield task
+            if len(page) < self._page_size:
+                return
+
+    # Persistence.
+    save_snapshot = _offloaded(TaskManager.save_snapshot)
+    close = _offloaded(TaskManager.close)
+    export_jsonl = _offloaded(TaskManager.export_jsonl)
+    dump_binary = _offloaded(TaskManager.dump_binary)
+    load_binary = _offloaded(TaskManager.load_binary)
+
+    # Single-task operations.
+    add_task = _offloaded(TaskManager.add_task)
+    get_task = _offloaded(TaskManager.get_task)
+    update_task = _offloaded(TaskManager.update_task)
+    delete_task = _offloaded(TaskManager.delete_task)
+    mark_task_in_progress = _offloaded(TaskManager.mark_task_in_progress)
+    mark_task_completed = _offloaded(TaskManager.mark_task_completed)
+    mark_task_cancelled = _offloaded(TaskManager.mark_task_cancelled)
+
+    # Bulk operations and scans.
+    transition_many = _offloaded(TaskManager.transition_many)
+    mark_tasks_in_progress = _offloaded(TaskManager.mark_tasks_in_progress)
+    mark_tasks_completed = _offloaded(TaskManager.mark_tasks_completed)
+    mark_tasks_cancelled = _offloaded(TaskManager.mark_tasks_cancelled)
+    get_all_tasks = _offloaded(TaskManager.get_all_tasks)
+    get_tasks_by_status = _offloaded(TaskManager.get_tasks_by_status)
+    get_tasks_by_priority = _offloaded(TaskManager.get_tasks_by_priority)
+    get_overdue_tasks = _offloaded(TaskManager.get_overdue_tasks)
+    get_tasks_due_between = _offloaded(TaskManager.get_tasks_due_between)
+    get_task_count = _offloaded(TaskManager.get_task_count)
+    get_statistics = _offloaded(TaskManager.get_statistics)
+    search = _offloaded(TaskManager.search)
+    complete_title = _offloaded(TaskManager.complete_title)
+    clear_all_tasks = _offloaded(TaskManager.clear_all_tasks)
+
+    async def add_tasks(self, items: Iterable[Mapping], atomic: bool = True) -> BulkAddResult:
+        """
+        Add a batch of new tasks; see TaskManager.add_tasks.
+
+        An atomic batch is added in one executor call, which holds the
+        write lock for the whole batch. A non-atomic batch is added
+        ``_ADD_CHUNK_SIZE`` items per call, so other requests are served in
+        between. Each chunk gets its own creation timestamp.
+
+        Args:
+            items: Task definitions to add
+            atomic: If True, add nothing and raise on the first invalid item
+
+        Returns:
+            BulkAddResult with the created tasks and, in non-atomic mode, the
+            validation message of every rejected item keyed by its position
+
+        Raises:
+            ValidationError: In atomic mode, if any item is invalid
+        """
+        if atomic:
+            return await self._call(self._manager.add_tasks, items)
+
+        result = BulkAddResult()
+        items = iter(items)
+        offset = 0
+        while True:
+            size, chunk = await self._call(self._add_chunk, items)
+            if not size:
+                return result
+            result.added.extend(chunk.added)
+            result.errors.update(
+                (offset + position, message) for position, message in chunk.errors.items()
+            )
+            offset += size
+
+    def _add_chunk(self, items: Iterator[Mapping]) -> tuple:
+        """Add the next chunk of a non-atomic add_tasks call; runs in the executor."""
+        chunk = _paginate(items, _ADD_CHUNK_SIZE)
+        if not chunk:
+            return 0, None
+        return len(chunk), self._manager.add_tasks(chunk, atomic=False)
+
+    async def import_jsonl(self, fp: IO[str], batch_size: int = 1000) -> ImportResult:
+        """
+        Add the tasks of a JSON Lines stream; see TaskManager.import_jsonl.
+
+        Each executor call reads, validates and adds one batch of lines,
+        so the write lock is released between batches.
+
+        Args:
+            fp: Readable text stream, read only from executor threads
+            batch_size: Number of lines read and added per executor call
+
+        Returns:
+            ImportResult with the number of imported tasks and the reason
+            each rejected line was skipped
+        """
+        result = ImportResult()
+        line_offset = 0
+        while True:
+            size, batch = await self._call(self._import_batch, fp, batch_size)
+            if not size:
+                return result
+            result.imported += batch.imported
+            result.errors.update(
+                (line_offset + line, reason) for line, reason in batch.errors.items()
+            )
+            line_offset += size
+
+    def _import_batch(self, fp: IO[str], batch_size: int) -> tuple:
+        """Read and import the next batch of import_jsonl; runs in the executor."""
+        lines = _paginate(fp, batch_size)
+        if not lines:
+            return 0, None
+        return len(lines), self._manager.import_jsonl(lines, batch_size)
+
+    def iter_tasks(self, *args, **kwargs) -> AsyncIterator[Task]:
+        """Iterate over tasks in ID order; see TaskManager.iter_tasks."""
+        return self._paged(self._manager.iter_tasks(*args, **kwargs))
+
+    def iter_tasks_by_status(self, *args, **kwargs) -> AsyncIterator[Task]:
+        """Iterate over the tasks with a status; see TaskManager.iter_tasks_by_status."""
+        return self._paged(self._manager.iter_tasks_by_status(*args, **kwargs))
+
+    def iter_tasks_by_priority(self, *args, **kwargs) -> AsyncIterator[Task]:
+        """Iterate over the tasks with a priority; see TaskManager.iter_tasks_by_priority."""
+        return self._paged(self._manager.iter_tasks_by_priority(*args, **kwargs))
+
+    def iter_overdue_tasks(self) -> AsyncIterator[Task]:
+        """Iterate over overdue tasks by due date; see TaskManager.iter_overdue_tasks."""
+        return self._paged(self._manager.iter_overdue_tasks())
+
+    def iter_tasks_due_between(self, *args, **kwargs) -> AsyncIterator[Task]:
+        """Iterate over open tasks due in a window; see TaskManager.iter_tasks_due_between."""
+        return self._paged(self._manager.iter_tasks_due_between(*args, **kwargs))
+
+    def query(self) -> "AsyncTaskQuery":
+        """Start a query whose results are awaited; see TaskManager.query."""
+        return AsyncTaskQuery(self, self._manager.query())
+
+    async def work_queue(self) -> "AsyncWorkQueue":
+        """Return the manager's work queue with awaitable operations."""
+        return AsyncWorkQueue(self, await self._call(self._manager.work_queue))
+
+    async def change_feed(self, capacity: int = DEFAULT_CAPACITY) -> "AsyncChangeFeed":
+        """Return the manager's change feed with awaitable reads; see TaskManager.change_feed."""
+        return AsyncChangeFeed(self, await self._call(self._manager.change_feed, capacity))
+
+
+def _builder(method: Callable[..., TaskQuery]) -> Callable[..., "AsyncTaskQuery"]:
+    """Wrap a TaskQuery builder method to return an AsyncTaskQuery."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def build(self, *args, **kwargs):
+        return AsyncTaskQuery(self._owner, getattr(self._query, name)(*args, **kwargs))
+
+    return build
+
+
+class AsyncTaskQuery:
+    """
+    TaskQuery whose evaluation is awaited.
+
+    Builder methods return new queries as in TaskQuery. all(), first(),
+    count() and explain() run in the executor, and ``async for`` fetches
+    results a page at a time.
+    """
+
+    def __init__(self, owner: AsyncTaskManager, query: TaskQuery):
+        """Wrap a query of an AsyncTaskManager's manager."""
+        self._owner = owner
+        self._query = query
+
+    status = _builder(TaskQuery.status)
+    priority = _builder(TaskQuery.priority)
+    due_between = _builder(TaskQuery.due_between)
+    text = _builder(TaskQuery.text)
+    where = _builder(TaskQuery.where)
+    order_by = _builder(TaskQuery.order_by)
+    limit = _builder(TaskQuery.limit)
+    offset = _builder(TaskQuery.offset)
+
+    async def all(self) -> List[Task]:
+        """Return every result as a list."""
+        return await self._owner._call(self._query.all)
+
+    async def first(self) -> Optional[Task]:
+        """Return the first result, or None if nothing matches."""
+        return await self._owner._call(self._query.first)
+
+    async def count(self) -> int:
+        """Return the number of results."""
+        return await self._owner._call(self._query.count)
+
+    async def explain(self) -> QueryPlan:
+        """Return the plan the query would run with right now."""
+        return await self._owner._call(self._query.explain)
+
+    def __aiter__(self) -> AsyncIterator[Task]:
+        """Evaluate the query lazily, fetching a page of results per executor call."""
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[Task]:
+        """Start the query in the executor, then page through its results."""
+        # Starting plans the query and may build the text index and sort every
+        # match, so it must not run on the event loop either. It also copies
+        # the candidates, so writes awaited between pages cannot break paging.
+        results = await self._owner._call(iter, self._query)
+        async for task in self._owner._paged(results):
+            yield task
+
+
+def _queue_call(method: Callable[..., T]) -> Callable[..., T]:
+    """Make an awaitable counterpart of a WorkQueue method."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    async def offloaded(self, *args, **kwargs):
+        return await self._owner._call(getattr(self._queue, name), *args, **kwargs)
+
+    return offloaded
+
+
+class AsyncWorkQueue:
+    """WorkQueue whose claims and lease operations are awaited."""
+
+    def __init__(self, owner: AsyncTaskManager, queue: WorkQueue):
+        """Wrap the work queue of an AsyncTaskManager's manager."""
+        self._owner = owner
+        self._queue = queue
+
+    def __len__(self) -> int:
+        """Return the number of tasks waiting to be claimed."""
+        return len(self._queue)
+
+    claim_next = _queue_call(WorkQueue.claim_next)
+    renew = _queue_call(WorkQueue.renew)
+    complete = _queue_call(WorkQueue.complete)
+    release = _queue_call(WorkQueue.release)
+    reclaim_expired = _queue_call(WorkQueue.reclaim_expired)
+    lease = _queue_call(WorkQueue.lease)
+
+
+class AsyncChangeFeed:
+    """
+    ChangeFeed whose reads are awaited.
+
+    Reads run in the executor, so one that waits for events blocks a
+    worker thread rather than the event loop; a read waiting with no
+    timeout holds its worker until an event arrives.
+    """
+
+    def __init__(self, owner: AsyncTaskManager, feed: ChangeFeed):
+        """Wrap the change feed of an AsyncTaskManager's manager."""
+        self._owner = owner
+        self._feed = feed
+
+    @property
+    def capacity(self) -> int:
+        """Number of events the feed keeps."""
+        return self._feed.capacity
+
+    @property
+    def last_sequence(self) -> int:
+        """Sequence of the newest event, 0 before the first one."""
+        return self._feed.last_sequence
+
+    @property
+    def first_sequence(self) -> int:
+        """Sequence of the oldest kept event, or of the next one while the feed is empty."""
+        return self._feed.first_sequence
+
+    async def read(
+        self, after: int, limit: int = DEFAULT_BATCH_SIZE, timeout: Optional[float] = 0
+    ) -> List[ChangeEvent]:
+        """Return the events that follow a sequence number; see ChangeFeed.read."""
+        return await self._owner._call(self._feed.read, after, limit, timeout)
+
+    def subscribe(self, after: Optional[int] = None) -> "AsyncFeedSubscription":
+        """Start reading the feed with a cursor; see ChangeFeed.subscribe."""
+        return AsyncFeedSubscription(self._owner, self._feed.subscribe(after))
+
+
+class AsyncFeedSubscription:
+    """FeedSubscription whose polls are awaited; see AsyncChangeFeed."""
+
+    def __init__(self, owner: AsyncTaskManager, subscription: FeedSubscription):
+        """Wrap a subscription to an AsyncTaskManager's change feed."""
+        self._owner = owner
+        self._subscription = subscription
+
+    @property
+    def position(self) -> int:
+        """Sequence of the last event already handled."""
+        return self._subscription.position
+
+    @position.setter
+    def position(self, value: int) -> None:
+        self._subscription.position = value
+
+    @property
+    def lag(self) -> int:
+        """Number of published events not yet returned by poll()."""
+        return self._subscription.lag
+
+    async def poll(
+        self, limit: int = DEFAULT_BATCH_SIZE, timeout: Optional[float] = 0
+    ) -> List[ChangeEvent]:
+        """Return the next batch of events and advance past it; see FeedSubscription.poll."""
+        return await self._owner._call(self._subscription.poll, limit, timeout)
@@ -0,0 +1,269 @@
+"""Bounded, sequence-numbered feed of the changes made to a TaskManager's tasks."""
+
+import threading
+from typing import Any, Iterable, List, NamedTuple, Optional
+
+from .exceptions import FeedOverrunError
+
+# Event kinds. EVENT_SET carries the field, its new value and its old value;
+# the others carry only the task ID, and EVENT_CLEAR not even that.
+EVENT_ADD = "add"
+EVENT_SET = "set"
+EVENT_DELETE = "delete"
+EVENT_CLEAR = "clear"
+
+# Events a feed keeps before overwriting the oldest.
+DEFAULT_CAPACITY = 65536
+
+# Events returned by one read unless the caller asks for another batch size.
+DEFAULT_BATCH_SIZE = 1000
+
+
+class ChangeEvent(NamedTuple):
+    """
+    One change to the tasks of a manager.
+
+    The ring itself holds plain tuples of these fields; events are built
+    when read, which keeps publishing cheap for the writer.
+
+    Attributes:
+        sequence: Position in the feed; the first event is 1 and each next one adds 1
+        kind: EVENT_ADD, EVENT_SET, EVENT_DELETE or EVENT_CLEAR
+        task_id: ID of the task concerned, None for EVENT_CLEAR
+        field: Name of the changed attribute, for EVENT_SET
+        value: New value of the attribute, for EVENT_SET
+        old_value: Value of the attribute before the change, for EVENT_SET
+    """
+
+    sequence: int
+    kind: str
+    task_id: Optional[int] = None
+    field: Optional[str] = None
+    value: Any = None
+    old_value: Any = None
+
+
+_event = ChangeEvent._make
+
+
+class ChangeFeed:
+    """
+    Ring buffer of the latest ChangeEvents of a TaskManager.
+
+    The manager publishes one event for every task it adds or deletes,
+    every attribute that changes (through its own methods, bulk
+    transitions or direct changes to owned tasks) and every clear. Events
+    are numbered consecutively and the newest ``capacity`` of them are
+    kept; older ones are overwritten.
+
+    Consumers keep the sequence of the last event they handled and read
+    the events after it in batches, with ``read`` or a FeedSubscription.
+    A read that starts before the oldest kept event raises
+    FeedOverrunError: the consumer has fallen behind and must rebuild its
+    state from the manager, then continue from ``last_sequence``.
+
+    Publishing and reading take a short lock of the feed's own, never the
+    manager's, so consumers can read from other threads while writers go
+    on. A read can wait for new events instead of polling.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialize an empty feed.
+
+        Args:
+            capacity: Number of events kept before the oldest are overwritten
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._ring: List[Optional[tuple]] = [None] * capacity
+        self._last = 0
+        # Publishers enter the plain lock, which is cheaper than entering the condition.
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        # Readers blocked in read(); publishers only notify when there are some.
+        self._waiting = 0
+
+    @property
+    def capacity(self) -> int:
+        """Number of events the feed keeps."""
+        return self._capacity
+
+    @property
+    def last_sequence(self) -> int:
+        """Sequence of the newest event, 0 before the first one."""
+        return self._last
+
+    @property
+    def first_sequence(self) -> int:
+        """Sequence of the oldest kept event, or of the next one while the feed is empty."""
+        return max(1, self._last - self._capacity + 1)
+
+    def publish(
+        self,
+        kind: str,
+        task_id: Optional[int] = None,
+        field: Optional[str] = None,
+        value: Any = None,
+        old_value: Any = None,
+    ) -> int:
+        """
+        Append one event and wake waiting readers.
+
+        Args:
+            kind: Event kind (one of the EVENT_* constants)
+            task_id: ID of the task concerned
+            field: Name of the changed attribute, for EVENT_SET
+            value: New value of the attribute, for EVENT_SET
+            old_value: Previous value of the attribute, for EVENT_SET
+
+        Returns:
+            The sequence number given to the event
+        """
+        with self._lock:
+            sequence = self._last + 1
+            self._ring[sequence % self._capacity] = (
+                sequence,
+                kind,
+                task_id,
+                field,
+                value,
+                old_value,
+            )
+            self._last = sequence
+            if self._waiting:
+                self._condition.notify_all()
+        return sequence
+
+    def publish_many(self, changes: Iterable[tuple]) -> int:
+        """
+        Append several events under one lock acquisition.
+
+        Args:
+            changes: Complete ``(kind, task_id, field, value, old_value)``
+                tuples, in order
+
+        Returns:
+            The sequence number of the last event
+        """
+        with self._lock:
+            ring = self._ring
+            capacity = self._capacity
+            sequence = self._last
+            for change in changes:
+                sequence += 1
+                ring[sequence % capacity] = (sequence, *change)
+            self._last = sequence
+            if self._waiting:
+                self._condition.notify_all()
+        return sequence
+
+    def read(
+        self,
+        after: int,
+        limit: int = DEFAULT_BATCH_SIZE,
+        timeout: Optional[float] = 0,
+    ) -> List[ChangeEvent]:
+        """
+        Return the events that follow a sequence number, oldest first.
+
+        Args:
+            after: Sequence of the last event already handled (0 for the start)
+            limit: Largest number of events to return
+            timeout: Seconds to wait for an event if none follows ``after``;
+                0 returns at once and None waits indefinitely
+
+        Returns:
+            Up to ``limit`` consecutive events starting at ``after + 1``;
+            empty if none arrived in time
+
+        Raises:
+            FeedOverrunError: If events after ``after`` were already overwritten
+        """
+        with self._condition:
+            if timeout != 0 and self._last <= after:
+                self._waiting += 1
+                try:
+                    self._condition.wait_for(lambda: self._last > after, timeout)
+                finally:
+                    self._waiting -= 1
+            first = self.first_sequence
+            if after + 1 < first:
+                raise FeedOverrunError(after, first)
+            start = after + 1
+            stop = min(self._last, after + limit)
+            if start > stop:
+                return []
+            low = start % self._capacity
+            high = stop % self._capacity
+            if low <= high:
+                changes = self._ring[low : high + 1]
+            else:
+                changes = self._ring[low:] + self._ring[: high + 1]
+        return [_event(change) for change in changes]
+
+    def subscribe(self, after: Optional[int] = None) -> "FeedSubscription":
+        """
+        Start reading the feed with a cursor that tracks its position.
+
+        Args:
+            after: Sequence of the last event already handled; by default
+                the newest one, so only later changes are delivered
+
+        Returns:
+            A FeedSubscription positioned after ``after``
+        """
+        return FeedSubscription(self, self._last if after is None else after)
+
+
+class FeedSubscription:
+    """
+    A consumer's position in a ChangeFeed.
+
+    poll() returns the next batch of events and moves the position past
+    them. When it raises FeedOverrunError the position is left where it
+    was; the consumer rebuilds its state and assigns
+    ``feed.last_sequence`` (read before rebuilding) to ``position``.
+    """
+
+    def __init__(self, feed: ChangeFeed, position: int):
+        """
+        Initialize a subscription.
+
+        Args:
+            feed: Feed to read
+            position: Sequence of the last event already handled
+        """
+        self.feed = feed
+        self.position = position
+
+    @property
+    def lag(self) -> int:
+        """Number of published events not yet returned by poll()."""
+        return self.feed.last_sequence - self.position
+
+    def poll(
+        self, limit: int = DEFAULT_BATCH_SIZE, timeout: Optional[float] = 0
+    ) -> List[ChangeEvent]:
+        """
+        Return the next batch of events and advance past it.
+
+        Args:
+            limit: Largest number of events to return
+            timeout: Seconds to wait when no event is pending; 0 returns at
+                once and None waits indefinitely
+
+        Returns:
+            Up to ``limit`` events in sequence order
+
+        Raises:
+            FeedOverrunError: If the subscription fell behind the oldest kept event
+        """
+        events = self.feed.read(self.position, limit, timeout)
+        if events:
+            self.position = events[-1].sequence
+        return events
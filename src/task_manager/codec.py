@@ -0,0 +1,217 @@
+"""Compact numeric encodings of task fields shared by storage engines."""
+
+import struct
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .task import TASK_FIELDS, Task, TaskPriority, TaskStatus
+
+# Timestamps are stored as whole microseconds since the (naive) Unix epoch,
+# which round-trips naive datetimes exactly.
+EPOCH = datetime(1970, 1, 1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Sentinel for "no due date"; the largest int64 sorts after every real date,
+# so "due before X" comparisons exclude it without a separate check.
+NO_DATE = 2**63 - 1
+
+STATUSES = tuple(TaskStatus)
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+# Lookup by code that, unlike indexing STATUSES, rejects negative codes.
+STATUSES_BY_CODE = dict(enumerate(STATUSES))
+
+PRIORITIES = {priority.value: priority for priority in TaskPriority}
+
+
+def datetime_to_micros(moment: datetime) -> int:
+    """Encode a naive datetime as microseconds since the epoch."""
+    # Plain integer arithmetic on the normalized timedelta is faster than
+    # dividing by ONE_MICROSECOND and gives the same result.
+    delta = moment - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def micros_to_datetime(micros: int) -> datetime:
+    """Decode microseconds since the epoch into a naive datetime."""
+    return EPOCH + timedelta(0, 0, micros)
+
+
+def optional_datetime_to_micros(moment: Optional[datetime]) -> int:
+    """Encode an optional datetime, using NO_DATE for None."""
+    return NO_DATE if moment is None else datetime_to_micros(moment)
+
+
+def micros_to_optional_datetime(micros: int) -> Optional[datetime]:
+    """Decode an optional datetime encoded by optional_datetime_to_micros."""
+    return None if micros == NO_DATE else micros_to_datetime(micros)
+
+
+def _identity(value):
+    """Return the value unchanged."""
+    return value
+
+
+# Task field -> function turning the attribute value into a compact plain value.
+FIELD_ENCODERS = {
+    "task_id": _identity,
+    "title": _identity,
+    "description": _identity,
+    "status": STATUS_CODES.__getitem__,
+    "priority": attrgetter("value"),
+    "created_at": datetime_to_micros,
+    "updated_at": datetime_to_micros,
+    "due_date": optional_datetime_to_micros,
+}
+
+# Task field -> inverse of its FIELD_ENCODERS entry.
+FIELD_DECODERS = {
+    "task_id": _identity,
+    "title": _identity,
+    "description": _identity,
+    "status": STATUSES_BY_CODE.__getitem__,
+    "priority": PRIORITIES.__getitem__,
+    "created_at": micros_to_datetime,
+    "updated_at": micros_to_datetime,
+    "due_date": micros_to_optional_datetime,
+}
+
+_ENCODERS_IN_ORDER = tuple(FIELD_ENCODERS[name] for name in TASK_FIELDS)
+_DECODERS_IN_ORDER = tuple(FIELD_DECODERS[name] for name in TASK_FIELDS)
+
+
+def encode_task(task: Task) -> list:
+    """Encode every field of a task, in TASK_FIELDS order."""
+    return [encode(getattr(task, name)) for name, encode in zip(TASK_FIELDS, _ENCODERS_IN_ORDER)]
+
+
+def decode_task(values) -> Task:
+    """Rebuild a task from values produced by encode_task, without re-validating."""
+    return Task._restore(*(decode(value) for decode, value in zip(_DECODERS_IN_ORDER, values)))
+
+
+# Fixed-width binary task record shared by snapshots and the wire format
+# (little-endian): task_id, status code, priority, then created, updated and
+# due microseconds, then the offset and length of the UTF-8 title and of the
+# description inside a separate string section, then the task's version.
+BINARY_RECORD = struct.Struct("<qbbqqqQIQIq")
+
+
+def pack_binary_records(tasks: Sequence[Task]) -> Tuple[bytearray, List[bytes]]:
+    """
+    Pack tasks into consecutive BINARY_RECORDs.
+
+    Returns:
+        The packed records and the chunks of the string section they
+        reference, in order
+    """
+    strings: List[bytes] = []
+    strings_size = 0
+    records = bytearray(BINARY_RECORD.size * len(tasks))
+    pack_into = BINARY_RECORD.pack_into
+    # Tasks added together share timestamp objects, so each distinct
+    # datetime is converted once per call.
+    micros_by_datetime: Dict[datetime, int] = {}
+
+    def to_micros(moment: datetime) -> int:
+        micros = micros_by_datetime.get(moment)
+        if micros is None:
+            micros = micros_by_datetime[moment] = datetime_to_micros(moment)
+        return micros
+
+    for position, task in enumerate(tasks):
+        title_bytes = task.title.encode()
+        description_bytes = task.description.encode()
+        due_date = task.due_date
+        pack_into(
+            records,
+            position * BINARY_RECORD.size,
+            task.task_id,
+            STATUS_CODES[task.status],
+            task.priority.value,
+            to_micros(task.created_at),
+            to_micros(task.updated_at),
+            NO_DATE if due_date is None else to_micros(due_date),
+            strings_size,
+            len(title_bytes),
+            strings_size + len(title_bytes),
+            len(description_bytes),
+            task.version,
+        )
+        strings.append(title_bytes)
+        strings.append(description_bytes)
+        strings_size += len(title_bytes) + len(description_bytes)
+
+    return records, strings
+
+
+def decode_binary_records(records: Iterable[tuple], buffer, strings_offset: int) -> List[Task]:
+    """
+    Build tasks from unpacked BINARY_RECORDs.
+
+    Args:
+        records: Values unpacked with BINARY_RECORD, one tuple per task
+        buffer: Bytes-like object holding the string section
+        strings_offset: Position of the string section in ``buffer``
+
+    Raises:
+        ValueError: If a record holds an unknown code, an out-of-range
+            timestamp or a string reference outside ``buffer``, or a string
+            is not valid UTF-8
+    """
+    restore = Task._restore
+    statuses = STATUSES_BY_CODE
+    end = len(buffer)
+    # Timestamps repeat heavily within a batch (created_at == updated_at,
+    # tasks added together), so each distinct value is decoded once.
+    datetimes: Dict[int, datetime] = {}
+
+    def to_datetime(micros: int) -> datetime:
+        moment = datetimes.get(micros)
+        if moment is None:
+            moment = datetimes[micros] = EPOCH + timedelta(0, 0, micros)
+        return moment
+
+    tasks = []
+    try:
+        for (
+            task_id,
+            status,
+            priority,
+            created,
+            updated,
+            due,
+            title_offset,
+            title_length,
+            description_offset,
+            description_length,
+            version,
+        ) in records:
+            title_end = strings_offset + title_offset + title_length
+            description_end = strings_offset + description_offset + description_length
+            # Slicing past the end would silently return a shorter string.
+            if title_end > end or description_end > end:
+                raise ValueError(f"task {task_id} refers to text past the end of the data")
+            tasks.append(
+                restore(
+                    task_id,
+                    str(buffer[title_end - title_length : title_end], "utf-8"),
+                    str(buffer[description_end - description_length : description_end], "utf-8"),
+                    statuses[status],
+                    PRIORITIES[priority],
+                    to_datetime(created),
+                    to_datetime(updated),
+                    None if due == NO_DATE else to_datetime(due),
+                    version,
+                )
+            )
+    except KeyError as error:
+        raise ValueError(f"unknown status or priority code {error.args[0]}") from None
+    except OverflowError as error:
+        raise ValueError(f"timestamp out of range: {error}") from None
+    return tasks
+
+
+def decode_binary_record(record: tuple, buffer, strings_offset: int) -> Task:
+    """Build one task from an unpacked BINARY_RECORD; see decode_binary_records."""
+    return decode_binary_records((record,), buffer, strings_offset)[0]
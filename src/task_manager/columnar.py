@@ -0,0 +1,314 @@
+"""Columnar (struct-of-arrays) storage engine for bulk analytics."""
+
+import weakref
+from array import array
+from itertools import compress
+from typing import Dict, Iterator, List, Optional
+
+from .codec import (
+    FIELD_ENCODERS,
+    PRIORITIES,
+    STATUS_CODES,
+    STATUSES,
+    datetime_to_micros,
+    micros_to_datetime,
+    micros_to_optional_datetime,
+    optional_datetime_to_micros,
+)
+from .storage import SortedIdIndex, TaskStore
+from .task import OPEN_STATUSES, Task, TaskPriority, TaskStatus
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; scans fall back to pure-Python loops
+    np = None
+
+# Smallest int64, used as an open lower bound for due-date scans.
+_MIN_MICROS = -(2**63)
+
+_OPEN_CODES = frozenset(STATUS_CODES[status] for status in OPEN_STATUSES)
+
+
+# Task field -> column attribute holding its encoded values.
+_COLUMNS = {
+    "title": "_titles",
+    "description": "_descriptions",
+    "status": "_statuses",
+    "priority": "_priorities",
+    "created_at": "_created",
+    "updated_at": "_updated",
+    "due_date": "_due",
+}
+
+
+class ColumnarTaskStore(TaskStore):
+    """
+    Engine that keeps tasks as parallel columns instead of Task objects.
+
+    IDs, status codes, priority codes and timestamps live in ``array``
+    columns; titles and descriptions live in list columns. Task objects are
+    materialized only when requested and are cached weakly, so a task that
+    is still referenced is always returned as the same object and writes
+    to it are applied to the columns. Filters, counts and deadline checks
+    are column scans, vectorized with NumPy when it is installed. Each
+    row also records its task's version, so a task materialized again
+    after its object was collected keeps the version it had.
+
+    Timestamps are stored as microseconds since the epoch, so this engine
+    expects naive datetimes such as those returned by ``datetime.now()``.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        super().__init__()
+        self._ids = array("q")
+        self._statuses = array("b")
+        self._priorities = array("b")
+        self._created = array("q")
+        self._updated = array("q")
+        self._due = array("q")
+        self._versions = array("q")
+        self._titles: List[str] = []
+        self._descriptions: List[str] = []
+        self._rows: Dict[int, int] = {}
+        self._id_order = SortedIdIndex()
+        self._live: "weakref.WeakValueDictionary[int, Task]" = weakref.WeakValueDictionary()
+
+    def _columns(self) -> tuple:
+        """Return every column, in a fixed order."""
+        return (
+            self._ids,
+            self._statuses,
+            self._priorities,
+            self._created,
+            self._updated,
+            self._due,
+            self._versions,
+            self._titles,
+            self._descriptions,
+        )
+
+    def add(self, task: Task) -> None:
+        """Append a task as a new row."""
+        self._rows[task.task_id] = len(self._ids)
+        self._ids.append(task.task_id)
+        self._statuses.append(STATUS_CODES[task.status])
+        self._priorities.append(task.priority.value)
+        self._created.append(datetime_to_micros(task.created_at))
+        self._updated.append(datetime_to_micros(task.updated_at))
+        self._due.append(optional_datetime_to_micros(task.due_date))
+        self._versions.append(task.version)
+        self._titles.append(task.title)
+        self._descriptions.append(task.description)
+        self._id_order.add(task.task_id)
+        self._live[task.task_id] = task
+        task._owner = self.owner
+
+    def add_many(self, tasks: List[Task]) -> None:
+        """Append a batch of tasks, extending each column once."""
+        first_row = len(self._ids)
+        self._ids.extend(task.task_id for task in tasks)
+        self._statuses.extend(STATUS_CODES[task.status] for task in tasks)
+        self._priorities.extend(task.priority.value for task in tasks)
+        self._created.extend(datetime_to_micros(task.created_at) for task in tasks)
+        self._updated.extend(datetime_to_micros(task.updated_at) for task in tasks)
+        self._due.extend(optional_datetime_to_micros(task.due_date) for task in tasks)
+        self._versions.extend(task.version for task in tasks)
+        self._titles.extend(task.title for task in tasks)
+        self._descriptions.extend(task.description for task in tasks)
+
+        owner = self.owner
+        for row, task in enumerate(tasks, first_row):
+            self._rows[task.task_id] = row
+            self._live[task.task_id] = task
+            task._owner = owner
+        self._id_order.add_many([task.task_id for task in tasks])
+
+    def _materialize(self, row: int) -> Task:
+        """Return the Task for a row, reusing the live object if there is one."""
+        task_id = self._ids[row]
+        task = self._live.get(task_id)
+        if task is None:
+            task = Task._restore(
+                task_id,
+                self._titles[row],
+                self._descriptions[row],
+                STATUSES[self._statuses[row]],
+                PRIORITIES[self._priorities[row]],
+                micros_to_datetime(self._created[row]),
+                micros_to_datetime(self._updated[row]),
+                micros_to_optional_datetime(self._due[row]),
+            )
+            task.version = self._versions[row]
+            task._owner = self.owner
+            self._live[task_id] = task
+        return task
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """Return the task with the given ID, materializing it if needed."""
+        row = self._rows.get(task_id)
+        return None if row is None else self._materialize(row)
+
+    def remove(self, task_id: int) -> Optional[Task]:
+        """Remove a task by moving the last row into its slot."""
+        row = self._rows.get(task_id)
+        if row is None:
+            return None
+
+        task = self._materialize(row)
+        task._owner = None
+        del self._live[task_id]
+        del self._rows[task_id]
+
+        last = len(self._ids) - 1
+        columns = self._columns()
+        if row != last:
+            for column in columns:
+                column[row] = column[last]
+            self._rows[self._ids[row]] = row
+        for column in columns:
+            column.pop()
+        self._id_order.remove(task_id, self._rows)
+        return task
+
+    def clear(self) -> None:
+        """Remove every row and detach every live task."""
+        for task in list(self._live.values()):
+            task._owner = None
+        self._live.clear()
+        self._rows.clear()
+        self._id_order.clear()
+        for column in self._columns():
+            del column[:]
+
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return len(self._ids)
+
+    def __contains__(self, task_id: int) -> bool:
+        """Return whether a task with the given ID is stored."""
+        return task_id in self._rows
+
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate over every stored task in row order."""
+        for task_id in self._ids.tolist():
+            task = self.get(task_id)
+            if task is not None:
+                yield task
+
+    def task_changed(self, task: Task, field_name: str, old_value) -> None:
+        """Write a changed task field and the task's new version into their columns."""
+        attribute = _COLUMNS.get(field_name)
+        if attribute is None:
+            return
+        row = self._rows[task.task_id]
+        getattr(self, attribute)[row] = FIELD_ENCODERS[field_name](getattr(task, field_name))
+        self._versions[row] = task.version
+
+    def tasks_transitioned(self, tasks: List[Task], old_statuses: List[TaskStatus]) -> None:
+        """Write the new status, updated_at and version of a batch of tasks into their columns."""
+        rows = self._rows
+        statuses = self._statuses
+        updated = self._updated
+        versions = self._versions
+        for task in tasks:
+            row = rows[task.task_id]
+            statuses[row] = STATUS_CODES[task.status]
+            updated[row] = datetime_to_micros(task.updated_at)
+            versions[row] = task.version
+
+    def _matching_rows(self, column: array, code: int) -> List[int]:
+        """Return the rows whose value in a code column equals ``code``."""
+        if np is not None:
+            return np.flatnonzero(np.frombuffer(column, dtype=np.int8) == code).tolist()
+        return list(compress(range(len(column)), map(code.__eq__, column)))
+
+    def _open_due_rows(self, low: int, high: int) -> List[int]:
+        """Return rows of open tasks due in ``[low, high)`` microseconds, by due date."""
+        due = self._due
+        ids = self._ids
+        if np is not None and due:
+            due_values = np.frombuffer(due, dtype=np.int64)
+            statuses = np.frombuffer(self._statuses, dtype=np.int8)
+            mask = (due_values >= low) & (due_values < high) & np.isin(statuses, list(_OPEN_CODES))
+            rows = np.flatnonzero(mask)
+            id_values = np.frombuffer(ids, dtype=np.int64)
+            return rows[np.lexsort((id_values[rows], due_values[rows]))].tolist()
+
+        rows = [
+            row
+            for row, (due_value, status) in enumerate(zip(due, self._statuses))
+            if low <= due_value < high and status in _OPEN_CODES
+        ]
+        rows.sort(key=lambda row: (due[row], ids[row]))
+        return rows
+
+    def by_status(self, status: TaskStatus) -> List[Task]:
+        """Return tasks with the given status using a status column scan."""
+        rows = self._matching_rows(self._statuses, STATUS_CODES[status])
+        return [self._materialize(row) for row in rows]
+
+    def by_priority(self, priority: TaskPriority) -> List[Task]:
+        """Return tasks with the given priority using a priority column scan."""
+        rows = self._matching_rows(self._priorities, priority.value)
+        return [self._materialize(row) for row in rows]
+
+    def due_between(self, start, end) -> List[Task]:
+        """Return open tasks due in ``[start, end)`` using a due-date column scan."""
+        rows = self._open_due_rows(datetime_to_micros(start), datetime_to_micros(end))
+        return [self._materialize(row) for row in rows]
+
+    def due_before(self, moment) -> List[Task]:
+        """Return open tasks due strictly before ``moment``."""
+        rows = self._open_due_rows(_MIN_MICROS, datetime_to_micros(moment))
+        return [self._materialize(row) for row in rows]
+
+    def page(
+        self,
+        after_id: int,
+        limit: int,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+    ) -> List[Task]:
+        """Return the next tasks in ID order, checking the code columns before materializing."""
+        rows = self._rows
+        statuses = self._statuses
+        priorities = self._priorities
+        status_code = None if status is None else STATUS_CODES[status]
+        priority_code = None if priority is None else priority.value
+        result = []
+        if limit <= 0:
+            return result
+        for task_id in self._id_order.after(after_id):
+            row = rows.get(task_id)
+            if (
+                row is None
+                or (status_code is not None and statuses[row] != status_code)
+                or (priority_code is not None and priorities[row] != priority_code)
+            ):
+                continue
+            result.append(self._materialize(row))
+            if len(result) == limit:
+                break
+        return result
+
+    def count_due_before(self, moment) -> int:
+        """Count open tasks due strictly before ``moment`` without materializing them."""
+        high = datetime_to_micros(moment)
+        if np is not None and self._due:
+            due_values = np.frombuffer(self._due, dtype=np.int64)
+            statuses = np.frombuffer(self._statuses, dtype=np.int8)
+            return int(np.count_nonzero((due_values < high) & np.isin(statuses, list(_OPEN_CODES))))
+        return sum(
+            1
+            for due_value, status in zip(self._due, self._statuses)
+            if due_value < high and status in _OPEN_CODES
+        )
+
+    def status_counts(self) -> Dict[TaskStatus, int]:
+        """Count each status code in the status column."""
+        return {status: self._statuses.count(STATUS_CODES[status]) for status in STATUSES}
+
+    def priority_counts(self) -> Dict[TaskPriority, int]:
+        """Count each priority code in the priority column."""
+        return {priority: self._priorities.count(priority.value) for priority in TaskPriority}
@@ -4,10 +4,21 @@
 class TaskManagerError(Exception):
     """Base exception for all task manager errors."""
 
+    # Attributes holding the constructor arguments, in order.
+    _fields: tuple = ()
+
+    def __reduce__(self):
+        """Pickle from the constructor arguments, e.g. to pass errors between processes."""
+        if not self._fields:
+            return super().__reduce__()
+        return type(self), tuple(getattr(self, name) for name in self._fields)
+
 
 class TaskNotFoundError(TaskManagerError):
     """Raised when a task is not found."""
 
+    _fields = ("task_id",)
+
     def __init__(self, task_id: int):
         self.task_id = task_id
         super().__init__(f"Task with ID {task_id} not found")
@@ -16,6 +27,8 @@ class TaskNotFoundError(TaskManagerError):
 class DuplicateTaskError(TaskManagerError):
     """Raised when attempting to add a duplicate task."""
 
+    _fields = ("task_id",)
+
     def __init__(self, task_id: int):
         self.task_id = task_id
         super().__init__(f"Task with ID {task_id} already exists")
@@ -24,5 +37,65 @@ class DuplicateTaskError(TaskManagerError):
 class ValidationError(TaskManagerError):
     """Raised when task validation fails."""
 
+    _fields = ("message",)
+
     def __init__(self, message: str):
+        self.message = message
         super().__init__(f"Validation error: {message}")
+
+
+class SnapshotFormatError(TaskManagerError):
+    """Raised when a file is not a readable task snapshot."""
+
+    _fields = ("path", "reason")
+
+    def __init__(self, path: str, reason: str):
+        self.path = path
+        self.reason = reason
+        super().__init__(f"Invalid snapshot {path}: {reason}")
+
+
+class WireFormatError(TaskManagerError):
+    """Raised when binary task data cannot be decoded."""
+
+    _fields = ("reason",)
+
+    def __init__(self, reason: str):
+        self.reason = reason
+        super().__init__(f"Invalid binary task data: {reason}")
+
+
+class LeaseError(TaskManagerError):
+    """Raised when a worker acts on a task it does not hold a live lease on."""
+
+    _fields = ("task_id", "worker_id")
+
+    def __init__(self, task_id: int, worker_id: str):
+        self.task_id = task_id
+        self.worker_id = worker_id
+        super().__init__(f"Task {task_id} is not leased to worker {worker_id!r}")
+
+
+class VersionConflictError(TaskManagerError):
+    """Raised when a write expects a task version that is no longer current."""
+
+    _fields = ("task_id", "expected_version", "actual_version")
+
+    def __init__(self, task_id: int, expected_version: int, actual_version: int):
+        self.task_id = task_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+        super().__init__(f"Task {task_id} is at version {actual_version}, not {expected_version}")
+
+
+class FeedOverrunError(TaskManagerError):
+    """Raised when a change feed reader asks for events the feed no longer holds."""
+
+    _fields = ("after", "first_sequence")
+
+    def __init__(self, after: int, first_sequence: int):
+        self.after = after
+        self.first_sequence = first_sequence
+        super().__init__(
+            f"Events after {after} were overwritten; the feed now starts at {first_sequence}"
+        )
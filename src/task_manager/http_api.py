@@ -0,0 +1,515 @@
+"""HTTP JSON API over a TaskManager, built on the standard library."""
+
+import json
+import re
+import select
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from itertools import islice
+from typing import Callable, Iterable, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .exceptions import TaskNotFoundError, ValidationError, VersionConflictError
+from .task import Task, TaskPriority, TaskStatus
+from .thread_safe import ThreadSafeTaskManager
+
+# Largest request body accepted, in bytes.
+MAX_BODY_BYTES = 1 << 20
+
+# Tasks encoded per chunk of a streamed list response.
+_STREAM_BATCH = 200
+
+# Seconds between checks, on an idle kept-alive connection, for a new
+# connection waiting for its worker.
+_IDLE_POLL = 0.05
+
+# Status codes of handled errors.
+_ERROR_STATUS = {
+    TaskNotFoundError: HTTPStatus.NOT_FOUND,
+    ValidationError: HTTPStatus.BAD_REQUEST,
+    VersionConflictError: HTTPStatus.PRECONDITION_FAILED,
+}
+
+# mark_* endpoints: action in the URL -> TaskManager method name.
+_TRANSITIONS = {
+    "start": "mark_task_in_progress",
+    "complete": "mark_task_completed",
+    "cancel": "mark_task_cancelled",
+}
+
+
+class _RequestError(Exception):
+    """A request the client got wrong, answered with ``status``."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        self.status = status
+        self.message = message
+        super().__init__(message)
+
+
+def _parse_priority(value) -> TaskPriority:
+    """Accept a priority as its number (2) or name ("MEDIUM", any case)."""
+    # JSON true/false would otherwise pass as the integers 1 and 0.
+    if isinstance(value, bool):
+        raise ValidationError(f"Unknown priority {value!r}")
+    try:
+        if isinstance(value, int) or str(value).isdigit():
+            return TaskPriority(int(value))
+        return TaskPriority[str(value).upper()]
+    except (KeyError, ValueError):
+        raise ValidationError(f"Unknown priority {value!r}") from None
+
+
+def _parse_status(value: str) -> TaskStatus:
+    """Accept a status by its value ("in_progress")."""
+    try:
+        return TaskStatus(value)
+    except ValueError:
+        raise ValidationError(f"Unknown status {value!r}") from None
+
+
+def _parse_datetime(value) -> Optional[datetime]:
+    """Accept an ISO 8601 datetime or null; an offset is converted to naive local time."""
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f"Invalid datetime {value!r}") from None
+    # Tasks hold naive local times, which cannot be compared with aware ones.
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def _parse_int(value: str, name: str) -> int:
+    """Parse an integer query parameter."""
+    try:
+        return int(value)
+    except ValueError:
+        raise ValidationError(f"{name} must be an integer") from None
+
+
+class TaskRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves one connection; HTTP/1.1, so a client may send many requests on it.
+
+    Endpoints (JSON in and out):
+        GET    /healthz, /readyz         liveness and readiness probes
+        GET    /tasks                    list, streamed; ?status= &priority= &after_id= &limit=
+        POST   /tasks                    create from {title, description, priority, due_date}
+        GET    /tasks/overdue            overdue tasks, streamed
+        GET    /tasks/<id>               one task
+        PATCH  /tasks/<id>               update title, description and/or priority
+        DELETE /tasks/<id>               delete
+        POST   /tasks/<id>/start|complete|cancel   status transitions
+        GET    /stats                    get_statistics()
+        GET    /search?q=&limit=         full-text search
+
+    Single-task responses carry the task's version as their ETag. PATCH,
+    DELETE and the transitions accept it back in If-Match and answer 412
+    Precondition Failed if the task has changed since.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "TaskManagerHTTP/1.0"
+    # Small responses on kept-alive connections should not wait for Nagle.
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        """Apply the server's idle timeout, after which a kept-alive connection closes."""
+        self.timeout = self.server.keep_alive_timeout
+        super().setup()
+
+    def handle(self) -> None:
+        """Serve requests until the connection closes or gives its worker up while idle."""
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection and self._await_request():
+            self.handle_one_request()
+
+    def _await_request(self) -> bool:
+        """
+        Wait for the next request on a kept-alive connection.
+
+        Returns:
+            True once a request (or the client's close) arrives; False after
+            ``keep_alive_timeout`` idle seconds, or as soon as a new
+            connection is waiting for a worker, so idle clients cannot keep
+            probes and other requests out of a full pool
+        """
+        connection = self.connection
+        # A pipelined request may already sit in the read buffer, where
+        # select() cannot see it; peek at it without blocking.
+        connection.settimeout(0)
+        try:
+            if self.rfile.peek(1):
+                return True
+        finally:
+            connection.settimeout(self.timeout)
+
+        deadline = time.monotonic() + self.server.keep_alive_timeout
+        while not self.server.connection_waiting.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if select.select([connection], [], [], min(remaining, _IDLE_POLL))[0]:
+                return True
+        return False
+
+    def log_message(self, format: str, *args) -> None:
+        """Write access and error logs only if the server asks for them."""
+        if self.server.access_log:
+            super().log_message(format, *args)
+
+    # -- dispatch ------------------------------------------------------------
+
+    def do_GET(self) -> None:
+        """Dispatch a GET request."""
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        """Dispatch a POST request."""
+        self._dispatch("POST")
+
+    def do_PATCH(self) -> None:
+        """Dispatch a PATCH request."""
+        self._dispatch("PATCH")
+
+    def do_DELETE(self) -> None:
+        """Dispatch a DELETE request."""
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        """Route a request and turn handled errors into JSON error responses."""
+        # One handler serves every request of a kept-alive connection.
+        url = urlsplit(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        self._body_read = False
+        self._streaming = False
+        try:
+            for route_method, pattern, handler in _ROUTES:
+                match = pattern.fullmatch(url.path)
+                if match is not None and route_method == method:
+                    handler(self, *match.groups())
+                    return
+            if any(pattern.fullmatch(url.path) for _, pattern, _ in _ROUTES):
+                raise _RequestError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} not allowed")
+            raise _RequestError(HTTPStatus.NOT_FOUND, f"No endpoint {url.path}")
+        except _RequestError as error:
+            self._send_error(error.status, error.message)
+        except (TaskNotFoundError, ValidationError, VersionConflictError) as error:
+            self._send_error(_ERROR_STATUS[type(error)], str(error))
+        except Exception:
+            self.close_connection = True
+            if not self._streaming:
+                self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal error"})
+            raise
+
+    # -- responses -------------------------------------------------------------
+
+    def _send_json(
+        self, status: HTTPStatus, payload, headers: Optional[Mapping[str, str]] = None
+    ) -> None:
+        """Send a complete JSON response with a Content-Length and any extra headers."""
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        """Send a JSON error, closing the connection if an unread body would follow."""
+        if not self._body_read and int(self.headers.get("Content-Length") or 0):
+            self.close_connection = True
+        self._send_json(status, {"error": message})
+
+    def _send_task(self, status: HTTPStatus, task: Task) -> None:
+        """Send one task, tagged with the version it was serialized at."""
+        data = task.to_dict()
+        self._send_json(status, data, {"ETag": f'"{data["version"]}"'})
+
+    def _send_empty(self) -> None:
+        """Send 204 No Content."""
+        self.send_response(HTTPStatus.NO_CONTENT)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _stream_tasks(self, tasks: Iterable[Task]) -> None:
+        """
+        Send tasks as a JSON array with chunked transfer encoding.
+
+        Tasks are encoded a batch at a time as the iterator yields them, so
+        a long list is never built or buffered whole. HTTP/1.0 clients,
+        which cannot read chunks, get the array unframed and the connection
+        closes after it.
+        """
+        self._streaming = True
+        chunked = self.request_version != "HTTP/1.0"
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        else:
+            self.close_connection = True
+        self.end_headers()
+
+        if chunked:
+
+            def write(data: bytes) -> None:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+        else:
+            write = self.wfile.write
+        separator = "["
+        tasks = iter(tasks)
+        while True:
+            batch = list(islice(tasks, _STREAM_BATCH))
+            if not batch:
+                break
+            text = separator + ",".join(
+                json.dumps(task.to_dict(), separators=(",", ":")) for task in batch
+            )
+            separator = ","
+            write(text.encode())
+        write(b"[]" if separator == "[" else b"]")
+        if chunked:
+            self.wfile.write(b"0\r\n\r\n")
+
+    # -- request bodies and headers ---------------------------------------------
+
+    def _expected_version(self) -> Optional[int]:
+        """Return the task version required by If-Match, or None if any version will do."""
+        value = self.headers.get("If-Match")
+        if value is None or value.strip() == "*":
+            return None
+        tag = value.strip()
+        if tag.startswith('"') and tag.endswith('"') and len(tag) > 1:
+            tag = tag[1:-1]
+        if not tag.isdigit():
+            raise ValidationError(f"If-Match must be a task version, not {value!r}")
+        return int(tag)
+
+    def _read_body(self) -> dict:
+        """Read and decode the JSON object body of the request."""
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            raise _RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+        raw = self.rfile.read(length) if length else b""
+        self._body_read = True
+        try:
+            body = json.loads(raw or b"{}")
+        except ValueError:
+            raise _RequestError(HTTPStatus.BAD_REQUEST, "Body is not valid JSON") from None
+        if not isinstance(body, dict):
+            raise _RequestError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+        return body
+
+    # -- endpoints -------------------------------------------------------------
+
+    def _healthz(self) -> None:
+        """Report that the process serves requests; touches no locks."""
+        self._send_json(HTTPStatus.OK, {"status": "ok"})
+
+    def _readyz(self) -> None:
+        """Report whether the server accepts work; 503 while starting or draining."""
+        if self.server.ready.is_set():
+            self._send_json(HTTPStatus.OK, {"status": "ready"})
+        else:
+            self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"status": "not ready"})
+
+    def _list_tasks(self) -> None:
+        """Stream tasks in ID order, optionally filtered and paged by cursor."""
+        query = self.query
+        status = _parse_status(query["status"]) if "status" in query else None
+        priority = _parse_priority(query["priority"]) if "priority" in query else None
+        after_id = _parse_int(query.get("after_id", "0"), "after_id")
+        limit = _parse_int(query["limit"], "limit") if "limit" in query else None
+        manager = self.server.manager
+        self._stream_tasks(manager.iter_tasks(after_id, limit, status, priority))
+
+    def _overdue_tasks(self) -> None:
+        """Stream overdue tasks by due date."""
+        self._stream_tasks(self.server.manager.iter_overdue_tasks())
+
+    def _create_task(self) -> None:
+        """Create a task from the request body."""
+        body = self._read_body()
+        if not isinstance(body.get("title"), str):
+            raise ValidationError("title is required")
+        description = body.get("description")
+        if description is not None and not isinstance(description, str):
+            raise ValidationError("description must be a string")
+        task = self.server.manager.add_task(
+            title=body["title"],
+            description=description or "",
+            priority=_parse_priority(body.get("priority", TaskPriority.MEDIUM.value)),
+            due_date=_parse_datetime(body.get("due_date")),
+        )
+        self._send_task(HTTPStatus.CREATED, task)
+
+    def _get_task(self, task_id: str) -> None:
+        """Return one task."""
+        self._send_task(HTTPStatus.OK, self.server.manager.get_task(int(task_id)))
+
+    def _update_task(self, task_id: str) -> None:
+        """Update the fields given in the request body."""
+        body = self._read_body()
+        for name in ("title", "description"):
+            if body.get(name) is not None and not isinstance(body[name], str):
+                raise ValidationError(f"{name} must be a string")
+        priority = body.get("priority")
+        task = self.server.manager.update_task(
+            int(task_id),
+            title=body.get("title"),
+            description=body.get("description"),
+            priority=None if priority is None else _parse_priority(priority),
+            expected_version=self._expected_version(),
+        )
+        self._send_task(HTTPStatus.OK, task)
+
+    def _delete_task(self, task_id: str) -> None:
+        """Delete a task."""
+        self.server.manager.delete_task(int(task_id), self._expected_version())
+        self._send_empty()
+
+    def _transition(self, task_id: str, action: str) -> None:
+        """Apply a status transition; a transition the task's status forbids is a 409."""
+        manager = self.server.manager
+        expected_version = self._expected_version()
+        try:
+            task = getattr(manager, _TRANSITIONS[action])(int(task_id), expected_version)
+        except ValidationError as error:
+            raise _RequestError(HTTPStatus.CONFLICT, str(error)) from None
+        self._send_task(HTTPStatus.OK, task)
+
+    def _statistics(self) -> None:
+        """Return the task statistics."""
+        self._send_json(HTTPStatus.OK, self.server.manager.get_statistics())
+
+    def _search(self) -> None:
+        """Return the tasks matching ?q=, best first."""
+        query = self.query.get("q", "")
+        limit = _parse_int(self.query["limit"], "limit") if "limit" in self.query else None
+        tasks = self.server.manager.search(query, limit)
+        self._send_json(HTTPStatus.OK, [task.to_dict() for task in tasks])
+
+
+_ROUTES: Tuple[Tuple[str, "re.Pattern[str]", Callable], ...] = tuple(
+    (method, re.compile(pattern), handler)
+    for method, pattern, handler in (
+        ("GET", r"/healthz", TaskRequestHandler._healthz),
+        ("GET", r"/readyz", TaskRequestHandler._readyz),
+        ("GET", r"/tasks", TaskRequestHandler._list_tasks),
+        ("POST", r"/tasks", TaskRequestHandler._create_task),
+        ("GET", r"/tasks/overdue", TaskRequestHandler._overdue_tasks),
+        ("GET", r"/tasks/(\d+)", TaskRequestHandler._get_task),
+        ("PATCH", r"/tasks/(\d+)", TaskRequestHandler._update_task),
+        ("DELETE", r"/tasks/(\d+)", TaskRequestHandler._delete_task),
+        ("POST", r"/tasks/(\d+)/(start|complete|cancel)", TaskRequestHandler._transition),
+        ("GET", r"/stats", TaskRequestHandler._statistics),
+        ("GET", r"/search", TaskRequestHandler._search),
+    )
+)
+
+
+class TaskServer(HTTPServer):
+    """
+    HTTP server for a ThreadSafeTaskManager with a bounded pool of worker threads.
+
+    Each accepted connection is handed to one of ``max_workers`` threads,
+    which serves its requests until the client closes it or it sits idle
+    for ``keep_alive_timeout`` seconds. When every worker is busy the
+    accept loop waits for a free one and new connections queue in the
+    listen backlog, so load beyond capacity raises latency instead of the
+    thread count. While a connection waits, kept-alive connections close
+    as soon as they are idle, so /healthz and /readyz still get a worker
+    when idle clients fill the pool.
+
+    ``ready`` is set once the server is listening and cleared by
+    drain(), which makes /readyz fail so a load balancer stops routing
+    new work before shutdown.
+    """
+
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        manager: ThreadSafeTaskManager,
+        address: Tuple[str, int] = ("0.0.0.0", 8000),
+        max_workers: int = 16,
+        keep_alive_timeout: float = 5.0,
+        access_log: bool = False,
+    ):
+        """
+        Bind the server; call serve_forever() to start handling requests.
+
+        Args:
+            manager: Manager to serve; it must be safe to share between threads
+            address: (host, port) to listen on; port 0 picks a free port
+            max_workers: Connections served at once
+            keep_alive_timeout: Seconds an idle kept-alive connection stays open
+            access_log: If True, log every request to stderr
+
+        Raises:
+            ValueError: If max_workers is not positive
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        super().__init__(address, TaskRequestHandler)
+        self.manager = manager
+        self.keep_alive_timeout = keep_alive_timeout
+        self.access_log = access_log
+        self.ready = threading.Event()
+        # Set while an accepted connection waits for a worker.
+        self.connection_waiting = threading.Event()
+        self._workers = ThreadPoolExecutor(max_workers, thread_name_prefix="task-http")
+        self._free_workers = threading.BoundedSemaphore(max_workers)
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        """Mark the server ready and handle requests until shutdown() is called."""
+        self.ready.set()
+        super().serve_forever(poll_interval)
+
+    def drain(self) -> None:
+        """Fail readiness checks from now on, ahead of a shutdown."""
+        self.ready.clear()
+
+    def process_request(self, request, client_address) -> None:
+        """Hand a connection to a worker thread, waiting for one to be free."""
+        if not self._free_workers.acquire(blocking=False):
+            self.connection_waiting.set()
+            self._free_workers.acquire()
+            self.connection_waiting.clear()
+        self._workers.submit(self._serve_connection, request, client_address)
+
+    def _serve_connection(self, request, client_address) -> None:
+        """Serve every request on a connection, then close it and free the worker."""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._free_workers.release()
+
+    def server_close(self) -> None:
+        """Stop listening and wait for the connections in progress to finish."""
+        super().server_close()
+        self._workers.shutdown(wait=True)
+
+    @property
+    def url(self) -> str:
+        """Return the base URL the server listens on."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
@@ -0,0 +1,263 @@
+"""Prefix index for type-ahead completion of task titles."""
+
+import heapq
+from bisect import bisect_left, insort
+from itertools import islice, takewhile
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .codec import datetime_to_micros
+from .task import Task
+
+# Sorts after every character a title can contain, closing a prefix range.
+_MAX_CHAR = "\U0010ffff"
+
+# Prefixes matching up to this many titles are ranked by scanning them;
+# larger ones are ranked from their children and cached.
+_SCAN_THRESHOLD = 256
+
+# Number of best matches kept in each cached prefix.
+CACHED_MATCHES = 32
+
+# Target number of entries per block of _SortedEntries.
+_BLOCK_SIZE = 1000
+
+Rank = Tuple[int, int, int]
+Entry = Tuple[str, int]
+
+
+def normalize(title: str) -> str:
+    """Case-fold a title and collapse its whitespace to single spaces."""
+    return " ".join(title.casefold().split())
+
+
+def _normalize_prefix(prefix: str) -> str:
+    """Normalize a prefix, keeping one trailing space if it ends a word."""
+    normalized = normalize(prefix)
+    if normalized and prefix[-1:].isspace():
+        normalized += " "
+    return normalized
+
+
+def _rank(task: Task) -> Rank:
+    """Return a key ordering tasks by priority, then most recently created first."""
+    return -task.priority.value, -datetime_to_micros(task.created_at), -task.task_id
+
+
+class _SortedEntries:
+    """
+    Sorted list of (title, task ID) entries split into blocks.
+
+    A flat list moves every later entry on each insert or delete; blocks
+    of about _BLOCK_SIZE entries, located by bisecting their last entries,
+    keep both at O(log n + _BLOCK_SIZE).
+    """
+
+    def __init__(self):
+        """Initialize an empty list."""
+        self._blocks: List[List[Entry]] = []
+        self._maxes: List[Entry] = []
+        self._length = 0
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return self._length
+
+    def __iter__(self) -> Iterator[Entry]:
+        """Iterate over every entry in order."""
+        for block in self._blocks:
+            yield from block
+
+    def reset(self, entries: List[Entry]) -> None:
+        """Replace the contents with entries, which are sorted in place."""
+        entries.sort()
+        self._blocks = [
+            entries[start : start + _BLOCK_SIZE] for start in range(0, len(entries), _BLOCK_SIZE)
+        ]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._length = len(entries)
+
+    def add(self, entry: Entry) -> None:
+        """Insert an entry."""
+        self._length += 1
+        if not self._blocks:
+            self._blocks.append([entry])
+            self._maxes.append(entry)
+            return
+
+        index = min(bisect_left(self._maxes, entry), len(self._blocks) - 1)
+        block = self._blocks[index]
+        insort(block, entry)
+        self._maxes[index] = block[-1]
+        if len(block) > 2 * _BLOCK_SIZE:
+            self._blocks[index : index + 1] = [block[:_BLOCK_SIZE], block[_BLOCK_SIZE:]]
+            self._maxes[index : index + 1] = [block[_BLOCK_SIZE - 1], block[-1]]
+
+    def remove(self, entry: Entry) -> None:
+        """Delete an entry that is present."""
+        index = bisect_left(self._maxes, entry)
+        block = self._blocks[index]
+        del block[bisect_left(block, entry)]
+        self._length -= 1
+        if block:
+            self._maxes[index] = block[-1]
+        else:
+            del self._blocks[index]
+            del self._maxes[index]
+
+    def first_from(self, key: tuple) -> Optional[Entry]:
+        """Return the first entry not less than key, or None."""
+        index = bisect_left(self._maxes, key)
+        if index == len(self._blocks):
+            return None
+        block = self._blocks[index]
+        return block[bisect_left(block, key)]
+
+    def iter_from(self, key: tuple) -> Iterator[Entry]:
+        """Iterate in order over the entries not less than key."""
+        index = bisect_left(self._maxes, key)
+        if index == len(self._blocks):
+            return
+        block = self._blocks[index]
+        yield from islice(block, bisect_left(block, key), None)
+        for block in islice(self._blocks, index + 1, None):
+            yield from block
+
+
+class PrefixIndex:
+    """
+    Sorted index of normalized titles for prefix completion.
+
+    Titles are kept sorted, so the tasks sharing a prefix are contiguous
+    and found by bisection. The best CACHED_MATCHES tasks of every large
+    prefix that has been queried are cached and kept exact on every
+    change, so a repeated or extended prefix costs O(len(prefix) + limit).
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._entries = _SortedEntries()
+        self._keys: Dict[int, Tuple[str, Rank]] = {}
+        self._cache: Dict[str, List[Tuple[Rank, int]]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed tasks."""
+        return len(self._entries)
+
+    def add(self, task: Task) -> None:
+        """Index a task's title."""
+        title = normalize(task.title)
+        rank = _rank(task)
+        self._keys[task.task_id] = (title, rank)
+        self._entries.add((title, task.task_id))
+
+        match = (rank, task.task_id)
+        cache = self._cache
+        for end in range(len(title) + 1):
+            cached = cache.get(title[:end])
+            if cached is not None:
+                insort(cached, match)
+                if len(cached) > CACHED_MATCHES:
+                    cached.pop()
+
+    def add_many(self, tasks: Iterable[Task]) -> None:
+        """Index a batch of tasks, re-sorting once when the batch is large."""
+        tasks = list(tasks)
+        if len(tasks) < max(len(self._entries) // 8, 64):
+            for task in tasks:
+                self.add(task)
+            return
+
+        entries = list(self._entries)
+        for task in tasks:
+            title = normalize(task.title)
+            self._keys[task.task_id] = (title, _rank(task))
+            entries.append((title, task.task_id))
+        self._entries.reset(entries)
+        self._cache.clear()
+
+    def remove(self, task_id: int) -> None:
+        """Remove a task from the index."""
+        title, rank = self._keys.pop(task_id)
+        self._entries.remove((title, task_id))
+
+        match = (rank, task_id)
+        cache = self._cache
+        for end in range(len(title) + 1):
+            prefix = title[:end]
+            cached = cache.get(prefix)
+            if cached is not None:
+                position = bisect_left(cached, match)
+                if position < len(cached) and cached[position] == match:
+                    # A replacement would have to come from the uncached tail.
+                    del cache[prefix]
+
+    def task_changed(self, task: Task) -> None:
+        """Re-index a task after its title or priority changed."""
+        self.remove(task.task_id)
+        self.add(task)
+
+    def clear(self) -> None:
+        """Remove every task."""
+        self._entries.reset([])
+        self._keys.clear()
+        self._cache.clear()
+
+    def complete(self, prefix: str, limit: int = 10) -> List[int]:
+        """
+        Find the best tasks whose normalized title starts with a prefix.
+
+        Args:
+            prefix: Typed text; case and repeated whitespace are ignored
+            limit: Maximum number of results
+
+        Returns:
+            Task IDs ordered by descending priority, then newest first
+        """
+        if limit <= 0:
+            return []
+        prefix = _normalize_prefix(prefix)
+        if limit > CACHED_MATCHES:
+            matches = self._rank_entries(self._matching(prefix), limit)
+        else:
+            matches = self._best(prefix)[:limit]
+        return [task_id for _, task_id in matches]
+
+    def _matching(self, prefix: str) -> Iterator[Entry]:
+        """Iterate over the entries whose title starts with prefix."""
+        entries = self._entries.iter_from((prefix,))
+        return takewhile(lambda entry: entry[0].startswith(prefix), entries)
+
+    def _rank_entries(self, entries: Iterable[Entry], limit: int) -> List[Tuple[Rank, int]]:
+        """Return the best ``limit`` of some entries, best first."""
+        keys = self._keys
+        return heapq.nsmallest(limit, ((keys[task_id][1], task_id) for _, task_id in entries))
+
+    def _best(self, prefix: str) -> List[Tuple[Rank, int]]:
+        """
+        Return the best CACHED_MATCHES matches of a prefix.
+
+        Prefixes with few matches are scanned. For larger ones the matches
+        are split by the character following the prefix, each child prefix
+        is ranked (recursively, from the cache when possible) and the
+        children's best lists are merged; the result is cached.
+        """
+        cached = self._cache.get(prefix)
+        if cached is not None:
+            return cached
+        head = list(islice(self._matching(prefix), _SCAN_THRESHOLD + 1))
+        if len(head) <= _SCAN_THRESHOLD:
+            return self._rank_entries(head, CACHED_MATCHES)
+
+        depth = len(prefix)
+        # Titles equal to the prefix itself sort before any longer title.
+        exact = takewhile(lambda entry: len(entry[0]) == depth, self._matching(prefix))
+        lists = [self._rank_entries(exact, CACHED_MATCHES)]
+        entry = self._entries.first_from((prefix + "\0",))
+        while entry is not None and entry[0].startswith(prefix):
+            child = prefix + entry[0][depth]
+            lists.append(self._best(child))
+            entry = self._entries.first_from((child + _MAX_CHAR,))
+
+        best = list(islice(heapq.merge(*lists), CACHED_MATCHES))
+        self._cache[prefix] = best
+        return best
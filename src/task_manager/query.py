@@ -0,0 +1,336 @@
+"""Composable task queries with a small index-aware planner."""
+
+import copy
+import heapq
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import chain, islice
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .task import OPEN_STATUSES, Task, TaskPriority, TaskStatus
+from .text_index import matcher
+
+# Access paths.
+ACCESS_TEXT = "text index"
+ACCESS_DUE = "due-date index"
+ACCESS_STATUS = "status index"
+ACCESS_PRIORITY = "priority index"
+ACCESS_SCAN = "full scan"
+
+# The order the planner prefers access paths in when their costs tie.
+_PREFERENCE = (ACCESS_TEXT, ACCESS_DUE, ACCESS_STATUS, ACCESS_PRIORITY, ACCESS_SCAN)
+
+# Fields accepted by order_by.
+SORT_FIELDS = ("task_id", "title", "priority", "created_at", "updated_at", "due_date")
+
+
+def _sort_key(field_name: str, descending: bool = False) -> Callable[[Task], tuple]:
+    """Return a key ordering tasks by a field, missing due dates last, then by ID."""
+    if field_name == "due_date":
+        # The flag ranks undated tasks last in either sort direction.
+        if descending:
+            return lambda task: (task.due_date is not None, task.due_date, task.task_id)
+        return lambda task: (task.due_date is None, task.due_date, task.task_id)
+    # attrgetter builds the key tuple in C, which matters for large sorts.
+    if field_name == "priority":
+        return attrgetter("priority.value", "task_id")
+    return attrgetter(field_name, "task_id")
+
+
+def _member_check(field_name: str, values: frozenset) -> Callable[[Task], bool]:
+    """Return a check that a task's enum field holds one of ``values``."""
+    getter = attrgetter(field_name)
+    if len(values) == 1:
+        # Identity is much cheaper than hashing an Enum member.
+        (value,) = values
+        return lambda task: getter(task) is value
+    return lambda task: getter(task) in values
+
+
+@dataclass
+class QueryPlan:
+    """
+    How a TaskQuery will be evaluated, as returned by TaskQuery.explain.
+
+    Attributes:
+        access: Index or scan the candidate tasks are read from
+        estimated_rows: Number of candidates the access path can yield
+        estimated_reads: Number of candidates expected to be read before
+            the query has its results (lower than estimated_rows when a
+            limited query can stop early)
+        filters: Conditions checked on each candidate after it is read
+        order: How results are ordered: "access order", "index order",
+            "top-N heap (k)" or "full sort"
+        considered: Estimated reads of every usable access path
+    """
+
+    access: str
+    estimated_rows: int
+    estimated_reads: int
+    filters: List[str] = field(default_factory=list)
+    order: str = "access order"
+    considered: List[Tuple[str, int]] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        """Return the plan as indented text, one step per line."""
+        scope = f"~{self.estimated_rows} rows"
+        if self.estimated_reads < self.estimated_rows:
+            scope += f", stops after ~{self.estimated_reads}"
+        lines = [f"access: {self.access} ({scope})"]
+        lines.extend(f"  filter: {condition}" for condition in self.filters)
+        lines.append(f"  order: {self.order}")
+        alternatives = ", ".join(f"{access} ~{rows}" for access, rows in self.considered)
+        lines.append(f"  considered: {alternatives}")
+        return "\n".join(lines)
+
+
+class TaskQuery:
+    """
+    Immutable query over the tasks of a TaskManager.
+
+    Each builder method returns a new query, so partial queries can be
+    shared and extended. Evaluation is deferred until the query is
+    iterated or all(), first() or count() is called; the planner then
+    reads candidates from the most selective index, checks the remaining
+    conditions on each candidate lazily and, when a limit is set, keeps
+    only the best rows in a heap instead of sorting every match.
+
+    Do not add or delete tasks while iterating over a query.
+    """
+
+    def __init__(self, manager):
+        """Create a query matching every task of a TaskManager."""
+        self._manager = manager
+        self._statuses: Optional[frozenset] = None
+        self._priorities: Optional[frozenset] = None
+        self._due_range: Optional[Tuple[datetime, datetime]] = None
+        self._text: Optional[str] = None
+        self._predicates: Tuple[Callable[[Task], bool], ...] = ()
+        self._order: Optional[Tuple[str, bool]] = None
+        self._offset = 0
+        self._limit: Optional[int] = None
+
+    def _with(self, **changes) -> "TaskQuery":
+        """Return a copy of the query with some attributes replaced."""
+        query = copy.copy(self)
+        for name, value in changes.items():
+            setattr(query, f"_{name}", value)
+        return query
+
+    # -- builder -----------------------------------------------------------
+
+    def status(self, *statuses: TaskStatus) -> "TaskQuery":
+        """Keep tasks in any of the given statuses."""
+        return self._with(statuses=frozenset(statuses))
+
+    def priority(self, *priorities: TaskPriority) -> "TaskQuery":
+        """Keep tasks at any of the given priorities."""
+        return self._with(priorities=frozenset(priorities))
+
+    def due_between(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> "TaskQuery":
+        """
+        Keep tasks due in ``[start, end)``; tasks without a deadline never match.
+
+        Args:
+            start: Earliest due date, or None for no lower bound
+            end: Due date to stop before, or None for no upper bound
+        """
+        return self._with(
+            due_range=(
+                datetime.min if start is None else start,
+                datetime.max if end is None else end,
+            )
+        )
+
+    def text(self, query: str) -> "TaskQuery":
+        """Keep tasks matching a full-text query, with the syntax of TaskManager.search."""
+        return self._with(text=query)
+
+    def where(self, predicate: Callable[[Task], bool]) -> "TaskQuery":
+        """Keep tasks for which ``predicate`` returns True; checked after every index filter."""
+        return self._with(predicates=self._predicates + (predicate,))
+
+    def order_by(self, field_name: str, descending: bool = False) -> "TaskQuery":
+        """
+        Sort results by a task field, then by task ID.
+
+        Tasks without a due date sort after every dated task, in both
+        directions. Without
+        order_by, results come in the order of the chosen access path
+        (relevance for a text query).
+
+        Raises:
+            ValueError: If the field is not one of SORT_FIELDS
+        """
+        if field_name not in SORT_FIELDS:
+            raise ValueError(f"Cannot order by {field_name!r}; choose one of {SORT_FIELDS}")
+        return self._with(order=(field_name, descending))
+
+    def limit(self, count: int) -> "TaskQuery":
+        """Return at most ``count`` tasks."""
+        if count < 0:
+            raise ValueError("Limit cannot be negative")
+        return self._with(limit=count)
+
+    def offset(self, count: int) -> "TaskQuery":
+        """Skip the first ``count`` results."""
+        if count < 0:
+            raise ValueError("Offset cannot be negative")
+        return self._with(offset=count)
+
+    # -- planning ----------------------------------------------------------
+
+    def explain(self) -> QueryPlan:
+        """Return the plan the query would run with right now."""
+        return self._plan()[0]
+
+    def _path_rows(self) -> Dict[str, int]:
+        """Estimate how many tasks each filter's access path would yield."""
+        store = self._manager._store
+        rows = {ACCESS_SCAN: len(store)}
+        if self._text is not None:
+            rows[ACCESS_TEXT] = self._manager._ensure_text_index().estimate(self._text)
+        if self._due_range is not None:
+            rows[ACCESS_DUE] = store.count_due_between(*self._due_range)
+        if self._statuses is not None:
+            counts = store.status_counts()
+            rows[ACCESS_STATUS] = sum(counts[status] for status in self._statuses)
+        if self._priorities is not None:
+            counts = store.priority_counts()
+            rows[ACCESS_PRIORITY] = sum(counts[priority] for priority in self._priorities)
+        return rows
+
+    def _plan(self) -> Tuple[QueryPlan, List[Callable[[Task], bool]], bool]:
+        """
+        Choose the access path expected to read the fewest tasks.
+
+        A path reads every candidate it yields, unless the results can be
+        streamed in its order (no order_by, or an index already sorted by
+        the order_by field) and a limit is set: it then stops after about
+        ``offset + limit`` divided by the selectivity of the remaining
+        filters, which are assumed independent.
+
+        Returns:
+            The plan, the checks left to run on each candidate and whether
+            the access path already yields candidates in the requested order
+        """
+        rows = self._path_rows()
+        total = max(rows[ACCESS_SCAN], 1)
+        usable = [access for access in _PREFERENCE if access in rows]
+        # The due-date index only covers open tasks.
+        if ACCESS_DUE in rows and not (self._statuses and self._statuses <= OPEN_STATUSES):
+            usable.remove(ACCESS_DUE)
+
+        considered = []
+        for access in usable:
+            reads = rows[access]
+            presorted = self._presorted(access)
+            if self._limit is not None and (self._order is None or presorted):
+                selectivity = 1.0
+                for other, other_rows in rows.items():
+                    if other not in (access, ACCESS_SCAN):
+                        selectivity *= other_rows / total
+                needed = self._offset + self._limit
+                reads = min(reads, math.ceil(needed / selectivity) if selectivity else reads)
+            considered.append((access, reads))
+        # min() keeps the first of equal costs, i.e. the preferred path.
+        access, reads = min(considered, key=lambda path: path[1])
+        presorted = self._presorted(access)
+
+        filters = []
+        checks = []
+        if self._statuses is not None and access != ACCESS_STATUS:
+            filters.append(f"status in {sorted(status.value for status in self._statuses)}")
+            checks.append(_member_check("status", self._statuses))
+        if self._priorities is not None and access != ACCESS_PRIORITY:
+            filters.append(f"priority in {sorted(priority.name for priority in self._priorities)}")
+            checks.append(_member_check("priority", self._priorities))
+        if self._due_range is not None and access != ACCESS_DUE:
+            start, end = self._due_range
+            filters.append(f"due_date in [{start}, {end})")
+            checks.append(lambda task: task.due_date is not None and start <= task.due_date < end)
+        if self._text is not None and access != ACCESS_TEXT:
+            filters.append(f"text matches {self._text!r}")
+            checks.append(matcher(self._text))
+        for predicate in self._predicates:
+            filters.append(f"where {getattr(predicate, '__name__', repr(predicate))}")
+            checks.append(predicate)
+
+        if self._order is None:
+            order = "access order"
+        elif presorted:
+            order = "index order"
+        elif self._limit is not None:
+            order = f"top-N heap ({self._offset + self._limit})"
+        else:
+            order = "full sort"
+        if self._order is not None:
+            field_name, descending = self._order
+            order += f" by {field_name} {'desc' if descending else 'asc'}"
+
+        plan = QueryPlan(access, rows[access], reads, filters, order, considered)
+        return plan, checks, presorted
+
+    def _presorted(self, access: str) -> bool:
+        """Return whether an access path yields candidates in the requested order."""
+        return access == ACCESS_DUE and self._order == ("due_date", False)
+
+    # -- evaluation --------------------------------------------------------
+
+    def _read(self, access: str) -> Iterable[Task]:
+        """Yield the candidates of an access path."""
+        store = self._manager._store
+        if access == ACCESS_TEXT:
+            index = self._manager._ensure_text_index()
+            return (store.get(task_id) for task_id, _ in index.search(self._text))
+        if access == ACCESS_DUE:
+            return store.iter_due_between(*self._due_range)
+        if access == ACCESS_STATUS:
+            return chain.from_iterable(store.by_status(status) for status in self._statuses)
+        if access == ACCESS_PRIORITY:
+            return chain.from_iterable(store.by_priority(priority) for priority in self._priorities)
+        return store
+
+    def __iter__(self) -> Iterator[Task]:
+        """Evaluate the query lazily, yielding matching tasks in result order."""
+        plan, checks, presorted = self._plan()
+        tasks = self._read(plan.access)
+        for check in checks:
+            tasks = filter(check, tasks)
+
+        stop = None if self._limit is None else self._offset + self._limit
+        if self._order is not None and not presorted:
+            field_name, descending = self._order
+            key = _sort_key(field_name, descending)
+            if stop is not None:
+                select = heapq.nlargest if descending else heapq.nsmallest
+                tasks = select(stop, tasks, key=key)
+            else:
+                tasks = sorted(tasks, key=key, reverse=descending)
+        return islice(tasks, self._offset, stop)
+
+    def all(self) -> List[Task]:
+        """Return every result as a list."""
+        return list(self)
+
+    def first(self) -> Optional[Task]:
+        """Return the first result, or None if nothing matches."""
+        query = self if self._limit is not None and self._limit <= 1 else self.limit(1)
+        return next(iter(query), None)
+
+    def count(self) -> int:
+        """
+        Return the number of results.
+
+        Queries answered by a status or priority index without further
+        conditions are counted from the index sizes without reading tasks.
+        """
+        plan, checks, _ = self._plan()
+        if checks or plan.access == ACCESS_TEXT or plan.access == ACCESS_DUE:
+            return sum(1 for _ in self)
+        total = max(plan.estimated_rows - self._offset, 0)
+        return total if self._limit is None else min(total, self._limit)
@@ -0,0 +1,408 @@
+"""Read replicas of a TaskManager published in shared memory."""
+
+import functools
+import gc
+import os
+import struct
+import sys
+import threading
+import time
+import traceback
+from contextlib import nullcontext
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, Optional
+
+from .snapshot import SnapshotTaskStore, encode_snapshot
+from .task_manager import TaskManager
+
+# Control block layout (little-endian): magic, sequence, latest epoch.
+# The sequence is odd while the publisher rewrites the epoch (a seqlock),
+# so readers retry instead of reading a torn value. Epoch 0 means nothing
+# has been published yet.
+#
+# A rewrite is three stores, so readers seeing an odd sequence retry at
+# once and then back off up to this many seconds between attempts.
+_MAX_RETRY_DELAY = 0.01
+CONTROL = struct.Struct("<8sQQ")
+CONTROL_MAGIC = b"TASKREPL"
+_UINT64 = struct.Struct("<Q")
+_SEQUENCE_OFFSET = 8
+_EPOCH_OFFSET = 16
+
+# Python 3.13 can open blocks without the resource tracker. Earlier
+# versions register every block a process opens, and the tracker unlinks
+# them all when that process exits, even blocks another process published.
+_UNTRACKED = {"track": False} if sys.version_info >= (3, 13) else {}
+
+
+def _open_block(name: str, create: bool = False, size: int = 0) -> shared_memory.SharedMemory:
+    """Open a shared memory block whose lifetime the publisher manages, not the tracker."""
+    block = shared_memory.SharedMemory(name, create, size, **_UNTRACKED)
+    if not _UNTRACKED:
+        resource_tracker.unregister(block._name, "shared_memory")
+    return block
+
+
+def _unlink_block(name: str) -> None:
+    """Remove a shared memory block if it still exists."""
+    try:
+        # Opened tracked before 3.13, so that unlink()'s unregister is balanced.
+        block = shared_memory.SharedMemory(name, **_UNTRACKED)
+    except FileNotFoundError:
+        return
+    block.close()
+    block.unlink()
+
+
+def _epoch_block_name(name: str, epoch: int) -> str:
+    """Return the name of the shared memory block holding one epoch."""
+    return f"{name}-{epoch}"
+
+
+class ReplicaPublisher:
+    """
+    Publishes immutable snapshots of a TaskManager into shared memory.
+
+    Each publish() writes a new epoch, in the snapshot layout, to its own
+    shared memory block, then points a small control block named ``name``
+    at it. Published blocks are never modified, so a reader attached to
+    an epoch keeps a consistent view while newer epochs appear.
+
+    The snapshot is encoded by a forked child process. The fork gives the
+    child a copy-on-write image of the manager, so the main process pauses
+    only for the fork itself, never for the encoding. The manager's read
+    lock is held across the fork when it is a ThreadSafeTaskManager, so no
+    write is half-applied in the image. With a plain TaskManager, call
+    publish() from the thread that changes it, or use start() only if no
+    other thread writes. Forking needs POSIX, and the store must be one
+    that survives a fork (the in-memory and snapshot engines, not SQLite).
+
+    The last ``keep`` epochs stay available; older blocks are unlinked,
+    and readers already attached to them keep their mapping.
+    """
+
+    def __init__(self, manager: TaskManager, name: str, keep: int = 2):
+        """
+        Create the control block.
+
+        Args:
+            manager: Manager to publish
+            name: Name of the control block that readers attach to
+            keep: Number of published epochs to keep linked
+
+        Raises:
+            RuntimeError: If the platform cannot fork
+            ValueError: If keep is less than 1
+            FileExistsError: If a block with this name already exists
+        """
+        if not hasattr(os, "fork"):
+            raise RuntimeError("ReplicaPublisher needs os.fork")
+        if keep < 1:
+            raise ValueError("keep must be at least 1")
+        self._manager = manager
+        self._name = name
+        self._keep = keep
+        self._control = _open_block(name, create=True, size=CONTROL.size)
+        CONTROL.pack_into(self._control.buf, 0, CONTROL_MAGIC, 0, 0)
+        self._last_epoch = 0
+        self._published: List[int] = []
+        # (pid, epoch) of the child still encoding, if any.
+        self._pending: Optional[tuple] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def name(self) -> str:
+        """The control block name readers attach to."""
+        return self._name
+
+    @property
+    def epoch(self) -> int:
+        """The latest fully published epoch, or 0 if none is."""
+        return self._published[-1] if self._published else 0
+
+    def publish(self, wait: bool = False) -> Optional[int]:
+        """
+        Start publishing a new epoch of the manager's current state.
+
+        Args:
+            wait: If True, wait until the epoch is published (and wait for
+                a publication already in progress instead of skipping)
+
+        Returns:
+            The new epoch number, or None if a publication was still in
+            progress and ``wait`` is False
+
+        Raises:
+            RuntimeError: If wait is set and the child failed to publish
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The publisher is closed")
+            self._reap(block=wait)
+            if self._pending is not None:
+                return None
+
+            epoch = self._last_epoch + 1
+            with getattr(self._manager, "_read_guard", nullcontext()):
+                pid = os.fork()
+            if pid == 0:
+                self._publish_in_child(epoch)
+            self._last_epoch = epoch
+            self._pending = pid, epoch
+            if wait and not self._reap(block=True):
+                raise RuntimeError(f"Publishing epoch {epoch} failed")
+            return epoch
+
+    def _publish_in_child(self, epoch: int) -> None:
+        """Encode the manager into a new epoch block and announce it; never returns."""
+        status = 1
+        try:
+            # Collecting would touch every object and copy the parent's pages.
+            gc.disable()
+            manager = self._manager
+            chunks = encode_snapshot(manager._store, manager._next_id, epoch)
+            size = sum(len(chunk) for chunk in chunks)
+            block = _open_block(_epoch_block_name(self._name, epoch), create=True, size=size)
+            offset = 0
+            for chunk in chunks:
+                block.buf[offset : offset + len(chunk)] = chunk
+                offset += len(chunk)
+            block.close()
+
+            control = self._control.buf
+            sequence = _UINT64.unpack_from(control, _SEQUENCE_OFFSET)[0]
+            _UINT64.pack_into(control, _SEQUENCE_OFFSET, sequence + 1)
+            _UINT64.pack_into(control, _EPOCH_OFFSET, epoch)
+            _UINT64.pack_into(control, _SEQUENCE_OFFSET, sequence + 2)
+            status = 0
+        except BaseException:
+            traceback.print_exc()
+            sys.stderr.flush()
+        finally:
+            os._exit(status)
+
+    def _reap(self, block: bool) -> bool:
+        """
+        Collect the encoding child if it has finished.
+
+        Returns:
+            False if the child failed, True otherwise
+        """
+        if self._pending is None:
+            return True
+        pid, epoch = self._pending
+        waited, status = os.waitpid(pid, 0 if block else os.WNOHANG)
+        if not waited:
+            return True
+        self._pending = None
+        if os.waitstatus_to_exitcode(status) != 0:
+            _unlink_block(_epoch_block_name(self._name, epoch))
+            self._finish_control_update()
+            return False
+
+        self._published.append(epoch)
+        while len(self._published) > self._keep:
+            _unlink_block(_epoch_block_name(self._name, self._published.pop(0)))
+        return True
+
+    def _finish_control_update(self) -> None:
+        """Point the control block back at the last published epoch if a child died updating it."""
+        control = self._control.buf
+        sequence = _UINT64.unpack_from(control, _SEQUENCE_OFFSET)[0]
+        if sequence % 2:
+            _UINT64.pack_into(control, _EPOCH_OFFSET, self.epoch)
+            _UINT64.pack_into(control, _SEQUENCE_OFFSET, sequence + 1)
+
+    def start(self, interval: float) -> None:
+        """
+        Publish now and then every ``interval`` seconds from a background thread.
+
+        Raises:
+            RuntimeError: If the publisher is already running
+        """
+        if self._thread is not None:
+            raise RuntimeError("The publisher is already running")
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name=f"replica-{self._name}", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, interval: float) -> None:
+        """Background loop of start()."""
+        while True:
+            self.publish()
+            if self._stop.wait(interval):
+                return
+
+    def stop(self) -> None:
+        """Stop the background thread and wait for a publication in progress."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            self._reap(block=True)
+
+    def close(self) -> None:
+        """Stop publishing and unlink every block. Attached readers keep their epoch."""
+        if self._closed:
+            return
+        self.stop()
+        self._closed = True
+        for epoch in self._published:
+            _unlink_block(_epoch_block_name(self._name, epoch))
+        self._published.clear()
+        self._control.close()
+        _unlink_block(self._name)
+
+    def __enter__(self) -> "ReplicaPublisher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _replica_reader(method):
+    """Delegate a read method to the manager over the replica's current epoch."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def read(self, *args, **kwargs):
+        return getattr(self._manager, name)(*args, **kwargs)
+
+    return read
+
+
+class TaskReplica:
+    """
+    Read-only view of the tasks published by a ReplicaPublisher.
+
+    The replica maps the latest epoch's block without copying it and
+    stays on that epoch until refresh(), so every read sees one
+    consistent state. Counts and statistics scan the shared records in
+    place; getters decode only the tasks they return, into private
+    copies. Tasks from an older epoch stay valid after a refresh.
+    """
+
+    def __init__(self, name: str, timeout: float = 5.0):
+        """
+        Attach to a publisher's control block and its latest epoch.
+
+        Args:
+            name: Control block name given to the ReplicaPublisher
+            timeout: Seconds to wait for the first epoch to be published,
+                and for an update of the control block to finish
+
+        Raises:
+            FileNotFoundError: If no publisher uses this name
+            ValueError: If the block is not a replica control block
+            TimeoutError: If nothing is published within ``timeout``
+        """
+        self._name = name
+        self._timeout = timeout
+        self._control = _open_block(name)
+        magic = CONTROL.unpack_from(self._control.buf)[0]
+        if magic != CONTROL_MAGIC:
+            self._control.close()
+            raise ValueError(f"{name} is not a task replica control block")
+        self._block: Optional[shared_memory.SharedMemory] = None
+        self._manager: Optional[TaskManager] = None
+        self.epoch = 0
+
+        deadline = time.monotonic() + timeout
+        try:
+            while not self.refresh():
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Nothing was published to {name} within {timeout} s")
+                time.sleep(0.01)
+        except BaseException:
+            self._control.close()
+            raise
+
+    def _latest_epoch(self) -> int:
+        """
+        Read the latest epoch from the control block's seqlock.
+
+        Raises:
+            TimeoutError: If an update of the control block does not finish
+                within the replica's timeout, as when the publisher process
+                died in the middle of one
+        """
+        control = self._control.buf
+        deadline = None
+        delay = 0.0
+        while True:
+            before = _UINT64.unpack_from(control, _SEQUENCE_OFFSET)[0]
+            epoch = _UINT64.unpack_from(control, _EPOCH_OFFSET)[0]
+            if before % 2 == 0 and before == _UINT64.unpack_from(control, _SEQUENCE_OFFSET)[0]:
+                return epoch
+            if deadline is None:
+                deadline = time.monotonic() + self._timeout
+            elif time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"The control block of {self._name} stayed mid-update for "
+                    f"{self._timeout} s; its publisher may have died while publishing"
+                )
+            time.sleep(delay)
+            delay = min(max(delay * 2, 0.0001), _MAX_RETRY_DELAY)
+
+    def refresh(self) -> bool:
+        """
+        Move to the latest published epoch.
+
+        Returns:
+            True if the replica moved to a newer epoch
+        """
+        while True:
+            epoch = self._latest_epoch()
+            if epoch == 0 or epoch == self.epoch:
+                return False
+            block_name = _epoch_block_name(self._name, epoch)
+            try:
+                block = _open_block(block_name)
+            except FileNotFoundError:
+                # The publisher moved on and unlinked it; read the control block again.
+                continue
+            break
+
+        store = SnapshotTaskStore(f"shared memory {block_name}", buffer=block.buf)
+        self._release()
+        self._block = block
+        self._manager = TaskManager(store=store)
+        self.epoch = epoch
+        return True
+
+    def _release(self) -> None:
+        """Detach from the current epoch's block."""
+        if self._manager is not None:
+            self._manager.close()
+            self._block.close()
+            self._manager = None
+            self._block = None
+
+    def close(self) -> None:
+        """Detach from the publisher."""
+        self._release()
+        self._control.close()
+
+    def __enter__(self) -> "TaskReplica":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    get_task = _replica_reader(TaskManager.get_task)
+    get_all_tasks = _replica_reader(TaskManager.get_all_tasks)
+    get_tasks_by_status = _replica_reader(TaskManager.get_tasks_by_status)
+    get_tasks_by_priority = _replica_reader(TaskManager.get_tasks_by_priority)
+    get_overdue_tasks = _replica_reader(TaskManager.get_overdue_tasks)
+    get_tasks_due_between = _replica_reader(TaskManager.get_tasks_due_between)
+    get_task_count = _replica_reader(TaskManager.get_task_count)
+    get_statistics = _replica_reader(TaskManager.get_statistics)
+    iter_tasks = _replica_reader(TaskManager.iter_tasks)
+    query = _replica_reader(TaskManager.query)
+    search = _replica_reader(TaskManager.search)
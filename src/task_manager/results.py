@@ -0,0 +1,70 @@
+"""Result containers returned by TaskManager bulk operations."""
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from .task import Task
+
+
+@dataclass
+class BulkAddResult:
+    """
+    Outcome of a TaskManager.add_tasks call.
+
+    Attributes:
+        added: Tasks that were created, in input order
+        errors: Validation messages keyed by the zero-based position of each
+            rejected input item
+    """
+
+    added: List[Task] = field(default_factory=list)
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Return True if every item was added."""
+        return not self.errors
+
+
+@dataclass
+class TransitionResult:
+    """
+    Outcome of a bulk status transition such as TaskManager.transition_many.
+
+    Attributes:
+        succeeded: IDs of tasks that now have the target status
+        missing: IDs that did not match any task
+        rejected: Reason the transition was refused, keyed by task ID
+        conflicts: Current version of each task that was not at its
+            expected version, keyed by task ID
+    """
+
+    succeeded: List[int] = field(default_factory=list)
+    missing: List[int] = field(default_factory=list)
+    rejected: Dict[int, str] = field(default_factory=dict)
+    conflicts: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Return True if every requested task was transitioned."""
+        return not self.missing and not self.rejected and not self.conflicts
+
+
+@dataclass
+class ImportResult:
+    """
+    Outcome of a TaskManager.import_jsonl call.
+
+    Attributes:
+        imported: Number of tasks that were added
+        errors: Reason each rejected record was skipped, keyed by its
+            one-based line number in the input
+    """
+
+    imported: int = 0
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Return True if every record was imported."""
+        return not self.errors
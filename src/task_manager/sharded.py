@@ -0,0 +1,460 @@
+"""A task manager partitioned by task ID across worker processes."""
+
+import itertools
+import multiprocessing
+import os
+import threading
+from datetime import datetime
+from operator import attrgetter
+from typing import Callable, Iterable, List, Mapping, Optional
+
+from .exceptions import ValidationError
+from .results import BulkAddResult, TransitionResult
+from .storage import DictTaskStore, TaskStore
+from .task import Task, TaskPriority, TaskStatus
+from .task_manager import TaskManager
+from .wire import TaskBatchView, pack_tasks
+
+_by_id = attrgetter("task_id")
+
+
+def _by_due_date(task: Task) -> tuple:
+    """Sort key of the deadline getters: due date, then ID."""
+    return task.due_date, task.task_id
+
+
+class _ShardTaskManager(TaskManager):
+    """TaskManager of one shard, numbering its tasks shard+1, shard+1+count, ..."""
+
+    def __init__(self, shard: int, shard_count: int, store: TaskStore):
+        self._first_id = shard + 1
+        self._id_step = shard_count
+        super().__init__(store=store)
+
+
+def _encode_tasks(tasks: List[Task]) -> bytes:
+    """Encode tasks, with their versions, as wire-format bytes, which pickle cheaply."""
+    return pack_tasks(tasks)
+
+
+def _encode_result(value):
+    """Replace the tasks in a shard's reply by their encoded form."""
+    if isinstance(value, Task):
+        return _encode_tasks([value])
+    if isinstance(value, list):
+        return _encode_tasks(value)
+    if isinstance(value, BulkAddResult):
+        return _encode_tasks(value.added), value.errors
+    return value
+
+
+def _unpack(data: bytes) -> List[Task]:
+    """Decode tasks sent by a shard, with the versions they have there."""
+    return TaskBatchView(data).to_tasks()
+
+
+def _run_shard(connection, shard: int, shard_count: int, store_factory) -> None:
+    """
+    Serve one shard: answer (method, args, kwargs) requests until None arrives.
+
+    Each reply is (True, result) or (False, exception).
+    """
+    manager = _ShardTaskManager(shard, shard_count, store_factory())
+    while True:
+        try:
+            request = connection.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        name, args, kwargs = request
+        try:
+            reply = True, _encode_result(getattr(manager, name)(*args, **kwargs))
+        except Exception as error:
+            reply = False, error
+        connection.send(reply)
+    manager.close()
+    connection.close()
+
+
+class ShardedTaskManager:
+    """
+    Task manager partitioned by task ID across worker processes.
+
+    Each shard is a process running its own TaskManager, so shards work
+    in parallel instead of sharing one interpreter lock. Task ``i``
+    belongs to shard ``(i - 1) % shards``. Each shard numbers its new
+    tasks from its own stride of that sequence, so IDs are unique without
+    a shared counter. New tasks are placed round-robin, and IDs are not in
+    creation order across shards.
+
+    Point operations go to the owning shard. Bulk adds and transitions
+    are split between shards. Getters, counts and statistics ask every
+    shard at once and merge the answers. Calls from several threads may
+    overlap; each shard serves one request at a time.
+
+    Returned tasks are copies decoded from the shard's reply. Change
+    tasks through the manager's methods; assigning attributes on a copy
+    does not reach the shard. A copy carries the task's version on its
+    shard, ready to pass back as ``expected_version``. Call close() (or
+    use ``with``) to stop the worker processes.
+    """
+
+    def __init__(
+        self,
+        shards: Optional[int] = None,
+        store_factory: Callable[[], TaskStore] = DictTaskStore,
+        start_method: Optional[str] = None,
+    ):
+        """
+        Start the shard processes.
+
+        Args:
+            shards: Number of shards; defaults to the number of CPUs
+            store_factory: Picklable callable creating each shard's storage
+                engine, called inside the shard process
+            start_method: multiprocessing start method, e.g. "spawn";
+                defaults to the platform's
+
+        Raises:
+            ValueError: If shards is less than 1
+        """
+        shard_count = shards if shards is not None else os.cpu_count() or 1
+        if shard_count < 1:
+            raise ValueError("A sharded manager needs at least one shard")
+
+        context = multiprocessing.get_context(start_method)
+        self._connections = []
+        self._processes = []
+        self._locks = [threading.Lock() for _ in range(shard_count)]
+        for shard in range(shard_count):
+            parent_end, child_end = context.Pipe()
+            process = context.Process(
+                target=_run_shard,
+                args=(child_end, shard, shard_count, store_factory),
+                name=f"task-shard-{shard}",
+                daemon=True,
+            )
+            process.start()
+            child_end.close()
+            self._connections.append(parent_end)
+            self._processes.append(process)
+        # Round-robin cursor for placing new tasks.
+        self._placement = itertools.count()
+        self._closed = False
+
+    @property
+    def shard_count(self) -> int:
+        """The number of shards."""
+        return len(self._connections)
+
+    def shard_of(self, task_id: int) -> int:
+        """Return the index of the shard owning a task ID."""
+        return (task_id - 1) % len(self._connections)
+
+    def _call(self, shard: int, name: str, *args, **kwargs):
+        """Run a TaskManager method on one shard and return its encoded result."""
+        with self._locks[shard]:
+            connection = self._connections[shard]
+            connection.send((name, args, kwargs))
+            ok, value = connection.recv()
+        if not ok:
+            raise value
+        return value
+
+    def _scatter(self, name: str, *args, shard_args: Optional[list] = None, **kwargs) -> list:
+        """
+        Run a method on every shard in parallel and return the results in shard order.
+
+        Args:
+            name: TaskManager method to call
+            *args: Positional arguments for every shard
+            shard_args: Per-shard positional arguments, replacing ``args``
+            **kwargs: Keyword arguments for every shard
+
+        Raises:
+            Exception: The first shard's error, after every shard has replied
+        """
+        # Locks are always taken in shard order, so concurrent scatters cannot deadlock.
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            for shard, connection in enumerate(self._connections):
+                connection.send((name, shard_args[shard] if shard_args else args, kwargs))
+            replies = [connection.recv() for connection in self._connections]
+        finally:
+            for lock in self._locks:
+                lock.release()
+        for ok, value in replies:
+            if not ok:
+                raise value
+        return [value for _, value in replies]
+
+    def _gather_tasks(self, name: str, *args, key=_by_id) -> List[Task]:
+        """Collect a task list from every shard, merged by ``key``."""
+        parts = self._scatter(name, *args)
+        # Each part is already sorted, and sorted() merges presorted runs in linear passes.
+        return sorted(itertools.chain.from_iterable(map(_unpack, parts)), key=key)
+
+    def add_task(
+        self,
+        title: str,
+        description: str = "",
+        priority: TaskPriority = TaskPriority.MEDIUM,
+        due_date=None,
+    ) -> Task:
+        """
+        Add a new task to the next shard in turn; see TaskManager.add_task.
+
+        Returns:
+            A copy of the created task
+
+        Raises:
+            ValidationError: If task data is invalid
+        """
+        shard = next(self._placement) % len(self._connections)
+        return _unpack(self._call(shard, "add_task", title, description, priority, due_date))[0]
+
+    def add_tasks(self, items: Iterable[Mapping], atomic: bool = True) -> BulkAddResult:
+        """
+        Add a batch of new tasks spread over the shards; see TaskManager.add_tasks.
+
+        In atomic mode the whole batch is validated here before any shard
+        adds its share, so an invalid item adds nothing anywhere. The shards
+        check their shares again as of the same instant, which therefore
+        cannot reject an item accepted here, and give the whole batch that
+        creation time.
+
+        Args:
+            items: Task definitions to add
+            atomic: If True, add nothing and raise on the first invalid item
+
+        Returns:
+            BulkAddResult with copies of the created tasks, in input order,
+            and the message of every rejected item keyed by its position
+
+        Raises:
+            ValidationError: In atomic mode, if any item is invalid
+        """
+        items = list(items)
+        now = datetime.now()
+        if atomic:
+            for position, item in enumerate(items):
+                try:
+                    TaskManager._check_bulk_item(item, now)
+                except ValidationError as error:
+                    raise ValidationError(f"Item {position}: {error.message}") from error
+
+        shard_count = len(self._connections)
+        first_shard = next(self._placement) % shard_count
+        # Item p goes to shard (first_shard + p) % shard_count.
+        positions = [
+            range((shard - first_shard) % shard_count, len(items), shard_count)
+            for shard in range(shard_count)
+        ]
+        replies = self._scatter(
+            "_add_tasks_at",
+            shard_args=[([items[p] for p in share], atomic, now) for share in positions],
+        )
+
+        added = []
+        result = BulkAddResult()
+        for share, (data, errors) in zip(positions, replies):
+            accepted = [p for index, p in enumerate(share) if index not in errors]
+            added.extend(zip(accepted, _unpack(data)))
+            result.errors.update((share[index], message) for index, message in errors.items())
+        added.sort(key=lambda pair: pair[0])
+        result.added = [task for _, task in added]
+        result.errors = dict(sorted(result.errors.items()))
+        return result
+
+    def get_task(self, task_id: int) -> Task:
+        """
+        Retrieve a copy of a task by ID.
+
+        Raises:
+            TaskNotFoundError: If task doesn't exist
+        """
+        return _unpack(self._call(self.shard_of(task_id), "get_task", task_id))[0]
+
+    def update_task(
+        self,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        priority: Optional[TaskPriority] = None,
+        expected_version: Optional[int] = None,
+    ) -> Task:
+        """
+        Update task details; see TaskManager.update_task.
+
+        Returns:
+            A copy of the updated task
+
+        Raises:
+            TaskNotFoundError: If task doesn't exist
+            ValidationError: If update data is invalid
+            VersionConflictError: If the task is not at expected_version
+        """
+        data = self._call(
+            self.shard_of(task_id),
+            "update_task",
+            task_id,
+            title,
+            description,
+            priority,
+            expected_version,
+        )
+        return _unpack(data)[0]
+
+    def delete_task(self, task_id: int, expected_version: Optional[int] = None) -> None:
+        """
+        Delete a task.
+
+        Raises:
+            TaskNotFoundError: If task doesn't exist
+            VersionConflictError: If the task is not at expected_version
+        """
+        self._call(self.shard_of(task_id), "delete_task", task_id, expected_version)
+
+    def _mark(self, name: str, task_id: int, expected_version: Optional[int]) -> Task:
+        """Run a single-task transition on the owning shard."""
+        return _unpack(self._call(self.shard_of(task_id), name, task_id, expected_version))[0]
+
+    def mark_task_in_progress(self, task_id: int, expected_version: Optional[int] = None) -> Task:
+        """Mark a task as in progress; see TaskManager.mark_task_in_progress."""
+        return self._mark("mark_task_in_progress", task_id, expected_version)
+
+    def mark_task_completed(self, task_id: int, expected_version: Optional[int] = None) -> Task:
+        """Mark a task as completed; see TaskManager.mark_task_completed."""
+        return self._mark("mark_task_completed", task_id, expected_version)
+
+    def mark_task_cancelled(self, task_id: int, expected_version: Optional[int] = None) -> Task:
+        """Mark a task as cancelled; see TaskManager.mark_task_cancelled."""
+        return self._mark("mark_task_cancelled", task_id, expected_version)
+
+    def transition_many(
+        self,
+        task_ids: Iterable[int],
+        status: TaskStatus,
+        expected_versions: Optional[Mapping[int, int]] = None,
+    ) -> TransitionResult:
+        """
+        Move many tasks to a status, each shard handling its own; see TaskManager.transition_many.
+
+        Returns:
+            TransitionResult listing succeeded, missing, rejected and conflicting IDs
+            in input order
+
+        Raises:
+            ValidationError: If status cannot be reached through a transition
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        shares = [[] for _ in self._connections]
+        for task_id in task_ids:
+            shares[self.shard_of(task_id)].append(task_id)
+        if expected_versions is None:
+            shard_args = [(ids, status) for ids in shares]
+        else:
+            shard_args = [
+                (ids, status, {i: expected_versions[i] for i in ids if i in expected_versions})
+                for ids in shares
+            ]
+        replies = self._scatter("transition_many", shard_args=shard_args)
+
+        order = {task_id: position for position, task_id in enumerate(task_ids)}
+        result = TransitionResult()
+        for reply in replies:
+            result.succeeded.extend(reply.succeeded)
+            result.missing.extend(reply.missing)
+            result.rejected.update(reply.rejected)
+            result.conflicts.update(reply.conflicts)
+        result.succeeded.sort(key=order.__getitem__)
+        result.missing.sort(key=order.__getitem__)
+        result.rejected = dict(sorted(result.rejected.items(), key=lambda item: order[item[0]]))
+        result.conflicts = dict(sorted(result.conflicts.items(), key=lambda item: order[item[0]]))
+        return result
+
+    def mark_tasks_in_progress(
+        self, task_ids: Iterable[int], expected_versions: Optional[Mapping[int, int]] = None
+    ) -> TransitionResult:
+        """Mark many tasks as in progress; see transition_many."""
+        return self.transition_many(task_ids, TaskStatus.IN_PROGRESS, expected_versions)
+
+    def mark_tasks_completed(
+        self, task_ids: Iterable[int], expected_versions: Optional[Mapping[int, int]] = None
+    ) -> TransitionResult:
+        """Mark many tasks as completed; see transition_many."""
+        return self.transition_many(task_ids, TaskStatus.COMPLETED, expected_versions)
+
+    def mark_tasks_cancelled(
+        self, task_ids: Iterable[int], expected_versions: Optional[Mapping[int, int]] = None
+    ) -> TransitionResult:
+        """Mark many tasks as cancelled; see transition_many."""
+        return self.transition_many(task_ids, TaskStatus.CANCELLED, expected_versions)
+
+    def get_all_tasks(self) -> List[Task]:
+        """Get copies of all tasks, ordered by ID."""
+        return self._gather_tasks("get_all_tasks")
+
+    def get_tasks_by_status(self, status: TaskStatus) -> List[Task]:
+        """Get copies of the tasks with a status, ordered by ID."""
+        return self._gather_tasks("get_tasks_by_status", status)
+
+    def get_tasks_by_priority(self, priority: TaskPriority) -> List[Task]:
+        """Get copies of the tasks with a priority, ordered by ID."""
+        return self._gather_tasks("get_tasks_by_priority", priority)
+
+    def get_overdue_tasks(self) -> List[Task]:
+        """Get copies of the overdue tasks, ordered by due date."""
+        return self._gather_tasks("get_overdue_tasks", key=_by_due_date)
+
+    def get_tasks_due_between(self, start: datetime, end: datetime) -> List[Task]:
+        """Get copies of the open tasks due in ``[start, end)``, ordered by due date."""
+        return self._gather_tasks("get_tasks_due_between", start, end, key=_by_due_date)
+
+    def get_task_count(self) -> int:
+        """Get the total number of tasks."""
+        return sum(self._scatter("get_task_count"))
+
+    def get_statistics(self, verify: bool = False) -> dict:
+        """
+        Get statistics about tasks, summed over the shards; see TaskManager.get_statistics.
+
+        Raises:
+            AssertionError: If verify is set and a shard's counters are inconsistent
+        """
+        parts = self._scatter("get_statistics", verify)
+        counts = {status: sum(part[status.value] for part in parts) for status in TaskStatus}
+        return TaskManager._build_statistics(
+            counts,
+            sum(part["total"] for part in parts),
+            sum(part["overdue"] for part in parts),
+        )
+
+    def clear_all_tasks(self) -> None:
+        """Clear all tasks from every shard."""
+        self._scatter("clear_all_tasks")
+
+    def close(self) -> None:
+        """Stop the shard processes. Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        for lock, connection in zip(self._locks, self._connections):
+            with lock:
+                try:
+                    connection.send(None)
+                except OSError:
+                    pass
+        for process, connection in zip(self._processes, self._connections):
+            process.join(5)
+            if process.is_alive():
+                process.terminate()
+            connection.close()
+
+    def __enter__(self) -> "ShardedTaskManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,479 @@
+"""Binary snapshots of TaskManager state, loaded lazily through mmap."""
+
+import mmap
+import os
+import struct
+import weakref
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .codec import (
+    BINARY_RECORD,
+    STATUS_CODES,
+    STATUSES,
+    datetime_to_micros,
+    decode_binary_record,
+    pack_binary_records,
+)
+from .exceptions import SnapshotFormatError
+from .storage import DictTaskStore, TaskStore
+from .task import OPEN_STATUSES, Task, TaskPriority, TaskStatus
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; base scans fall back to struct.iter_unpack
+    np = None
+
+# File layout (little-endian):
+#   header   magic, format version, generation, next task ID, task count, heap offset
+#   records  one codec.BINARY_RECORD per task, sorted by task ID
+#   heap     UTF-8 titles and descriptions, addressed by (offset, length) from records
+MAGIC = b"TASKSNAP"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<8sHQQQQ")
+RECORD = BINARY_RECORD
+
+if np is not None:
+    RECORD_DTYPE = np.dtype(
+        [
+            ("task_id", "<i8"),
+            ("status", "i1"),
+            ("priority", "i1"),
+            ("created", "<i8"),
+            ("updated", "<i8"),
+            ("due", "<i8"),
+            ("title_offset", "<u8"),
+            ("title_length", "<u4"),
+            ("description_offset", "<u8"),
+            ("description_length", "<u4"),
+            ("version", "<i8"),
+        ]
+    )
+
+# Smallest int64, used as an open lower bound for due-date scans.
+_MIN_MICROS = -(2**63)
+
+_OPEN_CODES = frozenset(STATUS_CODES[status] for status in OPEN_STATUSES)
+
+# Offsets of the one-byte status and priority codes inside a record, and
+# the number of count slots needed to index priority codes by value.
+_STATUS_OFFSET = struct.calcsize("<q")
+_PRIORITY_OFFSET = _STATUS_OFFSET + 1
+_PRIORITY_SLOTS = max(priority.value for priority in TaskPriority) + 1
+
+
+def encode_snapshot(tasks: Iterable[Task], next_id: int, generation: int) -> List[bytes]:
+    """
+    Encode tasks in the snapshot layout.
+
+    Args:
+        tasks: Tasks to store; they are written sorted by ID
+        next_id: ID the manager will assign next
+        generation: Snapshot generation, used to match it with its log
+
+    Returns:
+        Chunks whose concatenation is the snapshot: header, records, heap
+    """
+    ordered = sorted(tasks, key=lambda task: task.task_id)
+    records, heap = pack_binary_records(ordered)
+    heap_offset = HEADER.size + len(records)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, generation, next_id, len(ordered), heap_offset)
+    return [header, records, *heap]
+
+
+def write_snapshot(path: str, tasks: Iterable[Task], next_id: int, generation: int) -> None:
+    """
+    Write tasks to a snapshot file atomically.
+
+    The file is written next to ``path``, fsync'ed and then renamed over it,
+    so readers see either the old snapshot or the complete new one.
+
+    Args:
+        path: Destination file
+        tasks: Tasks to store; they are written sorted by ID
+        next_id: ID the manager will assign next
+        generation: Snapshot generation, used to match it with its log
+    """
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as snapshot_file:
+        snapshot_file.writelines(encode_snapshot(tasks, next_id, generation))
+        snapshot_file.flush()
+        os.fsync(snapshot_file.fileno())
+    os.replace(temporary_path, path)
+
+
+class SnapshotTaskStore(TaskStore):
+    """
+    Engine backed by a memory-mapped snapshot plus an in-memory overlay.
+
+    Opening a snapshot only reads its header. Records are decoded when a
+    task is requested and the resulting task is only weakly cached, so
+    reading every task (an export, a full listing, building a search index)
+    leaves memory as it was. The first change to a task moves it into an
+    overlay DictTaskStore; from then on all of its changes happen there and
+    the snapshot record is shadowed. Filters and counts combine the overlay
+    with scans over the mapped records, vectorized with NumPy when it is
+    installed, without materializing non-matching tasks.
+    """
+
+    def __init__(self, path: str, buffer=None):
+        """
+        Map a snapshot file, or read a snapshot held in memory.
+
+        Args:
+            path: Snapshot written by write_snapshot; names the snapshot in
+                errors when ``buffer`` is given
+            buffer: Optional bytes-like object holding an encode_snapshot
+                result, such as a shared memory block. It is read in place
+                and must not change while the store is open.
+
+        Raises:
+            SnapshotFormatError: If the file is not a valid snapshot
+        """
+        # The overlay must exist before the base class assigns ``owner``.
+        self._overlay = DictTaskStore()
+        super().__init__()
+        self.path = path
+
+        if buffer is not None:
+            self._map = memoryview(buffer).cast("B")
+            size = len(self._map)
+            if size < HEADER.size:
+                self._map.release()
+                raise SnapshotFormatError(path, "buffer is too short")
+        else:
+            with open(path, "rb") as snapshot_file:
+                size = os.fstat(snapshot_file.fileno()).st_size
+                if size < HEADER.size:
+                    raise SnapshotFormatError(path, "file is too short")
+                self._map = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, generation, next_id, count, heap_offset = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise SnapshotFormatError(path, "bad magic number")
+        if version != FORMAT_VERSION:
+            raise SnapshotFormatError(path, f"unsupported format version {version}")
+        if heap_offset != HEADER.size + count * RECORD.size or heap_offset > size:
+            raise SnapshotFormatError(path, "record section is truncated")
+
+        self.generation = generation
+        self.next_id = next_id
+        self._count = count
+        self._heap_offset = heap_offset
+        # Snapshot IDs whose record no longer applies (promoted or deleted),
+        # with the (status, priority) codes each had in the snapshot.
+        self._shadowed: Dict[int, Tuple[int, int]] = {}
+        self._base_status_counts: Optional[List[int]] = None
+        self._base_priority_counts: Optional[List[int]] = None
+        self._records = None
+        # Unchanged tasks decoded from records, alive while callers hold them.
+        self._live: "weakref.WeakValueDictionary[int, Task]" = weakref.WeakValueDictionary()
+
+    @property
+    def owner(self):
+        """TaskManager that owns the tasks; shared with the overlay."""
+        return self._overlay.owner
+
+    @owner.setter
+    def owner(self, value) -> None:
+        self._overlay.owner = value
+
+    # -- snapshot access ---------------------------------------------------
+
+    def _record(self, row: int) -> tuple:
+        """Unpack one fixed-width record."""
+        return RECORD.unpack_from(self._map, HEADER.size + row * RECORD.size)
+
+    def _id_at(self, row: int) -> int:
+        """Read the task ID of a record without unpacking the rest."""
+        return struct.unpack_from("<q", self._map, HEADER.size + row * RECORD.size)[0]
+
+    def _find_row(self, task_id: int) -> Optional[int]:
+        """Binary-search the ID-sorted records for a live (unshadowed) task."""
+        if task_id in self._shadowed:
+            return None
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._id_at(middle) < task_id:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._id_at(low) == task_id:
+            return low
+        return None
+
+    def _first_row_after(self, task_id: int) -> int:
+        """Binary-search the ID-sorted records for the first row with a larger ID."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._id_at(middle) <= task_id:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _decode(self, record: tuple) -> Task:
+        """Build a Task from an unpacked record, reading its strings from the heap."""
+        return decode_binary_record(record, self._map, self._heap_offset)
+
+    def _load(self, row: int) -> Task:
+        """Return the task of a snapshot record, reusing the live object if there is one."""
+        task_id = self._id_at(row)
+        task = self._live.get(task_id)
+        if task is None:
+            task = self._decode(self._record(row))
+            task._owner = self.owner
+            self._live[task_id] = task
+        return task
+
+    def _promote(self, task: Task) -> None:
+        """Move a loaded task that just changed into the overlay, shadowing its record."""
+        record = self._record(self._find_row(task.task_id))
+        self._shadowed[task.task_id] = (record[1], record[2])
+        del self._live[task.task_id]
+        # The overlay indexes the task by its new values, so the change is applied.
+        self._overlay.add(task)
+
+    def _numpy_records(self):
+        """Return a zero-copy structured NumPy view of the records."""
+        if self._records is None:
+            self._records = np.frombuffer(
+                self._map, dtype=RECORD_DTYPE, count=self._count, offset=HEADER.size
+            )
+        return self._records
+
+    def _base_rows(self, status=None, priority=None, due_low=None, due_high=None) -> List[int]:
+        """
+        Return unshadowed snapshot rows matching every given criterion.
+
+        ``status`` and ``priority`` are codes; a due range selects open
+        tasks due in ``[due_low, due_high)``.
+        """
+        if not self._count:
+            return []
+
+        if np is not None:
+            records = self._numpy_records()
+            mask = np.ones(self._count, dtype=bool)
+            if status is not None:
+                mask &= records["status"] == status
+            if priority is not None:
+                mask &= records["priority"] == priority
+            if due_high is not None:
+                due = records["due"]
+                mask &= (due >= due_low) & (due < due_high)
+                mask &= np.isin(records["status"], list(_OPEN_CODES))
+            rows = np.flatnonzero(mask).tolist()
+        else:
+            rows = []
+            view = memoryview(self._map)[HEADER.size : self._heap_offset]
+            for row, record in enumerate(RECORD.iter_unpack(view)):
+                if status is not None and record[1] != status:
+                    continue
+                if priority is not None and record[2] != priority:
+                    continue
+                if due_high is not None and not (
+                    due_low <= record[5] < due_high and record[1] in _OPEN_CODES
+                ):
+                    continue
+                rows.append(row)
+            view.release()
+
+        if self._shadowed:
+            shadowed = self._shadowed
+            rows = [row for row in rows if self._id_at(row) not in shadowed]
+        return rows
+
+    # -- TaskStore interface -----------------------------------------------
+
+    def add(self, task: Task) -> None:
+        """Store a new task in the overlay."""
+        self._overlay.add(task)
+
+    def add_many(self, tasks: List[Task]) -> None:
+        """Store a batch of new tasks in the overlay."""
+        self._overlay.add_many(tasks)
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """Return a task from the overlay, or decoded from its snapshot record."""
+        task = self._overlay.get(task_id)
+        if task is not None:
+            return task
+        row = self._find_row(task_id)
+        return None if row is None else self._load(row)
+
+    def remove(self, task_id: int) -> Optional[Task]:
+        """Remove a task from the overlay or shadow its snapshot record."""
+        task = self._overlay.remove(task_id)
+        if task is not None:
+            return task
+        row = self._find_row(task_id)
+        if row is None:
+            return None
+        record = self._record(row)
+        self._shadowed[task_id] = (record[1], record[2])
+        task = self._live.pop(task_id, None)
+        if task is None:
+            return self._decode(record)
+        task._owner = None
+        return task
+
+    def clear(self) -> None:
+        """Remove every task, treating the snapshot as empty from now on."""
+        self._overlay.clear()
+        for task in list(self._live.values()):
+            task._owner = None
+        self._live.clear()
+        self._count = 0
+        self._shadowed.clear()
+        self._base_status_counts = [0] * len(STATUSES)
+        self._base_priority_counts = [0] * _PRIORITY_SLOTS
+        self._records = None
+
+    def close(self) -> None:
+        """Unmap the snapshot file, or let go of the snapshot buffer."""
+        self._records = None
+        if isinstance(self._map, memoryview):
+            self._map.release()
+        else:
+            self._map.close()
+
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return len(self._overlay) + self._count - len(self._shadowed)
+
+    def __contains__(self, task_id: int) -> bool:
+        """Return whether a task with the given ID is stored, without promoting it."""
+        return task_id in self._overlay or self._find_row(task_id) is not None
+
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate over every task: overlay tasks first, then snapshot records by ID."""
+        yield from list(self._overlay)
+        for row in range(self._count):
+            if self._id_at(row) not in self._shadowed:
+                yield self._load(row)
+
+    def task_changed(self, task: Task, field_name: str, old_value) -> None:
+        """Apply a change in the overlay, moving the task there on its first change."""
+        if task.task_id in self._live:
+            self._promote(task)
+        else:
+            self._overlay.task_changed(task, field_name, old_value)
+
+    def tasks_transitioned(self, tasks: List[Task], old_statuses: List[TaskStatus]) -> None:
+        """Apply a bulk transition, moving tasks changed for the first time to the overlay."""
+        overlay_tasks = []
+        overlay_statuses = []
+        for task, old_status in zip(tasks, old_statuses):
+            if task.task_id in self._live:
+                self._promote(task)
+            else:
+                overlay_tasks.append(task)
+                overlay_statuses.append(old_status)
+        self._overlay.tasks_transitioned(overlay_tasks, overlay_statuses)
+
+    def by_status(self, status: TaskStatus) -> List[Task]:
+        """Return overlay matches plus decoded snapshot matches."""
+        rows = self._base_rows(status=STATUS_CODES[status])
+        return self._overlay.by_status(status) + [self._load(row) for row in rows]
+
+    def by_priority(self, priority: TaskPriority) -> List[Task]:
+        """Return overlay matches plus decoded snapshot matches."""
+        rows = self._base_rows(priority=priority.value)
+        return self._overlay.by_priority(priority) + [self._load(row) for row in rows]
+
+    def _due_range(self, low: int, high: int, overlay_tasks: List[Task]) -> List[Task]:
+        """Merge overlay and snapshot deadline matches, ordered by due date."""
+        tasks = overlay_tasks + [
+            self._load(row) for row in self._base_rows(due_low=low, due_high=high)
+        ]
+        tasks.sort(key=lambda task: (task.due_date, task.task_id))
+        return tasks
+
+    def due_between(self, start: datetime, end: datetime) -> List[Task]:
+        """Return open tasks due in ``[start, end)``, ordered by due date."""
+        return self._due_range(
+            datetime_to_micros(start),
+            datetime_to_micros(end),
+            self._overlay.due_between(start, end),
+        )
+
+    def due_before(self, moment: datetime) -> List[Task]:
+        """Return open tasks due strictly before ``moment``."""
+        return self._due_range(
+            _MIN_MICROS, datetime_to_micros(moment), self._overlay.due_before(moment)
+        )
+
+    def page(
+        self,
+        after_id: int,
+        limit: int,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+    ) -> List[Task]:
+        """Merge the overlay's next page with the next matching snapshot records."""
+        tasks = self._overlay.page(after_id, limit, status, priority)
+        status_code = None if status is None else STATUS_CODES[status]
+        priority_code = None if priority is None else priority.value
+        # Snapshot records past the overlay's last match cannot make the page.
+        stop_id = tasks[-1].task_id if len(tasks) == limit else None
+        rows = []
+        for row in range(self._first_row_after(after_id), self._count):
+            if len(rows) == limit:
+                break
+            record = self._record(row)
+            if stop_id is not None and record[0] > stop_id:
+                break
+            if (
+                record[0] in self._shadowed
+                or (status_code is not None and record[1] != status_code)
+                or (priority_code is not None and record[2] != priority_code)
+            ):
+                continue
+            rows.append(row)
+        tasks.extend(self._load(row) for row in rows)
+        tasks.sort(key=lambda task: task.task_id)
+        return tasks[: max(limit, 0)]
+
+    def count_due_before(self, moment: datetime) -> int:
+        """Count open tasks due before ``moment`` without promoting snapshot tasks."""
+        base = self._base_rows(due_low=_MIN_MICROS, due_high=datetime_to_micros(moment))
+        return self._overlay.count_due_before(moment) + len(base)
+
+    def status_counts(self) -> Dict[TaskStatus, int]:
+        """Combine overlay counts with cached snapshot counts minus shadowed records."""
+        if self._base_status_counts is None:
+            self._base_status_counts = self._count_base_codes(_STATUS_OFFSET, len(STATUSES))
+
+        counts = list(self._base_status_counts)
+        for status_code, _ in self._shadowed.values():
+            counts[status_code] -= 1
+        overlay_counts = self._overlay.status_counts()
+        return {
+            status: counts[code] + overlay_counts[status] for code, status in enumerate(STATUSES)
+        }
+
+    def priority_counts(self) -> Dict[TaskPriority, int]:
+        """Combine overlay counts with cached snapshot counts minus shadowed records."""
+        if self._base_priority_counts is None:
+            self._base_priority_counts = self._count_base_codes(_PRIORITY_OFFSET, _PRIORITY_SLOTS)
+
+        counts = list(self._base_priority_counts)
+        for _, priority_code in self._shadowed.values():
+            counts[priority_code] -= 1
+        overlay_counts = self._overlay.priority_counts()
+        return {
+            priority: counts[priority.value] + overlay_counts[priority] for priority in TaskPriority
+        }
+
+    def _count_base_codes(self, offset: int, slots: int) -> List[int]:
+        """Count every snapshot record by the one-byte code at ``offset`` with one scan."""
+        if not self._count:
+            return [0] * slots
+        # Codes sit at a fixed offset in each record, so a strided slice
+        # gathers them all without unpacking any record.
+        start = HEADER.size + offset
+        code_bytes = bytes(memoryview(self._map)[start : self._heap_offset : RECORD.size])
+        return [code_bytes.count(code) for code in range(slots)]
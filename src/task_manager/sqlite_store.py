@@ -0,0 +1,344 @@
+"""SQLite storage engine for datasets larger than memory."""
+
+import sqlite3
+import weakref
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from .codec import (
+    FIELD_ENCODERS,
+    STATUS_CODES,
+    STATUSES,
+    datetime_to_micros,
+    decode_task,
+    encode_task,
+)
+from .storage import TaskStore
+from .task import OPEN_STATUSES, TASK_FIELDS, Task, TaskPriority, TaskStatus
+
+# Smallest int64, used as an open lower bound for due-date queries.
+_MIN_MICROS = -(2**63)
+
+# Rows fetched per query while iterating over every task.
+_ITER_PAGE_SIZE = 1000
+
+# Position of the due date in a full row, for keyset paging in due order.
+_DUE_COLUMN = TASK_FIELDS.index("due_date")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS tasks (
+        task_id INTEGER PRIMARY KEY,
+        title TEXT NOT NULL,
+        description TEXT NOT NULL,
+        status INTEGER NOT NULL,
+        priority INTEGER NOT NULL,
+        created_at INTEGER NOT NULL,
+        updated_at INTEGER NOT NULL,
+        due_date INTEGER NOT NULL,
+        version INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    # Leading status column serves status filters; the trailing due_date
+    # turns "open and due before X" into two index range scans.
+    "CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, due_date)",
+    "CREATE INDEX IF NOT EXISTS tasks_priority ON tasks (priority)",
+    "CREATE INDEX IF NOT EXISTS tasks_due_date ON tasks (due_date)",
+)
+
+# Added to databases created before tasks had a stored version.
+_ADD_VERSION_COLUMN = "ALTER TABLE tasks ADD COLUMN version INTEGER NOT NULL DEFAULT 0"
+
+# Columns are named after TASK_FIELDS and hold the values produced by
+# encode_task, so rows decode with decode_task; the task's version follows
+# them. Statements are constant strings, which sqlite3 prepares once and
+# keeps in its statement cache.
+_ROW_COLUMNS = TASK_FIELDS + ("version",)
+_COLUMN_LIST = ", ".join(_ROW_COLUMNS)
+_OPEN_CODE_LIST = ", ".join(sorted(str(STATUS_CODES[status]) for status in OPEN_STATUSES))
+
+_INSERT = f"INSERT INTO tasks ({_COLUMN_LIST}) VALUES ({', '.join('?' * len(_ROW_COLUMNS))})"
+_SELECT_BY_ID = f"SELECT {_COLUMN_LIST} FROM tasks WHERE task_id = ?"
+_SELECT_PAGE = f"SELECT {_COLUMN_LIST} FROM tasks WHERE task_id > ? ORDER BY task_id LIMIT ?"
+_SELECT_PAGE_WHERE = (
+    f"SELECT {_COLUMN_LIST} FROM tasks WHERE task_id > ? AND {{}} ORDER BY task_id LIMIT ?"
+)
+_SELECT_BY_STATUS = f"SELECT {_COLUMN_LIST} FROM tasks WHERE status = ? ORDER BY task_id"
+_SELECT_BY_PRIORITY = f"SELECT {_COLUMN_LIST} FROM tasks WHERE priority = ? ORDER BY task_id"
+_SELECT_DUE = (
+    f"SELECT {_COLUMN_LIST} FROM tasks WHERE due_date >= ? AND due_date < ? "
+    f"AND status IN ({_OPEN_CODE_LIST}) ORDER BY due_date, task_id"
+)
+_SELECT_DUE_PAGE = (
+    f"SELECT {_COLUMN_LIST} FROM tasks WHERE (due_date, task_id) > (?, ?) AND due_date < ? "
+    f"AND status IN ({_OPEN_CODE_LIST}) ORDER BY due_date, task_id LIMIT ?"
+)
+_COUNT_DUE_BEFORE = (
+    f"SELECT COUNT(*) FROM tasks WHERE due_date < ? AND status IN ({_OPEN_CODE_LIST})"
+)
+_COUNT_BY_STATUS = "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+_COUNT_BY_PRIORITY = "SELECT priority, COUNT(*) FROM tasks GROUP BY priority"
+_COUNT = "SELECT COUNT(*) FROM tasks"
+_MAX_ID = "SELECT MAX(task_id) FROM tasks"
+_EXISTS = "SELECT 1 FROM tasks WHERE task_id = ?"
+_DELETE = "DELETE FROM tasks WHERE task_id = ?"
+_DELETE_ALL = "DELETE FROM tasks"
+_UPDATE_FIELD = {
+    field_name: f"UPDATE tasks SET {field_name} = ?, version = ? WHERE task_id = ?"
+    for field_name in TASK_FIELDS
+    if field_name != "task_id"
+}
+_UPDATE_TRANSITION = "UPDATE tasks SET status = ?, updated_at = ?, version = ? WHERE task_id = ?"
+
+
+class SqliteTaskStore(TaskStore):
+    """
+    Engine that keeps tasks in a SQLite database instead of in memory.
+
+    Each filter and count is a single SQL query served by the indexes on
+    status, priority and due date. Task objects are materialized only when
+    returned and are cached weakly, so a task that is still referenced is
+    always returned as the same object and writes to it reach the database.
+    Each row stores its task's version too, so versions survive both the
+    weak cache and reopening the database.
+
+    Writes accumulate in one open transaction, committed after
+    ``commit_every`` row changes and on commit() or close(); bulk adds and
+    bulk transitions are single ``executemany`` calls. The database uses
+    the WAL journal mode, so readers in other connections see the last
+    committed state without blocking on the writer.
+
+    Timestamps are stored as microseconds since the epoch, so this engine
+    expects naive datetimes such as those returned by ``datetime.now()``.
+    """
+
+    def __init__(self, path: str = ":memory:", commit_every: int = 256):
+        """
+        Open (and create if needed) a task database.
+
+        Args:
+            path: Database file, or ":memory:" for a private in-memory database
+            commit_every: Number of row changes per transaction (1 commits every write)
+
+        Raises:
+            ValueError: If commit_every is not positive
+        """
+        if commit_every < 1:
+            raise ValueError("commit_every must be at least 1")
+
+        super().__init__()
+        self.path = path
+        self.commit_every = commit_every
+        # Autocommit mode: transactions are opened and committed explicitly.
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        if "version" not in {row[1] for row in self._db.execute("PRAGMA table_info(tasks)")}:
+            self._db.execute(_ADD_VERSION_COLUMN)
+        self._pending = 0
+        self._live: "weakref.WeakValueDictionary[int, Task]" = weakref.WeakValueDictionary()
+
+        max_id = self._db.execute(_MAX_ID).fetchone()[0]
+        self.next_id = 1 if max_id is None else max_id + 1
+
+    # -- transactions ------------------------------------------------------
+
+    def _write(self, sql: str, parameters) -> None:
+        """Run a write inside the open transaction, committing when it is full."""
+        if not self._db.in_transaction:
+            self._db.execute("BEGIN")
+        self._db.execute(sql, parameters)
+        self._count_writes(1)
+
+    def _write_many(self, sql: str, parameter_rows: list) -> None:
+        """Run one statement for many rows inside the open transaction."""
+        if not self._db.in_transaction:
+            self._db.execute("BEGIN")
+        self._db.executemany(sql, parameter_rows)
+        self._count_writes(len(parameter_rows))
+
+    def _count_writes(self, rows: int) -> None:
+        """Record written rows and commit once a transaction's worth is pending."""
+        self._pending += rows
+        if self._pending >= self.commit_every:
+            self.commit()
+
+    def commit(self) -> None:
+        """Commit every pending write."""
+        if self._db.in_transaction:
+            self._db.execute("COMMIT")
+        self._pending = 0
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        self.commit()
+        self._db.close()
+
+    # -- materialization ---------------------------------------------------
+
+    def _materialize(self, row: tuple) -> Task:
+        """Return the Task for a row, reusing the live object if there is one."""
+        task = self._live.get(row[0])
+        if task is None:
+            task = decode_task(row)
+            task.version = row[-1]
+            task._owner = self.owner
+            self._live[task.task_id] = task
+        return task
+
+    def _query(self, sql: str, parameters=()) -> List[Task]:
+        """Run a SELECT over full rows and materialize the results."""
+        return [self._materialize(row) for row in self._db.execute(sql, parameters)]
+
+    # -- TaskStore interface -----------------------------------------------
+
+    def add(self, task: Task) -> None:
+        """Insert a task row."""
+        self._write(_INSERT, [*encode_task(task), task.version])
+        self._live[task.task_id] = task
+        task._owner = self.owner
+
+    def add_many(self, tasks: List[Task]) -> None:
+        """Insert a batch of task rows with one executemany call."""
+        self._write_many(_INSERT, [[*encode_task(task), task.version] for task in tasks])
+        owner = self.owner
+        for task in tasks:
+            self._live[task.task_id] = task
+            task._owner = owner
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """Return the task with the given ID, loading it if needed."""
+        task = self._live.get(task_id)
+        if task is not None:
+            return task
+        row = self._db.execute(_SELECT_BY_ID, (task_id,)).fetchone()
+        return None if row is None else self._materialize(row)
+
+    def remove(self, task_id: int) -> Optional[Task]:
+        """Delete a task row and detach its task."""
+        task = self.get(task_id)
+        if task is None:
+            return None
+        self._write(_DELETE, (task_id,))
+        task._owner = None
+        del self._live[task_id]
+        return task
+
+    def clear(self) -> None:
+        """Delete every row and detach every live task."""
+        for task in list(self._live.values()):
+            task._owner = None
+        self._live.clear()
+        self._write(_DELETE_ALL, ())
+
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return self._db.execute(_COUNT).fetchone()[0]
+
+    def __contains__(self, task_id: int) -> bool:
+        """Return whether a task with the given ID is stored, without loading it."""
+        return task_id in self._live or self._db.execute(_EXISTS, (task_id,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate over every task by ID, reading one page of rows at a time."""
+        last_id = _MIN_MICROS
+        while True:
+            page = self._db.execute(_SELECT_PAGE, (last_id, _ITER_PAGE_SIZE)).fetchall()
+            # Materializing the whole page keeps its tasks live, so changes made
+            # while iterating reach these objects rather than leaving stale rows.
+            yield from [self._materialize(row) for row in page]
+            if len(page) < _ITER_PAGE_SIZE:
+                return
+            last_id = page[-1][0]
+
+    def task_changed(self, task: Task, field_name: str, old_value) -> None:
+        """Write a changed task field and the task's new version into its row."""
+        sql = _UPDATE_FIELD.get(field_name)
+        if sql is not None:
+            value = FIELD_ENCODERS[field_name](getattr(task, field_name))
+            self._write(sql, (value, task.version, task.task_id))
+
+    def tasks_transitioned(self, tasks: List[Task], old_statuses: List[TaskStatus]) -> None:
+        """Write the new status, updated_at and version of a batch with one executemany call."""
+        self._write_many(
+            _UPDATE_TRANSITION,
+            [
+                (
+                    STATUS_CODES[task.status],
+                    datetime_to_micros(task.updated_at),
+                    task.version,
+                    task.task_id,
+                )
+                for task in tasks
+            ],
+        )
+
+    def by_status(self, status: TaskStatus) -> List[Task]:
+        """Return tasks with the given status through the status index."""
+        return self._query(_SELECT_BY_STATUS, (STATUS_CODES[status],))
+
+    def by_priority(self, priority: TaskPriority) -> List[Task]:
+        """Return tasks with the given priority through the priority index."""
+        return self._query(_SELECT_BY_PRIORITY, (priority.value,))
+
+    def due_between(self, start: datetime, end: datetime) -> List[Task]:
+        """Return open tasks due in ``[start, end)`` through the due-date index."""
+        return self._query(_SELECT_DUE, (datetime_to_micros(start), datetime_to_micros(end)))
+
+    def iter_due_between(self, start: datetime, end: datetime) -> Iterator[Task]:
+        """Yield open tasks due in ``[start, end)``, reading the due-date index a page at a time."""
+        last_due, last_id = datetime_to_micros(start), _MIN_MICROS
+        end_micros = datetime_to_micros(end)
+        while True:
+            page = self._db.execute(
+                _SELECT_DUE_PAGE, (last_due, last_id, end_micros, _ITER_PAGE_SIZE)
+            ).fetchall()
+            yield from [self._materialize(row) for row in page]
+            if len(page) < _ITER_PAGE_SIZE:
+                return
+            last_due, last_id = page[-1][_DUE_COLUMN], page[-1][0]
+
+    def due_before(self, moment: datetime) -> List[Task]:
+        """Return open tasks due strictly before ``moment``."""
+        return self._query(_SELECT_DUE, (_MIN_MICROS, datetime_to_micros(moment)))
+
+    def page(
+        self,
+        after_id: int,
+        limit: int,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+    ) -> List[Task]:
+        """Return the next tasks in ID order with one keyset query on the primary key."""
+        conditions = []
+        parameters = [after_id]
+        if status is not None:
+            conditions.append("status = ?")
+            parameters.append(STATUS_CODES[status])
+        if priority is not None:
+            conditions.append("priority = ?")
+            parameters.append(priority.value)
+        parameters.append(max(limit, 0))
+        if not conditions:
+            return self._query(_SELECT_PAGE, parameters)
+        return self._query(_SELECT_PAGE_WHERE.format(" AND ".join(conditions)), parameters)
+
+    def count_due_before(self, moment: datetime) -> int:
+        """Count open tasks due strictly before ``moment`` with one aggregate query."""
+        return self._db.execute(_COUNT_DUE_BEFORE, (datetime_to_micros(moment),)).fetchone()[0]
+
+    def status_counts(self) -> Dict[TaskStatus, int]:
+        """Count tasks per status with one GROUP BY query."""
+        counts = {status: 0 for status in STATUSES}
+        for status_code, count in self._db.execute(_COUNT_BY_STATUS):
+            counts[STATUSES[status_code]] = count
+        return counts
+
+    def priority_counts(self) -> Dict[TaskPriority, int]:
+        """Count tasks per priority with one GROUP BY query over the priority index."""
+        counts = {priority: 0 for priority in TaskPriority}
+        for priority_code, count in self._db.execute(_COUNT_BY_PRIORITY):
+            counts[TaskPriority(priority_code)] = count
+        return counts
@@ -0,0 +1,461 @@
+"""Storage engines that hold the tasks of a TaskManager."""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from heapq import nsmallest
+from typing import Container, Dict, Iterator, List, Optional, Tuple
+
+from .task import OPEN_STATUSES, Task, TaskPriority, TaskStatus
+
+# Above this many removals, the due-date index is rebuilt in one pass instead
+# of deleting entries one by one (each deletion shifts the tail of the list).
+_DUE_INDEX_REBUILD_THRESHOLD = 32
+
+# Entries read from the due-date index per step of iter_due_between.
+_DUE_PAGE_SIZE = 256
+
+
+class SortedIdIndex:
+    """
+    Task IDs in ascending order, for cursor pagination.
+
+    New IDs are usually larger than every stored one and are appended in
+    O(1). Removed IDs are left in place and skipped by ``after`` until
+    they make up half of the list, when it is compacted in one pass; this
+    keeps removal O(1) amortized instead of shifting the list each time.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._ids: List[int] = []
+        self._removed = 0
+
+    def add(self, task_id: int) -> None:
+        """Register a new ID."""
+        ids = self._ids
+        if not ids or task_id > ids[-1]:
+            ids.append(task_id)
+            return
+        position = bisect_left(ids, task_id)
+        if position < len(ids) and ids[position] == task_id:
+            # The ID was removed earlier and is still in the list.
+            self._removed -= 1
+        else:
+            ids.insert(position, task_id)
+
+    def add_many(self, task_ids: List[int]) -> None:
+        """Register a batch of new IDs."""
+        ids = self._ids
+        if task_ids and (not ids or min(task_ids) > ids[-1]):
+            ids.extend(sorted(task_ids))
+        else:
+            for task_id in task_ids:
+                self.add(task_id)
+
+    def remove(self, task_id: int, live: Container[int]) -> None:
+        """
+        Note that an ID was removed.
+
+        Args:
+            task_id: The removed ID
+            live: Container of the IDs still stored, used when compacting
+        """
+        self._removed += 1
+        if self._removed * 2 > len(self._ids):
+            self._ids = [task_id for task_id in self._ids if task_id in live]
+            self._removed = 0
+
+    def clear(self) -> None:
+        """Remove every ID."""
+        self._ids = []
+        self._removed = 0
+
+    def after(self, after_id: int) -> Iterator[int]:
+        """Iterate over the IDs greater than ``after_id``, including removed ones."""
+        ids = self._ids
+        for position in range(bisect_right(ids, after_id), len(ids)):
+            yield ids[position]
+
+
+class TaskStore(ABC):
+    """
+    Interface of a task storage engine.
+
+    A store owns the tasks of one TaskManager and answers the filter and
+    counting queries the manager exposes. The manager forwards every change
+    made to an owned task through ``task_changed`` so the store can keep its
+    data and indexes current.
+    """
+
+    # Whether read-only calls may run in several threads at once. Engines that
+    # materialize or cache tasks while reading leave this False.
+    concurrent_reads = False
+
+    def __init__(self):
+        """Initialize the store without an owning manager."""
+        # TaskManager that receives change notifications from stored tasks.
+        self.owner = None
+        # ID a manager attaching to this store assigns next; stores that open
+        # existing data set it past their highest stored ID.
+        self.next_id = 1
+
+    @abstractmethod
+    def add(self, task: Task) -> None:
+        """Store a new task and attach it to the owning manager."""
+
+    def add_many(self, tasks: List[Task]) -> None:
+        """Store a batch of new tasks; engines may override this with a faster path."""
+        for task in tasks:
+            self.add(task)
+
+    @abstractmethod
+    def get(self, task_id: int) -> Optional[Task]:
+        """Return the task with the given ID, or None if it is not stored."""
+
+    @abstractmethod
+    def remove(self, task_id: int) -> Optional[Task]:
+        """Remove a task, detach it from the manager and return it (None if absent)."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove and detach every task."""
+
+    def close(self) -> None:
+        """Release resources held by the store; in-memory engines hold none."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate over every stored task."""
+
+    @abstractmethod
+    def task_changed(self, task: Task, field_name: str, old_value) -> None:
+        """Apply a change made to an owned task."""
+
+    def tasks_transitioned(self, tasks: List[Task], old_statuses: List[TaskStatus]) -> None:
+        """
+        Apply a batch of status transitions made by a bulk TaskManager call.
+
+        The tasks already carry their new status and updated_at; engines may
+        override this to update their indexes once for the whole batch.
+        """
+        for task, old_status in zip(tasks, old_statuses):
+            self.task_changed(task, "status", old_status)
+            self.task_changed(task, "updated_at", None)
+
+    @abstractmethod
+    def by_status(self, status: TaskStatus) -> List[Task]:
+        """Return tasks with the given status."""
+
+    @abstractmethod
+    def by_priority(self, priority: TaskPriority) -> List[Task]:
+        """Return tasks with the given priority."""
+
+    @abstractmethod
+    def due_between(self, start: datetime, end: datetime) -> List[Task]:
+        """Return open tasks due in ``[start, end)``, ordered by due date."""
+
+    @abstractmethod
+    def count_due_before(self, moment: datetime) -> int:
+        """Count open tasks due strictly before ``moment``."""
+
+    @abstractmethod
+    def status_counts(self) -> Dict[TaskStatus, int]:
+        """Return the number of tasks in each status."""
+
+    @abstractmethod
+    def priority_counts(self) -> Dict[TaskPriority, int]:
+        """Return the number of tasks at each priority."""
+
+    def __contains__(self, task_id: int) -> bool:
+        """Return whether a task with the given ID is stored."""
+        return self.get(task_id) is not None
+
+    def due_before(self, moment: datetime) -> List[Task]:
+        """Return open tasks due strictly before ``moment``, ordered by due date."""
+        return self.due_between(datetime.min, moment)
+
+    def iter_due_between(self, start: datetime, end: datetime) -> Iterator[Task]:
+        """
+        Yield open tasks due in ``[start, end)`` in due-date order.
+
+        Engines with an ordered due-date index override this to read it
+        lazily, so a caller that stops early does not pay for the rest.
+        """
+        return iter(self.due_between(start, end))
+
+    def page(
+        self,
+        after_id: int,
+        limit: int,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+    ) -> List[Task]:
+        """
+        Return the next page of tasks in ID order, for cursor pagination.
+
+        Engines override this with an ordered read; the default scans
+        every task.
+
+        Args:
+            after_id: Return only tasks with a larger ID
+            limit: Maximum number of tasks to return
+            status: If given, return only tasks with this status
+            priority: If given, return only tasks with this priority
+
+        Returns:
+            Up to ``limit`` matching tasks, by ascending ID
+        """
+        matches = (
+            task
+            for task in self
+            if task.task_id > after_id
+            and (status is None or task.status is status)
+            and (priority is None or task.priority is priority)
+        )
+        return nsmallest(limit, matches, key=lambda task: task.task_id)
+
+    def count_due_between(self, start: datetime, end: datetime) -> int:
+        """Count open tasks due in ``[start, end)``."""
+        return max(self.count_due_before(end) - self.count_due_before(start), 0)
+
+
+class DictTaskStore(TaskStore):
+    """
+    Default in-memory engine: a dict of Task objects plus secondary indexes.
+
+    Status and priority queries read from per-value buckets and deadline
+    queries binary-search a sorted due-date index, so each costs
+    O(result size) or O(log n + k) instead of a full scan.
+    """
+
+    # Reads only look up dicts and lists that are changed by writes alone.
+    concurrent_reads = True
+
+    def __init__(self):
+        """Initialize an empty store."""
+        super().__init__()
+        self._tasks: Dict[int, Task] = {}
+        # Secondary indexes: each maps a status/priority to the tasks holding it.
+        # Inner dicts keep insertion order and give O(1) removal.
+        self._by_status: Dict[TaskStatus, Dict[int, Task]] = {status: {} for status in TaskStatus}
+        self._by_priority: Dict[TaskPriority, Dict[int, Task]] = {
+            priority: {} for priority in TaskPriority
+        }
+        # Sorted (due_date, task_id) pairs for open tasks that have a deadline.
+        self._due_index: List[Tuple[datetime, int]] = []
+        self._id_order = SortedIdIndex()
+
+    def add(self, task: Task) -> None:
+        """Store a new task and register it in the secondary indexes."""
+        self._tasks[task.task_id] = task
+        self._by_status[task.status][task.task_id] = task
+        self._by_priority[task.priority][task.task_id] = task
+        self._add_due_entry(task.due_date, task.task_id, task.status)
+        self._id_order.add(task.task_id)
+        task._owner = self.owner
+
+    def add_many(self, tasks: List[Task]) -> None:
+        """Store a batch of new tasks, merging their deadlines into the index once."""
+        owner = self.owner
+        by_status = self._by_status
+        by_priority = self._by_priority
+        due_entries = []
+        for task in tasks:
+            task_id = task.task_id
+            self._tasks[task_id] = task
+            by_status[task.status][task_id] = task
+            by_priority[task.priority][task_id] = task
+            if task.due_date is not None and task.status in OPEN_STATUSES:
+                due_entries.append((task.due_date, task_id))
+            task._owner = owner
+        self._id_order.add_many([task.task_id for task in tasks])
+
+        if due_entries:
+            # Sorting the batch first leaves two sorted runs, which Timsort
+            # merges in linear time.
+            due_entries.sort()
+            self._due_index.extend(due_entries)
+            self._due_index.sort()
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """Return the task with the given ID, or None if it is not stored."""
+        return self._tasks.get(task_id)
+
+    def remove(self, task_id: int) -> Optional[Task]:
+        """Remove a task from the store and the secondary indexes."""
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return None
+
+        del self._by_status[task.status][task_id]
+        del self._by_priority[task.priority][task_id]
+        self._remove_due_entry(task.due_date, task_id, task.status)
+        self._id_order.remove(task_id, self._tasks)
+        task._owner = None
+        return task
+
+    def clear(self) -> None:
+        """Remove every task and empty the indexes."""
+        for task in self._tasks.values():
+            task._owner = None
+        self._tasks.clear()
+        for status_bucket in self._by_status.values():
+            status_bucket.clear()
+        for priority_bucket in self._by_priority.values():
+            priority_bucket.clear()
+        self._due_index.clear()
+        self._id_order.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return len(self._tasks)
+
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate over every stored task in insertion order."""
+        return iter(self._tasks.values())
+
+    def __contains__(self, task_id: int) -> bool:
+        """Return whether a task with the given ID is stored."""
+        return task_id in self._tasks
+
+    def _add_due_entry(self, due_date, task_id: int, status: TaskStatus) -> None:
+        """Insert a task into the due-date index if it is open and has a deadline."""
+        if due_date is not None and status in OPEN_STATUSES:
+            insort(self._due_index, (due_date, task_id))
+
+    def _remove_due_entry(self, due_date, task_id: int, status: TaskStatus) -> None:
+        """Remove a task from the due-date index if it was indexed."""
+        if due_date is not None and status in OPEN_STATUSES:
+            entries = self._due_index
+            del entries[bisect_left(entries, (due_date, task_id))]
+
+    def task_changed(self, task: Task, field_name: str, old_value) -> None:
+        """Move a changed task between index buckets."""
+        task_id = task.task_id
+
+        if field_name == "due_date":
+            self._remove_due_entry(old_value, task_id, task.status)
+            self._add_due_entry(task.due_date, task_id, task.status)
+        elif field_name == "status":
+            del self._by_status[old_value][task_id]
+            self._by_status[task.status][task_id] = task
+            # Moving between two open (or two closed) statuses keeps the deadline entry.
+            if (old_value in OPEN_STATUSES) != (task.status in OPEN_STATUSES):
+                self._remove_due_entry(task.due_date, task_id, old_value)
+                self._add_due_entry(task.due_date, task_id, task.status)
+        elif field_name == "priority":
+            del self._by_priority[old_value][task_id]
+            self._by_priority[task.priority][task_id] = task
+
+    def tasks_transitioned(self, tasks: List[Task], old_statuses: List[TaskStatus]) -> None:
+        """Move a batch of tasks between status buckets and prune closed deadlines once."""
+        by_status = self._by_status
+        closed_ids = set()
+        for task, old_status in zip(tasks, old_statuses):
+            new_status = task.status
+            if new_status is old_status:
+                continue
+            task_id = task.task_id
+            del by_status[old_status][task_id]
+            by_status[new_status][task_id] = task
+            if (
+                task.due_date is not None
+                and old_status in OPEN_STATUSES
+                and new_status not in OPEN_STATUSES
+            ):
+                closed_ids.add(task_id)
+
+        if len(closed_ids) > _DUE_INDEX_REBUILD_THRESHOLD:
+            self._due_index[:] = [entry for entry in self._due_index if entry[1] not in closed_ids]
+        else:
+            for task, old_status in zip(tasks, old_statuses):
+                if task.task_id in closed_ids:
+                    self._remove_due_entry(task.due_date, task.task_id, old_status)
+
+    def by_status(self, status: TaskStatus) -> List[Task]:
+        """Return tasks with the given status from the status index."""
+        return list(self._by_status[status].values())
+
+    def by_priority(self, priority: TaskPriority) -> List[Task]:
+        """Return tasks with the given priority from the priority index."""
+        return list(self._by_priority[priority].values())
+
+    def due_between(self, start: datetime, end: datetime) -> List[Task]:
+        """Return open tasks due in ``[start, end)`` with two binary searches."""
+        entries = self._due_index
+        first = bisect_left(entries, (start,))
+        last = bisect_left(entries, (end,), first)
+        return [self._tasks[task_id] for _, task_id in entries[first:last]]
+
+    def iter_due_between(self, start: datetime, end: datetime) -> Iterator[Task]:
+        """
+        Yield open tasks due in ``[start, end)`` straight from the due-date index.
+
+        Each step resumes after the last (due date, ID) pair yielded, so the
+        index may change between steps without tasks being skipped or
+        repeated.
+        """
+        tasks = self._tasks
+        position = bisect_left(self._due_index, (start,))
+        while True:
+            entries = self._due_index
+            page = entries[position : position + _DUE_PAGE_SIZE]
+            for due_date, task_id in page:
+                if due_date >= end:
+                    return
+                # Skip entries whose task was deleted, closed or rescheduled
+                # while the caller held the previous task.
+                task = tasks.get(task_id)
+                if task is not None and task.due_date == due_date and task.status in OPEN_STATUSES:
+                    yield task
+            if len(page) < _DUE_PAGE_SIZE:
+                return
+            position = bisect_right(self._due_index, page[-1])
+
+    def due_before(self, moment: datetime) -> List[Task]:
+        """Return open tasks due strictly before ``moment``."""
+        entries = self._due_index
+        end = bisect_left(entries, (moment,))
+        return [self._tasks[task_id] for _, task_id in entries[:end]]
+
+    def page(
+        self,
+        after_id: int,
+        limit: int,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+    ) -> List[Task]:
+        """Return the next tasks in ID order by walking the sorted ID index."""
+        tasks = self._tasks
+        result = []
+        if limit <= 0:
+            return result
+        for task_id in self._id_order.after(after_id):
+            task = tasks.get(task_id)
+            if (
+                task is None
+                or (status is not None and task.status is not status)
+                or (priority is not None and task.priority is not priority)
+            ):
+                continue
+            result.append(task)
+            if len(result) == limit:
+                break
+        return result
+
+    def count_due_before(self, moment: datetime) -> int:
+        """Count open tasks due strictly before ``moment`` with one binary search."""
+        return bisect_left(self._due_index, (moment,))
+
+    def status_counts(self) -> Dict[TaskStatus, int]:
+        """Return the size of each status bucket."""
+        return {status: len(bucket) for status, bucket in self._by_status.items()}
+
+    def priority_counts(self) -> Dict[TaskPriority, int]:
+        """Return the size of each priority bucket."""
+        return {priority: len(bucket) for priority, bucket in self._by_priority.items()}
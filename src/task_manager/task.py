@@ -26,11 +26,123 @@ class TaskPriority(Enum):
     CRITICAL = 4
 
 
+# Statuses in which a task still counts as open work (and can become overdue).
+OPEN_STATUSES = frozenset({TaskStatus.PENDING, TaskStatus.IN_PROGRESS})
+
+
+# Rules enforced by the mark_* methods: target status -> {current status: reason}.
+_TRANSITION_ERRORS = {
+    TaskStatus.IN_PROGRESS: {
+        TaskStatus.COMPLETED: "Cannot modify a completed task",
+        TaskStatus.CANCELLED: "Cannot modify a cancelled task",
+    },
+    TaskStatus.COMPLETED: {TaskStatus.CANCELLED: "Cannot complete a cancelled task"},
+    TaskStatus.CANCELLED: {TaskStatus.COMPLETED: "Cannot cancel a completed task"},
+}
+
+# Statuses a task can be moved to with a mark_* method.
+TRANSITION_TARGETS = frozenset(_TRANSITION_ERRORS)
+
+
+def validate_title(title: str) -> None:
+    """
+    Validate a task title.
+
+    Args:
+        title: Title to check
+
+    Raises:
+        ValidationError: If the title is not a string, is empty or is longer
+            than 200 characters
+    """
+    if not isinstance(title, str):
+        raise ValidationError("Title must be a string")
+
+    if not title or len(title.strip()) == 0:
+        raise ValidationError("Title cannot be empty")
+
+    if len(title) > 200:
+        raise ValidationError("Title cannot exceed 200 characters")
+
+
+def validate_details(description: str, priority: TaskPriority, due_date) -> None:
+    """
+    Check the types of a task's description, priority and due date.
+
+    Args:
+        description: Description to check
+        priority: Priority to check
+        due_date: Optional deadline to check
+
+    Raises:
+        ValidationError: If the description is not a string, the priority
+            not a TaskPriority or the due date not a naive datetime or None
+    """
+    if not isinstance(description, str):
+        raise ValidationError("Description must be a string")
+
+    if not isinstance(priority, TaskPriority):
+        raise ValidationError("Priority must be a TaskPriority")
+
+    if due_date is not None:
+        if not isinstance(due_date, datetime):
+            raise ValidationError("Due date must be a datetime")
+        if due_date.utcoffset() is not None:
+            raise ValidationError("Due date must be a naive local datetime")
+
+
+# Data attributes of a Task, in constructor order.
+TASK_FIELDS = (
+    "task_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "created_at",
+    "updated_at",
+    "due_date",
+)
+
+# Every data attribute change bumps Task.version and, on an owned task, is
+# reported to the owning TaskManager, so its storage engine and indexes stay
+# in step with direct attribute writes and mark_* calls. Writing the value a
+# field already holds changes nothing.
+_WATCHED_FIELDS = frozenset(TASK_FIELDS)
+
+# Pickled and copied state: the data attributes followed by the version.
+_STATE_FIELDS = TASK_FIELDS + ("version",)
+
+
 @dataclass
+class _TaskFields:
+    """Field declarations of the former Task dataclass, kept for dataclasses.replace/asdict."""
+
+    task_id: int
+    title: str
+    description: str = ""
+    status: TaskStatus = TaskStatus.PENDING
+    priority: TaskPriority = TaskPriority.MEDIUM
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    due_date: Optional[datetime] = None
+
+
 class Task:
     """
     Represents a task with validation and business logic.
 
+    Tasks use ``__slots__`` instead of a per-instance ``__dict__`` to keep
+    large stores compact. When neither timestamp is given, ``created_at``
+    and ``updated_at`` share one datetime object until the first update.
+
+    Every change to a data attribute bumps ``version``. to_dict uses it to
+    reuse its serialized fields until the task changes, and the manager's
+    mutators accept an ``expected_version`` to refuse writes based on a
+    stale read.
+
+    Pickled and copied tasks keep their fields and version but not their
+    owner, so changing a copy never reaches the manager.
+
     Attributes:
         task_id: Unique identifier for the task
         title: Task title (1-200 characters)
@@ -40,21 +152,118 @@ class Task:
         created_at: Timestamp when task was created
         updated_at: Timestamp when task was last updated
         due_date: Optional deadline for the task
+        version: Mutation counter, starting at 0 for a new task; storage
+            engines, snapshots, exports and the wire format keep it
     """
 
-    task_id: int
-    title: str
-    description: str = ""
-    status: TaskStatus = TaskStatus.PENDING
-    priority: TaskPriority = TaskPriority.MEDIUM
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
-    due_date: Optional[datetime] = None
+    __slots__ = TASK_FIELDS + ("version", "_owner", "_serialized", "__weakref__")
+
+    # Tasks compare by value like the former dataclass and are not hashable.
+    __hash__ = None  # type: ignore[assignment]
+
+    # Lets dataclasses.replace, asdict and fields treat tasks as before.
+    __dataclass_fields__ = _TaskFields.__dataclass_fields__
+
+    def __init__(
+        self,
+        task_id: int,
+        title: str,
+        description: str = "",
+        status: TaskStatus = TaskStatus.PENDING,
+        priority: TaskPriority = TaskPriority.MEDIUM,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+        due_date: Optional[datetime] = None,
+    ):
+        """
+        Create a task and validate it.
 
-    def __post_init__(self):
-        """Validate task data after initialization."""
+        Raises:
+            ValidationError: If validation fails
+        """
+        now = datetime.now() if created_at is None or updated_at is None else None
+        # A new task has no owner to notify and starts at version 0, so its
+        # fields are assigned without going through __setattr__.
+        set_attr = object.__setattr__
+        set_attr(self, "_owner", None)
+        set_attr(self, "_serialized", None)
+        set_attr(self, "version", 0)
+        set_attr(self, "task_id", task_id)
+        set_attr(self, "title", title)
+        set_attr(self, "description", description)
+        set_attr(self, "status", status)
+        set_attr(self, "priority", priority)
+        set_attr(self, "created_at", created_at if created_at is not None else now)
+        set_attr(self, "updated_at", updated_at if updated_at is not None else now)
+        set_attr(self, "due_date", due_date)
         self.validate()
 
+    @classmethod
+    def _restore(
+        cls,
+        task_id: int,
+        title: str,
+        description: str,
+        status: TaskStatus,
+        priority: TaskPriority,
+        created_at: datetime,
+        updated_at: datetime,
+        due_date: Optional[datetime],
+        version: int = 0,
+    ) -> "Task":
+        """Rebuild a task from already-validated stored data, skipping validation."""
+        task = object.__new__(cls)
+        set_attr = object.__setattr__
+        set_attr(task, "_owner", None)
+        set_attr(task, "_serialized", None)
+        set_attr(task, "version", version)
+        set_attr(task, "task_id", task_id)
+        set_attr(task, "title", title)
+        set_attr(task, "description", description)
+        set_attr(task, "status", status)
+        set_attr(task, "priority", priority)
+        set_attr(task, "created_at", created_at)
+        set_attr(task, "updated_at", updated_at)
+        set_attr(task, "due_date", due_date)
+        return task
+
+    def __getstate__(self) -> tuple:
+        """Return the data attributes and version for pickling and copying."""
+        return tuple(getattr(self, name) for name in _STATE_FIELDS)
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restore a pickled or copied task; the copy has no owner."""
+        set_attr = object.__setattr__
+        set_attr(self, "_owner", None)
+        set_attr(self, "_serialized", None)
+        for name, value in zip(_STATE_FIELDS, state):
+            set_attr(self, name, value)
+
+    def __setattr__(self, name, value):
+        """Set an attribute; data changes bump the version and notify the owning manager."""
+        if name not in _WATCHED_FIELDS:
+            object.__setattr__(self, name, value)
+            return
+
+        old_value = getattr(self, name)
+        object.__setattr__(self, name, value)
+        if old_value != value:
+            object.__setattr__(self, "version", self.version + 1)
+            owner = self._owner
+            if owner is not None:
+                owner._on_task_changed(self, name, old_value)
+
+    def __eq__(self, other):
+        """Compare tasks field by field."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in TASK_FIELDS)
+
+    def __repr__(self):
+        """Return a constructor-style representation of the task."""
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in TASK_FIELDS)
+        return f"{self.__class__.__name__}({fields})"
+
     def validate(self) -> None:
         """
         Validate task data.
@@ -62,11 +271,8 @@ class Task:
         Raises:
             ValidationError: If validation fails
         """
-        if not self.title or len(self.title.strip()) == 0:
-            raise ValidationError("Title cannot be empty")
-
-        if len(self.title) > 200:
-            raise ValidationError("Title cannot exceed 200 characters")
+        validate_title(self.title)
+        validate_details(self.description, self.priority, self.due_date)
 
         if self.task_id < 0:
             raise ValidationError("Task ID must be non-negative")
@@ -74,31 +280,49 @@ class Task:
         if self.due_date and self.due_date < self.created_at:
             raise ValidationError("Due date cannot be before creation date")
 
-    def mark_in_progress(self) -> None:
-        """Mark task as in progress."""
-        if self.status == TaskStatus.COMPLETED:
-            raise ValidationError("Cannot modify a completed task")
-        if self.status == TaskStatus.CANCELLED:
-            raise ValidationError("Cannot modify a cancelled task")
+    def transition_error(self, status: TaskStatus) -> Optional[str]:
+        """
+        Check whether the task may move to a status through a mark_* method.
+
+        Args:
+            status: Target status (IN_PROGRESS, COMPLETED or CANCELLED)
 
-        self.status = TaskStatus.IN_PROGRESS
+        Returns:
+            The reason the transition is not allowed, or None if it is allowed
+        """
+        return _TRANSITION_ERRORS[status].get(self.status)
+
+    def _mark(self, status: TaskStatus) -> None:
+        """Move the task to a status, enforcing the transition rules."""
+        error = self.transition_error(status)
+        if error:
+            raise ValidationError(error)
+
+        self.status = status
         self.updated_at = datetime.now()
 
+    def _apply_transition(self, status: TaskStatus, now: datetime) -> None:
+        """
+        Set status and updated_at without notifying the owner.
+
+        Used by bulk transitions, which check the rules up front and report
+        the whole batch to the owner at once.
+        """
+        object.__setattr__(self, "status", status)
+        object.__setattr__(self, "updated_at", now)
+        object.__setattr__(self, "version", self.version + 1)
+
+    def mark_in_progress(self) -> None:
+        """Mark task as in progress."""
+        self._mark(TaskStatus.IN_PROGRESS)
+
     def mark_completed(self) -> None:
         """Mark task as completed."""
-        if self.status == TaskStatus.CANCELLED:
-            raise ValidationError("Cannot complete a cancelled task")
-
-        self.status = TaskStatus.COMPLETED
-        self.updated_at = datetime.now()
+        self._mark(TaskStatus.COMPLETED)
 
     def mark_cancelled(self) -> None:
         """Mark task as cancelled."""
-        if self.status == TaskStatus.COMPLETED:
-            raise ValidationError("Cannot cancel a completed task")
-
-        self.status = TaskStatus.CANCELLED
-        self.updated_at = datetime.now()
+        self._mark(TaskStatus.CANCELLED)
 
     def update_title(self, new_title: str) -> None:
         """
@@ -110,11 +334,7 @@ class Task:
         Raises:
             ValidationError: If title is invalid
         """
-        if not new_title or len(new_title.strip()) == 0:
-            raise ValidationError("Title cannot be empty")
-
-        if len(new_title) > 200:
-            raise ValidationError("Title cannot exceed 200 characters")
+        validate_title(new_title)
 
         self.title = new_title
         self.updated_at = datetime.now()
@@ -129,37 +349,49 @@ class Task:
         self.priority = priority
         self.updated_at = datetime.now()
 
-    def is_overdue(self) -> bool:
+    def is_overdue(self, now: Optional[datetime] = None) -> bool:
         """
         Check if task is overdue.
 
+        Args:
+            now: Time to compare the due date with (default: the current time)
+
         Returns:
             True if task has a due date and it has passed, False otherwise
         """
         if not self.due_date:
             return False
 
-        return (
-            datetime.now() > self.due_date
-            and self.status != TaskStatus.COMPLETED
-            and self.status != TaskStatus.CANCELLED
-        )
+        if now is None:
+            now = datetime.now()
+        return now > self.due_date and self.status in OPEN_STATUSES
 
     def to_dict(self) -> dict:
         """
         Convert task to dictionary representation.
 
+        Every field except the time-dependent ``is_overdue`` is cached and
+        reused while ``version`` is unchanged.
+
         Returns:
             Dictionary containing task data
         """
-        return {
-            "task_id": self.task_id,
-            "title": self.title,
-            "description": self.description,
-            "status": self.status.value,
-            "priority": self.priority.value,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "due_date": self.due_date.isoformat() if self.due_date else None,
-            "is_overdue": self.is_overdue(),
-        }
+        cached = self._serialized
+        if cached is not None and cached[0] == self.version:
+            data = dict(cached[1])
+        else:
+            fields = {
+                "task_id": self.task_id,
+                "title": self.title,
+                "description": self.description,
+                "status": self.status.value,
+                "priority": self.priority.value,
+                "created_at": self.created_at.isoformat(),
+                "updated_at": self.updated_at.isoformat(),
+                "due_date": self.due_date.isoformat() if self.due_date else None,
+                "version": self.version,
+            }
+            object.__setattr__(self, "_serialized", (self.version, fields))
+            data = dict(fields)
+        data["is_overdue"] = self.is_overdue()
+        return data
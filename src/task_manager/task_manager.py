@@ -1,9 +1,78 @@
 """Task manager for managing multiple tasks."""
 
-from typing import Dict, List, Optional
+import json
+from datetime import datetime
+from itertools import islice
+from typing import IO, Dict, Iterable, Iterator, List, Mapping, Optional
 
-from .exceptions import TaskNotFoundError
-from .task import Task, TaskPriority, TaskStatus
+from .change_feed import (
+    DEFAULT_CAPACITY,
+    EVENT_ADD,
+    EVENT_CLEAR,
+    EVENT_DELETE,
+    EVENT_SET,
+    ChangeFeed,
+)
+from .codec import (
+    FIELD_DECODERS,
+    FIELD_ENCODERS,
+    STATUS_CODES,
+    STATUSES,
+    datetime_to_micros,
+    decode_task,
+    encode_task,
+    micros_to_datetime,
+)
+from .exceptions import DuplicateTaskError, TaskNotFoundError, ValidationError, VersionConflictError
+from .prefix_index import PrefixIndex
+from .query import TaskQuery
+from .results import BulkAddResult, ImportResult, TransitionResult
+from .snapshot import SnapshotTaskStore, write_snapshot
+from .storage import DictTaskStore, TaskStore
+from .task import (
+    OPEN_STATUSES,
+    TASK_FIELDS,
+    TRANSITION_TARGETS,
+    Task,
+    TaskPriority,
+    TaskStatus,
+    validate_details,
+    validate_title,
+)
+from .text_index import TextIndex
+from .wal import (
+    RECORD_ADD,
+    RECORD_CLEAR,
+    RECORD_DELETE,
+    RECORD_SET,
+    RECORD_SNAPSHOT,
+    RECORD_TRANSITION,
+    WriteAheadLog,
+)
+from .wire import TaskBatchView, pack_tasks
+from .work_queue import WorkQueue
+
+# Keys accepted in the items passed to TaskManager.add_tasks.
+_BULK_ADD_FIELDS = frozenset({"title", "description", "priority", "due_date"})
+
+# Keys every import_jsonl record must carry (the output of Task.to_dict).
+_EXPORT_FIELDS = frozenset({"task_id", "title", "status", "priority", "created_at", "updated_at"})
+
+# Task fields covered by the full-text index.
+_TEXT_FIELDS = frozenset({"title", "description"})
+
+# Task fields that decide a task's place in the title completion index.
+_COMPLETION_FIELDS = frozenset({"title", "priority"})
+
+# Task fields that decide whether and where a task sits in the work queue.
+_QUEUE_FIELDS = frozenset({"status", "priority", "due_date", "created_at"})
+
+# Lines written per write() call by export_jsonl and validated per batch by import_jsonl.
+_EXPORT_CHUNK_SIZE = 1000
+_IMPORT_BATCH_SIZE = 1000
+
+# Tasks fetched from the store per step of the iter_* generators.
+_ITER_PAGE_SIZE = 500
 
 
 class TaskManager:
@@ -14,10 +83,193 @@ class TaskManager:
     including creation, retrieval, updating, and deletion operations.
     """
 
-    def __init__(self):
-        """Initialize an empty task manager."""
-        self._tasks: Dict[int, Task] = {}
-        self._next_id: int = 1
+    # New task IDs run first_id, first_id + id_step, ... Shards of a
+    # ShardedTaskManager each use their own sequence, so IDs never collide.
+    _first_id = 1
+    _id_step = 1
+
+    def __init__(self, store: Optional[TaskStore] = None, wal: Optional[WriteAheadLog] = None):
+        """
+        Initialize a task manager.
+
+        Args:
+            store: Storage engine to keep tasks in; defaults to a new
+                DictTaskStore. Pass a ColumnarTaskStore for bulk analytics
+                or a SqliteTaskStore for datasets larger than memory.
+            wal: Optional write-ahead log for durable mode. Its records are
+                replayed to rebuild the previous state, then every mutation
+                is appended to it.
+        """
+        self._store: TaskStore = store if store is not None else DictTaskStore()
+        self._store.owner = self
+        self._next_id: int = self._id_after(self._store.next_id - 1)
+        self._snapshot_generation = 0
+        self._wal: Optional[WriteAheadLog] = None
+        # Full-text index, built by the first search() and kept current after.
+        self._text_index: Optional[TextIndex] = None
+        # Title prefix index, built by the first complete_title() call.
+        self._prefix_index: Optional[PrefixIndex] = None
+        # Pending-task queue, built by the first work_queue() call.
+        self._work_queue: Optional[WorkQueue] = None
+        # Change feed, attached by the first change_feed() call.
+        self._change_feed: Optional[ChangeFeed] = None
+
+        if wal is not None:
+            self._attach_wal(wal)
+
+    @classmethod
+    def from_snapshot(cls, path: str, wal: Optional[WriteAheadLog] = None) -> "TaskManager":
+        """
+        Start a manager from a snapshot written by save_snapshot.
+
+        The snapshot is memory-mapped and its records are decoded only when
+        tasks are requested, so startup time does not grow with the number
+        of tasks. Changes logged since the snapshot are replayed on top.
+
+        Args:
+            path: Snapshot file
+            wal: Optional write-ahead log that was attached when the
+                snapshot was saved
+
+        Returns:
+            A manager holding the snapshot's tasks
+
+        Raises:
+            SnapshotFormatError: If the file is not a valid snapshot
+        """
+        store = SnapshotTaskStore(path)
+        manager = cls(store=store)
+        manager._snapshot_generation = store.generation
+        if wal is not None:
+            manager._attach_wal(wal)
+        return manager
+
+    def _attach_wal(self, wal: WriteAheadLog) -> None:
+        """
+        Replay a write-ahead log and start appending to it.
+
+        A log begins with a RECORD_SNAPSHOT marker once a snapshot has been
+        saved. A log older than the loaded snapshot is already contained in
+        it (the process stopped between writing the snapshot and truncating
+        the log), so it is discarded instead of replayed.
+
+        Raises:
+            ValueError: If the log continues a snapshot that was not loaded
+        """
+        records = wal.records()
+        first = next(records, None)
+        generation = first[1] if first is not None and first[0] == RECORD_SNAPSHOT else 0
+
+        if generation > self._snapshot_generation:
+            raise ValueError(
+                f"{wal.path} continues snapshot generation {generation}; "
+                "load it with TaskManager.from_snapshot"
+            )
+        if generation < self._snapshot_generation:
+            for _ in records:
+                pass
+            wal.open()
+            self._wal = wal
+            self._start_log_generation()
+            return
+
+        if first is not None:
+            self._replay([first])
+        self._replay(records)
+        wal.open()
+        self._wal = wal
+
+    def _id_after(self, task_id: int) -> int:
+        """Return the first ID of this manager's sequence that is above ``task_id``."""
+        return self._first_id + ((task_id - self._first_id) // self._id_step + 1) * self._id_step
+
+    def _start_log_generation(self) -> None:
+        """Empty the log and mark it as continuing the current snapshot."""
+        self._wal.reset()
+        self._wal.append([RECORD_SNAPSHOT, self._snapshot_generation])
+        self._wal.sync()
+
+    def _replay(self, records: Iterable[list]) -> None:
+        """Rebuild tasks and the ID counter from write-ahead log records."""
+        store = self._store
+        for record in records:
+            kind = record[0]
+            if kind == RECORD_SET:
+                _, task_id, field_name, value = record
+                setattr(store.get(task_id), field_name, FIELD_DECODERS[field_name](value))
+            elif kind == RECORD_ADD:
+                values = record[1:]
+                task = decode_task(values)
+                # Records logged before versions were kept end with the fields.
+                if len(values) > len(TASK_FIELDS):
+                    task.version = values[-1]
+                store.add(task)
+                self._next_id = max(self._next_id, self._id_after(task.task_id))
+            elif kind == RECORD_TRANSITION:
+                _, task_ids, status_code, updated_micros = record
+                status = STATUSES[status_code]
+                updated_at = micros_to_datetime(updated_micros)
+                tasks = [store.get(task_id) for task_id in task_ids]
+                old_statuses = [task.status for task in tasks]
+                for task in tasks:
+                    task._apply_transition(status, updated_at)
+                store.tasks_transitioned(tasks, old_statuses)
+            elif kind == RECORD_DELETE:
+                store.remove(record[1])
+            elif kind == RECORD_CLEAR:
+                store.clear()
+                self._next_id = self._first_id
+
+    def save_snapshot(self, path: str) -> None:
+        """
+        Write every task to a binary snapshot and compact the write-ahead log.
+
+        The snapshot replaces ``path`` atomically. Once it is on disk the log
+        is truncated, since the snapshot already holds everything it recorded.
+
+        Args:
+            path: Snapshot file to (re)write
+        """
+        generation = self._snapshot_generation + 1
+        write_snapshot(path, self._store, self._next_id, generation)
+        self._snapshot_generation = generation
+        if self._wal is not None:
+            self._start_log_generation()
+
+    def close(self) -> None:
+        """Sync and close the write-ahead log, if the manager is durable, and the store."""
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
+        self._store.close()
+
+    def _on_task_changed(self, task: Task, field_name: str, old_value) -> None:
+        """
+        Keep the storage engine in step with a change made to an owned task.
+
+        Called by Task whenever one of its attributes changes, whether through
+        a TaskManager method, a direct ``Task.mark_*`` call or a plain
+        attribute assignment.
+
+        Args:
+            task: The task that changed
+            field_name: Name of the attribute that changed
+            old_value: Value of the attribute before the change
+        """
+        self._store.task_changed(task, field_name, old_value)
+        if self._text_index is not None and field_name in _TEXT_FIELDS:
+            self._text_index.field_changed(task, field_name, old_value)
+        if self._prefix_index is not None and field_name in _COMPLETION_FIELDS:
+            self._prefix_index.task_changed(task)
+        if self._work_queue is not None and field_name in _QUEUE_FIELDS:
+            self._work_queue.task_changed(task)
+        if self._wal is not None:
+            value = FIELD_ENCODERS[field_name](getattr(task, field_name))
+            self._wal.append([RECORD_SET, task.task_id, field_name, value])
+        if self._change_feed is not None:
+            self._change_feed.publish(
+                EVENT_SET, task.task_id, field_name, getattr(task, field_name), old_value
+            )
 
     def add_task(
         self,
@@ -49,11 +301,282 @@ class TaskManager:
             due_date=due_date,
         )
 
-        self._tasks[task.task_id] = task
-        self._next_id += 1
+        self._store.add(task)
+        if self._text_index is not None:
+            self._text_index.add(task)
+        if self._prefix_index is not None:
+            self._prefix_index.add(task)
+        if self._work_queue is not None:
+            self._work_queue.add(task)
+        if self._wal is not None:
+            self._wal.append([RECORD_ADD, *encode_task(task), task.version])
+        if self._change_feed is not None:
+            self._change_feed.publish(EVENT_ADD, task.task_id)
+        self._next_id += self._id_step
 
         return task
 
+    def add_tasks(self, items: Iterable[Mapping], atomic: bool = True) -> BulkAddResult:
+        """
+        Add a batch of new tasks.
+
+        Each item is a mapping with the same keys as the add_task arguments
+        (``title`` is required). The batch shares one creation timestamp and
+        reserves its ID range in one step, so it is much cheaper than calling
+        add_task in a loop.
+
+        Args:
+            items: Task definitions to add
+            atomic: If True, add nothing and raise on the first invalid item;
+                if False, add the valid items and report the invalid ones
+
+        Returns:
+            BulkAddResult with the created tasks and, in non-atomic mode, the
+            validation message of every rejected item keyed by its position
+
+        Raises:
+            ValidationError: In atomic mode, if any item is invalid
+        """
+        return self._add_tasks_at(items, atomic, datetime.now())
+
+    def _add_tasks_at(self, items: Iterable[Mapping], atomic: bool, now: datetime) -> BulkAddResult:
+        """Run add_tasks with ``now`` as the batch's creation time and validation instant."""
+        result = BulkAddResult()
+        accepted = []
+
+        for position, item in enumerate(items):
+            try:
+                accepted.append(self._check_bulk_item(item, now))
+            except ValidationError as error:
+                if atomic:
+                    raise ValidationError(f"Item {position}: {error.message}") from error
+                result.errors[position] = error.message
+
+        first_id = self._next_id
+        self._next_id += len(accepted) * self._id_step
+        task_ids = range(first_id, self._next_id, self._id_step)
+        result.added = [
+            Task._restore(
+                task_id, title, description, TaskStatus.PENDING, priority, now, now, due_date
+            )
+            for task_id, (title, description, priority, due_date) in zip(task_ids, accepted)
+        ]
+        self._store_new_tasks(result.added)
+        return result
+
+    def _store_new_tasks(self, tasks: List[Task]) -> None:
+        """Add already-validated tasks to the store and log them."""
+        self._store.add_many(tasks)
+        if self._text_index is not None:
+            self._text_index.add_many(tasks)
+        if self._prefix_index is not None:
+            self._prefix_index.add_many(tasks)
+        if self._work_queue is not None:
+            self._work_queue.add_many(tasks)
+        if self._wal is not None:
+            for task in tasks:
+                self._wal.append([RECORD_ADD, *encode_task(task), task.version])
+        if self._change_feed is not None:
+            self._change_feed.publish_many(
+                (EVENT_ADD, task.task_id, None, None, None) for task in tasks
+            )
+
+    @staticmethod
+    def _check_bulk_item(item: Mapping, now: datetime) -> tuple:
+        """
+        Validate one add_tasks item and return its normalized fields.
+
+        Applies the checks Task runs for add_task, so a bulk item is
+        accepted exactly when the same add_task call would be.
+
+        Raises:
+            ValidationError: If the item is invalid
+        """
+        if not isinstance(item, Mapping):
+            raise ValidationError("Item must be a mapping of task fields")
+        unknown = item.keys() - _BULK_ADD_FIELDS
+        if unknown:
+            raise ValidationError(f"Unknown task fields: {', '.join(sorted(unknown))}")
+
+        title = item.get("title", "")
+        description = item.get("description", "")
+        priority = item.get("priority", TaskPriority.MEDIUM)
+        due_date = item.get("due_date")
+        validate_title(title)
+        validate_details(description, priority, due_date)
+        if due_date and due_date < now:
+            raise ValidationError("Due date cannot be before creation date")
+
+        return title, description, priority, due_date
+
+    def export_jsonl(self, fp: IO[str], chunk_size: int = _EXPORT_CHUNK_SIZE) -> int:
+        """
+        Write every task to a text stream as JSON Lines.
+
+        Each line is the ``to_dict()`` of one task. Tasks are read from the
+        store one at a time and written in chunks of ``chunk_size`` lines,
+        so memory use does not depend on the number of tasks.
+
+        Args:
+            fp: Writable text stream
+            chunk_size: Number of lines joined into each write() call
+
+        Returns:
+            The number of tasks written
+        """
+        count = 0
+        chunk: List[str] = []
+        for task in self._store:
+            chunk.append(json.dumps(task.to_dict(), ensure_ascii=False))
+            if len(chunk) >= chunk_size:
+                fp.write("\n".join(chunk) + "\n")
+                count += len(chunk)
+                chunk.clear()
+        if chunk:
+            fp.write("\n".join(chunk) + "\n")
+            count += len(chunk)
+        return count
+
+    def import_jsonl(self, fp: IO[str], batch_size: int = _IMPORT_BATCH_SIZE) -> ImportResult:
+        """
+        Add the tasks of a JSON Lines stream written by export_jsonl.
+
+        Lines are read lazily and validated ``batch_size`` at a time; each
+        batch's valid tasks are added in one step before the next batch is
+        read. Tasks keep their IDs, status, timestamps and versions (0 for
+        records without one). Invalid records, and records whose ID is
+        already in use, are skipped and reported by line number; blank
+        lines are ignored.
+
+        Args:
+            fp: Readable text stream
+            batch_size: Number of lines validated and added per batch
+
+        Returns:
+            ImportResult with the number of imported tasks and the reason
+            each rejected line was skipped
+        """
+        result = ImportResult()
+        lines = enumerate(fp, 1)
+        while True:
+            batch = list(islice(lines, batch_size))
+            if not batch:
+                break
+
+            tasks = []
+            batch_ids = set()
+            for line_number, line in batch:
+                if not line.strip():
+                    continue
+                try:
+                    task = self._parse_exported_task(line)
+                    if task.task_id in batch_ids or task.task_id in self._store:
+                        raise DuplicateTaskError(task.task_id)
+                except ValidationError as error:
+                    result.errors[line_number] = error.message
+                    continue
+                except DuplicateTaskError as error:
+                    result.errors[line_number] = str(error)
+                    continue
+                batch_ids.add(task.task_id)
+                tasks.append(task)
+
+            if tasks:
+                self._store_new_tasks(tasks)
+                self._next_id = max(self._next_id, self._id_after(max(batch_ids)))
+                result.imported += len(tasks)
+
+        return result
+
+    @staticmethod
+    def _parse_exported_task(line: str) -> Task:
+        """
+        Rebuild and validate one task from a line written by export_jsonl.
+
+        Raises:
+            ValidationError: If the line is not a valid task record
+        """
+        try:
+            record = json.loads(line)
+        except ValueError as error:
+            raise ValidationError(f"Invalid JSON: {error}") from error
+        if not isinstance(record, dict):
+            raise ValidationError("Record must be a JSON object")
+
+        missing = _EXPORT_FIELDS - record.keys()
+        if missing:
+            raise ValidationError(f"Missing task fields: {', '.join(sorted(missing))}")
+
+        task_id = record["task_id"]
+        title = record["title"]
+        description = record.get("description", "")
+        if not isinstance(task_id, int) or isinstance(task_id, bool):
+            raise ValidationError("Task ID must be an integer")
+        if not isinstance(title, str) or not isinstance(description, str):
+            raise ValidationError("Title and description must be strings")
+        version = record.get("version", 0)
+        if not isinstance(version, int) or isinstance(version, bool) or version < 0:
+            raise ValidationError("Version must be a non-negative integer")
+
+        due_date = record.get("due_date")
+        try:
+            task = Task._restore(
+                task_id,
+                title,
+                description,
+                TaskStatus(record["status"]),
+                TaskPriority(record["priority"]),
+                datetime.fromisoformat(record["created_at"]),
+                datetime.fromisoformat(record["updated_at"]),
+                None if due_date is None else datetime.fromisoformat(due_date),
+                version,
+            )
+        except (TypeError, ValueError) as error:
+            raise ValidationError(f"Invalid field value: {error}") from error
+
+        task.validate()
+        return task
+
+    def dump_binary(self) -> bytes:
+        """
+        Encode every task in the binary wire format.
+
+        Returns:
+            A message readable by load_binary or wire.TaskBatchView
+        """
+        return pack_tasks(self._store)
+
+    def load_binary(self, data) -> int:
+        """
+        Add every task of a binary wire-format message, keeping their IDs and versions.
+
+        The message is decoded without copying it, then validated as a
+        whole before anything is added.
+
+        Args:
+            data: bytes-like message produced by dump_binary or wire.pack_tasks
+
+        Returns:
+            The number of tasks added
+
+        Raises:
+            WireFormatError: If the message is malformed
+            ValidationError: If a decoded task is invalid
+            DuplicateTaskError: If a task ID is already in use or repeated
+        """
+        tasks = TaskBatchView(data).to_tasks()
+        seen = set()
+        for task in tasks:
+            task.validate()
+            if task.task_id in seen or task.task_id in self._store:
+                raise DuplicateTaskError(task.task_id)
+            seen.add(task.task_id)
+
+        if tasks:
+            self._store_new_tasks(tasks)
+            self._next_id = max(self._next_id, self._id_after(max(seen)))
+        return len(tasks)
+
     def get_task(self, task_id: int) -> Task:
         """
         Retrieve a task by ID.
@@ -67,10 +590,24 @@ class TaskManager:
         Raises:
             TaskNotFoundError: If task doesn't exist
         """
-        if task_id not in self._tasks:
+        task = self._store.get(task_id)
+        if task is None:
             raise TaskNotFoundError(task_id)
 
-        return self._tasks[task_id]
+        return task
+
+    def _get_task_at(self, task_id: int, expected_version: Optional[int]) -> Task:
+        """
+        Retrieve a task to change, checking its version if one is expected.
+
+        Raises:
+            TaskNotFoundError: If task doesn't exist
+            VersionConflictError: If the task is not at expected_version
+        """
+        task = self.get_task(task_id)
+        if expected_version is not None and task.version != expected_version:
+            raise VersionConflictError(task_id, expected_version, task.version)
+        return task
 
     def get_all_tasks(self) -> List[Task]:
         """
@@ -79,7 +616,7 @@ class TaskManager:
         Returns:
             List of all tasks
         """
-        return list(self._tasks.values())
+        return list(self._store)
 
     def get_tasks_by_status(self, status: TaskStatus) -> List[Task]:
         """
@@ -91,7 +628,7 @@ class TaskManager:
         Returns:
             List of tasks matching the status
         """
-        return [task for task in self._tasks.values() if task.status == status]
+        return self._store.by_status(status)
 
     def get_tasks_by_priority(self, priority: TaskPriority) -> List[Task]:
         """
@@ -103,7 +640,7 @@ class TaskManager:
         Returns:
             List of tasks matching the priority
         """
-        return [task for task in self._tasks.values() if task.priority == priority]
+        return self._store.by_priority(priority)
 
     def get_overdue_tasks(self) -> List[Task]:
         """
@@ -112,7 +649,221 @@ class TaskManager:
         Returns:
             List of overdue tasks
         """
-        return [task for task in self._tasks.values() if task.is_overdue()]
+        return self._store.due_before(datetime.now())
+
+    def get_tasks_due_between(self, start: datetime, end: datetime) -> List[Task]:
+        """
+        Get open tasks whose due date falls within a time window.
+
+        Only pending and in-progress tasks are considered; completed and
+        cancelled tasks are no longer tracked by deadline.
+
+        Args:
+            start: Start of the window (inclusive)
+            end: End of the window (exclusive)
+
+        Returns:
+            List of matching tasks, ordered by due date
+        """
+        return self._store.due_between(start, end)
+
+    def iter_tasks(
+        self,
+        after_id: int = 0,
+        limit: Optional[int] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+    ) -> Iterator[Task]:
+        """
+        Iterate over tasks in ID order, one page at a time.
+
+        This is a keyset cursor: pass the ID of the last task of one page as
+        ``after_id`` to get the next page. Only one page of tasks is held at
+        a time, so a full listing costs O(page) memory, and tasks may be
+        added, changed or deleted while iterating: every task that exists
+        for the whole iteration is yielded exactly once, deleted tasks are
+        not yielded after their deletion, and new tasks appear if their ID
+        is past the cursor.
+
+        Args:
+            after_id: Yield only tasks with a larger ID
+            limit: Maximum number of tasks to yield, or None for all
+            status: If given, yield only tasks with this status
+            priority: If given, yield only tasks with this priority
+
+        Yields:
+            Matching tasks, by ascending ID
+        """
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = _ITER_PAGE_SIZE if remaining is None else min(_ITER_PAGE_SIZE, remaining)
+            page = self._store.page(after_id, size, status, priority)
+            yielded = 0
+            for task in page:
+                # The caller may have deleted or changed the task since the page was read.
+                if (
+                    task._owner is self
+                    and (status is None or task.status is status)
+                    and (priority is None or task.priority is priority)
+                ):
+                    yielded += 1
+                    yield task
+            if len(page) < size:
+                return
+            after_id = page[-1].task_id
+            if remaining is not None:
+                # Only tasks actually yielded count towards the limit.
+                remaining -= yielded
+
+    def iter_tasks_by_status(self, status: TaskStatus, after_id: int = 0) -> Iterator[Task]:
+        """
+        Iterate over the tasks with a status in ID order; see iter_tasks.
+
+        Args:
+            status: The status to filter by
+            after_id: Yield only tasks with a larger ID
+        """
+        return self.iter_tasks(after_id, status=status)
+
+    def iter_tasks_by_priority(self, priority: TaskPriority, after_id: int = 0) -> Iterator[Task]:
+        """
+        Iterate over the tasks with a priority in ID order; see iter_tasks.
+
+        Args:
+            priority: The priority to filter by
+            after_id: Yield only tasks with a larger ID
+        """
+        return self.iter_tasks(after_id, priority=priority)
+
+    def iter_overdue_tasks(self) -> Iterator[Task]:
+        """Iterate over overdue tasks by due date, like get_overdue_tasks without the list."""
+        return self.iter_tasks_due_between(datetime.min, datetime.now())
+
+    def iter_tasks_due_between(self, start: datetime, end: datetime) -> Iterator[Task]:
+        """
+        Iterate over open tasks due in ``[start, end)`` by due date.
+
+        The generator form of get_tasks_due_between. Engines with an
+        ordered deadline index read it a page at a time and resume after
+        the last (due date, ID) yielded, so the store may change during
+        iteration; tasks closed or rescheduled out of the window before
+        they are reached are skipped.
+
+        Args:
+            start: Start of the window (inclusive)
+            end: End of the window (exclusive)
+        """
+        for task in self._store.iter_due_between(start, end):
+            # The caller may have closed or rescheduled the task since it was read.
+            if (
+                task._owner is self
+                and task.status in OPEN_STATUSES
+                and task.due_date is not None
+                and start <= task.due_date < end
+            ):
+                yield task
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Task]:
+        """
+        Find tasks whose title or description contains the query terms.
+
+        Terms are case-insensitive words combined with AND; the keyword
+        ``OR`` separates alternatives, e.g. ``"deploy api OR rollback"``.
+        Results are ranked by TF-IDF relevance, with title matches counting
+        more than description matches. The inverted index is built on the
+        first call and maintained incrementally afterwards.
+
+        Args:
+            query: Query text
+            limit: Maximum number of results, or None for all
+
+        Returns:
+            Matching tasks, most relevant first
+        """
+        index = self._ensure_text_index()
+        return [self._store.get(task_id) for task_id, _ in index.search(query, limit)]
+
+    def _ensure_text_index(self) -> TextIndex:
+        """Return the full-text index, building it on first use."""
+        if self._text_index is None:
+            self._text_index = TextIndex()
+            self._text_index.add_many(self._store)
+        return self._text_index
+
+    def query(self) -> TaskQuery:
+        """
+        Start a composable query over every task.
+
+        Chain filters, ordering and paging on the returned TaskQuery, e.g.
+        ``manager.query().status(TaskStatus.PENDING).order_by("due_date").limit(10)``.
+        The query is planned when it runs: candidates are read from the most
+        selective status, priority, due-date or text index, and the other
+        conditions are checked lazily on each candidate. Use explain() to see
+        the chosen plan.
+
+        Returns:
+            A TaskQuery matching every task
+        """
+        return TaskQuery(self)
+
+    def complete_title(self, prefix: str, limit: int = 10) -> List[Task]:
+        """
+        Suggest tasks whose title starts with a prefix, for type-ahead.
+
+        Matching ignores case and repeated whitespace. Suggestions are
+        ordered by priority (highest first), then by creation time (newest
+        first). The prefix index is built on the first call and maintained
+        incrementally afterwards, so each keystroke costs
+        O(len(prefix) + limit) once its prefix has been seen.
+
+        Args:
+            prefix: Text typed so far
+            limit: Maximum number of suggestions
+
+        Returns:
+            Matching tasks, best first
+        """
+        if self._prefix_index is None:
+            self._prefix_index = PrefixIndex()
+            self._prefix_index.add_many(self._store)
+        return [self._store.get(task_id) for task_id in self._prefix_index.complete(prefix, limit)]
+
+    def work_queue(self) -> WorkQueue:
+        """
+        Return the manager's work queue of pending tasks.
+
+        Workers call ``claim_next(worker_id, lease_seconds)`` on it to take
+        the most important pending task (highest priority, then earliest
+        due date, then oldest). The queue is built on the first call and
+        kept current as tasks change; tasks already IN_PROGRESS at that
+        point carry no lease and are not requeued.
+
+        Returns:
+            The WorkQueue shared by every caller of this manager
+        """
+        if self._work_queue is None:
+            self._work_queue = WorkQueue(self)
+        return self._work_queue
+
+    def change_feed(self, capacity: int = DEFAULT_CAPACITY) -> ChangeFeed:
+        """
+        Return the manager's feed of task changes.
+
+        The feed is attached on the first call and records every change made
+        from then on, including direct changes to owned tasks; later calls
+        return the same feed and ignore ``capacity``. Consumers that need the
+        current state as well subscribe first and then read the tasks, so no
+        change falls between the two.
+
+        Args:
+            capacity: Number of events the feed keeps for slow consumers
+
+        Returns:
+            The ChangeFeed shared by every caller of this manager
+        """
+        if self._change_feed is None:
+            self._change_feed = ChangeFeed(capacity)
+        return self._change_feed
 
     def update_task(
         self,
@@ -120,6 +871,7 @@ class TaskManager:
         title: Optional[str] = None,
         description: Optional[str] = None,
         priority: Optional[TaskPriority] = None,
+        expected_version: Optional[int] = None,
     ) -> Task:
         """
         Update task details.
@@ -129,6 +881,8 @@ class TaskManager:
             title: New title (optional)
             description: New description (optional)
             priority: New priority (optional)
+            expected_version: Only update the task if it is at this version,
+                i.e. unchanged since it was read (optional)
 
         Returns:
             The updated Task object
@@ -136,8 +890,9 @@ class TaskManager:
         Raises:
             TaskNotFoundError: If task doesn't exist
             ValidationError: If update data is invalid
+            VersionConflictError: If the task is not at expected_version
         """
-        task = self.get_task(task_id)
+        task = self._get_task_at(task_id, expected_version)
 
         if title is not None:
             task.update_title(title)
@@ -150,27 +905,42 @@ class TaskManager:
 
         return task
 
-    def delete_task(self, task_id: int) -> None:
+    def delete_task(self, task_id: int, expected_version: Optional[int] = None) -> None:
         """
         Delete a task.
 
         Args:
             task_id: ID of the task to delete
+            expected_version: Only delete the task if it is at this version (optional)
 
         Raises:
             TaskNotFoundError: If task doesn't exist
+            VersionConflictError: If the task is not at expected_version
         """
-        if task_id not in self._tasks:
+        if expected_version is not None:
+            self._get_task_at(task_id, expected_version)
+        task = self._store.remove(task_id)
+        if task is None:
             raise TaskNotFoundError(task_id)
+        if self._text_index is not None:
+            self._text_index.remove(task)
+        if self._prefix_index is not None:
+            self._prefix_index.remove(task_id)
+        if self._work_queue is not None:
+            self._work_queue.remove(task_id)
 
-        del self._tasks[task_id]
+        if self._wal is not None:
+            self._wal.append([RECORD_DELETE, task_id])
+        if self._change_feed is not None:
+            self._change_feed.publish(EVENT_DELETE, task_id)
 
-    def mark_task_in_progress(self, task_id: int) -> Task:
+    def mark_task_in_progress(self, task_id: int, expected_version: Optional[int] = None) -> Task:
         """
         Mark a task as in progress.
 
         Args:
             task_id: ID of the task
+            expected_version: Only change the task if it is at this version (optional)
 
         Returns:
             The updated Task object
@@ -178,17 +948,19 @@ class TaskManager:
         Raises:
             TaskNotFoundError: If task doesn't exist
             ValidationError: If status transition is invalid
+            VersionConflictError: If the task is not at expected_version
         """
-        task = self.get_task(task_id)
+        task = self._get_task_at(task_id, expected_version)
         task.mark_in_progress()
         return task
 
-    def mark_task_completed(self, task_id: int) -> Task:
+    def mark_task_completed(self, task_id: int, expected_version: Optional[int] = None) -> Task:
         """
         Mark a task as completed.
 
         Args:
             task_id: ID of the task
+            expected_version: Only change the task if it is at this version (optional)
 
         Returns:
             The updated Task object
@@ -196,17 +968,19 @@ class TaskManager:
         Raises:
             TaskNotFoundError: If task doesn't exist
             ValidationError: If status transition is invalid
+            VersionConflictError: If the task is not at expected_version
         """
-        task = self.get_task(task_id)
+        task = self._get_task_at(task_id, expected_version)
         task.mark_completed()
         return task
 
-    def mark_task_cancelled(self, task_id: int) -> Task:
+    def mark_task_cancelled(self, task_id: int, expected_version: Optional[int] = None) -> Task:
         """
         Mark a task as cancelled.
 
         Args:
             task_id: ID of the task
+            expected_version: Only change the task if it is at this version (optional)
 
         Returns:
             The updated Task object
@@ -214,11 +988,139 @@ class TaskManager:
         Raises:
             TaskNotFoundError: If task doesn't exist
             ValidationError: If status transition is invalid
+            VersionConflictError: If the task is not at expected_version
         """
-        task = self.get_task(task_id)
+        task = self._get_task_at(task_id, expected_version)
         task.mark_cancelled()
         return task
 
+    def transition_many(
+        self,
+        task_ids: Iterable[int],
+        status: TaskStatus,
+        expected_versions: Optional[Mapping[int, int]] = None,
+    ) -> TransitionResult:
+        """
+        Move many tasks to a status in one pass.
+
+        Each task follows the same rules as the matching ``Task.mark_*``
+        method, but problems are reported in the result instead of raised.
+        All transitioned tasks share one updated_at timestamp, and the
+        storage engine updates its indexes once for the whole batch.
+        Repeated IDs are processed once.
+
+        Args:
+            task_ids: IDs of the tasks to transition
+            status: Target status (IN_PROGRESS, COMPLETED or CANCELLED)
+            expected_versions: Version each task must be at, keyed by ID;
+                tasks at another version are left unchanged and reported as
+                conflicts. IDs not in the mapping are not checked (optional)
+
+        Returns:
+            TransitionResult listing succeeded, missing, rejected and conflicting IDs
+
+        Raises:
+            ValidationError: If status cannot be reached through a transition
+        """
+        if status not in TRANSITION_TARGETS:
+            raise ValidationError(f"Cannot transition tasks to {status.value}")
+
+        result = TransitionResult()
+        tasks = []
+        old_statuses = []
+        for task_id in dict.fromkeys(task_ids):
+            task = self._store.get(task_id)
+            if task is None:
+                result.missing.append(task_id)
+                continue
+            expected = None if expected_versions is None else expected_versions.get(task_id)
+            if expected is not None and expected != task.version:
+                result.conflicts[task_id] = task.version
+                continue
+            error = task.transition_error(status)
+            if error:
+                result.rejected[task_id] = error
+                continue
+            tasks.append(task)
+            old_statuses.append(task.status)
+            result.succeeded.append(task_id)
+
+        now = datetime.now()
+        old_updated_at = (
+            [task.updated_at for task in tasks] if self._change_feed is not None else []
+        )
+        for task in tasks:
+            task._apply_transition(status, now)
+        self._store.tasks_transitioned(tasks, old_statuses)
+        if self._work_queue is not None:
+            for task in tasks:
+                self._work_queue.task_changed(task)
+        if self._wal is not None and tasks:
+            self._wal.append(
+                [
+                    RECORD_TRANSITION,
+                    [task.task_id for task in tasks],
+                    STATUS_CODES[status],
+                    datetime_to_micros(now),
+                ]
+            )
+        if self._change_feed is not None and tasks:
+            self._change_feed.publish_many(
+                change
+                for task, old_status, old_time in zip(tasks, old_statuses, old_updated_at)
+                for change in (
+                    (EVENT_SET, task.task_id, "status", status, old_status),
+                    (EVENT_SET, task.task_id, "updated_at", now, old_time),
+                )
+            )
+
+        return result
+
+    def mark_tasks_in_progress(
+        self, task_ids: Iterable[int], expected_versions: Optional[Mapping[int, int]] = None
+    ) -> TransitionResult:
+        """
+        Mark many tasks as in progress; see transition_many.
+
+        Args:
+            task_ids: IDs of the tasks
+            expected_versions: Version each task must be at, keyed by ID (optional)
+
+        Returns:
+            TransitionResult listing succeeded, missing, rejected and conflicting IDs
+        """
+        return self.transition_many(task_ids, TaskStatus.IN_PROGRESS, expected_versions)
+
+    def mark_tasks_completed(
+        self, task_ids: Iterable[int], expected_versions: Optional[Mapping[int, int]] = None
+    ) -> TransitionResult:
+        """
+        Mark many tasks as completed; see transition_many.
+
+        Args:
+            task_ids: IDs of the tasks
+            expected_versions: Version each task must be at, keyed by ID (optional)
+
+        Returns:
+            TransitionResult listing succeeded, missing, rejected and conflicting IDs
+        """
+        return self.transition_many(task_ids, TaskStatus.COMPLETED, expected_versions)
+
+    def mark_tasks_cancelled(
+        self, task_ids: Iterable[int], expected_versions: Optional[Mapping[int, int]] = None
+    ) -> TransitionResult:
+        """
+        Mark many tasks as cancelled; see transition_many.
+
+        Args:
+            task_ids: IDs of the tasks
+            expected_versions: Version each task must be at, keyed by ID (optional)
+
+        Returns:
+            TransitionResult listing succeeded, missing, rejected and conflicting IDs
+        """
+        return self.transition_many(task_ids, TaskStatus.CANCELLED, expected_versions)
+
     def get_task_count(self) -> int:
         """
         Get total number of tasks.
@@ -226,33 +1128,80 @@ class TaskManager:
         Returns:
             Number of tasks
         """
-        return len(self._tasks)
+        return len(self._store)
 
-    def get_statistics(self) -> dict:
+    def get_statistics(self, verify: bool = False) -> dict:
         """
         Get statistics about tasks.
 
+        Counts come from the storage engine's maintained indexes or column
+        scans, so no task lists are built.
+
+        Args:
+            verify: If True, also recompute the statistics with a full scan and
+                fail loudly if the maintained counters disagree (for tests)
+
         Returns:
             Dictionary containing task statistics
+
+        Raises:
+            AssertionError: If verify is set and the counters are inconsistent
         """
-        total = len(self._tasks)
-        completed = len(self.get_tasks_by_status(TaskStatus.COMPLETED))
-        in_progress = len(self.get_tasks_by_status(TaskStatus.IN_PROGRESS))
-        pending = len(self.get_tasks_by_status(TaskStatus.PENDING))
-        cancelled = len(self.get_tasks_by_status(TaskStatus.CANCELLED))
-        overdue = len(self.get_overdue_tasks())
+        # One instant for the counters and the scan, so a task that falls due
+        # in between is counted the same way by both.
+        now = datetime.now()
+        stats = self._build_statistics(
+            self._store.status_counts(),
+            len(self._store),
+            self._store.count_due_before(now),
+        )
+
+        if verify:
+            scanned = self._scan_statistics(now)
+            if scanned != stats:
+                raise AssertionError(
+                    f"Statistics counters out of sync: counters={stats}, scan={scanned}"
+                )
+
+        return stats
+
+    def _scan_statistics(self, now: datetime) -> dict:
+        """Recompute statistics from scratch by scanning every task, as of ``now``."""
+        counts = dict.fromkeys(TaskStatus, 0)
+        overdue = 0
+        total = 0
+        for task in self._store:
+            total += 1
+            counts[task.status] += 1
+            if task.is_overdue(now):
+                overdue += 1
+        return self._build_statistics(counts, total, overdue)
 
+    @staticmethod
+    def _build_statistics(counts: Dict[TaskStatus, int], total: int, overdue: int) -> dict:
+        """Assemble the statistics dictionary from per-status counts."""
+        completed = counts[TaskStatus.COMPLETED]
         return {
             "total": total,
             "completed": completed,
-            "in_progress": in_progress,
-            "pending": pending,
-            "cancelled": cancelled,
+            "in_progress": counts[TaskStatus.IN_PROGRESS],
+            "pending": counts[TaskStatus.PENDING],
+            "cancelled": counts[TaskStatus.CANCELLED],
             "overdue": overdue,
             "completion_rate": (completed / total * 100) if total > 0 else 0,
         }
 
     def clear_all_tasks(self) -> None:
         """Clear all tasks from the manager."""
-        self._tasks.clear()
-        self._next_id = 1
+        self._store.clear()
+        self._next_id = self._first_id
+        if self._text_index is not None:
+            self._text_index.clear()
+        if self._prefix_index is not None:
+            self._prefix_index.clear()
+        if self._work_queue is not None:
+            self._work_queue.clear()
+        if self._wal is not None:
+            self._wal.append([RECORD_CLEAR])
+        if self._change_feed is not None:
+            self._change_feed.publish(EVENT_CLEAR)
@@ -0,0 +1,208 @@
+"""Inverted index for keyword search over task titles and descriptions."""
+
+import heapq
+import math
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .task import Task
+
+_TOKEN = re.compile(r"\w+")
+
+# A title match counts this many times as much as a description match.
+TITLE_WEIGHT = 3
+
+# Query keywords; any other word is a search term.
+_OR = "OR"
+_AND = "AND"
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into case-folded word tokens."""
+    return _TOKEN.findall(text.casefold())
+
+
+def _term_counts(text: str, weight: int = 1) -> Dict[str, int]:
+    """Return the weighted number of occurrences of each term in a text."""
+    counts: Dict[str, int] = {}
+    for term in tokenize(text):
+        counts[term] = counts.get(term, 0) + weight
+    return counts
+
+
+def _task_term_counts(task: Task) -> Dict[str, int]:
+    """Return the weighted term counts of a task's title and description."""
+    counts = _term_counts(task.title, TITLE_WEIGHT)
+    for term, count in _term_counts(task.description).items():
+        counts[term] = counts.get(term, 0) + count
+    return counts
+
+
+def matcher(query: str) -> Callable[[Task], bool]:
+    """
+    Compile a query into a predicate that tests one task without the index.
+
+    The predicate accepts the same syntax as TextIndex.search and returns
+    True for exactly the tasks a search would return.
+    """
+    groups = [set(group) for group in TextIndex._parse(query)]
+
+    def matches(task: Task) -> bool:
+        terms = set(tokenize(task.title))
+        terms.update(tokenize(task.description))
+        return any(group <= terms for group in groups)
+
+    return matches
+
+
+def _rank_key(item: Tuple[int, float]) -> Tuple[float, int]:
+    """Order (task ID, score) pairs by descending score, then ID."""
+    return -item[1], item[0]
+
+
+class TextIndex:
+    """
+    Inverted index from terms to the tasks containing them.
+
+    Each posting list maps a task ID to the weighted term frequency of the
+    term in that task (title occurrences count TITLE_WEIGHT times). Queries
+    intersect or merge posting lists and rank matches by TF-IDF.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._document_count = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed tasks."""
+        return self._document_count
+
+    def add(self, task: Task) -> None:
+        """Index a task's title and description."""
+        self._document_count += 1
+        self._apply(task.task_id, _task_term_counts(task), 1)
+
+    def add_many(self, tasks: Iterable[Task]) -> None:
+        """Index a batch of tasks."""
+        for task in tasks:
+            self.add(task)
+
+    def remove(self, task: Task) -> None:
+        """Remove a task, using its current title and description."""
+        self._document_count -= 1
+        self._apply(task.task_id, _task_term_counts(task), -1)
+
+    def field_changed(self, task: Task, field_name: str, old_value: str) -> None:
+        """
+        Re-index a task after its title or description changed.
+
+        Args:
+            task: Task carrying the new value
+            field_name: "title" or "description"
+            old_value: Text before the change
+        """
+        weight = TITLE_WEIGHT if field_name == "title" else 1
+        self._apply(task.task_id, _term_counts(old_value, weight), -1)
+        self._apply(task.task_id, _term_counts(getattr(task, field_name), weight), 1)
+
+    def clear(self) -> None:
+        """Remove every task."""
+        self._postings.clear()
+        self._document_count = 0
+
+    def _apply(self, task_id: int, counts: Dict[str, int], sign: int) -> None:
+        """Add (sign 1) or subtract (sign -1) term counts for a task."""
+        postings = self._postings
+        for term, count in counts.items():
+            posting = postings.get(term)
+            if posting is None:
+                posting = postings[term] = {}
+            frequency = posting.get(task_id, 0) + sign * count
+            if frequency > 0:
+                posting[task_id] = frequency
+            else:
+                posting.pop(task_id, None)
+                if not posting:
+                    del postings[term]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Find tasks matching a query, best first.
+
+        Terms are combined with AND by default; the keyword ``OR`` (upper
+        case) separates alternative groups, so ``"fix login OR signup"``
+        matches tasks containing both "fix" and "login", or "signup". The
+        score of a task is the sum over matched terms of weighted term
+        frequency times inverse document frequency.
+
+        Args:
+            query: Query text
+            limit: Maximum number of results, or None for all
+
+        Returns:
+            (task ID, score) pairs ordered by descending score, then ID
+        """
+        groups = self._parse(query)
+        if len(groups) == 1:
+            scores = self._match_all(groups[0])
+        else:
+            # A task matching several alternatives keeps its best score.
+            scores = {}
+            for group in groups:
+                for task_id, score in self._match_all(group).items():
+                    if score > scores.get(task_id, 0.0):
+                        scores[task_id] = score
+
+        if limit is None:
+            return sorted(scores.items(), key=_rank_key)
+        return heapq.nsmallest(limit, scores.items(), key=_rank_key)
+
+    def estimate(self, query: str) -> int:
+        """
+        Return an upper bound on the number of tasks matching a query.
+
+        Each AND group matches at most as many tasks as its rarest term, so
+        the bound costs one dictionary lookup per term.
+        """
+        total = 0
+        for group in self._parse(query):
+            total += min(len(self._postings.get(term, ())) for term in group)
+        return total
+
+    @staticmethod
+    def _parse(query: str) -> List[List[str]]:
+        """Split a query into OR-separated groups of AND-ed terms."""
+        groups: List[List[str]] = [[]]
+        for word in query.split():
+            if word == _OR:
+                groups.append([])
+            elif word != _AND:
+                groups[-1].extend(tokenize(word))
+        return [group for group in groups if group]
+
+    def _match_all(self, terms: List[str]) -> Dict[int, float]:
+        """Score the tasks containing every term, intersecting the shortest lists first."""
+        postings = []
+        for term in set(terms):
+            posting = self._postings.get(term)
+            if posting is None:
+                return {}
+            postings.append(posting)
+        postings.sort(key=len)
+
+        candidates = postings[0].keys()
+        for posting in postings[1:]:
+            candidates = candidates & posting.keys()
+            if not candidates:
+                return {}
+
+        document_count = self._document_count
+        weights = [math.log(1 + document_count / len(posting)) for posting in postings]
+        if len(postings) == 1:
+            weight = weights[0]
+            return {task_id: frequency * weight for task_id, frequency in postings[0].items()}
+        return {
+            task_id: sum(posting[task_id] * weight for posting, weight in zip(postings, weights))
+            for task_id in candidates
+        }
@@ -0,0 +1,284 @@
+"""Reader/writer locking and a TaskManager that is safe to share between threads."""
+
+import functools
+import threading
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from .change_feed import DEFAULT_CAPACITY, ChangeFeed
+from .query import ACCESS_DUE, QueryPlan, TaskQuery
+from .task import Task
+from .task_manager import TaskManager
+from .work_queue import WorkQueue
+
+T = TypeVar("T")
+
+# Sentinel returned by next() once an iterator is exhausted.
+_DONE = object()
+
+
+class _Guard:
+    """Context manager acquiring one side of a ReadWriteLock."""
+
+    __slots__ = ("_acquire", "_release")
+
+    def __init__(self, acquire: Callable[[], None], release: Callable[[], None]):
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self) -> None:
+        self._acquire()
+
+    def __exit__(self, *exc_info) -> None:
+        self._release()
+
+
+class ReadWriteLock:
+    """
+    Reentrant lock admitting many readers or one writer.
+
+    Use ``with lock.read:`` and ``with lock.write:``. Writers are preferred:
+    once a writer waits, new readers queue behind it, so a steady stream
+    of reads cannot starve writes. A thread may nest reads, nest writes
+    and read while it writes; asking to write while only reading raises
+    RuntimeError instead of deadlocking against another reader doing the
+    same.
+    """
+
+    def __init__(self):
+        """Initialize an unlocked lock."""
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._waiting_writers = 0
+        self._writer = None
+        self._write_depth = 0
+        # Per-thread read nesting and whether the outermost read was counted.
+        self._local = threading.local()
+        self.read = _Guard(self.acquire_read, self.release_read)
+        self.write = _Guard(self.acquire_write, self.release_write)
+
+    def acquire_read(self) -> None:
+        """Acquire the lock for reading, waiting while a writer holds or awaits it."""
+        local = self._local
+        depth = getattr(local, "depth", 0)
+        if depth:
+            local.depth = depth + 1
+            return
+        if self._writer == threading.get_ident():
+            # Reading inside this thread's own write needs no reader slot.
+            local.depth, local.counted = 1, False
+            return
+
+        with self._condition:
+            while self._writer is not None or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        local.depth, local.counted = 1, True
+
+    def release_read(self) -> None:
+        """Release one level of reading."""
+        local = self._local
+        local.depth -= 1
+        if local.depth or not local.counted:
+            return
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """
+        Acquire the lock for writing, waiting until no other thread holds it.
+
+        Raises:
+            RuntimeError: If the thread holds only a read lock
+        """
+        me = threading.get_ident()
+        if self._writer == me:
+            self._write_depth += 1
+            return
+        if getattr(self._local, "depth", 0):
+            raise RuntimeError("Cannot upgrade a read lock to a write lock")
+
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self) -> None:
+        """Release one level of writing."""
+        self._write_depth -= 1
+        if self._write_depth:
+            return
+        with self._condition:
+            self._writer = None
+            self._condition.notify_all()
+
+
+def _reader(method: Callable[..., T]) -> Callable[..., T]:
+    """Wrap a TaskManager method to run under the read lock."""
+
+    @functools.wraps(method)
+    def locked(self, *args, **kwargs):
+        with self._read_guard:
+            return method(self, *args, **kwargs)
+
+    return locked
+
+
+def _writer(method: Callable[..., T]) -> Callable[..., T]:
+    """Wrap a TaskManager method to run under the write lock."""
+
+    @functools.wraps(method)
+    def locked(self, *args, **kwargs):
+        with self._lock.write:
+            return method(self, *args, **kwargs)
+
+    return locked
+
+
+class _LockedTaskQuery(TaskQuery):
+    """TaskQuery that plans and reads under its ThreadSafeTaskManager's read lock."""
+
+    def _prepare(self) -> None:
+        """Build the text index up front; building it needs the write lock."""
+        if self._text is not None:
+            self._manager._ensure_text_index()
+
+    def _read(self, access: str) -> Iterable[Task]:
+        """
+        Return the candidates of an access path, copied unless it tolerates writes.
+
+        The lock is released between results, so a writer may add or delete
+        tasks before the next one; reading the live store then would fail.
+        The due-date path resumes from its last index entry and is read lazily.
+        """
+        candidates = super()._read(access)
+        return candidates if access == ACCESS_DUE else list(candidates)
+
+    def explain(self) -> QueryPlan:
+        """Return the plan the query would run with right now."""
+        self._prepare()
+        with self._manager._read_guard:
+            return super().explain()
+
+    def __iter__(self) -> Iterator:
+        """Evaluate the query, holding the read lock only while producing each result."""
+        self._prepare()
+        manager = self._manager
+        with manager._read_guard:
+            results = super().__iter__()
+        return manager._step_locked(results)
+
+    def count(self) -> int:
+        """Return the number of results."""
+        self._prepare()
+        with self._manager._read_guard:
+            return super().count()
+
+
+class ThreadSafeTaskManager(TaskManager):
+    """
+    TaskManager that may be shared by many threads.
+
+    Reads (get_*, filters, statistics, search, queries, exports) hold a
+    shared lock and run side by side; mutations hold an exclusive lock, so
+    check-then-act sequences such as ``mark_task_completed`` (look up,
+    check the transition, apply it) and bulk calls are atomic. Generators
+    hold the read lock only while fetching each step, never across a
+    yield. The work queue shares the write lock.
+
+    Reads are shared only when the storage engine supports it
+    (``TaskStore.concurrent_reads``, true for DictTaskStore); engines that
+    materialize tasks on read are read under the exclusive lock.
+
+    Change tasks through manager methods. A direct attribute write on a
+    task updates the indexes under the write lock, but the new value is
+    visible to concurrent readers of that task object a moment earlier.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize a manager; takes the same arguments as TaskManager."""
+        self._lock = ReadWriteLock()
+        super().__init__(*args, **kwargs)
+        self._read_guard = self._lock.read if self._store.concurrent_reads else self._lock.write
+
+    def _step_locked(self, iterator: Iterator[T]) -> Iterator[T]:
+        """Yield from an iterator, advancing it under the read lock."""
+        while True:
+            with self._read_guard:
+                item = next(iterator, _DONE)
+            if item is _DONE:
+                return
+            yield item
+
+    # Reads.
+    get_task = _reader(TaskManager.get_task)
+    get_all_tasks = _reader(TaskManager.get_all_tasks)
+    get_tasks_by_status = _reader(TaskManager.get_tasks_by_status)
+    get_tasks_by_priority = _reader(TaskManager.get_tasks_by_priority)
+    get_overdue_tasks = _reader(TaskManager.get_overdue_tasks)
+    get_tasks_due_between = _reader(TaskManager.get_tasks_due_between)
+    get_task_count = _reader(TaskManager.get_task_count)
+    get_statistics = _reader(TaskManager.get_statistics)
+    export_jsonl = _reader(TaskManager.export_jsonl)
+    dump_binary = _reader(TaskManager.dump_binary)
+
+    # Mutations. complete_title counts as one: it fills the prefix cache.
+    add_task = _writer(TaskManager.add_task)
+    add_tasks = _writer(TaskManager.add_tasks)
+    import_jsonl = _writer(TaskManager.import_jsonl)
+    load_binary = _writer(TaskManager.load_binary)
+    update_task = _writer(TaskManager.update_task)
+    delete_task = _writer(TaskManager.delete_task)
+    mark_task_in_progress = _writer(TaskManager.mark_task_in_progress)
+    mark_task_completed = _writer(TaskManager.mark_task_completed)
+    mark_task_cancelled = _writer(TaskManager.mark_task_cancelled)
+    transition_many = _writer(TaskManager.transition_many)
+    clear_all_tasks = _writer(TaskManager.clear_all_tasks)
+    save_snapshot = _writer(TaskManager.save_snapshot)
+    close = _writer(TaskManager.close)
+    complete_title = _writer(TaskManager.complete_title)
+    _on_task_changed = _writer(TaskManager._on_task_changed)
+
+    def iter_tasks(self, *args, **kwargs) -> Iterator:
+        """Iterate over tasks in ID order; see TaskManager.iter_tasks."""
+        return self._step_locked(super().iter_tasks(*args, **kwargs))
+
+    def iter_tasks_due_between(self, *args, **kwargs) -> Iterator:
+        """Iterate over open tasks due in a window; see TaskManager.iter_tasks_due_between."""
+        return self._step_locked(super().iter_tasks_due_between(*args, **kwargs))
+
+    def search(self, *args, **kwargs):
+        """Search titles and descriptions; see TaskManager.search."""
+        self._ensure_text_index()
+        with self._read_guard:
+            return super().search(*args, **kwargs)
+
+    def _ensure_text_index(self):
+        """Build the text index under the write lock the first time it is needed."""
+        if self._text_index is None:
+            with self._lock.write:
+                return super()._ensure_text_index()
+        return self._text_index
+
+    def query(self) -> TaskQuery:
+        """Start a query that evaluates under the read lock; see TaskManager.query."""
+        return _LockedTaskQuery(self)
+
+    def work_queue(self) -> WorkQueue:
+        """Return the work queue, serialized by the manager's write lock."""
+        with self._lock.write:
+            if self._work_queue is None:
+                work_queue = super().work_queue()
+                work_queue._lock = self._lock.write
+            return self._work_queue
+
+    def change_feed(self, capacity: int = DEFAULT_CAPACITY) -> ChangeFeed:
+        """Attach the change feed under the write lock; reads of it take only the feed's lock."""
+        with self._lock.write:
+            return super().change_feed(capacity)
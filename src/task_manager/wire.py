@@ -0,0 +1,241 @@
+"""Compact, versioned binary wire format for tasks and task batches."""
+
+import struct
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional
+
+from .codec import (
+    BINARY_RECORD,
+    FIELD_DECODERS,
+    decode_binary_record,
+    decode_binary_records,
+    pack_binary_records,
+)
+from .exceptions import WireFormatError
+from .task import Task, TaskPriority, TaskStatus
+
+# Message layout (little-endian):
+#   header    magic, format version, task count
+#   records   one codec.BINARY_RECORD per task, in batch order
+#   strings   byte length of the string section, then UTF-8 titles and
+#             descriptions addressed by (offset, length) from the records
+MAGIC = b"TSKW"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sHI")
+STRINGS_LENGTH = struct.Struct("<Q")
+
+# Numeric record field -> (struct reading it alone, offset inside the record).
+_NUMERIC_FIELDS = {
+    "task_id": (struct.Struct("<q"), 0),
+    "status": (struct.Struct("<b"), 8),
+    "priority": (struct.Struct("<b"), 9),
+    "created_at": (struct.Struct("<q"), 10),
+    "updated_at": (struct.Struct("<q"), 18),
+    "due_date": (struct.Struct("<q"), 26),
+    "version": (struct.Struct("<q"), 58),
+}
+# String field -> offset of its (offset, length) pair inside the record.
+_STRING_FIELDS = {"title": 34, "description": 46}
+_STRING_REFERENCE = struct.Struct("<QI")
+
+
+def pack_tasks(tasks: Iterable[Task]) -> bytes:
+    """
+    Encode a batch of tasks in the binary wire format.
+
+    Args:
+        tasks: Tasks to encode, kept in the given order
+
+    Returns:
+        The encoded message
+    """
+    tasks = list(tasks)
+    records, strings = pack_binary_records(tasks)
+    strings_length = sum(len(chunk) for chunk in strings)
+    return b"".join(
+        [
+            HEADER.pack(MAGIC, FORMAT_VERSION, len(tasks)),
+            records,
+            STRINGS_LENGTH.pack(strings_length),
+            *strings,
+        ]
+    )
+
+
+def pack_task(task: Task) -> bytes:
+    """Encode a single task as a one-task batch."""
+    return pack_tasks([task])
+
+
+def unpack_task(data) -> Task:
+    """
+    Decode a message produced by pack_task.
+
+    Raises:
+        WireFormatError: If the message is malformed or does not hold exactly one task
+    """
+    batch = TaskBatchView(data)
+    if len(batch) != 1:
+        raise WireFormatError(f"expected one task, found {len(batch)}")
+    return batch[0].to_task()
+
+
+class _LazyField:
+    """Descriptor that decodes one TaskView field from the buffer on access."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        return view._read(self.name)
+
+
+class TaskView:
+    """
+    Read-only view of one task inside a TaskBatchView.
+
+    Each attribute is decoded from the underlying buffer when it is read;
+    nothing else in the record is touched. Use to_task() to build a full
+    Task.
+    """
+
+    __slots__ = ("_batch", "_offset")
+
+    task_id: int = _LazyField()
+    title: str = _LazyField()
+    description: str = _LazyField()
+    status: TaskStatus = _LazyField()
+    priority: TaskPriority = _LazyField()
+    created_at: datetime = _LazyField()
+    updated_at: datetime = _LazyField()
+    due_date: Optional[datetime] = _LazyField()
+    version: int = _LazyField()
+
+    def __init__(self, batch: "TaskBatchView", offset: int):
+        """Bind the view to the record starting at ``offset`` in the batch buffer."""
+        self._batch = batch
+        self._offset = offset
+
+    def _read(self, name: str):
+        """
+        Decode a single field of the record.
+
+        Raises:
+            WireFormatError: If the field's stored value is invalid
+        """
+        buffer = self._batch._buffer
+        if name in _STRING_FIELDS:
+            offset, length = _STRING_REFERENCE.unpack_from(
+                buffer, self._offset + _STRING_FIELDS[name]
+            )
+            start = self._batch._strings_offset + offset
+            if start + length > len(buffer):
+                raise WireFormatError(f"{name} refers to text past the end of the message")
+            try:
+                return str(buffer[start : start + length], "utf-8")
+            except UnicodeDecodeError as error:
+                raise WireFormatError(f"{name} is not valid UTF-8") from error
+
+        field_struct, field_offset = _NUMERIC_FIELDS[name]
+        value = field_struct.unpack_from(buffer, self._offset + field_offset)[0]
+        # The version is stored as is; it is not a task field with a codec.
+        decode = FIELD_DECODERS.get(name)
+        if decode is None:
+            return value
+        try:
+            return decode(value)
+        except (KeyError, OverflowError) as error:
+            raise WireFormatError(f"invalid {name} value {value}") from error
+
+    def to_task(self) -> Task:
+        """
+        Decode every field into a new, unowned Task.
+
+        Raises:
+            WireFormatError: If the record holds invalid values
+        """
+        record = BINARY_RECORD.unpack_from(self._batch._buffer, self._offset)
+        try:
+            return decode_binary_record(record, self._batch._buffer, self._batch._strings_offset)
+        except ValueError as error:
+            raise WireFormatError(str(error)) from error
+
+    def __repr__(self):
+        """Return a short representation that decodes only the ID."""
+        return f"{self.__class__.__name__}(task_id={self.task_id!r})"
+
+
+class TaskBatchView:
+    """
+    Zero-copy reader for a message produced by pack_tasks.
+
+    The message is wrapped in a memoryview rather than copied, and only
+    the header is parsed up front; records are decoded when indexed or
+    iterated, field by field through TaskView.
+    """
+
+    def __init__(self, data):
+        """
+        Wrap an encoded message.
+
+        Args:
+            data: bytes, bytearray, memoryview or any other bytes-like object
+
+        Raises:
+            WireFormatError: If the header or section sizes are invalid
+        """
+        buffer = memoryview(data).cast("B")
+        if len(buffer) < HEADER.size:
+            raise WireFormatError("message is too short")
+
+        magic, version, count = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise WireFormatError("bad magic number")
+        if version != FORMAT_VERSION:
+            raise WireFormatError(f"unsupported format version {version}")
+
+        strings_length_offset = HEADER.size + count * BINARY_RECORD.size
+        if len(buffer) < strings_length_offset + STRINGS_LENGTH.size:
+            raise WireFormatError("record section is truncated")
+        (strings_length,) = STRINGS_LENGTH.unpack_from(buffer, strings_length_offset)
+        self._strings_offset = strings_length_offset + STRINGS_LENGTH.size
+        if len(buffer) != self._strings_offset + strings_length:
+            raise WireFormatError("string section length does not match the message")
+
+        self._buffer = buffer
+        self._count = count
+
+    def __len__(self) -> int:
+        """Return the number of tasks in the batch."""
+        return self._count
+
+    def __getitem__(self, index: int) -> TaskView:
+        """Return a lazy view of the task at ``index``."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("task index out of range")
+        return TaskView(self, HEADER.size + index * BINARY_RECORD.size)
+
+    def __iter__(self) -> Iterator[TaskView]:
+        """Iterate over lazy views of every task."""
+        for index in range(self._count):
+            yield TaskView(self, HEADER.size + index * BINARY_RECORD.size)
+
+    def to_tasks(self) -> List[Task]:
+        """
+        Decode every task into new, unowned Task objects.
+
+        Raises:
+            WireFormatError: If a record holds invalid values
+        """
+        buffer = self._buffer
+        records = buffer[HEADER.size : self._strings_offset - STRINGS_LENGTH.size]
+        try:
+            return decode_binary_records(
+                BINARY_RECORD.iter_unpack(records), buffer, self._strings_offset
+            )
+        except ValueError as error:
+            raise WireFormatError(str(error)) from error
@@ -0,0 +1,276 @@
+"""Lease-based priority queue handing pending tasks to workers."""
+
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .codec import datetime_to_micros
+from .exceptions import LeaseError
+from .task import Task, TaskStatus
+
+# Sorts after every real due date, so tasks without a deadline come last.
+_NO_DUE_DATE = float("inf")
+
+# Heaps are rebuilt once they hold this many times more entries than are live.
+_COMPACT_RATIO = 2
+_COMPACT_MINIMUM = 64
+
+QueueKey = Tuple[int, float, int, int]
+
+
+def _queue_key(task: Task) -> QueueKey:
+    """Order tasks by priority, then earliest due date, then oldest first."""
+    due = _NO_DUE_DATE if task.due_date is None else datetime_to_micros(task.due_date)
+    return -task.priority.value, due, datetime_to_micros(task.created_at), task.task_id
+
+
+@dataclass(frozen=True)
+class Lease:
+    """
+    A worker's claim on an in-progress task.
+
+    Attributes:
+        task_id: ID of the claimed task
+        worker_id: Worker holding the claim
+        expires_at: Time the claim lapses, on the queue's time.monotonic clock
+    """
+
+    task_id: int
+    worker_id: str
+    expires_at: float
+
+
+class WorkQueue:
+    """
+    Priority queue of the pending tasks of a TaskManager, claimed under leases.
+
+    The most important pending task (highest priority, then earliest due
+    date, then oldest) is kept at the top of a heap. claim_next pops it,
+    moves it to IN_PROGRESS and records a lease; a lease that is not
+    renewed or completed in time expires and its task returns to PENDING
+    and to the queue.
+
+    Changes made to tasks through the manager, or directly on owned tasks,
+    re-rank them: heap entries are invalidated lazily and skipped when
+    popped, so every operation costs O(log n) amortized.
+
+    Queue operations are serialized by a lock and safe to call from
+    several threads.
+    """
+
+    def __init__(self, manager):
+        """Create a queue holding a manager's pending tasks; see TaskManager.work_queue."""
+        self._manager = manager
+        self._lock = threading.RLock()
+        self._clock = time.monotonic
+        # Current key of every queued task; heap entries with another key are stale.
+        self._keys: Dict[int, QueueKey] = {}
+        self._heap: List[QueueKey] = []
+        self._leases: Dict[int, Lease] = {}
+        # (expiry, sequence, lease); the sequence keeps leases from being compared.
+        self._expiries: List[Tuple[float, int, Lease]] = []
+        self._sequence = itertools.count()
+        self.add_many(manager._store.by_status(TaskStatus.PENDING))
+
+    def __len__(self) -> int:
+        """Return the number of tasks waiting to be claimed."""
+        return len(self._keys)
+
+    # -- claims ------------------------------------------------------------
+
+    def claim_next(self, worker_id: str, lease_seconds: float) -> Optional[Task]:
+        """
+        Claim the most important pending task.
+
+        Expired leases are reclaimed first, so their tasks compete again.
+        The claimed task is moved to IN_PROGRESS before it is returned.
+
+        Args:
+            worker_id: Worker taking the task
+            lease_seconds: How long the claim lasts unless renewed
+
+        Returns:
+            The claimed task, or None if no task is pending
+
+        Raises:
+            ValueError: If lease_seconds is not positive
+        """
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be positive")
+
+        with self._lock:
+            now = self._clock()
+            self._reclaim(now)
+            keys = self._keys
+            heap = self._heap
+            while heap:
+                key = heapq.heappop(heap)
+                task_id = key[-1]
+                if keys.get(task_id) == key:
+                    break
+            else:
+                return None
+
+            del keys[task_id]
+            task = self._manager._store.get(task_id)
+            task.mark_in_progress()
+            self._lease(Lease(task_id, worker_id, now + lease_seconds))
+            return task
+
+    def renew(self, task_id: int, worker_id: str, lease_seconds: float) -> Lease:
+        """
+        Extend a worker's lease to ``lease_seconds`` from now.
+
+        Returns:
+            The new lease
+
+        Raises:
+            LeaseError: If the worker does not hold a live lease on the task
+            ValueError: If lease_seconds is not positive
+        """
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be positive")
+
+        with self._lock:
+            now = self._clock()
+            self._check_lease(task_id, worker_id, now)
+            lease = Lease(task_id, worker_id, now + lease_seconds)
+            self._lease(lease)
+            return lease
+
+    def complete(self, task_id: int, worker_id: str) -> Task:
+        """
+        Mark a leased task as completed and end its lease.
+
+        Raises:
+            LeaseError: If the worker does not hold a live lease on the task
+        """
+        with self._lock:
+            self._check_lease(task_id, worker_id, self._clock())
+            task = self._manager._store.get(task_id)
+            task.mark_completed()
+            return task
+
+    def release(self, task_id: int, worker_id: str) -> Task:
+        """
+        Give a leased task back, returning it to PENDING and to the queue.
+
+        Raises:
+            LeaseError: If the worker does not hold a live lease on the task
+        """
+        with self._lock:
+            self._check_lease(task_id, worker_id, self._clock())
+            return self._requeue(task_id)
+
+    def lease(self, task_id: int) -> Optional[Lease]:
+        """Return the current lease on a task, or None if it is not leased."""
+        with self._lock:
+            return self._leases.get(task_id)
+
+    def reclaim_expired(self) -> List[int]:
+        """
+        Return every task whose lease has expired to the queue.
+
+        claim_next does this on its own; call it to requeue tasks while no
+        worker is claiming.
+
+        Returns:
+            IDs of the requeued tasks
+        """
+        with self._lock:
+            return self._reclaim(self._clock())
+
+    def _lease(self, lease: Lease) -> None:
+        """Record a lease, superseding any earlier lease on the same task."""
+        self._leases[lease.task_id] = lease
+        heapq.heappush(self._expiries, (lease.expires_at, next(self._sequence), lease))
+        if len(self._expiries) > _COMPACT_RATIO * len(self._leases) + _COMPACT_MINIMUM:
+            self._expiries = [
+                (item.expires_at, next(self._sequence), item) for item in self._leases.values()
+            ]
+            heapq.heapify(self._expiries)
+
+    def _check_lease(self, task_id: int, worker_id: str, now: float) -> None:
+        """Raise LeaseError unless the worker holds an unexpired lease on the task."""
+        self._reclaim(now)
+        lease = self._leases.get(task_id)
+        if lease is None or lease.worker_id != worker_id:
+            raise LeaseError(task_id, worker_id)
+
+    def _reclaim(self, now: float) -> List[int]:
+        """Requeue the tasks of leases that expired at or before ``now``."""
+        reclaimed = []
+        expiries = self._expiries
+        leases = self._leases
+        while expiries and expiries[0][0] <= now:
+            lease = heapq.heappop(expiries)[2]
+            if leases.get(lease.task_id) is lease:
+                self._requeue(lease.task_id)
+                reclaimed.append(lease.task_id)
+        return reclaimed
+
+    def _requeue(self, task_id: int) -> Task:
+        """End a task's lease and move it back to PENDING, which queues it."""
+        del self._leases[task_id]
+        task = self._manager._store.get(task_id)
+        task.status = TaskStatus.PENDING
+        task.updated_at = datetime.now()
+        return task
+
+    # -- index maintenance (called by TaskManager) --------------------------
+
+    def add(self, task: Task) -> None:
+        """Queue a task if it is pending."""
+        if task.status is TaskStatus.PENDING:
+            with self._lock:
+                self._push(task)
+
+    def add_many(self, tasks: Iterable[Task]) -> None:
+        """Queue the pending tasks of a batch, re-heapifying once."""
+        with self._lock:
+            for task in tasks:
+                if task.status is TaskStatus.PENDING:
+                    self._keys[task.task_id] = key = _queue_key(task)
+                    self._heap.append(key)
+            heapq.heapify(self._heap)
+
+    def task_changed(self, task: Task) -> None:
+        """Re-rank, queue or drop a task after its status or ranking fields changed."""
+        with self._lock:
+            task_id = task.task_id
+            if task.status is not TaskStatus.IN_PROGRESS:
+                # Finished, cancelled or reset outside the queue: the claim is void.
+                self._leases.pop(task_id, None)
+            if task.status is TaskStatus.PENDING:
+                self._push(task)
+            else:
+                self._keys.pop(task_id, None)
+
+    def remove(self, task_id: int) -> None:
+        """Drop a deleted task and any lease on it."""
+        with self._lock:
+            self._keys.pop(task_id, None)
+            self._leases.pop(task_id, None)
+
+    def clear(self) -> None:
+        """Drop every task and lease."""
+        with self._lock:
+            self._keys.clear()
+            self._heap.clear()
+            self._leases.clear()
+            self._expiries.clear()
+
+    def _push(self, task: Task) -> None:
+        """Queue a pending task under its current key, invalidating older entries."""
+        key = _queue_key(task)
+        if self._keys.get(task.task_id) == key:
+            return
+        self._keys[task.task_id] = key
+        heapq.heappush(self._heap, key)
+        if len(self._heap) > _COMPACT_RATIO * len(self._keys) + _COMPACT_MINIMUM:
+            self._heap = list(self._keys.values())
+            heapq.heapify(self._heap)
@@ -4,13 +4,33 @@ from datetime import datetime, timedelta
 
 import pytest
 
-from src.task_manager import Task, TaskManager, TaskPriority
+from src.task_manager import (
+    ColumnarTaskStore,
+    DictTaskStore,
+    SqliteTaskStore,
+    Task,
+    TaskManager,
+    TaskPriority,
+    ThreadSafeTaskManager,
+)
 
+STORE_FACTORIES = {
+    "dict": DictTaskStore,
+    "columnar": ColumnarTaskStore,
+    "sqlite": SqliteTaskStore,
+}
 
-@pytest.fixture
-def task_manager():
-    """Provide a fresh TaskManager instance for each test."""
-    return TaskManager()
+
+@pytest.fixture(params=sorted(STORE_FACTORIES))
+def task_manager(request):
+    """Provide a fresh TaskManager instance for each test, once per storage engine."""
+    return TaskManager(store=STORE_FACTORIES[request.param]())
+
+
+@pytest.fixture(params=sorted(STORE_FACTORIES))
+def thread_safe_manager(request):
+    """Provide a fresh ThreadSafeTaskManager for each test, once per storage engine."""
+    return ThreadSafeTaskManager(store=STORE_FACTORIES[request.param]())
 
 
 @pytest.fixture
@@ -0,0 +1,305 @@
+"""Unit tests for the asyncio facade of the task manager."""
+
+import asyncio
+import io
+import json
+import threading
+import time
+
+import pytest
+
+from src.task_manager import (
+    AsyncTaskManager,
+    TaskManager,
+    TaskNotFoundError,
+    TaskPriority,
+    TaskStatus,
+    ValidationError,
+)
+from src.task_manager.change_feed import EVENT_ADD
+
+
+@pytest.fixture
+def async_manager(thread_safe_manager):
+    """Wrap a thread-safe manager, with small pages to exercise paging."""
+    return AsyncTaskManager(thread_safe_manager, page_size=3)
+
+
+def run(coroutine):
+    """Run a coroutine on a fresh event loop."""
+    return asyncio.run(coroutine)
+
+
+class TestAsyncTaskManager:
+    """Tests for the awaitable manager methods."""
+
+    def test_requires_thread_safe_manager(self):
+        """Test that a plain TaskManager is refused."""
+        with pytest.raises(TypeError):
+            AsyncTaskManager(TaskManager())
+        with pytest.raises(ValueError):
+            AsyncTaskManager(page_size=0)
+
+    def test_every_public_method_has_a_counterpart(self):
+        """Test that no public TaskManager method is missing from the async facade."""
+        public = {name for name in dir(TaskManager) if not name.startswith("_")}
+
+        assert sorted(name for name in public if not hasattr(AsyncTaskManager, name)) == []
+
+    def test_crud_runs_off_the_loop(self, async_manager):
+        """Test the single-task operations and that they run in worker threads."""
+        threads = set()
+        manager = async_manager.manager
+        original = manager.add_task
+
+        def add_task(*args, **kwargs):
+            threads.add(threading.get_ident())
+            return original(*args, **kwargs)
+
+        manager.add_task = add_task
+
+        async def scenario():
+            task = await async_manager.add_task("Write docs", priority=TaskPriority.HIGH)
+            await async_manager.update_task(task.task_id, title="Write API docs")
+            await async_manager.mark_task_completed(task.task_id)
+            fetched = await async_manager.get_task(task.task_id)
+            await async_manager.delete_task(task.task_id)
+            with pytest.raises(TaskNotFoundError):
+                await async_manager.get_task(task.task_id)
+            return fetched, threading.get_ident()
+
+        fetched, loop_thread = run(scenario())
+
+        assert fetched.title == "Write API docs"
+        assert fetched.status == TaskStatus.COMPLETED
+        assert threads and loop_thread not in threads
+
+    def test_reads_and_statistics(self, async_manager):
+        """Test the list getters, counts, statistics and search."""
+
+        async def scenario():
+            await async_manager.add_tasks(
+                {"title": f"Task {i}", "priority": TaskPriority.HIGH} for i in range(5)
+            )
+            await async_manager.mark_tasks_in_progress([1, 2])
+            return (
+                await async_manager.get_task_count(),
+                await async_manager.get_tasks_by_status(TaskStatus.IN_PROGRESS),
+                await async_manager.get_statistics(verify=True),
+                await async_manager.search("task", limit=2),
+            )
+
+        count, in_progress, statistics, found = run(scenario())
+
+        assert count == 5
+        assert [task.task_id for task in in_progress] == [1, 2]
+        assert statistics["in_progress"] == 2
+        assert len(found) == 2
+
+    def test_atomic_add_tasks_raises(self, async_manager):
+        """Test that an invalid atomic batch adds nothing."""
+
+        async def scenario():
+            with pytest.raises(ValidationError):
+                await async_manager.add_tasks([{"title": "ok"}, {"title": ""}])
+            return await async_manager.get_task_count()
+
+        assert run(scenario()) == 0
+
+    def test_non_atomic_add_tasks_in_chunks(self, async_manager, monkeypatch):
+        """Test that chunked adds report rejected items at their overall position."""
+        monkeypatch.setattr("src.task_manager.async_manager._ADD_CHUNK_SIZE", 4)
+        items = [{"title": "" if i in (2, 9) else f"Task {i}"} for i in range(10)]
+
+        result = run(async_manager.add_tasks(iter(items), atomic=False))
+
+        assert len(result.added) == 8
+        assert sorted(result.errors) == [2, 9]
+        assert async_manager.manager.get_task_count() == 8
+
+    def test_import_jsonl_in_batches(self, async_manager):
+        """Test that a batched import matches the line numbers of a single import."""
+        source = TaskManager()
+        source.add_tasks({"title": f"Task {i}"} for i in range(7))
+        buffer = io.StringIO()
+        source.export_jsonl(buffer)
+        lines = buffer.getvalue().splitlines(keepends=True)
+        lines.insert(4, "not json\n")
+        lines.append(json.dumps({"task_id": 1}) + "\n")
+
+        result = run(async_manager.import_jsonl(io.StringIO("".join(lines)), batch_size=3))
+
+        assert result.imported == 7
+        assert sorted(result.errors) == [5, 9]
+        assert async_manager.manager.get_task_count() == 7
+
+    def test_export_round_trip(self, async_manager):
+        """Test that exports and binary dumps run through the executor."""
+
+        async def scenario():
+            await async_manager.add_tasks([{"title": "One"}, {"title": "Two"}])
+            buffer = io.StringIO()
+            written = await async_manager.export_jsonl(buffer)
+            return written, buffer.getvalue(), await async_manager.dump_binary()
+
+        written, text, binary = run(scenario())
+        copy = AsyncTaskManager()
+
+        assert written == 2
+        assert run(copy.load_binary(binary)) == 2
+        assert [task.title for task in copy.manager.get_all_tasks()] == ["One", "Two"]
+        assert text.count("\n") == 2
+
+
+class TestAsyncIteration:
+    """Tests for the async generators, queries and work queue."""
+
+    def test_iter_tasks_pages(self, async_manager):
+        """Test that async iteration yields every task across pages."""
+        async_manager.manager.add_tasks(
+            {"title": f"Task {i}", "priority": TaskPriority.HIGH if i % 2 else TaskPriority.LOW}
+            for i in range(10)
+        )
+
+        async def collect(iterator):
+            return [task.task_id async for task in iterator]
+
+        assert run(collect(async_manager.iter_tasks())) == list(range(1, 11))
+        assert run(collect(async_manager.iter_tasks(after_id=4, limit=3))) == [5, 6, 7]
+        high = run(collect(async_manager.iter_tasks_by_priority(TaskPriority.HIGH)))
+        assert high == [2, 4, 6, 8, 10]
+
+    def test_query(self, async_manager):
+        """Test that query builders chain and evaluation is awaited."""
+        async_manager.manager.add_tasks(
+            {"title": f"Task {i}", "priority": TaskPriority(i % 4 + 1)} for i in range(12)
+        )
+        query = async_manager.query().priority(TaskPriority.CRITICAL).order_by("task_id", True)
+
+        async def scenario():
+            return (
+                await query.all(),
+                await query.count(),
+                await query.limit(1).first(),
+                [task.task_id async for task in query],
+            )
+
+        tasks, count, first, streamed = run(scenario())
+
+        assert [task.task_id for task in tasks] == [12, 8, 4]
+        assert count == 3
+        assert first.task_id == 12
+        assert streamed == [12, 8, 4]
+
+    def test_query_while_tasks_come_and_go(self, async_manager):
+        """Test that writes between pages of a scan query do not break it."""
+        async_manager.manager.add_tasks({"title": f"Task {i}"} for i in range(10))
+
+        async def scenario():
+            seen = []
+            async for task in async_manager.query().where(lambda task: task.task_id % 2):
+                seen.append(task.task_id)
+                await async_manager.add_task("Added meanwhile")
+                await async_manager.delete_task(task.task_id + 1)
+            return seen
+
+        assert run(scenario()) == [1, 3, 5, 7, 9]
+
+    def test_work_queue(self, async_manager):
+        """Test claiming and completing through the async work queue."""
+        async_manager.manager.add_task("Urgent", priority=TaskPriority.CRITICAL)
+        async_manager.manager.add_task("Later", priority=TaskPriority.LOW)
+
+        async def scenario():
+            work_queue = await async_manager.work_queue()
+            task = await work_queue.claim_next("worker", 30)
+            lease = await work_queue.lease(task.task_id)
+            await work_queue.complete(task.task_id, "worker")
+            return task, lease, len(work_queue)
+
+        task, lease, remaining = run(scenario())
+
+        assert task.title == "Urgent"
+        assert lease.worker_id == "worker"
+        assert task.status == TaskStatus.COMPLETED
+        assert remaining == 1
+
+    def test_change_feed_waits_off_the_loop(self, async_manager):
+        """Test that a poll waiting for events lets the loop run the write it waits for."""
+
+        async def scenario():
+            feed = await async_manager.change_feed(capacity=16)
+            subscription = feed.subscribe()
+            waiting = asyncio.ensure_future(subscription.poll(timeout=5))
+            await asyncio.sleep(0.01)
+            task = await async_manager.add_task("Watched")
+            events = await waiting
+            return feed, subscription, task, events, await feed.read(0)
+
+        feed, subscription, task, events, replayed = run(scenario())
+
+        assert [(event.kind, event.task_id) for event in events] == [(EVENT_ADD, task.task_id)]
+        assert replayed == events
+        assert subscription.lag == 0
+        assert feed.capacity == 16
+        assert feed.last_sequence == subscription.position == 1
+
+    def test_loop_stays_responsive(self, async_manager):
+        """Test that other coroutines run while a bulk import is in progress."""
+        source = TaskManager()
+        source.add_tasks({"title": f"Task {i}"} for i in range(3000))
+        buffer = io.StringIO()
+        source.export_jsonl(buffer)
+        buffer.seek(0)
+
+        async def scenario():
+            ticks = 0
+            importing = asyncio.ensure_future(async_manager.import_jsonl(buffer, 100))
+            while not importing.done():
+                ticks += 1
+                await asyncio.sleep(0)
+            return ticks, importing.result()
+
+        ticks, result = run(scenario())
+
+        assert result.imported == 3000
+        assert ticks > 30
+
+    def test_query_iteration_keeps_loop_responsive(self, thread_safe_manager):
+        """Test that starting a text query with order_by does not block the loop."""
+        items = [
+            {"title": f"Deploy service {i}", "description": f"Release {i % 97}"}
+            for i in range(30000)
+        ]
+        thread_safe_manager.add_tasks(items)
+        blocking = TaskManager()
+        blocking.add_tasks(items)
+        started = time.perf_counter()
+        iter(blocking.query().text("deploy").order_by("title", True))
+        blocking_time = time.perf_counter() - started
+        facade = AsyncTaskManager(thread_safe_manager, page_size=1000)
+        query = facade.query().text("deploy").order_by("title", descending=True)
+
+        async def scenario():
+            lags = []
+            stop = asyncio.Event()
+
+            async def ticker():
+                while not stop.is_set():
+                    tick = time.perf_counter()
+                    await asyncio.sleep(0.001)
+                    lags.append(time.perf_counter() - tick - 0.001)
+
+            background = asyncio.ensure_future(ticker())
+            await asyncio.sleep(0.01)
+            first = None
+            async for task in query:
+                first = first or task
+            stop.set()
+            await background
+            return first, max(lags)
+
+        first, max_lag = run(scenario())
+
+        assert first.title == "Deploy service 9999"
+        assert max_lag < blocking_time / 2
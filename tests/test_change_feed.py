@@ -0,0 +1,195 @@
+"""Unit tests for the change feed."""
+
+import threading
+import time
+
+import pytest
+
+from src.task_manager import ChangeFeed, FeedOverrunError, TaskPriority, TaskStatus
+from src.task_manager.change_feed import EVENT_ADD, EVENT_CLEAR, EVENT_DELETE, EVENT_SET
+
+
+def summary(events):
+    """Return (kind, task_id, field) for each event, dropping values."""
+    return [(event.kind, event.task_id, event.field) for event in events]
+
+
+class TestRingBuffer:
+    """Tests for the feed on its own."""
+
+    def test_events_are_numbered_in_order(self):
+        """Test that sequences start at 1 and reads return what follows an offset."""
+        feed = ChangeFeed(capacity=8)
+        feed.publish(EVENT_ADD, 1)
+        feed.publish_many([(EVENT_ADD, 2, None, None, None), (EVENT_DELETE, 1, None, None, None)])
+
+        events = feed.read(0)
+
+        assert [event.sequence for event in events] == [1, 2, 3]
+        assert summary(events) == [
+            (EVENT_ADD, 1, None),
+            (EVENT_ADD, 2, None),
+            (EVENT_DELETE, 1, None),
+        ]
+        assert feed.read(2) == events[2:]
+        assert feed.read(3) == []
+        assert feed.last_sequence == 3
+
+    def test_batches_across_the_wrap(self):
+        """Test that batches stay consecutive once the ring has wrapped."""
+        feed = ChangeFeed(capacity=5)
+        for task_id in range(1, 13):
+            feed.publish(EVENT_ADD, task_id)
+
+        assert feed.first_sequence == 8
+        assert [event.task_id for event in feed.read(7, limit=3)] == [8, 9, 10]
+        assert [event.task_id for event in feed.read(9)] == [10, 11, 12]
+
+    def test_overrun_is_detected(self):
+        """Test that reading overwritten events raises instead of skipping them."""
+        feed = ChangeFeed(capacity=4)
+        for task_id in range(1, 7):
+            feed.publish(EVENT_ADD, task_id)
+
+        with pytest.raises(FeedOverrunError) as error:
+            feed.read(1)
+
+        assert (error.value.after, error.value.first_sequence) == (1, 3)
+        assert len(feed.read(2)) == 4
+
+    def test_read_waits_for_events(self):
+        """Test that a read with a timeout returns as soon as an event arrives."""
+        feed = ChangeFeed()
+        timer = threading.Timer(0.05, feed.publish, args=(EVENT_ADD, 1))
+        timer.start()
+
+        started = time.monotonic()
+        events = feed.read(0, timeout=5)
+
+        assert summary(events) == [(EVENT_ADD, 1, None)]
+        assert time.monotonic() - started < 5
+        assert feed.read(1, timeout=0.01) == []
+        timer.join()
+
+    def test_rejects_invalid_capacity(self):
+        """Test that a feed must hold at least one event."""
+        with pytest.raises(ValueError):
+            ChangeFeed(capacity=0)
+
+
+class TestSubscription:
+    """Tests for subscription cursors."""
+
+    def test_poll_advances(self):
+        """Test that polling returns each event once, in batches."""
+        feed = ChangeFeed()
+        feed.publish(EVENT_ADD, 1)
+        subscription = feed.subscribe()
+        feed.publish_many((EVENT_ADD, task_id, None, None, None) for task_id in range(2, 7))
+
+        assert subscription.lag == 5
+        assert [event.task_id for event in subscription.poll(limit=3)] == [2, 3, 4]
+        assert [event.task_id for event in subscription.poll()] == [5, 6]
+        assert subscription.poll() == []
+        assert subscription.lag == 0
+
+    def test_fallen_behind_keeps_position(self):
+        """Test that an overrun subscription can resync from the newest event."""
+        feed = ChangeFeed(capacity=2)
+        subscription = feed.subscribe(after=0)
+        feed.publish_many((EVENT_ADD, task_id, None, None, None) for task_id in range(1, 5))
+
+        with pytest.raises(FeedOverrunError):
+            subscription.poll()
+
+        assert subscription.position == 0
+        subscription.position = feed.last_sequence
+        feed.publish(EVENT_DELETE, 4)
+        assert summary(subscription.poll()) == [(EVENT_DELETE, 4, None)]
+
+
+class TestManagerEvents:
+    """Tests for the events a TaskManager publishes."""
+
+    def test_feed_is_attached_on_first_call(self, task_manager):
+        """Test that changes before the first call are not recorded."""
+        task_manager.add_task(title="Before")
+        feed = task_manager.change_feed(capacity=16)
+
+        assert task_manager.change_feed() is feed
+        assert feed.capacity == 16
+        assert feed.last_sequence == 0
+
+    def test_every_mutation_is_published(self, task_manager):
+        """Test the events of adds, edits, transitions, deletes and clears."""
+        feed = task_manager.change_feed()
+        task = task_manager.add_task(title="First")
+        task_manager.add_tasks([{"title": "Second"}, {"title": "Third"}])
+        task_manager.update_task(1, title="Renamed")
+        task.priority = TaskPriority.HIGH
+        task.priority = TaskPriority.HIGH
+        task_manager.mark_task_in_progress(2)
+        task_manager.mark_tasks_completed([2, 3, 99])
+        task_manager.delete_task(3)
+        task_manager.clear_all_tasks()
+
+        events = feed.read(0)
+
+        assert summary(events) == [
+            (EVENT_ADD, 1, None),
+            (EVENT_ADD, 2, None),
+            (EVENT_ADD, 3, None),
+            (EVENT_SET, 1, "title"),
+            (EVENT_SET, 1, "updated_at"),
+            (EVENT_SET, 1, "priority"),
+            (EVENT_SET, 2, "status"),
+            (EVENT_SET, 2, "updated_at"),
+            (EVENT_SET, 2, "status"),
+            (EVENT_SET, 2, "updated_at"),
+            (EVENT_SET, 3, "status"),
+            (EVENT_SET, 3, "updated_at"),
+            (EVENT_DELETE, 3, None),
+            (EVENT_CLEAR, None, None),
+        ]
+        assert (events[3].value, events[3].old_value) == ("Renamed", "First")
+        assert (events[8].value, events[8].old_value) == (
+            TaskStatus.COMPLETED,
+            TaskStatus.IN_PROGRESS,
+        )
+        assert events[9].old_value == events[7].value
+
+    def test_consumer_mirrors_manager(self, thread_safe_manager):
+        """Test that a consumer thread rebuilds the manager's titles from events alone."""
+        manager = thread_safe_manager
+        subscription = manager.change_feed().subscribe()
+        titles = {}
+        done = threading.Event()
+
+        def consume():
+            while not done.is_set() or subscription.lag:
+                for event in subscription.poll(limit=50, timeout=0.05):
+                    if event.kind == EVENT_ADD:
+                        titles[event.task_id] = None
+                    elif event.kind == EVENT_SET and event.field == "title":
+                        titles[event.task_id] = event.value
+                    elif event.kind == EVENT_DELETE:
+                        del titles[event.task_id]
+
+        def write(worker):
+            for i in range(100):
+                task = manager.add_task(title=f"Worker {worker} task {i}")
+                manager.update_task(task.task_id, title=f"Edited {task.task_id}")
+                if i % 3 == 0:
+                    manager.delete_task(task.task_id)
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        writers = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join()
+        done.set()
+        consumer.join()
+
+        assert titles == {task.task_id: task.title for task in manager.get_all_tasks()}
@@ -0,0 +1,110 @@
+"""Unit tests for the columnar storage engine."""
+
+import gc
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.task_manager import ColumnarTaskStore, TaskManager, TaskPriority, TaskStatus, columnar
+
+
+@pytest.fixture(params=["numpy", "pure-python"])
+def columnar_manager(request, monkeypatch):
+    """Provide a columnar TaskManager, with and without NumPy-vectorized scans."""
+    if request.param == "pure-python":
+        monkeypatch.setattr(columnar, "np", None)
+    elif columnar.np is None:
+        pytest.skip("NumPy is not installed")
+    return TaskManager(store=ColumnarTaskStore())
+
+
+class TestMaterialization:
+    """Tests for on-demand Task materialization."""
+
+    def test_live_task_is_returned_as_same_object(self, columnar_manager):
+        """Test that a referenced task is not materialized twice."""
+        task = columnar_manager.add_task(title="Task")
+
+        assert columnar_manager.get_task(task.task_id) is task
+
+    def test_dropped_task_is_rebuilt_from_columns(self, columnar_manager):
+        """Test that a task is rebuilt with the same data after being released."""
+        due_date = datetime.now() + timedelta(days=2)
+        task = columnar_manager.add_task(
+            title="Task", description="Details", priority=TaskPriority.HIGH, due_date=due_date
+        )
+        task.mark_in_progress()
+        expected = repr(task)
+        task_id = task.task_id
+        del task
+        gc.collect()
+
+        rebuilt = columnar_manager.get_task(task_id)
+
+        assert repr(rebuilt) == expected
+
+    def test_writes_to_rebuilt_task_reach_columns(self, columnar_manager):
+        """Test that a materialized task writes its changes back to the columns."""
+        task_id = columnar_manager.add_task(title="Task").task_id
+        gc.collect()
+
+        columnar_manager.get_task(task_id).update_title("Renamed")
+        gc.collect()
+
+        assert columnar_manager.get_task(task_id).title == "Renamed"
+
+
+class TestColumnScans:
+    """Tests for filters and counts answered by column scans."""
+
+    def test_delete_keeps_remaining_rows_consistent(self, columnar_manager):
+        """Test that swap-removal keeps every other task addressable."""
+        tasks = [
+            columnar_manager.add_task(title=f"Task {i}", priority=TaskPriority(i % 4 + 1))
+            for i in range(8)
+        ]
+
+        columnar_manager.delete_task(tasks[2].task_id)
+        columnar_manager.delete_task(tasks[7].task_id)
+
+        remaining = [task for i, task in enumerate(tasks) if i not in (2, 7)]
+        for task in remaining:
+            assert columnar_manager.get_task(task.task_id) is task
+        medium = columnar_manager.get_tasks_by_priority(TaskPriority.MEDIUM)
+        assert sorted(task.task_id for task in medium) == [tasks[1].task_id, tasks[5].task_id]
+
+    def test_statistics_match_full_scan(self, columnar_manager):
+        """Test that column counts agree with a full scan."""
+        now = datetime.now()
+        tasks = [
+            columnar_manager.add_task(title=f"Task {i}", due_date=now + timedelta(days=1))
+            for i in range(5)
+        ]
+        tasks[0].created_at = now - timedelta(days=5)
+        tasks[0].due_date = now - timedelta(days=1)
+        columnar_manager.mark_task_completed(tasks[1].task_id)
+        columnar_manager.mark_task_cancelled(tasks[2].task_id)
+
+        stats = columnar_manager.get_statistics(verify=True)
+
+        assert stats["overdue"] == 1
+        assert stats["pending"] == 3
+        assert columnar_manager.get_tasks_by_status(TaskStatus.CANCELLED) == [tasks[2]]
+
+    def test_due_window_is_ordered_by_due_date(self, columnar_manager):
+        """Test that deadline scans return open tasks ordered by due date."""
+        now = datetime.now()
+        late = columnar_manager.add_task(title="Late", due_date=now + timedelta(days=3))
+        early = columnar_manager.add_task(title="Early", due_date=now + timedelta(days=1))
+        columnar_manager.add_task(title="No Date")
+
+        assert columnar_manager.get_tasks_due_between(now, now + timedelta(days=4)) == [
+            early,
+            late,
+        ]
+
+    def test_empty_store_queries(self, columnar_manager):
+        """Test that scans over empty columns return empty results."""
+        assert columnar_manager.get_tasks_by_status(TaskStatus.PENDING) == []
+        assert columnar_manager.get_overdue_tasks() == []
+        assert columnar_manager.get_statistics()["overdue"] == 0
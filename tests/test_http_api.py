@@ -0,0 +1,308 @@
+"""Unit tests for the HTTP JSON API server."""
+
+import http.client
+import json
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.task_manager import TaskPriority, ThreadSafeTaskManager
+from src.task_manager.http_api import MAX_BODY_BYTES, TaskServer
+
+
+@pytest.fixture
+def server():
+    """Run a server for a fresh manager on a free port."""
+    task_server = TaskServer(ThreadSafeTaskManager(), ("127.0.0.1", 0), max_workers=4)
+    thread = threading.Thread(target=task_server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    task_server.ready.wait(5)
+    yield task_server
+    task_server.shutdown()
+    task_server.server_close()
+    thread.join(5)
+
+
+@pytest.fixture
+def client(server):
+    """Provide a kept-alive connection to the server."""
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+    yield connection
+    connection.close()
+
+
+def call(connection, method, path, body=None):
+    """Send a request and return (status, decoded JSON or None)."""
+    payload = None if body is None else json.dumps(body)
+    headers = {} if body is None else {"Content-Type": "application/json"}
+    connection.request(method, path, body=payload, headers=headers)
+    response = connection.getresponse()
+    data = response.read()
+    return response.status, json.loads(data) if data else None
+
+
+def call_if_match(connection, method, path, if_match, body=None):
+    """Send a request with an If-Match header and return (status, ETag, JSON or None)."""
+    headers = {"If-Match": if_match}
+    if body is not None:
+        headers["Content-Type"] = "application/json"
+    payload = None if body is None else json.dumps(body)
+    connection.request(method, path, body=payload, headers=headers)
+    response = connection.getresponse()
+    data = response.read()
+    return response.status, response.getheader("ETag"), json.loads(data) if data else None
+
+
+class TestProbes:
+    """Tests for the health and readiness probes."""
+
+    def test_healthz(self, client):
+        """Test that the liveness probe answers OK."""
+        assert call(client, "GET", "/healthz") == (200, {"status": "ok"})
+
+    def test_readyz_follows_drain(self, server, client):
+        """Test that readiness fails once the server drains."""
+        assert call(client, "GET", "/readyz")[0] == 200
+
+        server.drain()
+
+        assert call(client, "GET", "/readyz")[0] == 503
+        assert call(client, "GET", "/healthz")[0] == 200
+
+
+class TestTasks:
+    """Tests for the task endpoints."""
+
+    def test_create_get_update_delete(self, client):
+        """Test the lifecycle of one task over a single connection."""
+        due = (datetime.now() + timedelta(days=2)).isoformat()
+        status, created = call(
+            client, "POST", "/tasks", {"title": "Write docs", "priority": "high", "due_date": due}
+        )
+        assert status == 201
+        assert created["priority"] == 3
+        assert created["due_date"] == due
+
+        task_path = f"/tasks/{created['task_id']}"
+        assert call(client, "GET", task_path)[1]["title"] == "Write docs"
+
+        status, updated = call(client, "PATCH", task_path, {"title": "Write API docs"})
+        assert status == 200
+        assert updated["title"] == "Write API docs"
+
+        assert call(client, "DELETE", task_path) == (204, None)
+        assert call(client, "GET", task_path)[0] == 404
+
+    def test_transitions(self, client):
+        """Test status transitions and the conflict of a forbidden one."""
+        call(client, "POST", "/tasks", {"title": "Ship"})
+
+        assert call(client, "POST", "/tasks/1/start")[1]["status"] == "in_progress"
+        assert call(client, "POST", "/tasks/1/complete")[1]["status"] == "completed"
+        status, error = call(client, "POST", "/tasks/1/cancel")
+        assert status == 409
+        assert "completed" in error["error"]
+
+    def test_list_streams_with_filters_and_cursor(self, server, client):
+        """Test that the chunked list honours filters, the cursor and the limit."""
+        server.manager.add_tasks(
+            {"title": f"Task {i}", "priority": TaskPriority.HIGH if i % 2 else TaskPriority.LOW}
+            for i in range(450)
+        )
+        server.manager.mark_task_completed(2)
+
+        status, tasks = call(client, "GET", "/tasks")
+        assert status == 200
+        assert [task["task_id"] for task in tasks] == list(range(1, 451))
+
+        _, page = call(client, "GET", "/tasks?after_id=100&limit=5&priority=HIGH")
+        assert [task["task_id"] for task in page] == [102, 104, 106, 108, 110]
+
+        _, done = call(client, "GET", "/tasks?status=completed")
+        assert [task["task_id"] for task in done] == [2]
+        assert call(client, "GET", "/tasks?status=finished")[0] == 400
+
+    def test_empty_list_and_overdue(self, client):
+        """Test that empty streamed lists are valid JSON."""
+        assert call(client, "GET", "/tasks") == (200, [])
+        assert call(client, "GET", "/tasks/overdue") == (200, [])
+
+    def test_stats_and_search(self, client):
+        """Test the statistics and search endpoints."""
+        call(client, "POST", "/tasks", {"title": "Deploy API"})
+        call(client, "POST", "/tasks", {"title": "Review docs"})
+
+        assert call(client, "GET", "/stats")[1]["total"] == 2
+        _, found = call(client, "GET", "/search?q=deploy")
+        assert [task["title"] for task in found] == ["Deploy API"]
+
+
+class TestVersions:
+    """Tests for ETags and If-Match preconditions."""
+
+    def test_etag_is_the_version(self, client):
+        """Test that single-task responses are tagged with the task's version."""
+        client.request("POST", "/tasks", body=json.dumps({"title": "Tagged"}))
+        response = client.getresponse()
+        created = json.loads(response.read())
+
+        assert response.getheader("ETag") == f'"{created["version"]}"'
+
+    def test_stale_if_match_is_refused(self, client):
+        """Test that writes with an outdated If-Match fail with 412 and change nothing."""
+        created = call(client, "POST", "/tasks", {"title": "Shared"})[1]
+        stale = f'"{created["version"]}"'
+        status, etag, updated = call_if_match(
+            client, "PATCH", "/tasks/1", stale, {"title": "First"}
+        )
+        assert status == 200
+        assert etag == f'"{updated["version"]}"' != stale
+
+        assert call_if_match(client, "PATCH", "/tasks/1", stale, {"title": "Second"})[0] == 412
+        assert call_if_match(client, "POST", "/tasks/1/start", stale)[0] == 412
+        assert call_if_match(client, "DELETE", "/tasks/1", stale)[0] == 412
+        assert call(client, "GET", "/tasks/1")[1]["title"] == "First"
+
+        assert call_if_match(client, "POST", "/tasks/1/start", etag)[0] == 200
+        assert call_if_match(client, "PATCH", "/tasks/1", "*", {"title": "Any"})[0] == 200
+
+    def test_invalid_if_match(self, client):
+        """Test that an If-Match that is not a version is a bad request."""
+        call(client, "POST", "/tasks", {"title": "Task"})
+
+        assert call_if_match(client, "DELETE", "/tasks/1", '"abc"')[0] == 400
+
+
+class TestErrors:
+    """Tests for error responses."""
+
+    def test_not_found_and_method(self, client):
+        """Test unknown endpoints, unknown tasks and unsupported methods."""
+        assert call(client, "GET", "/nope")[0] == 404
+        assert call(client, "GET", "/tasks/99")[0] == 404
+        assert call(client, "DELETE", "/stats")[0] == 405
+
+    def test_bad_bodies(self, client):
+        """Test invalid JSON, missing titles and bad priorities."""
+        client.request("POST", "/tasks", body="{not json")
+        response = client.getresponse()
+        response.read()
+        assert response.status == 400
+
+        assert call(client, "POST", "/tasks", {"description": "no title"})[0] == 400
+        assert call(client, "POST", "/tasks", {"title": "x", "priority": "urgent"})[0] == 400
+        assert call(client, "POST", "/tasks", {"title": ""})[0] == 400
+        # The connection is still usable after the errors.
+        assert call(client, "GET", "/healthz")[0] == 200
+
+    def test_field_types(self, client):
+        """Test that null descriptions are empty and booleans or objects are refused."""
+        status, created = call(client, "POST", "/tasks", {"title": "x", "description": None})
+        assert (status, created["description"]) == (201, "")
+
+        assert call(client, "POST", "/tasks", {"title": "x", "description": 5})[0] == 400
+        assert call(client, "POST", "/tasks", {"title": "x", "priority": True})[0] == 400
+        assert call(client, "PATCH", "/tasks/1", {"priority": False})[0] == 400
+
+    def test_due_date_with_offset(self, server, client):
+        """Test that a due date with a UTC offset is stored as naive local time."""
+        due = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+        status, created = call(
+            client, "POST", "/tasks", {"title": "x", "due_date": due.isoformat()}
+        )
+
+        assert status == 201
+        assert created["due_date"] == due.astimezone().replace(tzinfo=None).isoformat()
+        assert call(client, "GET", "/tasks/overdue") == (200, [])
+        assert call(client, "GET", "/stats")[1]["overdue"] == 0
+
+    def test_body_too_large(self, server):
+        """Test that oversized bodies are refused and the connection closed."""
+        connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+        connection.putrequest("POST", "/tasks")
+        connection.putheader("Content-Length", str(MAX_BODY_BYTES + 1))
+        connection.endheaders()
+        response = connection.getresponse()
+
+        assert response.status == 413
+        assert response.getheader("Connection") == "close"
+        connection.close()
+
+
+class TestConnections:
+    """Tests for keep-alive, HTTP/1.0 and the worker pool."""
+
+    def test_http_1_0_list(self, server):
+        """Test that an HTTP/1.0 client gets an unchunked list and a closed connection."""
+        server.manager.add_task("Legacy")
+        with socket.create_connection(server.server_address[:2], timeout=5) as sock:
+            sock.sendall(b"GET /tasks HTTP/1.0\r\n\r\n")
+            data = b""
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+
+        head, body = data.split(b"\r\n\r\n", 1)
+        assert b"chunked" not in head
+        assert [task["title"] for task in json.loads(body)] == ["Legacy"]
+
+    def test_more_clients_than_workers(self, server):
+        """Test that clients beyond the pool size wait and are then served."""
+        results = []
+
+        def request():
+            connection = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+            results.append(call(connection, "POST", "/tasks", {"title": "Parallel"})[0])
+            connection.close()
+
+        threads = [threading.Thread(target=request) for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [201] * 12
+        assert server.manager.get_task_count() == 12
+
+    def test_idle_keep_alive_clients_do_not_starve_probes(self):
+        """Test that /healthz answers while idle kept-alive connections fill the pool."""
+        task_server = TaskServer(
+            ThreadSafeTaskManager(), ("127.0.0.1", 0), max_workers=2, keep_alive_timeout=30
+        )
+        thread = threading.Thread(target=task_server.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+        task_server.ready.wait(5)
+        idle = [http.client.HTTPConnection(*task_server.server_address[:2]) for _ in range(2)]
+        try:
+            for connection in idle:
+                assert call(connection, "GET", "/readyz")[0] == 200
+
+            probe = http.client.HTTPConnection(*task_server.server_address[:2], timeout=5)
+            started = time.monotonic()
+            assert call(probe, "GET", "/healthz") == (200, {"status": "ok"})
+            assert time.monotonic() - started < 1
+            probe.close()
+        finally:
+            for connection in idle:
+                connection.close()
+            task_server.shutdown()
+            task_server.server_close()
+            thread.join(5)
+
+    def test_pipelined_requests(self, server):
+        """Test that a request already buffered behind another is answered without waiting."""
+        with socket.create_connection(server.server_address[:2], timeout=5) as sock:
+            sock.sendall(b"GET /healthz HTTP/1.1\r\n\r\nGET /readyz HTTP/1.1\r\n\r\n")
+            data = b""
+            started = time.monotonic()
+            while b'"ready"' not in data:
+                data += sock.recv(65536)
+
+        assert time.monotonic() - started < 1
+        assert data.count(b"HTTP/1.1 200") == 2
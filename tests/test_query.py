@@ -0,0 +1,207 @@
+"""Unit tests for composable task queries and their planner."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.task_manager import TaskPriority, TaskStatus
+from src.task_manager.query import (
+    ACCESS_DUE,
+    ACCESS_PRIORITY,
+    ACCESS_SCAN,
+    ACCESS_STATUS,
+    ACCESS_TEXT,
+)
+
+
+@pytest.fixture
+def now():
+    """Provide one reference time for deadlines."""
+    return datetime.now()
+
+
+@pytest.fixture
+def manager(task_manager, now):
+    """Add tasks spread over statuses, priorities and deadlines."""
+    priorities = list(TaskPriority)
+    for i in range(1, 41):
+        task_manager.add_task(
+            title=f"Task {i}" + (" deploy" if i % 5 == 0 else ""),
+            priority=priorities[i % 4],
+            due_date=now + timedelta(days=i) if i % 2 else None,
+        )
+    task_manager.mark_tasks_completed(range(1, 11))
+    task_manager.mark_tasks_in_progress(range(11, 16))
+    return task_manager
+
+
+def ids(tasks):
+    """Return the IDs of tasks in order."""
+    return [task.task_id for task in tasks]
+
+
+def brute_force(manager, condition, key=None, reverse=False):
+    """Filter and sort every task the slow way, for comparison."""
+    tasks = [task for task in manager.get_all_tasks() if condition(task)]
+    tasks.sort(key=key or (lambda task: task.task_id), reverse=reverse)
+    return ids(tasks)
+
+
+class TestResults:
+    """Tests that queries return the same tasks as a scan."""
+
+    def test_status_and_priority(self, manager):
+        """Test that status and priority filters combine with AND."""
+        query = manager.query().status(TaskStatus.PENDING).priority(TaskPriority.HIGH)
+
+        assert sorted(ids(query)) == brute_force(
+            manager,
+            lambda task: task.status is TaskStatus.PENDING and task.priority is TaskPriority.HIGH,
+        )
+
+    def test_multiple_values_per_filter(self, manager):
+        """Test that several values of one filter combine with OR."""
+        query = manager.query().status(TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED)
+
+        assert sorted(ids(query)) == list(range(1, 16))
+
+    def test_due_range_ordered_with_limit_and_offset(self, manager, now):
+        """Test a deadline window sorted by due date and paged."""
+        query = (
+            manager.query()
+            .status(TaskStatus.PENDING)
+            .due_between(now + timedelta(days=10), now + timedelta(days=30))
+            .order_by("due_date")
+        )
+
+        assert ids(query) == [17, 19, 21, 23, 25, 27, 29]
+        assert ids(query.offset(2).limit(3)) == [21, 23, 25]
+
+    def test_due_range_includes_closed_tasks(self, manager, now):
+        """Test that without a status filter completed tasks with deadlines match."""
+        query = manager.query().due_between(end=now + timedelta(days=6))
+
+        assert sorted(ids(query)) == [1, 3, 5]
+
+    def test_text_and_where(self, manager):
+        """Test full-text matching combined with an arbitrary predicate."""
+        query = manager.query().text("deploy").where(lambda task: task.task_id > 20)
+
+        assert sorted(ids(query)) == [25, 30, 35, 40]
+
+    @pytest.mark.parametrize("field_name", ["priority", "title", "created_at", "due_date"])
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_top_n_matches_full_sort(self, manager, field_name, descending):
+        """Test that heap-selected top-N results equal a full sort truncated."""
+        full = ids(manager.query().order_by(field_name, descending))
+        top = ids(manager.query().order_by(field_name, descending).offset(3).limit(5))
+
+        assert top == full[3:8]
+
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_missing_due_dates_sort_last(self, manager, descending):
+        """Test that tasks without a deadline follow every dated task in both directions."""
+        result = manager.query().order_by("due_date", descending).all()
+        dates = [task.due_date for task in result[:20]]
+
+        assert None not in dates
+        assert dates == sorted(dates, reverse=descending)
+        assert all(task.due_date is None for task in result[20:])
+        top = manager.query().order_by("due_date", descending).limit(3).all()
+        assert top == result[:3]
+
+    def test_first_and_count(self, manager):
+        """Test the single-result and counting helpers."""
+        pending = manager.query().status(TaskStatus.PENDING)
+
+        assert pending.count() == 25
+        assert pending.limit(4).count() == 4
+        assert pending.where(lambda task: task.task_id > 38).count() == 2
+        assert pending.order_by("task_id", descending=True).first().task_id == 40
+        assert manager.query().text("nothing").first() is None
+
+    def test_queries_are_immutable(self, manager):
+        """Test that extending a query leaves the original unchanged."""
+        base = manager.query().status(TaskStatus.COMPLETED)
+        base.priority(TaskPriority.LOW)
+
+        assert base.count() == 10
+
+    def test_rejects_bad_arguments(self, manager):
+        """Test validation of order fields, limits and offsets."""
+        with pytest.raises(ValueError):
+            manager.query().order_by("description")
+        with pytest.raises(ValueError):
+            manager.query().limit(-1)
+        with pytest.raises(ValueError):
+            manager.query().offset(-1)
+
+
+class TestPlanner:
+    """Tests for access path selection and explain()."""
+
+    def test_unfiltered_query_scans(self, manager):
+        """Test that a query without filters reads every task."""
+        plan = manager.query().explain()
+
+        assert plan.access == ACCESS_SCAN
+        assert plan.estimated_rows == 40
+
+    def test_picks_most_selective_index(self, manager):
+        """Test that the smaller of two index candidates is chosen."""
+        in_progress = manager.query().status(TaskStatus.IN_PROGRESS).priority(TaskPriority.LOW)
+        pending = manager.query().status(TaskStatus.PENDING).priority(TaskPriority.LOW)
+
+        assert in_progress.explain().access == ACCESS_STATUS
+        assert in_progress.explain().estimated_rows == 5
+        assert pending.explain().access == ACCESS_PRIORITY
+        assert pending.explain().filters == ["status in ['pending']"]
+
+    def test_due_index_requires_open_statuses(self, manager, now):
+        """Test that the open-only due index is used only for open statuses."""
+        window = (now, now + timedelta(days=18))
+        open_query = manager.query().status(TaskStatus.PENDING).due_between(*window)
+        any_status = manager.query().due_between(*window)
+
+        assert open_query.explain().access == ACCESS_DUE
+        assert any_status.explain().access == ACCESS_SCAN
+
+    def test_index_order_skips_sort(self, manager, now):
+        """Test that ordering by due date over the due index needs no sort."""
+        query = (
+            manager.query()
+            .status(TaskStatus.PENDING)
+            .due_between(now, now + timedelta(days=18))
+            .order_by("due_date")
+            .limit(2)
+        )
+
+        assert query.explain().order == "index order by due_date asc"
+        assert ids(query) == [17]
+
+    def test_limited_stream_stops_early(self, manager, now):
+        """Test that a limited query in index order expects to read only a few rows."""
+        query = manager.query().status(TaskStatus.PENDING).due_between().order_by("due_date")
+
+        assert query.explain().estimated_reads == query.explain().estimated_rows
+        plan = query.limit(2).explain()
+        assert plan.access == ACCESS_DUE
+        assert plan.estimated_reads < plan.estimated_rows
+        assert "stops after" in str(plan)
+        assert ids(query.limit(2)) == [17, 19]
+
+    def test_text_index_for_rare_terms(self, manager):
+        """Test that a selective text term drives the plan."""
+        plan = manager.query().status(TaskStatus.PENDING).text("deploy").explain()
+
+        assert plan.access == ACCESS_TEXT
+        assert plan.estimated_rows == 8
+
+    def test_top_n_plan_and_text(self, manager):
+        """Test that limited sorted queries use a heap and explain renders."""
+        plan = manager.query().priority(TaskPriority.HIGH).order_by("title").limit(3).explain()
+
+        assert plan.order == "top-N heap (3) by title asc"
+        text = str(plan)
+        assert text.startswith("access: priority index (~10 rows)")
+        assert "considered: priority index ~10, full scan ~40" in text
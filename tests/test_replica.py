@@ -0,0 +1,255 @@
+"""Unit tests for shared-memory read replicas."""
+
+import multiprocessing
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.task_manager import (
+    ReplicaPublisher,
+    TaskManager,
+    TaskNotFoundError,
+    TaskPriority,
+    TaskReplica,
+    TaskStatus,
+    ThreadSafeTaskManager,
+)
+from src.task_manager import replica as replica_module
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="publishing needs os.fork")
+
+
+@pytest.fixture
+def name():
+    """Provide a shared memory name no other test or run uses."""
+    return f"tmtest{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def manager():
+    """Provide a thread-safe manager holding a mix of tasks."""
+    manager = ThreadSafeTaskManager()
+    now = datetime.now()
+    overdue = manager.add_task("Overdue", priority=TaskPriority.HIGH)
+    overdue.due_date = now - timedelta(1)
+    manager.add_task("Soon", description="Café ☕", due_date=now + timedelta(1))
+    manager.add_task("Later", priority=TaskPriority.LOW, due_date=now + timedelta(9))
+    manager.add_task("Critical", priority=TaskPriority.CRITICAL)
+    manager.mark_task_completed(3)
+    manager.delete_task(4)
+    return manager
+
+
+def block_exists(block_name):
+    """Return whether a shared memory block is still linked."""
+    try:
+        replica_module._open_block(block_name).close()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def read_statistics(block_name, results):
+    """Attach from another process and report what the replica sees."""
+    with TaskReplica(block_name) as replica:
+        results.put((replica.epoch, replica.get_statistics(), replica.get_task(2).description))
+
+
+class TestPublishing:
+    """Tests for publishing epochs and reading them back."""
+
+    def test_replica_matches_manager(self, manager, name):
+        """Test that a replica answers reads exactly like the manager it mirrors."""
+        with ReplicaPublisher(manager, name) as publisher:
+            assert publisher.publish(wait=True) == 1
+            with TaskReplica(name) as replica:
+                assert replica.epoch == publisher.epoch == 1
+                assert replica.get_statistics(verify=True) == manager.get_statistics()
+                assert replica.get_task_count() == 3
+                assert replica.get_task(2).description == "Café ☕"
+                assert [task.title for task in replica.get_overdue_tasks()] == ["Overdue"]
+                high = replica.get_tasks_by_priority(TaskPriority.HIGH)
+                assert [task.task_id for task in high] == [1]
+                completed = replica.get_tasks_by_status(TaskStatus.COMPLETED)
+                assert [task.title for task in completed] == ["Later"]
+                with pytest.raises(TaskNotFoundError):
+                    replica.get_task(4)
+
+    def test_replica_is_read_only(self, manager, name):
+        """Test that the replica exposes no way to change tasks."""
+        with ReplicaPublisher(manager, name) as publisher:
+            publisher.publish(wait=True)
+            with TaskReplica(name) as replica:
+                assert not hasattr(replica, "add_task")
+                assert not hasattr(replica, "mark_task_completed")
+
+    def test_reader_in_another_process(self, manager, name):
+        """Test that a spawned process attaches without inheriting anything."""
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+        with ReplicaPublisher(manager, name) as publisher:
+            publisher.publish(wait=True)
+            reader = context.Process(target=read_statistics, args=(name, results))
+            reader.start()
+            epoch, stats, description = results.get(timeout=30)
+            reader.join(timeout=30)
+
+        assert reader.exitcode == 0
+        assert epoch == 1
+        assert stats == manager.get_statistics()
+        assert description == "Café ☕"
+
+    def test_plain_manager(self, name):
+        """Test that a manager without a read lock can be published too."""
+        manager = TaskManager()
+        manager.add_tasks({"title": f"Task {i}"} for i in range(100))
+        with ReplicaPublisher(manager, name) as publisher:
+            publisher.publish(wait=True)
+            with TaskReplica(name) as replica:
+                assert replica.get_task_count() == 100
+
+    def test_failed_publish_raises(self, manager, name, monkeypatch):
+        """Test that an error in the child is reported and leaves no block behind."""
+
+        def broken(*args):
+            raise OSError("disk on fire")
+
+        monkeypatch.setattr(replica_module, "encode_snapshot", broken)
+        with ReplicaPublisher(manager, name) as publisher:
+            with pytest.raises(RuntimeError, match="epoch 1"):
+                publisher.publish(wait=True)
+            assert publisher.epoch == 0
+            assert not block_exists(f"{name}-1")
+
+    def test_child_dying_mid_update_is_repaired(self, manager, name, monkeypatch):
+        """Test that the publisher finishes a control block update its child abandoned."""
+        real = replica_module._UINT64
+
+        class DiesWritingEpochTwo:
+            """Fail the store of epoch 2, after the sequence has been made odd."""
+
+            unpack_from = staticmethod(real.unpack_from)
+
+            @staticmethod
+            def pack_into(buffer, offset, value):
+                if offset == replica_module._EPOCH_OFFSET and value == 2:
+                    raise OSError("killed")
+                real.pack_into(buffer, offset, value)
+
+        monkeypatch.setattr(replica_module, "_UINT64", DiesWritingEpochTwo)
+        with ReplicaPublisher(manager, name) as publisher:
+            publisher.publish(wait=True)
+            with TaskReplica(name, timeout=0.5) as replica:
+                with pytest.raises(RuntimeError, match="epoch 2"):
+                    publisher.publish(wait=True)
+
+                assert replica.refresh() is False
+                assert publisher.publish(wait=True) == 3
+                assert replica.refresh() is True
+                assert replica.epoch == 3
+
+    def test_dead_publisher_mid_update_times_out(self, manager, name):
+        """Test that readers give up on a control block left mid-update instead of spinning."""
+        with ReplicaPublisher(manager, name) as publisher:
+            publisher.publish(wait=True)
+            with TaskReplica(name, timeout=0.1) as replica:
+                control = publisher._control.buf
+                sequence = replica_module._UINT64.unpack_from(control, 8)[0]
+                replica_module._UINT64.pack_into(control, 8, sequence + 1)
+
+                started = time.monotonic()
+                with pytest.raises(TimeoutError, match="mid-update"):
+                    replica.refresh()
+
+                assert time.monotonic() - started < 2
+                with pytest.raises(TimeoutError, match="mid-update"):
+                    TaskReplica(name, timeout=0.1)
+
+
+class TestEpochs:
+    """Tests for consistent epochs and their lifetime."""
+
+    def test_replica_stays_on_its_epoch(self, manager, name):
+        """Test that a replica ignores newer epochs until it refreshes."""
+        with ReplicaPublisher(manager, name) as publisher:
+            publisher.publish(wait=True)
+            with TaskReplica(name) as replica:
+                before = replica.get_statistics()
+                manager.mark_task_completed(1)
+                manager.add_task("New")
+                assert publisher.publish(wait=True) == 2
+
+                assert replica.epoch == 1
+                assert replica.get_statistics() == before
+                assert replica.refresh()
+                assert replica.epoch == 2
+                assert replica.get_statistics() == manager.get_statistics()
+                assert not replica.refresh()
+
+    def test_old_epochs_are_unlinked(self, manager, name):
+        """Test that only ``keep`` epochs stay linked and attached readers survive."""
+        with ReplicaPublisher(manager, name, keep=2) as publisher:
+            publisher.publish(wait=True)
+            replica = TaskReplica(name)
+            publisher.publish(wait=True)
+            manager.add_task("Third epoch")
+            publisher.publish(wait=True)
+
+            assert not block_exists(f"{name}-1")
+            assert block_exists(f"{name}-2") and block_exists(f"{name}-3")
+            assert replica.epoch == 1
+            assert replica.get_task_count() == 3
+            assert replica.refresh()
+            assert replica.get_task_count() == 4
+            replica.close()
+
+        assert not any(block_exists(block) for block in (name, f"{name}-2", f"{name}-3"))
+
+    def test_tasks_outlive_their_epoch(self, manager, name):
+        """Test that tasks read from an epoch stay usable after the replica moves on."""
+        with ReplicaPublisher(manager, name, keep=1) as publisher:
+            publisher.publish(wait=True)
+            with TaskReplica(name) as replica:
+                task = replica.get_task(2)
+                publisher.publish(wait=True)
+                replica.refresh()
+                assert task.description == "Café ☕"
+
+    def test_background_publishing(self, manager, name):
+        """Test that start() keeps publishing new epochs until stop()."""
+        with ReplicaPublisher(manager, name) as publisher:
+            publisher.start(0.01)
+            with pytest.raises(RuntimeError):
+                publisher.start(0.01)
+            deadline = time.monotonic() + 10
+            while publisher.epoch < 3 and time.monotonic() < deadline:
+                manager.add_task("Tick")
+                time.sleep(0.01)
+            publisher.stop()
+
+            assert publisher.epoch >= 3
+            with TaskReplica(name) as replica:
+                assert replica.epoch == publisher.epoch
+
+
+class TestAttaching:
+    """Tests for attaching to a publisher."""
+
+    def test_waits_for_first_epoch(self, manager, name):
+        """Test that a replica times out while nothing has been published."""
+        with ReplicaPublisher(manager, name):
+            with pytest.raises(TimeoutError):
+                TaskReplica(name, timeout=0.05)
+
+    def test_unknown_name(self, name):
+        """Test that attaching to a missing publisher fails."""
+        with pytest.raises(FileNotFoundError):
+            TaskReplica(name)
+
+    def test_invalid_keep(self, manager, name):
+        """Test that keep must allow at least one epoch."""
+        with pytest.raises(ValueError):
+            ReplicaPublisher(manager, name, keep=0)
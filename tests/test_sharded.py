@@ -0,0 +1,225 @@
+"""Unit tests for the task manager sharded across worker processes."""
+
+import pickle
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.task_manager import (
+    ColumnarTaskStore,
+    ShardedTaskManager,
+    TaskManager,
+    TaskNotFoundError,
+    TaskPriority,
+    TaskStatus,
+    ValidationError,
+    VersionConflictError,
+)
+from src.task_manager import sharded as sharded_module
+
+
+@pytest.fixture
+def sharded():
+    """Provide a manager with three shards, stopped after the test."""
+    manager = ShardedTaskManager(shards=3)
+    yield manager
+    manager.close()
+
+
+class TestIdAllocation:
+    """Tests for per-shard ID sequences."""
+
+    def test_ids_follow_the_owning_shard(self, sharded):
+        """Test that round-robin placement yields unique IDs owned by their shard."""
+        tasks = [sharded.add_task(f"Task {i}") for i in range(9)]
+        tasks += sharded.add_tasks({"title": f"Bulk {i}"} for i in range(7)).added
+
+        ids = [task.task_id for task in tasks]
+        assert len(set(ids)) == 16
+        assert sorted(ids) == list(range(1, 17))
+        assert sharded.get_task_count() == 16
+        for task in tasks:
+            assert sharded.get_task(task.task_id).title == task.title
+
+    def test_strided_manager_sequence(self):
+        """Test that a manager with an ID stride skips the other shards' IDs."""
+        manager = TaskManager()
+        manager._first_id, manager._id_step = 2, 3
+        manager._next_id = 2
+
+        manager.add_task("a")
+        added = manager.add_tasks([{"title": "b"}, {"title": "c"}]).added
+        manager.clear_all_tasks()
+
+        assert [task.task_id for task in added] == [5, 8]
+        assert manager._next_id == 2
+        assert manager._id_after(8) == 11
+        assert manager._id_after(9) == 11
+
+    def test_errors_cross_processes_intact(self, sharded):
+        """Test that shard errors arrive with their original attributes."""
+        with pytest.raises(TaskNotFoundError) as caught:
+            sharded.get_task(42)
+        assert caught.value.task_id == 42
+
+        error = pickle.loads(pickle.dumps(ValidationError("Title cannot be empty")))
+        assert error.message == "Title cannot be empty"
+
+
+class TestRouting:
+    """Tests for point operations and bulk splits."""
+
+    def test_point_operations(self, sharded):
+        """Test update, transitions and delete on the owning shard."""
+        task = sharded.add_task("Draft", priority=TaskPriority.LOW)
+
+        assert sharded.update_task(task.task_id, title="Final").title == "Final"
+        assert sharded.mark_task_in_progress(task.task_id).status == TaskStatus.IN_PROGRESS
+        assert sharded.mark_task_completed(task.task_id).status == TaskStatus.COMPLETED
+        with pytest.raises(ValidationError):
+            sharded.mark_task_cancelled(task.task_id)
+
+        sharded.delete_task(task.task_id)
+        with pytest.raises(TaskNotFoundError):
+            sharded.delete_task(task.task_id)
+
+    def test_returned_tasks_are_copies(self, sharded):
+        """Test that changing a returned task does not change the shard."""
+        task = sharded.add_task("Original")
+        task.title = "Changed locally"
+
+        assert sharded.get_task(task.task_id).title == "Original"
+
+    def test_add_tasks_atomic_rejects_everywhere(self, sharded):
+        """Test that an invalid item in an atomic batch adds nothing on any shard."""
+        with pytest.raises(ValidationError, match="Item 4"):
+            sharded.add_tasks([{"title": f"Task {i}"} for i in range(4)] + [{"title": ""}])
+
+        assert sharded.get_task_count() == 0
+
+    def test_add_tasks_atomic_validates_once(self, sharded, monkeypatch):
+        """Test that shards do not reject a due date that passed after the batch was checked."""
+        checked_at = datetime.now() - timedelta(hours=1)
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return checked_at
+
+        monkeypatch.setattr(sharded_module, "datetime", FrozenDatetime)
+        due = datetime.now() - timedelta(minutes=1)
+
+        result = sharded.add_tasks([{"title": f"Task {i}", "due_date": due} for i in range(6)])
+
+        assert sharded.get_task_count() == 6
+        assert {task.created_at for task in result.added} == {checked_at}
+
+    def test_add_tasks_non_atomic_positions(self, sharded):
+        """Test that results keep input order and positions across shards."""
+        items = [{"title": "" if i in (1, 5) else f"Task {i}"} for i in range(8)]
+
+        result = sharded.add_tasks(items, atomic=False)
+
+        assert [task.title for task in result.added] == [
+            f"Task {i}" for i in range(8) if i not in (1, 5)
+        ]
+        assert list(result.errors) == [1, 5]
+
+    def test_versions_cross_processes(self, sharded):
+        """Test that copies carry the shard's version and stale writes are refused."""
+        task = sharded.add_task("Draft")
+        renamed = sharded.update_task(task.task_id, title="Final", expected_version=task.version)
+        assert renamed.version > task.version
+
+        with pytest.raises(VersionConflictError):
+            sharded.mark_task_completed(task.task_id, expected_version=task.version)
+        assert sharded.get_task(task.task_id).version == renamed.version
+
+        other = sharded.add_task("Other")
+        result = sharded.mark_tasks_completed(
+            [task.task_id, other.task_id], expected_versions={task.task_id: task.version}
+        )
+        assert result.succeeded == [other.task_id]
+        assert result.conflicts == {task.task_id: renamed.version}
+
+    def test_transition_many(self, sharded):
+        """Test that bulk transitions are split and reported in input order."""
+        sharded.add_tasks({"title": f"Task {i}"} for i in range(6))
+        sharded.mark_task_cancelled(4)
+
+        result = sharded.mark_tasks_completed([6, 99, 4, 1, 2, 6])
+
+        assert result.succeeded == [6, 1, 2]
+        assert result.missing == [99]
+        assert list(result.rejected) == [4]
+        assert len(sharded.get_tasks_by_status(TaskStatus.COMPLETED)) == 3
+
+
+class TestScatterGather:
+    """Tests for reads merged from every shard."""
+
+    def test_filters_merge_by_id(self, sharded):
+        """Test that filtered lists come back ordered by ID."""
+        sharded.add_tasks(
+            {"title": f"Task {i}", "priority": TaskPriority.HIGH if i % 2 else TaskPriority.LOW}
+            for i in range(10)
+        )
+
+        assert [task.task_id for task in sharded.get_all_tasks()] == list(range(1, 11))
+        high = sharded.get_tasks_by_priority(TaskPriority.HIGH)
+        assert [task.task_id for task in high] == [2, 4, 6, 8, 10]
+
+    def test_deadlines_merge_by_due_date(self, sharded):
+        """Test that deadline queries are ordered by due date across shards."""
+        now = datetime.now()
+        for days in (5, 1, 3, 2, 4):
+            sharded.add_task(f"Due in {days}", due_date=now + timedelta(days=days))
+
+        window = sharded.get_tasks_due_between(now, now + timedelta(days=4, hours=1))
+
+        assert [task.title for task in window] == [f"Due in {days}" for days in (1, 2, 3, 4)]
+        assert sharded.get_overdue_tasks() == []
+
+    def test_statistics_sum_shards(self, sharded):
+        """Test that statistics add up the shards' counters."""
+        sharded.add_tasks({"title": f"Task {i}"} for i in range(9))
+        sharded.mark_tasks_completed([1, 2, 3])
+        sharded.mark_tasks_in_progress([4])
+
+        stats = sharded.get_statistics(verify=True)
+
+        assert stats["total"] == 9
+        assert stats["completed"] == 3
+        assert stats["in_progress"] == 1
+        assert stats["pending"] == 5
+        assert stats["completion_rate"] == pytest.approx(100 / 3)
+
+    def test_clear_and_concurrent_calls(self, sharded):
+        """Test that threads may share the manager and clear resets every shard."""
+
+        def worker(index):
+            for i in range(20):
+                sharded.add_task(f"Thread {index} task {i}")
+                sharded.get_task_count()
+
+        threads = [threading.Thread(target=worker, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sharded.get_task_count() == 80
+        sharded.clear_all_tasks()
+        assert sharded.get_task_count() == 0
+
+
+def test_store_factory_and_close():
+    """Test a non-default storage engine and that close stops the processes."""
+    with ShardedTaskManager(shards=2, store_factory=ColumnarTaskStore) as manager:
+        manager.add_tasks({"title": f"Task {i}"} for i in range(4))
+        assert manager.get_statistics()["total"] == 4
+        processes = list(manager._processes)
+
+    assert not any(process.is_alive() for process in processes)
+    manager.close()
@@ -0,0 +1,285 @@
+"""Unit tests for binary snapshots and log compaction."""
+
+import gc
+import io
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.task_manager import (
+    SnapshotFormatError,
+    SnapshotTaskStore,
+    TaskManager,
+    TaskPriority,
+    TaskStatus,
+    WriteAheadLog,
+)
+from src.task_manager import snapshot as snapshot_module
+from src.task_manager.wal import RECORD_SNAPSHOT
+
+
+@pytest.fixture(params=["numpy", "pure-python"])
+def scan_mode(request, monkeypatch):
+    """Run each test with and without NumPy-vectorized snapshot scans."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(snapshot_module, "np", None)
+    return request.param
+
+
+@pytest.fixture
+def paths(tmp_path):
+    """Provide snapshot and log paths in a temporary directory."""
+    return str(tmp_path / "tasks.snap"), str(tmp_path / "tasks.wal")
+
+
+def make_wal(path):
+    """Build a log that syncs only on demand."""
+    return WriteAheadLog(path, group_commit_interval=None)
+
+
+def state(manager):
+    """Return a comparable view of every task in a manager."""
+    return sorted(repr(task) for task in manager.get_all_tasks())
+
+
+@pytest.fixture
+def populated(paths):
+    """Save a snapshot of a manager holding a mix of tasks and return it."""
+    snapshot_path, _ = paths
+    manager = TaskManager()
+    now = datetime.now()
+    overdue = manager.add_task(title="Overdue", priority=TaskPriority.HIGH)
+    overdue.due_date = now - timedelta(1)
+    manager.add_task(title="Soon", description="Café ☕", due_date=now + timedelta(1))
+    manager.add_task(title="Later", priority=TaskPriority.LOW, due_date=now + timedelta(9))
+    manager.add_task(title="No deadline", priority=TaskPriority.CRITICAL)
+    manager.mark_task_completed(3)
+    manager.delete_task(4)
+    manager.add_task(title="Fifth")
+    manager.save_snapshot(snapshot_path)
+    return manager
+
+
+class TestSnapshotLoad:
+    """Tests for loading a snapshot through the mapped store."""
+
+    def test_round_trip(self, paths, populated, scan_mode):
+        """Test that a loaded snapshot holds the same tasks and ID counter."""
+        restored = TaskManager.from_snapshot(paths[0])
+
+        assert state(restored) == state(populated)
+        assert restored.add_task(title="Next").task_id == 6
+
+    def test_records_decoded_lazily(self, paths, populated, scan_mode):
+        """Test that opening and counting do not materialize any task."""
+        restored = TaskManager.from_snapshot(paths[0])
+        store = restored._store
+
+        stats = restored.get_statistics(verify=False)
+
+        assert stats["total"] == 4
+        assert stats["completed"] == 1
+        assert stats["overdue"] == 1
+        assert len(store._overlay) == 0
+
+    def test_queries_merge_overlay_and_snapshot(self, paths, populated, scan_mode):
+        """Test that filters see snapshot records and tasks added after loading."""
+        restored = TaskManager.from_snapshot(paths[0])
+        restored.add_task(title="New high", priority=TaskPriority.HIGH)
+        now = datetime.now()
+
+        high = restored.get_tasks_by_priority(TaskPriority.HIGH)
+        pending = restored.get_tasks_by_status(TaskStatus.PENDING)
+        due = restored.get_tasks_due_between(now - timedelta(2), now + timedelta(30))
+
+        assert sorted(task.task_id for task in high) == [1, 6]
+        assert sorted(task.task_id for task in pending) == [1, 2, 5, 6]
+        assert [task.task_id for task in due] == [1, 2]
+        assert [task.task_id for task in restored.get_overdue_tasks()] == [1]
+
+    def test_reads_leave_records_in_the_snapshot(self, paths, populated, scan_mode):
+        """Test that listing, exporting and indexing every task keeps nothing in memory."""
+        restored = TaskManager.from_snapshot(paths[0])
+        store = restored._store
+
+        listed = restored.get_all_tasks()
+        restored.export_jsonl(io.StringIO())
+        restored.search("later")
+        restored.complete_title("No")
+        restored.get_tasks_by_priority(TaskPriority.HIGH)
+
+        assert len(store._overlay) == 0
+        assert restored.get_task(1) is listed[0]
+        del listed
+        gc.collect()
+        assert len(store._live) == 0
+
+    def test_first_write_moves_task_to_overlay(self, paths, populated, scan_mode):
+        """Test that a listed task changed later is kept, indexed and counted once."""
+        restored = TaskManager.from_snapshot(paths[0])
+        listed = {task.task_id: task for task in restored.get_all_tasks()}
+
+        listed[2].priority = TaskPriority.CRITICAL
+        restored.mark_tasks_completed([1, 5])
+        del listed
+        gc.collect()
+
+        assert sorted(restored._store._overlay._tasks) == [1, 2, 5]
+        assert restored.get_task(2).priority == TaskPriority.CRITICAL
+        assert [task.task_id for task in restored.get_tasks_by_priority(TaskPriority.CRITICAL)] == [
+            2
+        ]
+        assert restored.get_statistics(verify=True)["completed"] == 3
+
+    def test_changes_after_load_update_queries(self, paths, populated, scan_mode):
+        """Test that promoted tasks are indexed by their new values only."""
+        restored = TaskManager.from_snapshot(paths[0])
+
+        restored.mark_task_completed(1)
+        restored.get_task(2).priority = TaskPriority.CRITICAL
+        restored.delete_task(5)
+
+        assert restored.get_task_count() == 3
+        assert restored.get_overdue_tasks() == []
+        assert [task.task_id for task in restored.get_tasks_by_priority(TaskPriority.CRITICAL)] == [
+            2
+        ]
+        assert restored.get_statistics(verify=True)["completed"] == 2
+        with pytest.raises(Exception):
+            restored.get_task(5)
+
+    def test_priority_counts_skip_shadowed_records(self, paths, populated, scan_mode):
+        """Test that promoted and deleted snapshot records are counted once."""
+        restored = TaskManager.from_snapshot(paths[0])
+
+        restored.get_task(2).priority = TaskPriority.CRITICAL
+        restored.delete_task(1)
+
+        counts = restored._store.priority_counts()
+        assert counts == {
+            TaskPriority.LOW: 1,
+            TaskPriority.MEDIUM: 1,
+            TaskPriority.HIGH: 0,
+            TaskPriority.CRITICAL: 1,
+        }
+
+    def test_clear_empties_snapshot(self, paths, populated, scan_mode):
+        """Test that clearing hides every snapshot record."""
+        restored = TaskManager.from_snapshot(paths[0])
+
+        restored.clear_all_tasks()
+
+        assert restored.get_all_tasks() == []
+        assert restored.get_statistics(verify=True)["total"] == 0
+
+    def test_rejects_non_snapshot(self, tmp_path):
+        """Test that a file with the wrong magic number is refused."""
+        path = tmp_path / "bogus.snap"
+        path.write_bytes(b"not a snapshot at all, just some bytes here")
+
+        with pytest.raises(SnapshotFormatError):
+            SnapshotTaskStore(str(path))
+
+    def test_rejects_truncated_snapshot(self, paths, populated):
+        """Test that a snapshot cut short inside its records is refused."""
+        with open(paths[0], "r+b") as snapshot_file:
+            snapshot_file.truncate(snapshot_module.HEADER.size + 10)
+
+        with pytest.raises(SnapshotFormatError):
+            SnapshotTaskStore(paths[0])
+
+    def test_load_from_buffer(self, populated, scan_mode):
+        """Test that an encoded snapshot loads from memory as it does from a file."""
+        data = b"".join(
+            snapshot_module.encode_snapshot(populated.get_all_tasks(), populated._next_id, 7)
+        )
+
+        restored = TaskManager(store=SnapshotTaskStore("in memory", buffer=bytearray(data)))
+
+        assert state(restored) == state(populated)
+        assert restored.get_statistics(verify=True) == populated.get_statistics()
+        with pytest.raises(SnapshotFormatError, match="in memory"):
+            SnapshotTaskStore("in memory", buffer=data[:20])
+
+
+class TestLogCompaction:
+    """Tests for combining snapshots with the write-ahead log."""
+
+    def test_snapshot_truncates_log(self, paths):
+        """Test that saving a snapshot leaves only a generation marker in the log."""
+        snapshot_path, log_path = paths
+        manager = TaskManager(wal=make_wal(log_path))
+        for i in range(50):
+            manager.add_task(title=f"Task {i}")
+        manager._wal.sync()
+        size_before = os.path.getsize(log_path)
+
+        manager.save_snapshot(snapshot_path)
+
+        assert os.path.getsize(log_path) < size_before
+        assert list(make_wal(log_path).records()) == [[RECORD_SNAPSHOT, 1]]
+        manager.close()
+
+    def test_changes_after_snapshot_are_replayed(self, paths):
+        """Test that a restart loads the snapshot and replays only newer records."""
+        snapshot_path, log_path = paths
+        manager = TaskManager(wal=make_wal(log_path))
+        manager.add_task(title="Before")
+        manager.save_snapshot(snapshot_path)
+        manager.add_task(title="After")
+        manager.mark_task_in_progress(1)
+        expected = state(manager)
+        manager.close()
+
+        restored = TaskManager.from_snapshot(snapshot_path, wal=make_wal(log_path))
+
+        assert state(restored) == expected
+        restored.close()
+
+    def test_stale_log_is_discarded(self, paths):
+        """Test that a log the snapshot already contains is not replayed twice."""
+        snapshot_path, log_path = paths
+        manager = TaskManager(wal=make_wal(log_path))
+        manager.add_task(title="Only once")
+        manager.close()
+        # Simulate a crash between writing the snapshot and truncating the log.
+        TaskManager(wal=make_wal(log_path)).save_snapshot(snapshot_path)
+        stale = TaskManager(wal=make_wal(log_path + ".copy"))
+        stale.add_task(title="Only once")
+        stale.close()
+        os.replace(log_path + ".copy", log_path)
+
+        restored = TaskManager.from_snapshot(snapshot_path, wal=make_wal(log_path))
+
+        assert restored.get_task_count() == 1
+        assert list(make_wal(log_path).records()) == [[RECORD_SNAPSHOT, 1]]
+        restored.close()
+
+    def test_log_without_its_snapshot_is_refused(self, paths):
+        """Test that a compacted log cannot be replayed on its own."""
+        snapshot_path, log_path = paths
+        manager = TaskManager(wal=make_wal(log_path))
+        manager.add_task(title="In snapshot")
+        manager.save_snapshot(snapshot_path)
+        manager.close()
+
+        with pytest.raises(ValueError):
+            TaskManager(wal=make_wal(log_path))
+
+    def test_resnapshot_from_snapshot_store(self, paths, populated):
+        """Test that a loaded manager can save a newer generation."""
+        snapshot_path, log_path = paths
+        restored = TaskManager.from_snapshot(snapshot_path, wal=make_wal(log_path))
+        restored.add_task(title="Added later")
+        expected = state(restored)
+
+        restored.save_snapshot(snapshot_path)
+        restored.close()
+        reloaded = TaskManager.from_snapshot(snapshot_path, wal=make_wal(log_path))
+
+        assert state(reloaded) == expected
+        assert reloaded._snapshot_generation == 2
+        reloaded.close()
@@ -0,0 +1,175 @@
+"""Unit tests for the SQLite storage engine."""
+
+import gc
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.task_manager import (
+    SqliteTaskStore,
+    TaskManager,
+    TaskPriority,
+    TaskStatus,
+    codec,
+    sqlite_store,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Provide a path for a fresh database file."""
+    return str(tmp_path / "tasks.db")
+
+
+def query_plan(store, sql, parameters):
+    """Return the SQLite query plan details for a statement."""
+    return " ".join(row[-1] for row in store._db.execute(f"EXPLAIN QUERY PLAN {sql}", parameters))
+
+
+class TestPersistence:
+    """Tests for keeping tasks in a database file."""
+
+    def test_tasks_survive_reopen(self, db_path):
+        """Test that a reopened database holds the same tasks and ID counter."""
+        manager = TaskManager(store=SqliteTaskStore(db_path))
+        due_date = datetime.now() + timedelta(days=2)
+        manager.add_task(title="First", priority=TaskPriority.HIGH, due_date=due_date)
+        manager.add_tasks([{"title": "Second"}, {"title": "Third"}])
+        manager.mark_task_in_progress(1)
+        manager.get_task(2).update_description("Edited directly")
+        manager.delete_task(3)
+        expected = sorted(repr(task) for task in manager.get_all_tasks())
+        manager.close()
+
+        restored = TaskManager(store=SqliteTaskStore(db_path))
+
+        assert sorted(repr(task) for task in restored.get_all_tasks()) == expected
+        assert restored.add_task(title="Fourth").task_id == 3
+        restored.close()
+
+    def test_versions_survive_reopen(self, db_path):
+        """Test that task versions are stored with the rows."""
+        manager = TaskManager(store=SqliteTaskStore(db_path))
+        manager.add_tasks([{"title": "First"}, {"title": "Second"}])
+        manager.update_task(1, title="Renamed")
+        manager.mark_tasks_completed([1, 2])
+        versions = [task.version for task in manager.get_all_tasks()]
+        manager.close()
+
+        restored = TaskManager(store=SqliteTaskStore(db_path))
+
+        assert [task.version for task in restored.get_all_tasks()] == versions
+        restored.close()
+
+    def test_adds_version_column_to_old_database(self, db_path):
+        """Test that a database created without versions is upgraded on open."""
+        old = sqlite3.connect(db_path)
+        old.execute(
+            "CREATE TABLE tasks (task_id INTEGER PRIMARY KEY, title TEXT NOT NULL, "
+            "description TEXT NOT NULL, status INTEGER NOT NULL, priority INTEGER NOT NULL, "
+            "created_at INTEGER NOT NULL, updated_at INTEGER NOT NULL, due_date INTEGER NOT NULL)"
+        )
+        old.execute("INSERT INTO tasks VALUES (1, 'Old', '', 0, 2, 0, 0, ?)", (codec.NO_DATE,))
+        old.commit()
+        old.close()
+
+        manager = TaskManager(store=SqliteTaskStore(db_path))
+
+        assert manager.get_task(1).version == 0
+        assert manager.update_task(1, title="New", expected_version=0).title == "New"
+        manager.close()
+
+    def test_uses_wal_journal_mode(self, db_path):
+        """Test that file databases are opened in WAL journal mode."""
+        store = SqliteTaskStore(db_path)
+
+        assert store._db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        store.close()
+
+    def test_writes_are_batched_in_transactions(self, db_path):
+        """Test that writes commit once per commit_every rows."""
+        manager = TaskManager(store=SqliteTaskStore(db_path, commit_every=3))
+        reader = sqlite3.connect(db_path)
+
+        manager.add_task(title="One")
+        manager.add_task(title="Two")
+        assert reader.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 0
+
+        manager.add_task(title="Three")
+        assert reader.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 3
+
+        manager.add_task(title="Four")
+        manager.close()
+        assert reader.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 4
+        reader.close()
+
+    def test_rejects_invalid_commit_every(self):
+        """Test that a non-positive transaction size is refused."""
+        with pytest.raises(ValueError):
+            SqliteTaskStore(commit_every=0)
+
+
+class TestQueries:
+    """Tests for indexed queries and materialization."""
+
+    def test_filters_use_indexes(self):
+        """Test that status, priority and deadline filters are index lookups."""
+        store = SqliteTaskStore()
+
+        assert "tasks_status" in query_plan(store, sqlite_store._SELECT_BY_STATUS, (0,))
+        assert "tasks_priority" in query_plan(store, sqlite_store._SELECT_BY_PRIORITY, (1,))
+        assert "due_date<?" in query_plan(store, sqlite_store._COUNT_DUE_BEFORE, (0,))
+        assert "due_date>? AND due_date<?" in query_plan(store, sqlite_store._SELECT_DUE, (0, 1))
+
+    def test_dropped_task_is_reloaded(self):
+        """Test that a released task is loaded again with the same data."""
+        manager = TaskManager(store=SqliteTaskStore())
+        task = manager.add_task(title="Task", priority=TaskPriority.LOW)
+        task.mark_completed()
+        expected = repr(task)
+        del task
+        gc.collect()
+
+        reloaded = manager.get_task(1)
+
+        assert repr(reloaded) == expected
+        assert manager.get_task(1) is reloaded
+        reloaded.set_priority(TaskPriority.HIGH)
+        assert manager.get_tasks_by_priority(TaskPriority.HIGH) == [reloaded]
+
+    def test_iteration_pages_through_every_row(self, monkeypatch):
+        """Test that iterating reads every task across several pages."""
+        monkeypatch.setattr(sqlite_store, "_ITER_PAGE_SIZE", 4)
+        manager = TaskManager(store=SqliteTaskStore())
+        manager.add_tasks([{"title": f"Task {i}"} for i in range(10)])
+
+        assert [task.task_id for task in manager.get_all_tasks()] == list(range(1, 11))
+
+    def test_due_iteration_pages_in_due_order(self, monkeypatch):
+        """Test that keyset paging over deadlines handles ties and the range end."""
+        monkeypatch.setattr(sqlite_store, "_ITER_PAGE_SIZE", 3)
+        store = SqliteTaskStore()
+        manager = TaskManager(store=store)
+        start = datetime.now() + timedelta(days=1)
+        manager.add_tasks(
+            [{"title": f"Task {i}", "due_date": start + timedelta(days=i // 2)} for i in range(10)]
+        )
+        manager.mark_task_completed(4)
+
+        due = store.iter_due_between(start, start + timedelta(days=4))
+
+        assert [task.task_id for task in due] == [1, 2, 3, 5, 6, 7, 8]
+
+    def test_statistics_come_from_aggregates(self):
+        """Test that statistics match a scan after bulk transitions."""
+        manager = TaskManager(store=SqliteTaskStore())
+        manager.add_tasks([{"title": f"Task {i}"} for i in range(6)])
+        manager.mark_tasks_completed([1, 2])
+        manager.mark_tasks_cancelled([3])
+
+        stats = manager.get_statistics(verify=True)
+
+        assert stats["completed"] == 2
+        assert stats["cancelled"] == 1
+        assert len(manager.get_tasks_by_status(TaskStatus.PENDING)) == 3
@@ -1,10 +1,14 @@
 """Unit tests for Task class."""
 
+import copy
+import dataclasses
+import pickle
 from datetime import datetime, timedelta
 
 import pytest
 
-from src.task_manager import Task, TaskPriority, TaskStatus, ValidationError
+from src.task_manager import Task, TaskManager, TaskPriority, TaskStatus, ValidationError
+from src.task_manager import task as task_module
 
 
 class TestTaskCreation:
@@ -204,3 +208,138 @@ class TestTaskSerialization:
         task_dict = sample_task.to_dict()
 
         assert task_dict["due_date"] is None
+
+
+class TestTaskVersion:
+    """Tests for the mutation version and the cached to_dict fields."""
+
+    def test_new_task_starts_at_version_zero(self, sample_task):
+        """Test that a freshly created task has version 0."""
+        assert sample_task.version == 0
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda task: task.update_title("New title"),
+            lambda task: task.update_description("New description"),
+            lambda task: task.set_priority(TaskPriority.HIGH),
+            lambda task: task.mark_in_progress(),
+            lambda task: task.mark_completed(),
+            lambda task: task.mark_cancelled(),
+        ],
+    )
+    def test_mutations_bump_version(self, sample_task, mutate):
+        """Test that every update, priority and status method bumps the version."""
+        mutate(sample_task)
+
+        assert sample_task.version > 0
+
+    def test_bulk_transition_bumps_version(self):
+        """Test that bulk status transitions bump the version too."""
+        manager = TaskManager()
+        task = manager.add_task(title="Task")
+
+        manager.mark_tasks_completed([task.task_id])
+
+        assert task.version == 1
+
+    def test_cached_fields_reused_until_change(self, sample_task):
+        """Test that static fields are serialized once per version."""
+        first = sample_task.to_dict()
+        second = sample_task.to_dict()
+
+        assert second == first
+        assert second["created_at"] is first["created_at"]
+
+        sample_task.update_title("Renamed")
+        third = sample_task.to_dict()
+
+        assert third["title"] == "Renamed"
+        assert third["updated_at"] == sample_task.updated_at.isoformat()
+
+    def test_returned_dict_is_independent_of_cache(self, sample_task):
+        """Test that editing a returned dict does not affect later calls."""
+        sample_task.to_dict()["title"] = "Edited"
+
+        assert sample_task.to_dict()["title"] == "Sample Task"
+
+    def test_is_overdue_recomputed_on_every_call(self, monkeypatch):
+        """Test that is_overdue follows the clock while the cache stays valid."""
+        due_date = datetime.now() + timedelta(hours=1)
+        task = Task(task_id=1, title="Task", due_date=due_date)
+        assert task.to_dict()["is_overdue"] is False
+
+        class Later(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return due_date + timedelta(hours=1)
+
+        monkeypatch.setattr(task_module, "datetime", Later)
+
+        assert task.to_dict()["is_overdue"] is True
+        assert task.version == 0
+
+
+class TestTaskLayout:
+    """Tests for the compact slotted task layout."""
+
+    def test_task_has_no_instance_dict(self, sample_task):
+        """Test that tasks are slotted and reject unknown attributes."""
+        assert not hasattr(sample_task, "__dict__")
+        with pytest.raises(AttributeError):
+            sample_task.unknown_attribute = 1
+
+    def test_default_timestamps_share_one_datetime(self):
+        """Test that default created/updated timestamps start out identical."""
+        task = Task(task_id=1, title="Task")
+
+        assert task.created_at is task.updated_at
+
+    def test_tasks_compare_by_value(self):
+        """Test that tasks with the same field values are equal."""
+        created = datetime.now()
+        task = Task(task_id=1, title="Task", created_at=created, updated_at=created)
+        same = Task(task_id=1, title="Task", created_at=created, updated_at=created)
+        other = Task(task_id=2, title="Task", created_at=created, updated_at=created)
+
+        assert task == same
+        assert task != other
+        assert task != "Task"
+
+    def test_repr_lists_fields(self, sample_task):
+        """Test that repr shows the task fields in constructor order."""
+        assert repr(sample_task).startswith("Task(task_id=1, title='Sample Task'")
+
+
+class TestTaskCopying:
+    """Tests for pickling, copying and dataclass helpers on slotted tasks."""
+
+    @pytest.mark.parametrize(
+        "duplicate",
+        [lambda task: pickle.loads(pickle.dumps(task)), copy.copy, copy.deepcopy],
+        ids=["pickle", "copy", "deepcopy"],
+    )
+    def test_duplicate_keeps_fields_and_version(self, duplicate):
+        """Test that a duplicate of an owned task is equal, versioned and unowned."""
+        manager = TaskManager()
+        task = manager.add_task(title="Original", due_date=datetime.now() + timedelta(days=1))
+        task.update_description("Edited")
+
+        clone = duplicate(task)
+        clone.title = "Changed copy"
+
+        assert clone.version == task.version + 1
+        assert clone._owner is None
+        assert manager.get_task(1).title == "Original"
+        assert manager.search("changed") == []
+
+    def test_dataclass_replace_and_asdict(self, sample_task):
+        """Test that dataclasses.replace builds a validated new task and asdict lists fields."""
+        renamed = dataclasses.replace(sample_task, title="Renamed")
+
+        assert renamed.title == "Renamed"
+        assert renamed.description == sample_task.description
+        assert dataclasses.asdict(sample_task)["title"] == "Sample Task"
+        assert list(dataclasses.asdict(sample_task)) == list(task_module.TASK_FIELDS)
+        with pytest.raises(ValidationError):
+            dataclasses.replace(sample_task, title="")
@@ -1,15 +1,23 @@
 """Unit tests for TaskManager class."""
 
+import gc
+import io
+import json
 from datetime import datetime, timedelta
 
 import pytest
 
 from src.task_manager import (
+    DictTaskStore,
+    TaskManager,
     TaskNotFoundError,
     TaskPriority,
     TaskStatus,
     ValidationError,
+    VersionConflictError,
+    prefix_index,
 )
+from src.task_manager import task_manager as task_manager_module
 
 
 class TestTaskManagerCreation:
@@ -67,6 +75,109 @@ class TestAddTask:
             task_manager.add_task(title="")
 
 
+class TestAddTasks:
+    """Tests for bulk task ingestion."""
+
+    def test_add_tasks_assigns_consecutive_ids(self, task_manager):
+        """Test that a batch reserves one contiguous ID range."""
+        task_manager.add_task(title="Existing")
+
+        result = task_manager.add_tasks(
+            [{"title": "Bulk 1"}, {"title": "Bulk 2", "priority": TaskPriority.HIGH}]
+        )
+
+        assert result.ok
+        assert [task.task_id for task in result.added] == [2, 3]
+        assert task_manager.get_task(3).priority == TaskPriority.HIGH
+        assert task_manager.add_task(title="After").task_id == 4
+
+    def test_add_tasks_share_one_timestamp(self, task_manager):
+        """Test that every task in a batch gets the same creation time."""
+        result = task_manager.add_tasks([{"title": "A"}, {"title": "B"}])
+
+        first, second = result.added
+        assert first.created_at == second.created_at == first.updated_at
+
+    def test_add_tasks_updates_indexes(self, task_manager):
+        """Test that bulk-added tasks are visible to filtered queries."""
+        now = datetime.now()
+        result = task_manager.add_tasks(
+            [
+                {"title": "Later", "due_date": now + timedelta(days=2)},
+                {"title": "Sooner", "due_date": now + timedelta(days=1)},
+                {"title": "Critical", "priority": TaskPriority.CRITICAL},
+            ]
+        )
+        later, sooner, critical = result.added
+
+        assert task_manager.get_tasks_due_between(now, now + timedelta(days=3)) == [sooner, later]
+        assert task_manager.get_tasks_by_priority(TaskPriority.CRITICAL) == [critical]
+        assert len(task_manager.get_tasks_by_status(TaskStatus.PENDING)) == 3
+
+    def test_atomic_add_tasks_rejects_whole_batch(self, task_manager):
+        """Test that one invalid item in atomic mode adds nothing."""
+        with pytest.raises(ValidationError, match="Item 1: Title cannot be empty"):
+            task_manager.add_tasks([{"title": "Valid"}, {"title": ""}])
+
+        assert task_manager.get_task_count() == 0
+        assert task_manager.add_task(title="Next").task_id == 1
+
+    def test_non_atomic_add_tasks_reports_errors(self, task_manager):
+        """Test that non-atomic mode adds valid items and reports the rest."""
+        past = datetime.now() - timedelta(days=1)
+
+        result = task_manager.add_tasks(
+            [
+                {"title": "Valid"},
+                {"title": "a" * 201},
+                {"title": "Late", "due_date": past},
+                {"title": "Extra", "owner": "someone"},
+                {"title": "Also valid"},
+            ],
+            atomic=False,
+        )
+
+        assert not result.ok
+        assert [task.title for task in result.added] == ["Valid", "Also valid"]
+        assert [task.task_id for task in result.added] == [1, 2]
+        assert result.errors == {
+            1: "Title cannot exceed 200 characters",
+            2: "Due date cannot be before creation date",
+            3: "Unknown task fields: owner",
+        }
+
+    @pytest.mark.parametrize(
+        "item, message",
+        [
+            ({"title": 42}, "Title must be a string"),
+            ({"title": "Task", "description": None}, "Description must be a string"),
+            ({"title": "Task", "priority": 3}, "Priority must be a TaskPriority"),
+            ({"title": "Task", "priority": "high"}, "Priority must be a TaskPriority"),
+            ({"title": "Task", "due_date": "2030-01-01"}, "Due date must be a datetime"),
+            ("Task", "Item must be a mapping of task fields"),
+        ],
+    )
+    def test_add_tasks_checks_field_types(self, task_manager, item, message):
+        """Test that badly typed items are reported like any invalid item, in both modes."""
+        with pytest.raises(ValidationError, match=f"Item 1: {message}"):
+            task_manager.add_tasks([{"title": "Valid"}, item])
+        assert task_manager.get_task_count() == 0
+
+        result = task_manager.add_tasks([{"title": "Valid"}, item, {"title": "Next"}], atomic=False)
+
+        assert result.errors == {1: message}
+        assert [task.title for task in result.added] == ["Valid", "Next"]
+
+    def test_add_task_checks_field_types(self, task_manager):
+        """Test that add_task applies the same type checks as add_tasks."""
+        with pytest.raises(ValidationError, match="Priority must be a TaskPriority"):
+            task_manager.add_task(title="Task", priority=2)
+        with pytest.raises(ValidationError, match="Due date must be a datetime"):
+            task_manager.add_task(title="Task", due_date="tomorrow")
+
+        assert task_manager.get_task_count() == 0
+
+
 class TestGetTask:
     """Tests for retrieving tasks."""
 
@@ -199,6 +310,51 @@ class TestGetOverdueTasks:
         assert len(overdue_tasks) == 0
 
 
+class TestGetTasksDueBetween:
+    """Tests for the due-date window query."""
+
+    def test_returns_open_tasks_in_window_ordered_by_due_date(self, task_manager):
+        """Test that tasks due inside the window are returned by due date."""
+        now = datetime.now()
+        later = task_manager.add_task(title="Later", due_date=now + timedelta(days=3))
+        sooner = task_manager.add_task(title="Sooner", due_date=now + timedelta(days=1))
+        task_manager.add_task(title="Outside", due_date=now + timedelta(days=10))
+        task_manager.add_task(title="No Date")
+
+        due = task_manager.get_tasks_due_between(now, now + timedelta(days=5))
+
+        assert due == [sooner, later]
+
+    def test_closed_tasks_leave_window(self, task_manager):
+        """Test that completed, cancelled and deleted tasks are not returned."""
+        now = datetime.now()
+        window = (now, now + timedelta(days=5))
+        tasks = [
+            task_manager.add_task(title=f"Task {i}", due_date=now + timedelta(days=1))
+            for i in range(4)
+        ]
+
+        task_manager.mark_task_completed(tasks[0].task_id)
+        tasks[1].mark_cancelled()
+        task_manager.delete_task(tasks[2].task_id)
+
+        assert task_manager.get_tasks_due_between(*window) == [tasks[3]]
+
+    def test_due_date_change_moves_task(self, task_manager):
+        """Test that changing a due date re-positions the task in the index."""
+        now = datetime.now()
+        task = task_manager.add_task(title="Task", due_date=now + timedelta(days=1))
+
+        task.due_date = now + timedelta(days=20)
+
+        assert task_manager.get_tasks_due_between(now, now + timedelta(days=5)) == []
+        assert task_manager.get_tasks_due_between(now, now + timedelta(days=30)) == [task]
+
+        task.due_date = None
+
+        assert task_manager.get_tasks_due_between(now, now + timedelta(days=30)) == []
+
+
 class TestUpdateTask:
     """Tests for updating tasks."""
 
@@ -285,6 +441,493 @@ class TestTaskStatusMethods:
             task_manager.mark_task_completed(999)
 
 
+class TestBulkTransitions:
+    """Tests for bulk status transitions."""
+
+    def test_transition_many_reports_each_outcome(self, task_manager):
+        """Test that succeeded, missing and rejected IDs are reported, not raised."""
+        pending = task_manager.add_task(title="Pending")
+        cancelled = task_manager.add_task(title="Cancelled")
+        task_manager.mark_task_cancelled(cancelled.task_id)
+
+        result = task_manager.mark_tasks_completed([pending.task_id, 999, cancelled.task_id])
+
+        assert not result.ok
+        assert result.succeeded == [pending.task_id]
+        assert result.missing == [999]
+        assert result.rejected == {cancelled.task_id: "Cannot complete a cancelled task"}
+        assert pending.status == TaskStatus.COMPLETED
+        assert cancelled.status == TaskStatus.CANCELLED
+
+    def test_bulk_transition_updates_indexes_and_statistics(self, task_manager):
+        """Test that filters and counters reflect a bulk transition."""
+        tasks = task_manager.add_tasks([{"title": f"Task {i}"} for i in range(5)]).added
+        ids = [task.task_id for task in tasks]
+
+        assert task_manager.mark_tasks_in_progress(ids[:3]).ok
+        assert task_manager.mark_tasks_cancelled(ids[3:]).ok
+
+        assert len(task_manager.get_tasks_by_status(TaskStatus.IN_PROGRESS)) == 3
+        assert len(task_manager.get_tasks_by_status(TaskStatus.CANCELLED)) == 2
+        assert task_manager.get_statistics(verify=True)["pending"] == 0
+        assert len({task.updated_at for task in tasks[:3]}) == 1
+
+    @pytest.mark.parametrize("count", [3, 50])
+    def test_bulk_completion_removes_deadlines(self, task_manager, count):
+        """Test that closed tasks leave the due-date index for small and large batches."""
+        now = datetime.now()
+        tasks = task_manager.add_tasks(
+            [{"title": f"Task {i}", "due_date": now + timedelta(hours=i + 1)} for i in range(count)]
+        ).added
+        keep = task_manager.add_task(title="Keep", due_date=now + timedelta(hours=1))
+
+        task_manager.mark_tasks_completed(task.task_id for task in tasks)
+
+        window = task_manager.get_tasks_due_between(now, now + timedelta(days=10))
+        assert window == [keep]
+
+    def test_repeated_ids_are_processed_once(self, task_manager):
+        """Test that duplicate IDs in a batch do not corrupt the indexes."""
+        task = task_manager.add_task(title="Task")
+
+        result = task_manager.mark_tasks_completed([task.task_id, task.task_id])
+
+        assert result.succeeded == [task.task_id]
+        assert task_manager.get_statistics(verify=True)["completed"] == 1
+
+    def test_transition_to_pending_is_not_allowed(self, task_manager):
+        """Test that tasks cannot be bulk-moved back to pending."""
+        task = task_manager.add_task(title="Task")
+
+        with pytest.raises(ValidationError, match="Cannot transition tasks to pending"):
+            task_manager.transition_many([task.task_id], TaskStatus.PENDING)
+
+
+def restart_from_snapshot(manager, tmp_path):
+    """Save a snapshot and start a new manager from it."""
+    path = str(tmp_path / "tasks.snap")
+    manager.save_snapshot(path)
+    return TaskManager.from_snapshot(path)
+
+
+def restart_from_binary(manager, tmp_path):
+    """Copy every task into a new manager through the wire format."""
+    restarted = TaskManager()
+    restarted.load_binary(manager.dump_binary())
+    return restarted
+
+
+def restart_from_jsonl(manager, tmp_path):
+    """Copy every task into a new manager through a JSON Lines export."""
+    stream = io.StringIO()
+    manager.export_jsonl(stream)
+    stream.seek(0)
+    restarted = TaskManager()
+    restarted.import_jsonl(stream)
+    return restarted
+
+
+class TestOptimisticConcurrency:
+    """Tests for version checks on writes."""
+
+    def test_write_at_current_version(self, task_manager):
+        """Test that a write expecting the current version succeeds and bumps it."""
+        task = task_manager.add_task(title="Draft")
+        read_version = task.version
+
+        updated = task_manager.update_task(
+            task.task_id, title="Final", expected_version=read_version
+        )
+
+        assert updated.title == "Final"
+        assert updated.version > read_version
+        assert updated.to_dict()["version"] == updated.version
+
+    def test_stale_write_is_refused(self, task_manager):
+        """Test that a write based on an old read raises and changes nothing."""
+        task = task_manager.add_task(title="Draft")
+        stale = task.version
+        task_manager.update_task(task.task_id, description="Other writer")
+
+        with pytest.raises(VersionConflictError) as caught:
+            task_manager.update_task(task.task_id, title="Mine", expected_version=stale)
+
+        assert caught.value.task_id == task.task_id
+        assert caught.value.expected_version == stale
+        assert caught.value.actual_version == task.version
+        assert task_manager.get_task(task.task_id).title == "Draft"
+
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda manager, task_id, version: manager.mark_task_in_progress(task_id, version),
+            lambda manager, task_id, version: manager.mark_task_completed(task_id, version),
+            lambda manager, task_id, version: manager.mark_task_cancelled(task_id, version),
+            lambda manager, task_id, version: manager.delete_task(task_id, version),
+        ],
+    )
+    def test_every_mutator_checks_version(self, task_manager, write):
+        """Test that transitions and deletes refuse a stale version too."""
+        task = task_manager.add_task(title="Task")
+        task_manager.update_task(task.task_id, priority=TaskPriority.HIGH)
+
+        with pytest.raises(VersionConflictError):
+            write(task_manager, task.task_id, 0)
+        assert task_manager.get_task(task.task_id).status == TaskStatus.PENDING
+
+        write(task_manager, task.task_id, task.version)
+
+    def test_unchanged_value_keeps_version(self, task_manager):
+        """Test that writing the value a field already holds is not a change."""
+        task = task_manager.add_task(title="Same", priority=TaskPriority.HIGH)
+        version = task.version
+
+        task.priority = TaskPriority.HIGH
+
+        assert task.version == version
+
+    def test_version_outlives_task_object(self, task_manager):
+        """Test that an engine returning a new object for a task keeps its version."""
+        task_id = task_manager.add_task(title="Task").task_id
+        task_manager.update_task(task_id, title="Renamed")
+        task_manager.mark_tasks_in_progress([task_id])
+        version = task_manager.get_task(task_id).version
+        gc.collect()
+
+        assert task_manager.get_task(task_id).version == version
+        assert version > 0
+
+    @pytest.mark.parametrize(
+        "restart", [restart_from_snapshot, restart_from_binary, restart_from_jsonl]
+    )
+    def test_versions_survive_restart(self, task_manager, tmp_path, restart):
+        """Test that a token read before a restart matches only the state it was read from."""
+        task_id = task_manager.add_task(title="Draft").task_id
+        stale = task_manager.get_task(task_id).version
+        task_manager.update_task(task_id, title="Reviewed")
+        current = task_manager.mark_task_in_progress(task_id).version
+
+        restarted = restart(task_manager, tmp_path)
+
+        assert restarted.get_task(task_id).version == current
+        with pytest.raises(VersionConflictError):
+            restarted.update_task(task_id, title="Draft edit", expected_version=stale)
+        assert (
+            restarted.update_task(task_id, title="Final", expected_version=current).version
+            > current
+        )
+
+    def test_bulk_transition_reports_conflicts(self, task_manager):
+        """Test that stale tasks in a batch are reported and the rest transitioned."""
+        tasks = task_manager.add_tasks([{"title": f"Task {i}"} for i in range(3)]).added
+        first, second, third = (task.task_id for task in tasks)
+        task_manager.update_task(second, title="Changed")
+
+        result = task_manager.mark_tasks_completed(
+            [first, second, third], expected_versions={first: 0, second: 0}
+        )
+
+        assert not result.ok
+        assert result.succeeded == [first, third]
+        assert result.conflicts == {second: task_manager.get_task(second).version}
+        assert task_manager.get_task(second).status == TaskStatus.PENDING
+
+
+class TestJsonLines:
+    """Tests for streaming JSON Lines export and import."""
+
+    def test_round_trip(self, task_manager):
+        """Test that an exported manager is rebuilt with identical tasks."""
+        due_date = datetime.now() + timedelta(days=4)
+        task_manager.add_task(title="First", priority=TaskPriority.HIGH, due_date=due_date)
+        task_manager.add_task(title="Café ☕", description="Unicode text")
+        task_manager.add_task(title="Third")
+        task_manager.mark_task_completed(2)
+        task_manager.delete_task(3)
+        stream = io.StringIO()
+
+        written = task_manager.export_jsonl(stream, chunk_size=1)
+        stream.seek(0)
+        restored = TaskManager()
+        result = restored.import_jsonl(stream)
+
+        assert written == 2
+        assert result.ok
+        assert result.imported == 2
+        assert [repr(task) for task in restored.get_all_tasks()] == [
+            repr(task) for task in task_manager.get_all_tasks()
+        ]
+        assert restored.add_task(title="Next").task_id == 3
+
+    def test_export_writes_in_chunks(self, task_manager):
+        """Test that export issues one write per chunk of lines."""
+        task_manager.add_tasks([{"title": f"Task {i}"} for i in range(5)])
+        writes = []
+
+        class Recorder:
+            def write(self, text):
+                writes.append(text)
+
+        task_manager.export_jsonl(Recorder(), chunk_size=2)
+
+        assert [text.count("\n") for text in writes] == [2, 2, 1]
+
+    def test_import_reports_bad_lines(self, task_manager):
+        """Test that invalid records are skipped and reported by line number."""
+        source = TaskManager()
+        source.add_task(title="Good")
+        good = source.get_task(1).to_dict()
+        lines = [
+            json.dumps(good),
+            "",
+            "{not json",
+            json.dumps({**good, "task_id": 2, "status": "bogus"}),
+            json.dumps({**good, "task_id": 3, "title": ""}),
+            json.dumps({"title": "Missing fields"}),
+            json.dumps(good),
+            json.dumps({**good, "task_id": 4}),
+        ]
+
+        result = task_manager.import_jsonl(io.StringIO("\n".join(lines) + "\n"), batch_size=3)
+
+        assert result.imported == 2
+        assert sorted(result.errors) == [3, 4, 5, 6, 7]
+        assert "Title cannot be empty" in result.errors[5]
+        assert "already exists" in result.errors[7]
+        assert [task.task_id for task in task_manager.get_all_tasks()] == [1, 4]
+
+
+class TestSearch:
+    """Tests for full-text search over titles and descriptions."""
+
+    @pytest.fixture
+    def searchable(self, task_manager):
+        """Add tasks with overlapping vocabulary."""
+        task_manager.add_task(title="Fix login bug", description="Users cannot sign in")
+        task_manager.add_task(title="Write release notes", description="Mention the login fix")
+        task_manager.add_task(title="Deploy API", description="Roll out the new release")
+        task_manager.add_task(title="Plan sprint")
+        return task_manager
+
+    def test_single_term_ranks_title_matches_first(self, searchable):
+        """Test that a title match outranks a description match."""
+        assert [task.task_id for task in searchable.search("login")] == [1, 2]
+
+    def test_terms_are_combined_with_and(self, searchable):
+        """Test that every term must be present by default."""
+        assert [task.task_id for task in searchable.search("login fix")] == [1, 2]
+        assert [task.task_id for task in searchable.search("login AND deploy")] == []
+
+    def test_or_separates_alternatives(self, searchable):
+        """Test that OR matches either group."""
+        results = searchable.search("sprint OR deploy api")
+
+        assert sorted(task.task_id for task in results) == [3, 4]
+
+    def test_case_insensitive_and_limited(self, searchable):
+        """Test that terms ignore case and limit caps the results."""
+        assert [task.task_id for task in searchable.search("RELEASE", limit=1)] == [2]
+
+    def test_index_follows_updates_and_deletes(self, searchable):
+        """Test that title, description and delete changes are reflected."""
+        searchable.search("login")
+
+        searchable.update_task(1, title="Fix signup bug")
+        searchable.get_task(4).update_description("Includes login work")
+        searchable.delete_task(2)
+        searchable.add_task(title="Login audit")
+
+        assert sorted(task.task_id for task in searchable.search("login")) == [4, 5]
+        assert [task.task_id for task in searchable.search("signup")] == [1]
+
+    def test_index_follows_bulk_add_and_clear(self, searchable):
+        """Test that batches are indexed and clearing empties the index."""
+        searchable.search("anything")
+        searchable.add_tasks([{"title": "Bulk login check"}])
+        assert 5 in [task.task_id for task in searchable.search("login")]
+
+        searchable.clear_all_tasks()
+
+        assert searchable.search("login") == []
+
+
+class TestTitleCompletion:
+    """Tests for title prefix completion."""
+
+    @pytest.fixture
+    def titled(self, task_manager):
+        """Add tasks sharing title prefixes at different priorities."""
+        task_manager.add_task(title="Deploy API", priority=TaskPriority.LOW)
+        task_manager.add_task(title="deploy  cache", priority=TaskPriority.HIGH)
+        task_manager.add_task(title="Design review", priority=TaskPriority.HIGH)
+        task_manager.add_task(title="Deploy docs", priority=TaskPriority.HIGH)
+        task_manager.add_task(title="Write tests")
+        return task_manager
+
+    @staticmethod
+    def ids(tasks):
+        """Return the IDs of tasks in order."""
+        return [task.task_id for task in tasks]
+
+    def test_orders_by_priority_then_newest(self, titled):
+        """Test that higher priority wins and ties go to the newest task."""
+        assert self.ids(titled.complete_title("de")) == [4, 3, 2, 1]
+        assert self.ids(titled.complete_title("dep", limit=2)) == [4, 2]
+
+    def test_ignores_case_and_whitespace(self, titled):
+        """Test that matching uses case-folded, whitespace-collapsed titles."""
+        assert self.ids(titled.complete_title("DEPLOY C")) == [2]
+        assert self.ids(titled.complete_title("deploy ")) == [4, 2, 1]
+        assert titled.complete_title("deployx") == []
+
+    def test_empty_prefix_and_limit(self, titled):
+        """Test that an empty prefix ranks every task and limit 0 returns nothing."""
+        assert self.ids(titled.complete_title("", limit=10)) == [4, 3, 2, 5, 1]
+        assert titled.complete_title("de", limit=0) == []
+
+    def test_index_follows_changes(self, titled):
+        """Test that renames, priority changes, deletes and adds are reflected."""
+        titled.complete_title("de")
+
+        titled.update_task(5, title="Deploy workers")
+        titled.get_task(1).set_priority(TaskPriority.CRITICAL)
+        titled.delete_task(4)
+        titled.add_tasks([{"title": "Debug flaky test"}])
+
+        assert self.ids(titled.complete_title("de")) == [1, 3, 2, 6, 5]
+        titled.clear_all_tasks()
+        assert titled.complete_title("de") == []
+
+    def test_large_ranges_match_a_full_scan(self, task_manager, monkeypatch):
+        """Test cached ranking against sorting every match, across updates."""
+        # Small blocks make the sorted entry list split and drop blocks.
+        monkeypatch.setattr(prefix_index, "_BLOCK_SIZE", 8)
+        priorities = list(TaskPriority)
+        task_manager.add_tasks(
+            {"title": f"task {i % 7} item {i}", "priority": priorities[i % 4]} for i in range(1500)
+        )
+
+        def expected(prefix, limit):
+            matches = [
+                task
+                for task in task_manager.get_all_tasks()
+                if task.title.casefold().startswith(prefix)
+            ]
+            matches.sort(key=lambda task: (-task.priority.value, -task.task_id))
+            return self.ids(matches[:limit])
+
+        for prefix in ["", "task", "task 3", "task 3 item 1"]:
+            assert self.ids(task_manager.complete_title(prefix, 20)) == expected(prefix, 20)
+
+        for task_id in range(1500, 1300, -3):
+            task_manager.delete_task(task_id)
+        task_manager.get_task(10).set_priority(TaskPriority.CRITICAL)
+        for i in range(40):
+            task_manager.add_task(title=f"Task 3 item new {i}", priority=priorities[i % 4])
+
+        for prefix in ["", "task", "task 3", "task 3 item 1"]:
+            assert self.ids(task_manager.complete_title(prefix, 20)) == expected(prefix, 20)
+        assert self.ids(task_manager.complete_title("task", 100)) == expected("task", 100)
+
+
+class TestIteration:
+    """Tests for cursor pagination and the generator getters."""
+
+    @pytest.fixture
+    def paged(self, task_manager, monkeypatch):
+        """Add ten tasks and make the generators read three tasks per page."""
+        monkeypatch.setattr(task_manager_module, "_ITER_PAGE_SIZE", 3)
+        now = datetime.now()
+        for i in range(1, 11):
+            task_manager.add_task(
+                title=f"Task {i}",
+                priority=TaskPriority.HIGH if i % 2 else TaskPriority.LOW,
+                due_date=now + timedelta(days=11 - i),
+            )
+        return task_manager
+
+    @staticmethod
+    def ids(tasks):
+        """Return the IDs of tasks in order."""
+        return [task.task_id for task in tasks]
+
+    def test_iterates_in_id_order_across_pages(self, paged):
+        """Test that every task is yielded once, by ID."""
+        assert self.ids(paged.iter_tasks()) == list(range(1, 11))
+
+    def test_cursor_pages(self, paged):
+        """Test that after_id and limit page through the tasks."""
+        first = self.ids(paged.iter_tasks(limit=4))
+        second = self.ids(paged.iter_tasks(after_id=first[-1], limit=4))
+        last = self.ids(paged.iter_tasks(after_id=second[-1], limit=4))
+
+        assert (first, second, last) == ([1, 2, 3, 4], [5, 6, 7, 8], [9, 10])
+        assert self.ids(paged.iter_tasks(after_id=10)) == []
+        assert self.ids(paged.iter_tasks(limit=0)) == []
+
+    def test_stable_under_mutation(self, paged):
+        """Test that changes made while iterating neither break nor repeat the cursor."""
+        seen = []
+        for task in paged.iter_tasks():
+            seen.append(task.task_id)
+            if task.task_id == 2:
+                paged.delete_task(3)
+                paged.delete_task(7)
+                paged.add_task(title="Added while iterating")
+                paged.update_task(5, title="Renamed while iterating")
+
+        assert seen == [1, 2, 4, 5, 6, 8, 9, 10, 11]
+
+    def test_limit_counts_yielded_tasks(self, paged):
+        """Test that tasks deleted from a page already read do not use up the limit."""
+        seen = []
+        for task in paged.iter_tasks(limit=5):
+            seen.append(task.task_id)
+            if task.task_id == 1:
+                paged.delete_task(2)
+                paged.delete_task(3)
+
+        assert seen == [1, 4, 5, 6, 7]
+
+    def test_filtered_generators_match_getters(self, paged):
+        """Test that the status and priority generators match the list getters."""
+        paged.mark_tasks_completed([2, 3, 9])
+
+        by_status = self.ids(paged.iter_tasks_by_status(TaskStatus.COMPLETED))
+        by_priority = self.ids(paged.iter_tasks_by_priority(TaskPriority.HIGH))
+
+        assert by_status == sorted(self.ids(paged.get_tasks_by_status(TaskStatus.COMPLETED)))
+        assert by_priority == sorted(self.ids(paged.get_tasks_by_priority(TaskPriority.HIGH)))
+        assert self.ids(paged.iter_tasks_by_status(TaskStatus.COMPLETED, after_id=3)) == [9]
+
+    def test_due_generators(self, paged):
+        """Test deadline iteration, including tasks closed while iterating."""
+        start, end = datetime.now(), datetime.now() + timedelta(days=30)
+        expected = self.ids(paged.get_tasks_due_between(start, end))
+
+        assert self.ids(paged.iter_tasks_due_between(start, end)) == expected
+        assert list(paged.iter_overdue_tasks()) == []
+
+        seen = []
+        for task in paged.iter_tasks_due_between(start, end):
+            seen.append(task.task_id)
+            if task.task_id == 10:
+                paged.mark_task_completed(9)
+        assert seen == [10, 8, 7, 6, 5, 4, 3, 2, 1]
+
+    def test_ids_added_out_of_order(self, paged):
+        """Test that tasks loaded with lower IDs are yielded in ID order."""
+        data = paged.dump_binary()
+        paged.clear_all_tasks()
+        other = type(paged)(store=type(paged._store)())
+        other.add_task(title="Latecomer")
+        paged.load_binary(data)
+        paged.delete_task(1)
+        paged.load_binary(other.dump_binary())
+
+        assert self.ids(paged.iter_tasks()) == list(range(1, 11))
+
+
 class TestStatistics:
     """Tests for task statistics."""
 
@@ -333,6 +976,49 @@ class TestStatistics:
 
         assert stats["overdue"] == 1
 
+    def test_statistics_counters_match_full_scan(self, task_manager):
+        """Test that maintained counters agree with a full scan after transitions."""
+        tasks = [task_manager.add_task(title=f"Task {i}") for i in range(6)]
+        task_manager.mark_task_completed(tasks[0].task_id)
+        task_manager.mark_task_in_progress(tasks[1].task_id)
+        tasks[1].mark_completed()
+        task_manager.mark_task_cancelled(tasks[2].task_id)
+        task_manager.delete_task(tasks[3].task_id)
+
+        stats = task_manager.get_statistics(verify=True)
+
+        assert stats["total"] == 5
+        assert stats["completed"] == 2
+        assert stats["cancelled"] == 1
+        assert stats["pending"] == 2
+        assert stats["completion_rate"] == 40.0
+
+    def test_statistics_verify_uses_one_instant(self, task_manager, monkeypatch):
+        """Test that counters and the verify scan agree on a task falling due in between."""
+        task = task_manager.add_task(title="Due", due_date=datetime.now() + timedelta(days=1))
+        task.created_at = datetime.now() - timedelta(days=3)
+        task.due_date = datetime.now() - timedelta(hours=1)
+        earlier = datetime.now() - timedelta(days=1)
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return earlier
+
+        monkeypatch.setattr(task_manager_module, "datetime", FrozenDatetime)
+
+        assert task_manager.get_statistics(verify=True)["overdue"] == 0
+
+    def test_statistics_verify_detects_drift(self):
+        """Test that verify mode reports counters that drifted from the data."""
+        store = DictTaskStore()
+        task_manager = TaskManager(store=store)
+        task = task_manager.add_task(title="Task")
+        del store._by_status[TaskStatus.PENDING][task.task_id]
+
+        with pytest.raises(AssertionError, match="out of sync"):
+            task_manager.get_statistics(verify=True)
+
 
 class TestClearAllTasks:
     """Tests for clearing all tasks."""
@@ -358,3 +1044,45 @@ class TestClearAllTasks:
         new_task = task_manager.add_task(title="New Task")
 
         assert new_task.task_id == 1
+
+
+class TestSecondaryIndexes:
+    """Tests for the status and priority indexes kept by TaskManager."""
+
+    def test_direct_task_transition_updates_status_index(self, task_manager):
+        """Test that calling Task.mark_* directly keeps status queries correct."""
+        task = task_manager.add_task(title="Task")
+
+        task.mark_in_progress()
+
+        assert task_manager.get_tasks_by_status(TaskStatus.PENDING) == []
+        assert task_manager.get_tasks_by_status(TaskStatus.IN_PROGRESS) == [task]
+
+    def test_update_priority_moves_task_between_buckets(self, task_manager):
+        """Test that updating priority moves the task to the new priority."""
+        task = task_manager.add_task(title="Task", priority=TaskPriority.LOW)
+
+        task_manager.update_task(task.task_id, priority=TaskPriority.CRITICAL)
+
+        assert task_manager.get_tasks_by_priority(TaskPriority.LOW) == []
+        assert task_manager.get_tasks_by_priority(TaskPriority.CRITICAL) == [task]
+
+    def test_deleted_task_leaves_indexes(self, task_manager):
+        """Test that deleted tasks no longer appear in filtered queries."""
+        task = task_manager.add_task(title="Task", priority=TaskPriority.HIGH)
+
+        task_manager.delete_task(task.task_id)
+        task.mark_completed()
+
+        assert task_manager.get_tasks_by_priority(TaskPriority.HIGH) == []
+        assert task_manager.get_tasks_by_status(TaskStatus.COMPLETED) == []
+
+    def test_clear_empties_indexes(self, task_manager):
+        """Test that clearing all tasks empties every index."""
+        task_manager.add_task(title="Task 1")
+        task_manager.add_task(title="Task 2", priority=TaskPriority.HIGH)
+
+        task_manager.clear_all_tasks()
+
+        assert task_manager.get_tasks_by_status(TaskStatus.PENDING) == []
+        assert task_manager.get_tasks_by_priority(TaskPriority.HIGH) == []
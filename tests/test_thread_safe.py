@@ -0,0 +1,242 @@
+"""Unit tests for reader/writer locking and the thread-safe task manager."""
+
+import threading
+import time
+
+import pytest
+
+from src.task_manager import TaskPriority, TaskStatus, ValidationError, VersionConflictError
+from src.task_manager.thread_safe import ReadWriteLock
+
+
+def run_threads(target, count):
+    """Run ``target(index)`` in ``count`` threads and wait for all of them."""
+    threads = [threading.Thread(target=target, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestReadWriteLock:
+    """Tests for ReadWriteLock."""
+
+    def test_readers_share(self):
+        """Test that several threads hold the read lock at once."""
+        lock = ReadWriteLock()
+        inside = threading.Barrier(3, timeout=5)
+
+        def reader(_):
+            with lock.read:
+                inside.wait()
+
+        run_threads(reader, 3)
+
+    def test_writer_excludes_readers(self):
+        """Test that a reader waits for the writer to finish."""
+        lock = ReadWriteLock()
+        events = []
+        lock.acquire_write()
+
+        reader = threading.Thread(target=lambda: (lock.acquire_read(), events.append("read")))
+        reader.start()
+        time.sleep(0.05)
+        events.append("write done")
+        lock.release_write()
+        reader.join()
+
+        assert events == ["write done", "read"]
+
+    def test_waiting_writer_blocks_new_readers(self):
+        """Test writer preference: a reader arriving after a waiting writer goes second."""
+        lock = ReadWriteLock()
+        events = []
+        lock.acquire_read()
+
+        def writer():
+            with lock.write:
+                events.append("write")
+
+        def late_reader():
+            with lock.read:
+                events.append("read")
+
+        writing = threading.Thread(target=writer)
+        writing.start()
+        time.sleep(0.05)
+        reading = threading.Thread(target=late_reader)
+        reading.start()
+        time.sleep(0.05)
+        lock.release_read()
+        writing.join()
+        reading.join()
+
+        assert events == ["write", "read"]
+
+    def test_reentrancy(self):
+        """Test nested reads, nested writes and reads inside a write."""
+        lock = ReadWriteLock()
+        with lock.write:
+            with lock.write:
+                with lock.read:
+                    with lock.write:
+                        pass
+        with lock.read:
+            with lock.read:
+                pass
+
+        with lock.write:
+            pass
+
+    def test_upgrade_raises(self):
+        """Test that writing while only reading fails instead of deadlocking."""
+        lock = ReadWriteLock()
+        with lock.read:
+            with pytest.raises(RuntimeError):
+                lock.acquire_write()
+        with lock.write:
+            pass
+
+
+class TestThreadSafeTaskManager:
+    """Tests that concurrent use keeps the manager consistent."""
+
+    def test_concurrent_adds(self, thread_safe_manager):
+        """Test that concurrent adds get distinct IDs and consistent counters."""
+
+        def add(index):
+            for i in range(50):
+                thread_safe_manager.add_task(f"Task {index}-{i}", priority=TaskPriority.HIGH)
+
+        run_threads(add, 4)
+
+        ids = [task.task_id for task in thread_safe_manager.get_all_tasks()]
+        assert sorted(ids) == list(range(1, 201))
+        assert thread_safe_manager.get_statistics(verify=True)["total"] == 200
+
+    def test_check_then_act_is_atomic(self, thread_safe_manager):
+        """Test that racing complete and cancel calls let exactly one win per task."""
+        thread_safe_manager.add_tasks({"title": f"Task {i}"} for i in range(100))
+        wins = []
+
+        def close(index):
+            method = (
+                thread_safe_manager.mark_task_completed
+                if index % 2
+                else thread_safe_manager.mark_task_cancelled
+            )
+            for task_id in range(1, 101):
+                try:
+                    method(task_id)
+                except ValidationError:
+                    continue
+                wins.append((task_id, index % 2))
+
+        run_threads(close, 4)
+
+        stats = thread_safe_manager.get_statistics(verify=True)
+        assert stats["completed"] + stats["cancelled"] == 100
+        # A task may be re-closed in its own final status, never flipped to the other.
+        for task_id, completed in wins:
+            status = thread_safe_manager.get_task(task_id).status
+            assert status == (TaskStatus.COMPLETED if completed else TaskStatus.CANCELLED)
+
+    def test_versioned_writes_lose_no_update(self, thread_safe_manager):
+        """Test that racing read-modify-write cycles retried on conflict all count."""
+        counter = thread_safe_manager.add_task(title="Counter", description="0")
+
+        def increment(index):
+            for _ in range(50):
+                while True:
+                    task = thread_safe_manager.get_task(counter.task_id)
+                    # Version first: a write landing after it makes the update conflict.
+                    version = task.version
+                    value = int(task.description)
+                    time.sleep(0)
+                    try:
+                        thread_safe_manager.update_task(
+                            counter.task_id, description=str(value + 1), expected_version=version
+                        )
+                        break
+                    except VersionConflictError:
+                        continue
+
+        run_threads(increment, 4)
+
+        assert thread_safe_manager.get_task(counter.task_id).description == "200"
+
+    def test_readers_during_writes(self, thread_safe_manager):
+        """Test that readers see consistent indexes while writers change statuses."""
+        thread_safe_manager.add_tasks({"title": f"Task {i}"} for i in range(200))
+        errors = []
+
+        def work(index):
+            for task_id in range(1 + index, 201, 4):
+                if index < 2:
+                    thread_safe_manager.mark_task_in_progress(task_id)
+                    thread_safe_manager.update_task(task_id, title=f"Renamed {task_id}")
+                else:
+                    stats = thread_safe_manager.get_statistics()
+                    counted = len(thread_safe_manager.get_tasks_by_status(TaskStatus.PENDING))
+                    if stats["total"] != 200 or counted > 200:
+                        errors.append(stats)
+                    list(thread_safe_manager.iter_tasks(limit=10))
+                    thread_safe_manager.query().status(TaskStatus.IN_PROGRESS).count()
+
+        run_threads(work, 4)
+
+        assert errors == []
+        assert thread_safe_manager.get_statistics(verify=True)["in_progress"] == 100
+
+    def test_iteration_does_not_hold_lock(self, thread_safe_manager):
+        """Test that a writer can run between two steps of a generator."""
+        thread_safe_manager.add_tasks({"title": f"Task {i}"} for i in range(5))
+        tasks = thread_safe_manager.iter_tasks()
+        next(tasks)
+
+        writer = threading.Thread(target=thread_safe_manager.delete_task, args=(3,))
+        writer.start()
+        writer.join(timeout=5)
+
+        assert not writer.is_alive()
+        assert [task.task_id for task in tasks] == [2, 4, 5]
+
+    def test_scan_query_while_tasks_come_and_go(self, thread_safe_manager):
+        """Test that a full-scan query keeps its candidates while writers add and delete."""
+        thread_safe_manager.add_tasks({"title": f"Task {i}"} for i in range(20))
+        results = iter(thread_safe_manager.query())
+        seen = [next(results).task_id]
+
+        def churn(task_id):
+            thread_safe_manager.add_task(title="Added meanwhile")
+            thread_safe_manager.delete_task(task_id)
+
+        for task_id in range(2, 21):
+            writer = threading.Thread(target=churn, args=(task_id,))
+            writer.start()
+            writer.join(timeout=5)
+            seen.append(next(results).task_id)
+
+        assert next(results, None) is None
+        assert seen == list(range(1, 21))
+
+    def test_search_and_queue(self, thread_safe_manager):
+        """Test lazily built indexes and the work queue under concurrent use."""
+        thread_safe_manager.add_tasks({"title": f"Deploy {i}"} for i in range(100))
+        work_queue = thread_safe_manager.work_queue()
+        claimed = []
+
+        def work(index):
+            if index % 2:
+                assert len(thread_safe_manager.search("deploy")) == 100
+                thread_safe_manager.query().text("deploy").first()
+                thread_safe_manager.complete_title("dep")
+            else:
+                task = work_queue.claim_next(f"w{index}", 30)
+                while task is not None:
+                    claimed.append(task.task_id)
+                    task = work_queue.claim_next(f"w{index}", 30)
+
+        run_threads(work, 4)
+
+        assert sorted(claimed) == list(range(1, 101))
@@ -0,0 +1,167 @@
+"""Unit tests for write-ahead log persistence."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.task_manager import (
+    ColumnarTaskStore,
+    DictTaskStore,
+    TaskManager,
+    TaskPriority,
+    TaskStatus,
+    WriteAheadLog,
+)
+from src.task_manager import wal as wal_module
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    """Provide a path for a fresh log file."""
+    return str(tmp_path / "tasks.wal")
+
+
+def reopen(log_path, store_factory=None):
+    """Build a durable manager from an existing log."""
+    store = store_factory() if store_factory else None
+    return TaskManager(store=store, wal=WriteAheadLog(log_path, group_commit_interval=None))
+
+
+def snapshot(manager):
+    """Return a comparable view of every task in a manager."""
+    return sorted(repr(task) for task in manager.get_all_tasks())
+
+
+class TestReplay:
+    """Tests for rebuilding state from the log."""
+
+    @pytest.mark.parametrize("store_factory", [DictTaskStore, ColumnarTaskStore])
+    def test_every_mutation_survives_restart(self, log_path, store_factory):
+        """Test that a restarted manager sees the same tasks as before."""
+        manager = reopen(log_path, store_factory)
+        due_date = datetime.now() + timedelta(days=3)
+        first = manager.add_task(title="First", due_date=due_date)
+        second = manager.add_task(title="Second")
+        manager.add_tasks([{"title": "Bulk A"}, {"title": "Bulk B"}])
+        manager.update_task(first.task_id, title="Renamed", priority=TaskPriority.HIGH)
+        manager.mark_task_in_progress(first.task_id)
+        second.update_description("Edited directly")
+        manager.mark_tasks_completed([3, 4])
+        manager.delete_task(second.task_id)
+        expected = snapshot(manager)
+        manager.close()
+
+        restored = reopen(log_path, store_factory)
+
+        assert snapshot(restored) == expected
+        assert restored.get_tasks_by_status(TaskStatus.COMPLETED)[0].task_id in (3, 4)
+        assert restored.get_tasks_due_between(datetime.now(), due_date + timedelta(1)) == [
+            restored.get_task(first.task_id)
+        ]
+        restored.close()
+
+    def test_imported_versions_survive_restart(self, log_path):
+        """Test that tasks added with a version get it back from the log."""
+        source = TaskManager()
+        task = source.add_task(title="Imported")
+        source.update_task(task.task_id, title="Imported and edited")
+        manager = reopen(log_path)
+        manager.load_binary(source.dump_binary())
+        manager.close()
+
+        restored = reopen(log_path)
+
+        assert restored.get_task(task.task_id).version == task.version > 0
+        restored.close()
+
+    def test_next_id_is_restored_after_deleting_highest(self, log_path):
+        """Test that IDs are not reused after a restart."""
+        manager = reopen(log_path)
+        manager.add_task(title="One")
+        last = manager.add_task(title="Two")
+        manager.delete_task(last.task_id)
+        manager.close()
+
+        restored = reopen(log_path)
+
+        assert restored.add_task(title="Three").task_id == 3
+        restored.close()
+
+    def test_clear_resets_replayed_state(self, log_path):
+        """Test that a logged clear empties the store and resets IDs."""
+        manager = reopen(log_path)
+        manager.add_task(title="One")
+        manager.clear_all_tasks()
+        manager.add_task(title="After clear")
+        manager.close()
+
+        restored = reopen(log_path)
+
+        assert [task.title for task in restored.get_all_tasks()] == ["After clear"]
+        assert restored.add_task(title="Next").task_id == 2
+        restored.close()
+
+    def test_torn_tail_is_truncated(self, log_path):
+        """Test that a partially written record is dropped on restart."""
+        manager = reopen(log_path)
+        manager.add_task(title="Kept")
+        manager.close()
+        with open(log_path, "ab") as log_file:
+            log_file.write(b'["+",2,"Torn')
+
+        restored = reopen(log_path)
+        restored.add_task(title="New")
+        restored.close()
+
+        final = reopen(log_path)
+        assert [task.title for task in final.get_all_tasks()] == ["Kept", "New"]
+        final.close()
+
+
+class TestGroupCommit:
+    """Tests for batched fsync behaviour."""
+
+    @pytest.fixture
+    def fsync_calls(self, monkeypatch):
+        """Count fsync calls made by the log."""
+        calls = []
+        real_fsync = wal_module.os.fsync
+
+        def counting_fsync(fd):
+            calls.append(fd)
+            real_fsync(fd)
+
+        monkeypatch.setattr(wal_module.os, "fsync", counting_fsync)
+        return calls
+
+    def test_sync_once_per_group(self, log_path, fsync_calls):
+        """Test that fsync runs once per full group and on close."""
+        log = WriteAheadLog(log_path, group_commit_size=3, group_commit_interval=None)
+        log.open()
+
+        for i in range(7):
+            log.append(["C", i])
+
+        assert len(fsync_calls) == 2
+        log.close()
+        assert len(fsync_calls) == 3
+
+    def test_idle_records_are_synced_by_interval(self, log_path, fsync_calls):
+        """Test that the background flusher syncs records left by an idle writer."""
+        log = WriteAheadLog(log_path, group_commit_size=1000, group_commit_interval=0.01)
+        log.open()
+        log.append(["C"])
+
+        for _ in range(200):
+            if fsync_calls:
+                break
+            log._stop.wait(0.01)
+
+        assert fsync_calls
+        log.close()
+
+    @pytest.mark.parametrize("settings", [{"group_commit_size": 0}, {"group_commit_interval": 0}])
+    def test_invalid_settings_raise(self, log_path, settings):
+        """Test that invalid group commit settings are rejected."""
+        with pytest.raises(ValueError):
+            WriteAheadLog(log_path, **settings)
@@ -0,0 +1,184 @@
+"""Unit tests for the binary wire format."""
+
+import struct
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.task_manager import (
+    DuplicateTaskError,
+    Task,
+    TaskManager,
+    TaskPriority,
+    TaskStatus,
+    WireFormatError,
+    wire,
+)
+from src.task_manager.codec import BINARY_RECORD
+
+
+@pytest.fixture
+def tasks():
+    """Provide tasks covering every field type, including non-ASCII text."""
+    created = datetime(2024, 5, 1, 9, 30, 15, 123456)
+    return [
+        Task(
+            task_id=7,
+            title="Café ☕",
+            description="Ünïcode description",
+            status=TaskStatus.IN_PROGRESS,
+            priority=TaskPriority.CRITICAL,
+            created_at=created,
+            updated_at=created + timedelta(hours=1),
+            due_date=created + timedelta(days=3),
+        ),
+        Task(task_id=8, title="Plain", created_at=created, updated_at=created),
+    ]
+
+
+class TestEncoding:
+    """Tests for packing and unpacking tasks."""
+
+    def test_batch_round_trip(self, tasks):
+        """Test that every field survives a batch round trip."""
+        decoded = wire.TaskBatchView(wire.pack_tasks(tasks)).to_tasks()
+
+        assert decoded == tasks
+
+    def test_single_task_round_trip(self, tasks):
+        """Test the single-task helpers."""
+        assert wire.unpack_task(wire.pack_task(tasks[0])) == tasks[0]
+
+    def test_unpack_task_rejects_batches(self, tasks):
+        """Test that unpack_task refuses a message with several tasks."""
+        with pytest.raises(WireFormatError):
+            wire.unpack_task(wire.pack_tasks(tasks))
+
+    def test_empty_batch(self):
+        """Test that an empty batch encodes and decodes."""
+        assert wire.TaskBatchView(wire.pack_tasks([])).to_tasks() == []
+
+    def test_smaller_than_json(self, tasks):
+        """Test that the binary form is smaller than the JSON form."""
+        import json
+
+        assert len(wire.pack_tasks(tasks)) < len(json.dumps([task.to_dict() for task in tasks]))
+
+
+class TestLazyDecoding:
+    """Tests for zero-copy, field-by-field decoding."""
+
+    def test_fields_decode_individually(self, tasks):
+        """Test that each view attribute matches the original task."""
+        view = wire.TaskBatchView(wire.pack_tasks(tasks))
+
+        first = view[0]
+        assert first.title == "Café ☕"
+        assert first.priority is TaskPriority.CRITICAL
+        assert first.status is TaskStatus.IN_PROGRESS
+        assert first.due_date == tasks[0].due_date
+        assert first.version == tasks[0].version
+        assert view[-1].task_id == 8
+        assert view[-1].due_date is None
+        assert [item.task_id for item in view] == [7, 8]
+
+    def test_reads_from_memoryview_without_copying(self, tasks):
+        """Test that a view over a bytearray sees later changes to the buffer."""
+        data = bytearray(wire.pack_tasks(tasks))
+        view = wire.TaskBatchView(memoryview(data))
+        id_offset = wire.HEADER.size
+
+        data[id_offset] = 42
+
+        assert view[0].task_id == 42
+
+    def test_index_out_of_range(self, tasks):
+        """Test that indexing past the batch raises IndexError."""
+        with pytest.raises(IndexError):
+            wire.TaskBatchView(wire.pack_tasks(tasks))[2]
+
+    @pytest.mark.parametrize(
+        "corrupt",
+        [
+            lambda data: b"XXXX" + data[4:],
+            lambda data: data[:4] + b"\x09\x00" + data[6:],
+            lambda data: data[:-1],
+            lambda data: data[:5],
+        ],
+    )
+    def test_rejects_malformed_messages(self, tasks, corrupt):
+        """Test that bad magic, version or lengths are refused."""
+        with pytest.raises(WireFormatError):
+            wire.TaskBatchView(corrupt(wire.pack_tasks(tasks)))
+
+
+def patch(data, offset, fmt, value):
+    """Return a copy of a message with one value overwritten at ``offset``."""
+    data = bytearray(data)
+    struct.pack_into(fmt, data, offset, value)
+    return bytes(data)
+
+
+# Offset of the first record and of the first task's title in a two-task message.
+FIRST_RECORD = wire.HEADER.size
+FIRST_TITLE = wire.HEADER.size + 2 * BINARY_RECORD.size + wire.STRINGS_LENGTH.size
+
+
+class TestCorruptRecords:
+    """Tests for messages with a valid layout but invalid record contents."""
+
+    @pytest.mark.parametrize(
+        "field, corrupt",
+        [
+            ("status", lambda data: patch(data, FIRST_RECORD + 8, "<b", 9)),
+            ("status", lambda data: patch(data, FIRST_RECORD + 8, "<b", -1)),
+            ("priority", lambda data: patch(data, FIRST_RECORD + 9, "<b", 9)),
+            ("created_at", lambda data: patch(data, FIRST_RECORD + 10, "<q", 2**62)),
+            ("title", lambda data: patch(data, FIRST_RECORD + 42, "<I", 2**16)),
+            ("title", lambda data: patch(data, FIRST_RECORD + 34, "<Q", 2**40)),
+            ("title", lambda data: patch(data, FIRST_TITLE, "<B", 0xFF)),
+        ],
+    )
+    def test_corrupt_fields_are_refused(self, tasks, field, corrupt):
+        """Test that bad codes, timestamps and text raise WireFormatError everywhere."""
+        data = corrupt(wire.pack_tasks(tasks))
+        batch = wire.TaskBatchView(data)
+
+        with pytest.raises(WireFormatError):
+            getattr(batch[0], field)
+        with pytest.raises(WireFormatError):
+            batch[0].to_task()
+        with pytest.raises(WireFormatError):
+            batch.to_tasks()
+        manager = TaskManager()
+        with pytest.raises(WireFormatError):
+            manager.load_binary(data)
+        assert manager.get_task_count() == 0
+
+
+class TestManagerHelpers:
+    """Tests for dumping and loading whole stores."""
+
+    def test_dump_and_load(self, task_manager):
+        """Test that a dumped store loads into a new manager unchanged."""
+        task_manager.add_task(title="First", priority=TaskPriority.HIGH)
+        task_manager.add_task(title="Second", due_date=datetime.now() + timedelta(days=1))
+        task_manager.mark_task_completed(1)
+
+        restored = TaskManager()
+        count = restored.load_binary(task_manager.dump_binary())
+
+        assert count == 2
+        assert sorted(map(repr, restored.get_all_tasks())) == sorted(
+            map(repr, task_manager.get_all_tasks())
+        )
+        assert restored.add_task(title="Third").task_id == 3
+
+    def test_load_rejects_existing_ids(self, task_manager):
+        """Test that loading refuses IDs already in the manager and adds nothing."""
+        task_manager.add_task(title="Existing")
+        data = task_manager.dump_binary()
+
+        with pytest.raises(DuplicateTaskError):
+            task_manager.load_binary(data)
+        assert task_manager.get_task_count() == 1
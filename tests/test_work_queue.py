@@ -0,0 +1,223 @@
+"""Unit tests for the lease-based work queue."""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.task_manager import LeaseError, TaskPriority, TaskStatus
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Provide a hand-driven clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def queue(task_manager, clock):
+    """Add tasks whose queue order differs from their ID order."""
+    now = datetime.now()
+    task_manager.add_task("Low", priority=TaskPriority.LOW)
+    task_manager.add_task("High late", priority=TaskPriority.HIGH, due_date=now + timedelta(days=9))
+    task_manager.add_task("High soon", priority=TaskPriority.HIGH, due_date=now + timedelta(days=1))
+    task_manager.add_task("High undated", priority=TaskPriority.HIGH)
+    task_manager.add_task("Medium", priority=TaskPriority.MEDIUM)
+    work_queue = task_manager.work_queue()
+    work_queue._clock = clock
+    return work_queue
+
+
+def drain(work_queue, worker_id="w"):
+    """Claim every pending task and return their IDs in claim order."""
+    claimed = []
+    task = work_queue.claim_next(worker_id, 60)
+    while task is not None:
+        claimed.append(task.task_id)
+        task = work_queue.claim_next(worker_id, 60)
+    return claimed
+
+
+class TestClaims:
+    """Tests for claim order and lease bookkeeping."""
+
+    def test_claim_order(self, queue):
+        """Test priority first, then earliest due date, undated last."""
+        assert len(queue) == 5
+        assert drain(queue) == [3, 2, 4, 5, 1]
+        assert len(queue) == 0
+
+    def test_same_rank_oldest_first(self, task_manager, clock):
+        """Test that tasks of equal priority and deadline are claimed oldest first."""
+        base = datetime.now() - timedelta(days=1)
+        for i in range(3):
+            task = task_manager.add_task(f"Task {i}")
+            task.created_at = base - timedelta(hours=i)
+
+        assert drain(task_manager.work_queue()) == [3, 2, 1]
+
+    def test_claim_moves_to_in_progress(self, task_manager, queue, clock):
+        """Test that a claim starts the task and records a lease."""
+        task = queue.claim_next("worker-1", 30)
+
+        assert task.status == TaskStatus.IN_PROGRESS
+        assert task_manager.get_task(task.task_id) is task
+        lease = queue.lease(task.task_id)
+        assert lease.worker_id == "worker-1"
+        assert lease.expires_at == clock.now + 30
+        assert task_manager.get_statistics(verify=True)["in_progress"] == 1
+
+    def test_empty_queue(self, task_manager):
+        """Test that claiming from an empty queue returns None."""
+        assert task_manager.work_queue().claim_next("w", 10) is None
+
+    def test_lease_must_be_positive(self, queue):
+        """Test that a non-positive lease is rejected."""
+        with pytest.raises(ValueError):
+            queue.claim_next("w", 0)
+
+    def test_concurrent_claims(self, task_manager):
+        """Test that threads claiming together never get the same task."""
+        task_manager.add_tasks({"title": f"Task {i}"} for i in range(200))
+        work_queue = task_manager.work_queue()
+        claimed = []
+
+        def worker(name):
+            ids = drain(work_queue, name)
+            claimed.extend(ids)
+
+        threads = [threading.Thread(target=worker, args=(f"w{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(claimed) == list(range(1, 201))
+
+
+class TestLeases:
+    """Tests for lease expiry, renewal, completion and release."""
+
+    def test_expired_lease_returns_to_queue(self, task_manager, queue, clock):
+        """Test that an expired task is reclaimed before the next claim."""
+        first = queue.claim_next("slow", 10)
+        clock.now += 11
+
+        again = queue.claim_next("fast", 10)
+
+        assert again is first
+        assert queue.lease(first.task_id).worker_id == "fast"
+        with pytest.raises(LeaseError):
+            queue.complete(first.task_id, "slow")
+
+    def test_reclaim_expired(self, task_manager, queue, clock):
+        """Test that reclaim_expired requeues tasks without a claim."""
+        task = queue.claim_next("w", 10)
+        clock.now += 10
+
+        assert queue.reclaim_expired() == [task.task_id]
+        assert task.status == TaskStatus.PENDING
+        assert queue.lease(task.task_id) is None
+        assert len(queue) == 5
+
+    def test_renew(self, queue, clock):
+        """Test that renewing keeps a task leased past its first expiry."""
+        task = queue.claim_next("w", 10)
+        clock.now += 8
+        queue.renew(task.task_id, "w", 10)
+        clock.now += 8
+
+        assert queue.reclaim_expired() == []
+        assert queue.lease(task.task_id).expires_at == clock.now + 2
+
+    def test_complete(self, task_manager, queue):
+        """Test that completing ends the lease and keeps the task out of the queue."""
+        task = queue.claim_next("w", 10)
+
+        queue.complete(task.task_id, "w")
+
+        assert task.status == TaskStatus.COMPLETED
+        assert queue.lease(task.task_id) is None
+        assert task.task_id not in drain(queue)
+
+    def test_release(self, queue):
+        """Test that a released task is claimed again first."""
+        task = queue.claim_next("w", 10)
+
+        queue.release(task.task_id, "w")
+
+        assert task.status == TaskStatus.PENDING
+        assert queue.claim_next("other", 10) is task
+
+    def test_wrong_worker(self, queue):
+        """Test that only the lease holder may renew, complete or release."""
+        task = queue.claim_next("owner", 10)
+
+        for action in (queue.complete, queue.release):
+            with pytest.raises(LeaseError):
+                action(task.task_id, "intruder")
+        with pytest.raises(LeaseError):
+            queue.renew(task.task_id, "intruder", 10)
+        assert task.status == TaskStatus.IN_PROGRESS
+
+
+class TestMaintenance:
+    """Tests that the queue follows changes made outside it."""
+
+    def test_reprioritized_task_moves(self, task_manager, queue):
+        """Test that raising a priority moves the task to the front."""
+        task_manager.get_task(1).set_priority(TaskPriority.CRITICAL)
+
+        assert drain(queue) == [1, 3, 2, 4, 5]
+
+    def test_new_tasks_are_queued(self, task_manager, queue):
+        """Test that tasks added after the queue was built are claimable."""
+        task_manager.add_task("Urgent", priority=TaskPriority.CRITICAL)
+        task_manager.add_tasks([{"title": "Later", "priority": TaskPriority.LOW}])
+
+        assert drain(queue) == [6, 3, 2, 4, 5, 1, 7]
+
+    def test_closed_and_deleted_tasks_leave(self, task_manager, queue):
+        """Test that completed, cancelled and deleted tasks are not claimed."""
+        task_manager.mark_task_completed(3)
+        task_manager.mark_tasks_cancelled([2])
+        task_manager.delete_task(4)
+
+        assert drain(queue) == [5, 1]
+
+    def test_manual_reset_voids_lease(self, task_manager, queue):
+        """Test that closing a leased task outside the queue drops its lease."""
+        task = queue.claim_next("w", 10)
+
+        task_manager.mark_task_cancelled(task.task_id)
+
+        assert queue.lease(task.task_id) is None
+        with pytest.raises(LeaseError):
+            queue.complete(task.task_id, "w")
+
+    def test_clear(self, task_manager, queue):
+        """Test that clearing the manager empties the queue."""
+        queue.claim_next("w", 10)
+        task_manager.clear_all_tasks()
+
+        assert len(queue) == 0
+        assert queue.claim_next("w", 10) is None
+
+    def test_heap_compaction(self, task_manager, queue):
+        """Test that repeated re-ranking does not grow the heap without bound."""
+        task = task_manager.get_task(1)
+        for i in range(501):
+            task.set_priority(TaskPriority.HIGH if i % 2 else TaskPriority.LOW)
+
+        assert len(queue._heap) <= 2 * len(queue) + 64
+        assert drain(queue) == [3, 2, 4, 5, 1]